@@ -0,0 +1,97 @@
+using System.Numerics;
+using BenchmarkDotNet.Attributes;
+using Spaceorc.Z3Wrap.Values.BitVectors;
+
+namespace Z3Wrap.Benchmarks;
+
+/// <summary>
+/// Compares <see cref="Bv{TSize}"/> arithmetic on the inline 64-bit representation against the same
+/// operations on masked <see cref="BigInteger"/> values, which is how every size used to be stored.
+/// </summary>
+[MemoryDiagnoser]
+public class BvBenchmarks
+{
+    private const int Iterations = 1024;
+
+    private static readonly BigInteger Mask32 = (BigInteger.One << 32) - 1;
+    private static readonly BigInteger Mask64 = (BigInteger.One << 64) - 1;
+
+    private readonly Bv<Size32> a32 = 0x12345678u;
+    private readonly Bv<Size32> b32 = 0x9ABCDEF1u;
+    private readonly Bv<Size64> a64 = 0x123456789ABCDEF0UL;
+    private readonly Bv<Size64> b64 = 0x0FEDCBA987654321UL;
+    private readonly Bv<Size128> a128 = 0x123456789ABCDEF0UL;
+    private readonly Bv<Size128> b128 = 0x0FEDCBA987654321UL;
+
+    [Benchmark(Baseline = true)]
+    public BigInteger BigInteger64()
+    {
+        BigInteger x = 0x123456789ABCDEF0UL;
+        BigInteger y = 0x0FEDCBA987654321UL;
+        for (var i = 0; i < Iterations; i++)
+        {
+            x = (x * y + x) & Mask64;
+            x = (x ^ (x << 3)) & Mask64;
+            if (x < y)
+                x = (x - y) & Mask64;
+        }
+        return x;
+    }
+
+    [Benchmark]
+    public BigInteger BigInteger32()
+    {
+        BigInteger x = 0x12345678u;
+        BigInteger y = 0x9ABCDEF1u;
+        for (var i = 0; i < Iterations; i++)
+        {
+            x = (x * y + x) & Mask32;
+            x = (x ^ (x << 3)) & Mask32;
+            if (x < y)
+                x = (x - y) & Mask32;
+        }
+        return x;
+    }
+
+    [Benchmark]
+    public Bv<Size64> Bv64()
+    {
+        var x = a64;
+        for (var i = 0; i < Iterations; i++)
+        {
+            x = x * b64 + x;
+            x ^= x << 3;
+            if (x < b64)
+                x -= b64;
+        }
+        return x;
+    }
+
+    [Benchmark]
+    public Bv<Size32> Bv32()
+    {
+        var x = a32;
+        for (var i = 0; i < Iterations; i++)
+        {
+            x = x * b32 + x;
+            x ^= x << 3;
+            if (x < b32)
+                x -= b32;
+        }
+        return x;
+    }
+
+    [Benchmark]
+    public Bv<Size128> Bv128()
+    {
+        var x = a128;
+        for (var i = 0; i < Iterations; i++)
+        {
+            x = x * b128 + x;
+            x ^= x << 3;
+            if (x < b128)
+                x -= b128;
+        }
+        return x;
+    }
+}
@@ -0,0 +1,55 @@
+using System.Numerics;
+using BenchmarkDotNet.Attributes;
+using Spaceorc.Z3Wrap.Values.Numerics;
+
+namespace Z3Wrap.Benchmarks;
+
+/// <summary>
+/// Sums model-sized rationals with <see cref="Real"/> against the same computation on reduced
+/// <see cref="BigInteger"/> fractions, which is how every value used to be stored.
+/// </summary>
+[MemoryDiagnoser]
+public class RealBenchmarks
+{
+    private const int Count = 1000;
+
+    private readonly Real[] values = Enumerable.Range(1, Count).Select(i => new Real(i, i % 7 + 1)).ToArray();
+
+    [Benchmark(Baseline = true)]
+    public BigInteger BigIntegerFractionSum()
+    {
+        BigInteger num = 0;
+        BigInteger den = 1;
+        for (var i = 1; i <= Count; i++)
+        {
+            BigInteger otherDen = i % 7 + 1;
+            num = num * otherDen + i * den;
+            den *= otherDen;
+            var gcd = BigInteger.GreatestCommonDivisor(num, den);
+            num /= gcd;
+            den /= gcd;
+        }
+        return num;
+    }
+
+    [Benchmark]
+    public Real RealSum()
+    {
+        var sum = Real.Zero;
+        foreach (var value in values)
+            sum += value;
+        return sum;
+    }
+
+    [Benchmark]
+    public int RealCompare()
+    {
+        var count = 0;
+        for (var i = 1; i < values.Length; i++)
+        {
+            if (values[i] > values[i - 1])
+                count++;
+        }
+        return count;
+    }
+}
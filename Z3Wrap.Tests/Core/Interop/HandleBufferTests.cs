@@ -0,0 +1,85 @@
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+
+namespace Z3Wrap.Tests.Core.Interop;
+
+[TestFixture]
+public class HandleBufferTests
+{
+    [Test]
+    public void Add_WithinInitialBuffer_KeepsHandlesInOrder()
+    {
+        var buffer = new HandleBuffer(stackalloc IntPtr[4]);
+        try
+        {
+            buffer.Add(1);
+            buffer.Add(2);
+            buffer.Add(3);
+
+            Assert.That(buffer.Length, Is.EqualTo(3));
+            Assert.That(buffer.Span.ToArray(), Is.EqualTo(new IntPtr[] { 1, 2, 3 }));
+        }
+        finally
+        {
+            buffer.Dispose();
+        }
+    }
+
+    [Test]
+    public void Add_BeyondInitialBuffer_GrowsAndPreservesHandles()
+    {
+        var buffer = new HandleBuffer(stackalloc IntPtr[2]);
+        try
+        {
+            for (var i = 1; i <= 100; i++)
+                buffer.Add(i);
+
+            Assert.That(buffer.Length, Is.EqualTo(100));
+            Assert.That(buffer.Span.ToArray(), Is.EqualTo(Enumerable.Range(1, 100).Select(i => (IntPtr)i).ToArray()));
+        }
+        finally
+        {
+            buffer.Dispose();
+        }
+    }
+
+    [Test]
+    public void AddRange_Expressions_CollectsHandles()
+    {
+        using var context = new Z3Context();
+        var exprs = new[] { context.BoolConst("a"), context.BoolConst("b") };
+
+        var buffer = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            buffer.AddRange(exprs);
+
+            Assert.That(buffer.Span.ToArray(), Is.EqualTo(exprs.Select(e => e.Handle).ToArray()));
+        }
+        finally
+        {
+            buffer.Dispose();
+        }
+    }
+
+    [Test]
+    public void Clear_ResetsLength()
+    {
+        var buffer = new HandleBuffer(stackalloc IntPtr[2]);
+        try
+        {
+            buffer.Add(1);
+            buffer.Add(2);
+            buffer.Add(3);
+            buffer.Clear();
+
+            Assert.That(buffer.Length, Is.EqualTo(0));
+            Assert.That(buffer.Span.IsEmpty, Is.True);
+        }
+        finally
+        {
+            buffer.Dispose();
+        }
+    }
+}
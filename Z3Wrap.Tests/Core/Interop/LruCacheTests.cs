@@ -0,0 +1,69 @@
+using Spaceorc.Z3Wrap.Core.Interop;
+
+namespace Z3Wrap.Tests.Core.Interop;
+
+[TestFixture]
+public class LruCacheTests
+{
+    [Test]
+    public void Add_BeyondCapacity_EvictsLeastRecentlyUsed()
+    {
+        var cache = new LruCache<string, int>(2);
+        cache.Add("a", 1);
+        cache.Add("b", 2);
+        Assert.That(cache.TryGetValue("a", out _), Is.True);
+
+        cache.Add("c", 3);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(cache.Count, Is.EqualTo(2));
+            Assert.That(cache.TryGetValue("a", out var a), Is.True);
+            Assert.That(a, Is.EqualTo(1));
+            Assert.That(cache.TryGetValue("b", out _), Is.False);
+            Assert.That(cache.TryGetValue("c", out var c), Is.True);
+            Assert.That(c, Is.EqualTo(3));
+        });
+    }
+
+    [Test]
+    public void Add_ExistingKey_ReplacesValue()
+    {
+        var cache = new LruCache<string, int>(2);
+        cache.Add("a", 1);
+        cache.Add("a", 2);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(cache.Count, Is.EqualTo(1));
+            Assert.That(cache.TryGetValue("a", out var a), Is.True);
+            Assert.That(a, Is.EqualTo(2));
+        });
+    }
+
+    [Test]
+    public void Capacity_Reduced_TrimsOldestEntries()
+    {
+        var cache = new LruCache<int, int>(3);
+        cache.Add(1, 1);
+        cache.Add(2, 2);
+        cache.Add(3, 3);
+
+        cache.Capacity = 1;
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(cache.Count, Is.EqualTo(1));
+            Assert.That(cache.TryGetValue(3, out _), Is.True);
+        });
+    }
+
+    [Test]
+    public void Add_ZeroCapacity_IsIgnored()
+    {
+        var cache = new LruCache<int, int>(0);
+        cache.Add(1, 1);
+
+        Assert.That(cache.TryGetValue(1, out _), Is.False);
+    }
+}
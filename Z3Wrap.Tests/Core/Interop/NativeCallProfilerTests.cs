@@ -0,0 +1,52 @@
+using System.Diagnostics;
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
+
+namespace Z3Wrap.Tests.Core.Interop;
+
+[TestFixture]
+public class NativeCallProfilerTests
+{
+    [Test]
+    public void CallScope_Dispose_RecordsCallInProfile()
+    {
+        const string functionName = "Z3_test_profiled_function";
+
+        for (var i = 0; i < 3; i++)
+            new NativeCallProfiler.CallScope(functionName, Stopwatch.GetTimestamp()).Dispose();
+
+        var entry = Z3Library.GetCallProfile().Single(e => e.FunctionName == functionName);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(entry.CallCount, Is.EqualTo(3));
+            Assert.That(entry.MaxTime, Is.LessThanOrEqualTo(entry.TotalTime));
+            Assert.That(entry.AverageTime, Is.LessThanOrEqualTo(entry.MaxTime));
+        });
+    }
+
+    [Test]
+    public void DefaultCallScope_Dispose_DoesNotRecord()
+    {
+        var before = Z3Library.GetCallProfile().Sum(e => e.CallCount);
+
+        default(NativeCallProfiler.CallScope).Dispose();
+
+        Assert.That(Z3Library.GetCallProfile().Sum(e => e.CallCount), Is.EqualTo(before));
+    }
+
+    [Test]
+    public void GetCallProfile_Top_LimitsEntries()
+    {
+        new NativeCallProfiler.CallScope("Z3_test_first", Stopwatch.GetTimestamp()).Dispose();
+        new NativeCallProfiler.CallScope("Z3_test_second", Stopwatch.GetTimestamp()).Dispose();
+
+        Assert.That(Z3Library.GetCallProfile(top: 1), Has.Count.EqualTo(1));
+    }
+
+    [Test]
+    public void GetCallProfile_NegativeTop_ThrowsArgumentOutOfRangeException()
+    {
+        Assert.Throws<ArgumentOutOfRangeException>(() => Z3Library.GetCallProfile(top: -1));
+    }
+}
@@ -0,0 +1,45 @@
+using System.Text;
+using Spaceorc.Z3Wrap.Core.Interop;
+
+namespace Z3Wrap.Tests.Core.Interop;
+
+[TestFixture]
+public class NullTerminatedUtf8Tests
+{
+    [Test]
+    public void Constructor_Bytes_AppendsTerminator()
+    {
+        using var utf8 = new NullTerminatedUtf8("abc"u8, stackalloc byte[16]);
+
+        Assert.That(utf8.Span.ToArray(), Is.EqualTo(new byte[] { (byte)'a', (byte)'b', (byte)'c', 0 }));
+    }
+
+    [Test]
+    public void Constructor_BytesAlreadyTerminated_PassesThrough()
+    {
+        ReadOnlySpan<byte> input = "abc\0"u8;
+
+        using var utf8 = new NullTerminatedUtf8(input, stackalloc byte[16]);
+
+        Assert.That(utf8.Span == input, Is.True);
+    }
+
+    [Test]
+    public void Constructor_String_EncodesUtf8WithTerminator()
+    {
+        using var utf8 = new NullTerminatedUtf8("x→y", stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+
+        Assert.That(utf8.Span.ToArray(), Is.EqualTo(Encoding.UTF8.GetBytes("x→y\0")));
+    }
+
+    [Test]
+    public void Constructor_StringLongerThanBuffer_UsesPooledBuffer()
+    {
+        var value = new string('v', 1000);
+
+        using var utf8 = new NullTerminatedUtf8(value, stackalloc byte[8]);
+
+        Assert.That(utf8.Span.Length, Is.EqualTo(1001));
+        Assert.That(Encoding.UTF8.GetString(utf8.Span[..^1]), Is.EqualTo(value));
+    }
+}
@@ -0,0 +1,168 @@
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+
+namespace Z3Wrap.Tests.Core.Interop;
+
+[TestFixture]
+public class OperatorChainTests
+{
+    [Test]
+    public void And_Chain_BuildsSingleNaryTerm()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var a = context.BoolConst("a");
+        var b = context.BoolConst("b");
+        var c = context.BoolConst("c");
+        var d = context.BoolConst("d");
+
+        var expr = a & b & c & d;
+
+        Assert.That(expr.ToString(), Is.EqualTo("(and a b c d)"));
+    }
+
+    [Test]
+    public void Or_ChainOfChains_BuildsFlatTerm()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var a = context.BoolConst("a");
+        var b = context.BoolConst("b");
+        var c = context.BoolConst("c");
+        var d = context.BoolConst("d");
+
+        var expr = (a | b) | (c | d);
+
+        Assert.That(expr.ToString(), Is.EqualTo("(or a b c d)"));
+    }
+
+    [Test]
+    public void And_BranchedChains_KeepOwnOperands()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var a = context.BoolConst("a");
+        var b = context.BoolConst("b");
+        var c = context.BoolConst("c");
+        var d = context.BoolConst("d");
+
+        var ab = a & b;
+        var abc = ab & c;
+        var abd = ab & d;
+        var abcd = abc & d;
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(ab.ToString(), Is.EqualTo("(and a b)"));
+            Assert.That(abc.ToString(), Is.EqualTo("(and a b c)"));
+            Assert.That(abd.ToString(), Is.EqualTo("(and a b d)"));
+            Assert.That(abcd.ToString(), Is.EqualTo("(and a b c d)"));
+        });
+    }
+
+    [Test]
+    public void Mul_SharedOperand_GrowsLinearly()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var t = context.IntConst("x");
+        for (var i = 0; i < 24; i++)
+            t = t * t;
+
+        var app = context.Library.ToApp(context.Handle, t.Handle);
+
+        Assert.That(context.Library.GetAppNumArgs(context.Handle, app), Is.EqualTo(25u));
+    }
+
+    [Test]
+    public void Add_FibonacciSharedOperands_GrowsLinearly()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        IntExpr a = context.IntConst("a");
+        IntExpr b = context.IntConst("b");
+        for (var i = 0; i < 40; i++)
+            (a, b) = (b, a + b);
+
+        var app = context.Library.ToApp(context.Handle, b.Handle);
+
+        Assert.That(context.Library.GetAppNumArgs(context.Handle, app), Is.LessThanOrEqualTo(41u));
+    }
+
+    [Test]
+    public void MixedOperators_MaterializeInnerChain()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var a = context.BoolConst("a");
+        var b = context.BoolConst("b");
+        var c = context.BoolConst("c");
+
+        var expr = (a | b) & c & !a;
+
+        Assert.That(expr.ToString(), Is.EqualTo("(and (or a b) c (not a))"));
+    }
+
+    [Test]
+    public void Add_Chain_BuildsSingleNaryTerm()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var x = context.IntConst("x");
+        var y = context.IntConst("y");
+        var z = context.IntConst("z");
+
+        var sum = x + y + z + 1;
+        var product = x * y * z;
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(sum.ToString(), Is.EqualTo("(+ x y z 1)"));
+            Assert.That(product.ToString(), Is.EqualTo("(* x y z)"));
+        });
+    }
+
+    [Test]
+    public void Chain_UsedInSolver_MaterializesOnAssert()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.RealConst("x");
+        var y = context.RealConst("y");
+        var a = context.BoolConst("a");
+        var b = context.BoolConst("b");
+
+        solver.Assert(a & b & (x + y + 1 == context.Real(4)) & (x == context.Real(1)));
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+        Assert.Multiple(() =>
+        {
+            Assert.That(model.GetBoolValue(a), Is.True);
+            Assert.That(model.GetRealValue(y).ToString(), Is.EqualTo("2"));
+        });
+    }
+
+    [Test]
+    public void Equals_PendingChainAndBuiltTerm_ReturnsTrue()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var a = context.BoolConst("a");
+        var b = context.BoolConst("b");
+        var c = context.BoolConst("c");
+
+        Assert.That((a & b & c).Equals(context.And(a, b, c)), Is.True);
+    }
+}
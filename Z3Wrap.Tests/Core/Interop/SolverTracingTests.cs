@@ -0,0 +1,148 @@
+using System.Diagnostics;
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+
+namespace Z3Wrap.Tests.Core.Interop;
+
+[TestFixture]
+public class SolverTracingTests
+{
+    private readonly List<Activity> stopped = [];
+    private ActivityListener? listener;
+
+    [SetUp]
+    public void SetUp()
+    {
+        stopped.Clear();
+        listener = new ActivityListener
+        {
+            ShouldListenTo = source => source.Name == SolverTracing.SourceName,
+            Sample = (ref ActivityCreationOptions<ActivityContext> _) => ActivitySamplingResult.AllDataAndRecorded,
+            ActivityStopped = activity => stopped.Add(activity),
+        };
+        ActivitySource.AddActivityListener(listener);
+    }
+
+    [TearDown]
+    public void TearDown() => listener?.Dispose();
+
+    [Test]
+    public void Check_WithListener_RecordsSpanWithStatusAndAssertionCount()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        solver.Assert(x > 10);
+        solver.Assert(x < 20);
+        solver.Check();
+
+        var activity = stopped.Single(a => a.OperationName == "Z3Solver.Check");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(activity.GetTagItem("z3.assertions"), Is.EqualTo(2));
+            Assert.That(activity.GetTagItem("z3.status"), Is.EqualTo("Satisfiable"));
+            Assert.That(activity.GetTagItem("z3.reason_unknown"), Is.Null);
+        });
+    }
+
+    [Test]
+    public void CheckAssumptionsAndGetUnsatCore_WithListener_RecordsSpans()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        solver.CheckAssumptions(x > 10, x < 5);
+        var core = solver.GetUnsatCore();
+
+        var checkActivity = stopped.Single(a => a.OperationName == "Z3Solver.CheckAssumptions");
+        var coreActivity = stopped.Single(a => a.OperationName == "Z3Solver.GetUnsatCore");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(checkActivity.GetTagItem("z3.status"), Is.EqualTo("Unsatisfiable"));
+            Assert.That(coreActivity.GetTagItem("z3.core_size"), Is.EqualTo(core.Length));
+        });
+    }
+
+    [Test]
+    public void GetModel_WithListener_RecordsSpanOncePerModel()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        solver.Assert(context.IntConst("x") > 10);
+        solver.Check();
+        solver.GetModel();
+        solver.GetModel();
+
+        Assert.That(stopped.Count(a => a.OperationName == "Z3Solver.GetModel"), Is.EqualTo(1));
+    }
+
+    [Test]
+    public void OptimizerCheck_WithListener_RecordsSpan()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var x = context.IntConst("x");
+        optimizer.Assert(x < 10);
+        optimizer.Maximize(x);
+        optimizer.Check();
+
+        var activity = stopped.Single(a => a.OperationName == "Z3Optimizer.Check");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(activity.GetTagItem("z3.assertions"), Is.EqualTo(1));
+            Assert.That(activity.GetTagItem("z3.status"), Is.EqualTo("Satisfiable"));
+        });
+    }
+
+    [Test]
+    public void Check_WithPropagationOnlyListener_SkipsTagValues()
+    {
+        listener?.Dispose();
+        listener = new ActivityListener
+        {
+            ShouldListenTo = source => source.Name == SolverTracing.SourceName,
+            Sample = (ref ActivityCreationOptions<ActivityContext> _) => ActivitySamplingResult.PropagationData,
+            ActivityStopped = activity => stopped.Add(activity),
+        };
+        ActivitySource.AddActivityListener(listener);
+
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        solver.Assert(context.IntConst("x") > 10);
+        solver.Check();
+
+        var activity = stopped.Single(a => a.OperationName == "Z3Solver.Check");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(activity.IsAllDataRequested, Is.False);
+            Assert.That(activity.GetTagItem("z3.assertions"), Is.Null);
+            Assert.That(activity.GetTagItem("z3.conflicts"), Is.Null);
+        });
+    }
+
+    [Test]
+    public void Start_WithoutListener_ReturnsNull()
+    {
+        listener?.Dispose();
+        listener = null;
+
+        using var operation = SolverTracing.Start("Z3Solver.Check");
+
+        Assert.That(operation, Is.Null);
+    }
+}
@@ -0,0 +1,101 @@
+using System.Numerics;
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.BitVectors;
+using Spaceorc.Z3Wrap.Expressions.Common;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+using Spaceorc.Z3Wrap.Values.BitVectors;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3ConstArrayTests
+{
+    [Test]
+    public void IntConsts_CreatesDistinctNamedConstants()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var xs = context.IntConsts("x", 1000);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(xs.Count, Is.EqualTo(1000));
+            Assert.That(xs.Prefix, Is.EqualTo("x"));
+            Assert.That(xs.Select(x => x.Handle).Distinct().Count(), Is.EqualTo(1000));
+            Assert.That(xs[0].ToString(), Does.StartWith("x!"));
+        });
+    }
+
+    [Test]
+    public void Consts_SamePrefixTwice_CreatesFreshConstants()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var first = context.BoolConsts("b", 3);
+        var second = context.BoolConsts("b", 3);
+
+        Assert.That(first.Intersect(second), Is.Empty);
+    }
+
+    [Test]
+    public void IndexOf_ReturnsPositionOrMinusOne()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var xs = context.RealConsts("r", 10);
+        var other = context.RealConst("r");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(xs.IndexOf(xs[7]), Is.EqualTo(7));
+            Assert.That(xs.IndexOf(xs[0]), Is.EqualTo(0));
+            Assert.That(xs.IndexOf(other), Is.EqualTo(-1));
+        });
+    }
+
+    [Test]
+    public void BvConsts_UsableInSolver()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var bits = context.BvConsts<Size8>("v", 4);
+
+        for (var i = 0; i < bits.Count; i++)
+            solver.Assert(bits[i] == context.Bv<Size8>(i * 10));
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(solver.GetModel().GetBv(bits[3]).Value, Is.EqualTo(new BigInteger(30)));
+    }
+
+    [Test]
+    public void IntConsts_UsableInSolver()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var xs = context.IntConsts("x", 5);
+        foreach (var x in xs)
+            solver.Assert(x >= 0 & x < 5);
+        solver.Assert(context.Distinct(xs));
+        solver.Assert(xs[0] == 4);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(solver.GetModel().GetIntValue(xs[0]), Is.EqualTo(new BigInteger(4)));
+    }
+
+    [Test]
+    public void Consts_NegativeCount_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        Assert.Throws<ArgumentOutOfRangeException>(() => context.Consts<BoolExpr>("b", -1));
+    }
+}
@@ -348,6 +348,37 @@ public class Z3ContextTests
         Assert.That(Z3Context.IsCurrentContextSet, Is.False);
     }
 
+    [Test]
+    public void GetSymbol_SameName_ReturnsCachedSymbol()
+    {
+        using var context = new Z3Context();
+
+        var first = context.GetSymbol("x");
+        var second = context.GetSymbol("x");
+        var other = context.GetSymbol("y");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(second, Is.EqualTo(first));
+            Assert.That(other, Is.Not.EqualTo(first));
+            Assert.That(context.Library.GetSymbolString(context.Handle, first), Is.EqualTo("x"));
+        });
+    }
+
+    [Test]
+    public void GetSymbol_SameNameTwice_RefersToSameConstant()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x1 = context.IntConst("längd");
+        var x2 = context.IntConst("längd");
+        solver.Assert(x1 != x2);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Unsatisfiable));
+    }
+
     [Test]
     public void ErrorHandling_MultipleErrors_DoesNotCrashProcess()
     {
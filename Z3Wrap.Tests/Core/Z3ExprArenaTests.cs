@@ -0,0 +1,132 @@
+using System.Numerics;
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3ExprArenaTests
+{
+    [Test]
+    public void Operators_BuildExpectedTerms()
+    {
+        using var context = new Z3Context();
+        using var arena = context.CreateArena();
+
+        var x = arena.Const<IntExpr>("x");
+        var y = arena.Const<IntExpr>("y");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That((x + y).ToString(), Is.EqualTo("(+ x y)"));
+            Assert.That((2 * x - 1).ToString(), Is.EqualTo("(- (* 2 x) 1)"));
+            Assert.That((x <= y).ToString(), Is.EqualTo("(<= x y)"));
+            Assert.That((x == 3).ToString(), Is.EqualTo("(= x 3)"));
+            Assert.That((x != y).ToString(), Is.EqualTo("(not (= x y))"));
+        });
+    }
+
+    [Test]
+    public void Assert_ArenaConstraints_SolvesAndConvertsToExpr()
+    {
+        using var context = new Z3Context();
+        using var solver = context.CreateSolver();
+        using var arena = context.CreateArena();
+
+        var x = arena.Const<IntExpr>("x");
+        var y = arena.Const<IntExpr>("y");
+        var flag = arena.Const<BoolExpr>("flag");
+
+        solver.Assert((x + y == 10) & (x - y == 4) & !flag);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+        Assert.Multiple(() =>
+        {
+            Assert.That(model.GetIntValue(x.ToExpr()), Is.EqualTo(new BigInteger(7)));
+            Assert.That(model.GetBoolValue(flag.ToExpr()), Is.False);
+        });
+    }
+
+    [Test]
+    public void Sum_BuildsSingleNaryTerm()
+    {
+        using var context = new Z3Context();
+        using var arena = context.CreateArena();
+
+        var a = arena.Const<RealExpr>("a");
+        var b = arena.Const<RealExpr>("b");
+        var c = arena.Const<RealExpr>("c");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(arena.Sum(a, b, c).ToString(), Is.EqualTo("(+ a b c)"));
+            Assert.That(arena.Sum<RealExpr>().ToString(), Is.EqualTo("0.0"));
+            Assert.That(arena.And().ToString(), Is.EqualTo("true"));
+        });
+    }
+
+    [Test]
+    public void Ref_ExistingExpression_SharesHandle()
+    {
+        using var context = new Z3Context();
+        using var arena = context.CreateArena();
+
+        var x = context.IntConst("x");
+
+        Assert.That(arena.Ref(x).Handle, Is.EqualTo(x.Handle));
+    }
+
+    [Test]
+    public void Dispose_ReleasesReferencesAndRejectsNewTerms()
+    {
+        using var context = new Z3Context();
+        var arena = context.CreateArena();
+
+        var x = arena.Const<IntExpr>("x");
+        _ = x + 1;
+        Assert.That(arena.Count, Is.EqualTo(2));
+
+        arena.Dispose();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(arena.Count, Is.EqualTo(0));
+            Assert.Throws<ObjectDisposedException>(() => arena.Numeral<IntExpr>(1));
+        });
+    }
+
+    [Test]
+    public void Dispose_RejectsUseOfExistingTerms()
+    {
+        using var context = new Z3Context();
+        using var solver = context.CreateSolver();
+        using var optimizer = context.CreateOptimizer();
+        var arena = context.CreateArena();
+
+        var x = arena.Const<IntExpr>("x");
+        var constraint = x > 0;
+
+        arena.Dispose();
+
+        Assert.Multiple(() =>
+        {
+            Assert.Throws<ObjectDisposedException>(() => x.ToExpr());
+            Assert.Throws<ObjectDisposedException>(() => solver.Assert(constraint));
+            Assert.Throws<ObjectDisposedException>(() => optimizer.Assert(constraint));
+        });
+    }
+
+    [Test]
+    public void Dispose_AfterContextDispose_DoesNotThrow()
+    {
+        var context = new Z3Context();
+        var arena = context.CreateArena();
+        arena.Const<BoolExpr>("b");
+
+        context.Dispose();
+
+        Assert.DoesNotThrow(arena.Dispose);
+    }
+}
@@ -0,0 +1,75 @@
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3GoalTests
+{
+    [Test]
+    public void CreateGoal_ReturnsEmptyGoal()
+    {
+        using var context = new Z3Context();
+
+        var goal = context.CreateGoal();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(goal.Handle, Is.Not.EqualTo(IntPtr.Zero));
+            Assert.That(goal.Size, Is.EqualTo(0u));
+            Assert.That(goal.IsDecidedSat, Is.True);
+            Assert.That(goal.IsInconsistent, Is.False);
+        });
+    }
+
+    [Test]
+    public void Assert_AddsFormulas()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var x = context.IntConst("x");
+        var goal = context.CreateGoal();
+        goal.Assert(x > 0);
+        goal.Assert(x < 10);
+
+        var formulas = goal.GetFormulas();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(goal.Size, Is.EqualTo(2u));
+            Assert.That(goal.Depth, Is.EqualTo(0u));
+            Assert.That(formulas, Has.Length.EqualTo(2));
+            Assert.That(formulas[0].ToString(), Does.Contain("x"));
+            Assert.That(goal.ToString(), Does.Contain("goal"));
+        });
+    }
+
+    [Test]
+    public void Assert_False_MakesGoalInconsistent()
+    {
+        using var context = new Z3Context();
+
+        var goal = context.CreateGoal();
+        goal.Assert(context.False());
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(goal.IsInconsistent, Is.True);
+            Assert.That(goal.IsDecidedUnsat, Is.True);
+        });
+    }
+
+    [Test]
+    public void Reset_RemovesAllFormulas()
+    {
+        using var context = new Z3Context();
+
+        var goal = context.CreateGoal();
+        goal.Assert(context.BoolConst("p"));
+        goal.Reset();
+
+        Assert.That(goal.Size, Is.EqualTo(0u));
+    }
+}
@@ -1,4 +1,7 @@
+using System.Buffers;
+using System.Text;
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
 
 namespace Z3Wrap.Tests.Core;
 
@@ -73,4 +76,43 @@ public class Z3LibraryTests
         library.DelContext(contextHandle);
         library.DelConfig(configHandle);
     }
+
+    [Test]
+    public void AstToStringUtf8_MatchesAstToString()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        var expr = context.IntConst("x") + 1;
+
+        var expected = context.Library.AstToString(context.Handle, expr.Handle);
+        var actual = Encoding.UTF8.GetString(context.Library.AstToStringUtf8(context.Handle, expr.Handle));
+
+        Assert.That(actual, Is.EqualTo(expected));
+    }
+
+    [Test]
+    public void AstToString_Stream_WritesUtf8Result()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        var expr = context.IntConst("x") + 1;
+        using var stream = new MemoryStream();
+
+        context.Library.AstToString(context.Handle, expr.Handle, stream);
+
+        Assert.That(Encoding.UTF8.GetString(stream.ToArray()), Is.EqualTo(expr.ToString()));
+    }
+
+    [Test]
+    public void AstToString_BufferWriter_WritesUtf8Result()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        var expr = context.IntConst("x") + 1;
+        var writer = new ArrayBufferWriter<byte>();
+
+        context.Library.AstToString(context.Handle, expr.Handle, writer);
+
+        Assert.That(Encoding.UTF8.GetString(writer.WrittenSpan), Is.EqualTo(expr.ToString()));
+    }
 }
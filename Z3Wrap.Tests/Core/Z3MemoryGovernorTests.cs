@@ -0,0 +1,100 @@
+using System.Diagnostics.Metrics;
+using Spaceorc.Z3Wrap.Core;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3MemoryGovernorTests
+{
+    [TearDown]
+    public void TearDown() => Z3.MemoryGovernor = null;
+
+    [Test]
+    public void GetEstimatedAllocSize_WithLiveContext_ReturnsPositiveSize()
+    {
+        using var context = new Z3Context();
+
+        Assert.That(context.Library.GetEstimatedAllocSize(), Is.GreaterThan(0));
+    }
+
+    [Test]
+    public void Sample_WithinBudget_IsNotOverBudget()
+    {
+        using var governor = new Z3MemoryGovernor(Z3.Library, long.MaxValue, Timeout.InfiniteTimeSpan);
+        using var context = new Z3Context();
+
+        var size = governor.Sample();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(size, Is.GreaterThan(0));
+            Assert.That(governor.EstimatedAllocSize, Is.EqualTo(size));
+            Assert.That(governor.IsOverBudget, Is.False);
+        });
+    }
+
+    [Test]
+    public void Sample_OverBudget_IsOverBudget()
+    {
+        using var governor = new Z3MemoryGovernor(Z3.Library, 1, Timeout.InfiniteTimeSpan);
+        using var context = new Z3Context();
+
+        governor.Sample();
+
+        Assert.That(governor.IsOverBudget, Is.True);
+    }
+
+    [Test]
+    public void CreateContext_GovernorOverBudget_ThrowsMemoutException()
+    {
+        using var existing = new Z3Context();
+        Z3.MemoryGovernor = new Z3MemoryGovernor(Z3.Library, 1, Timeout.InfiniteTimeSpan);
+
+        var ex = Assert.Throws<Z3Exception>(() => _ = new Z3Context());
+
+        Assert.That(ex!.ErrorCode, Is.EqualTo(Z3Library.ErrorCode.Z3_MEMOUT_FAIL));
+    }
+
+    [Test]
+    public void CreateContext_GovernorWithinBudget_CreatesContext()
+    {
+        Z3.MemoryGovernor = new Z3MemoryGovernor(Z3.Library, long.MaxValue, Timeout.InfiniteTimeSpan);
+
+        using var context = new Z3Context();
+        using var solver = context.CreateSolver();
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+    }
+
+    [Test]
+    public void Gauge_ReportsInstalledGovernorOnly()
+    {
+        var measurements = new List<long>();
+        using var listener = new MeterListener();
+        listener.InstrumentPublished = (instrument, l) =>
+        {
+            if (instrument.Meter.Name == "Spaceorc.Z3Wrap" && instrument.Name == "z3.native.memory")
+                l.EnableMeasurementEvents(instrument);
+        };
+        listener.SetMeasurementEventCallback<long>((_, value, _, _) => measurements.Add(value));
+        listener.Start();
+
+        using var context = new Z3Context();
+        using (new Z3MemoryGovernor(Z3.Library, long.MaxValue, Timeout.InfiniteTimeSpan))
+        {
+            listener.RecordObservableInstruments();
+        }
+
+        Z3.MemoryGovernor = new Z3MemoryGovernor(Z3.Library, long.MaxValue, Timeout.InfiniteTimeSpan);
+        var size = Z3.MemoryGovernor.Sample();
+        listener.RecordObservableInstruments();
+
+        Assert.That(measurements, Is.EqualTo(new[] { size }));
+    }
+
+    [Test]
+    public void Constructor_NonPositiveBudget_Throws()
+    {
+        Assert.Throws<ArgumentOutOfRangeException>(() => _ = new Z3MemoryGovernor(Z3.Library, 0));
+    }
+}
@@ -0,0 +1,77 @@
+using System.Numerics;
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3ModelEnumerationTests
+{
+    [Test]
+    public void EnumerateModels_BoundedIntegers_ReturnsEveryAssignmentOnce()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        var y = context.IntConst("y");
+        solver.Assert((x >= 0) & (x < 3) & (y >= 0) & (y < 2));
+
+        var models = solver.EnumerateModels([x, y]);
+        var rows = models.ToList();
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+        var pairs = rows.Select(r => (model.GetIntValue(r[0]), model.GetIntValue(r[1]))).ToHashSet();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(rows, Has.Count.EqualTo(6));
+            Assert.That(pairs, Has.Count.EqualTo(6));
+            Assert.That(pairs, Does.Contain((new BigInteger(2), BigInteger.One)));
+            Assert.That(models.ModelCount, Is.EqualTo(6));
+            Assert.That(models.Elapsed, Is.GreaterThan(TimeSpan.Zero));
+            Assert.That(models.ModelsPerSecond, Is.GreaterThan(0));
+        });
+    }
+
+    [Test]
+    public void EnumerateModels_Projection_IgnoresOtherVariables()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var a = context.BoolConst("a");
+        var b = context.BoolConst("b");
+        var c = context.BoolConst("c");
+        solver.Assert(a | b | c);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(solver.EnumerateModels([a]).Count(), Is.EqualTo(2));
+            Assert.That(solver.EnumerateModels([a, b, c]).Count(), Is.EqualTo(7));
+        });
+    }
+
+    [Test]
+    public void EnumerateModels_Limit_StopsEarlyAndRestoresSolver()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        solver.Assert(x > 0);
+
+        var rows = solver.EnumerateModels([x], limit: 5).ToList();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(rows, Has.Count.EqualTo(5));
+            Assert.That(solver.EnumerateModels([x], limit: 5).Count(), Is.EqualTo(5));
+        });
+    }
+}
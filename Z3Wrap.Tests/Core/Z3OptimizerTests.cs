@@ -1,6 +1,8 @@
 using System.Numerics;
+using System.Text;
 using Spaceorc.Z3Wrap.Core;
 using Spaceorc.Z3Wrap.Expressions.BitVectors;
+using Spaceorc.Z3Wrap.Expressions.Logic;
 using Spaceorc.Z3Wrap.Expressions.Numerics;
 using Spaceorc.Z3Wrap.Values.BitVectors;
 
@@ -140,6 +142,218 @@ public class Z3OptimizerTests
         Assert.That(status3, Is.EqualTo(Z3Status.Satisfiable));
     }
 
+    [Test]
+    public void Pop_MultipleScopes_BacktracksAllOfThem()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var x = context.IntConst("x");
+
+        optimizer.Assert(x > 0);
+        optimizer.Push();
+        optimizer.Assert(x < 5);
+        optimizer.Push();
+        optimizer.Assert(x < 0);
+        Assert.That(optimizer.Check(), Is.EqualTo(Z3Status.Unsatisfiable));
+
+        optimizer.Pop(2);
+        optimizer.Maximize(x);
+        optimizer.Assert(x < 100);
+
+        Assert.That(optimizer.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(optimizer.GetModel().GetIntValue(x), Is.EqualTo(new BigInteger(99)));
+    }
+
+    [Test]
+    public void CheckAssumptions_ConflictingAssumptions_ReportsUnsatCore()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var x = context.IntConst("x");
+        var low = context.BoolConst("low");
+        var high = context.BoolConst("high");
+        var positive = context.BoolConst("positive");
+
+        optimizer.Assert(context.Implies(low, x < 0));
+        optimizer.Assert(context.Implies(high, x > 10));
+        optimizer.Assert(context.Implies(positive, x > 0));
+        optimizer.Minimize(x);
+
+        Assert.That(optimizer.CheckAssumptions(high, positive), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(optimizer.GetModel().GetIntValue(x), Is.EqualTo(new BigInteger(11)));
+
+        Assert.That(optimizer.CheckAssumptions(low, high, positive), Is.EqualTo(Z3Status.Unsatisfiable));
+        var core = optimizer.GetUnsatCore();
+        Assert.Multiple(() =>
+        {
+            Assert.That(core, Is.Not.Empty);
+            Assert.That(core.Select(c => c.Handle), Has.Member(low.Handle));
+        });
+    }
+
+    [Test]
+    public void GetUnsatCore_AfterSatisfiableCheck_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var flag = context.BoolConst("flag");
+
+        Assert.That(optimizer.CheckAssumptions(flag), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.Throws<InvalidOperationException>(() => optimizer.GetUnsatCore());
+    }
+
+    [Test]
+    public void AssertSoft_Batch_MinimizesTotalPenalty()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var a = context.BoolConst("a");
+        var b = context.BoolConst("b");
+        var c = context.BoolConst("c");
+
+        optimizer.Assert(!(a & b));
+        optimizer.Assert(!(b & c));
+        optimizer.AssertSoft([(a, 2L), (b, 5L), (c, 2L)], "penalties");
+
+        Assert.That(optimizer.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = optimizer.GetModel();
+        Assert.Multiple(() =>
+        {
+            Assert.That(model.GetBoolValue(a), Is.False);
+            Assert.That(model.GetBoolValue(b), Is.True);
+            Assert.That(model.GetBoolValue(c), Is.False);
+        });
+    }
+
+    [Test]
+    public void AssertSoft_EmptyBatch_Throws()
+    {
+        using var context = new Z3Context();
+        using var optimizer = context.CreateOptimizer();
+
+        Assert.Throws<ArgumentException>(() => optimizer.AssertSoft([]));
+    }
+
+    [Test]
+    public void EnumerateParetoFront_TwoObjectives_YieldsAllOptimalPoints()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var x = context.IntConst("x");
+        var y = context.IntConst("y");
+
+        optimizer.Assert(x >= 0);
+        optimizer.Assert(y >= 0);
+        optimizer.Assert(x + y <= 2);
+        var maxX = optimizer.Maximize(x);
+        var maxY = optimizer.Maximize(y);
+
+        var points = optimizer.EnumerateParetoFront([maxX, maxY]).Select(p => (p[0], p[1])).ToList();
+
+        Assert.That(
+            points,
+            Is.EquivalentTo(
+                new[]
+                {
+                    (BigInteger.Zero, new BigInteger(2)),
+                    (BigInteger.One, BigInteger.One),
+                    (new BigInteger(2), BigInteger.Zero),
+                }
+            )
+        );
+    }
+
+    [Test]
+    public void EnumerateParetoFront_WithLimit_StopsEarly()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var x = context.IntConst("x");
+        var y = context.IntConst("y");
+
+        optimizer.Assert(x >= 0);
+        optimizer.Assert(y >= 0);
+        optimizer.Assert(x + y <= 10);
+        var maxX = optimizer.Maximize(x);
+        var maxY = optimizer.Maximize(y);
+
+        var points = optimizer.EnumerateParetoFront([maxX, maxY], limit: 3).ToList();
+
+        Assert.That(points, Has.Count.EqualTo(3));
+        Assert.That(points, Has.All.Matches<BigInteger[]>(p => p[0] + p[1] == 10));
+    }
+
+    [Test]
+    public void EnumerateParetoFront_EarlyBreak_DiscardsRemainingPoints()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var x = context.IntConst("x");
+        var y = context.IntConst("y");
+
+        optimizer.Assert(x >= 0);
+        optimizer.Assert(y >= 0);
+        optimizer.Assert(x + y <= 2);
+        var maxX = optimizer.Maximize(x);
+        var maxY = optimizer.Maximize(y);
+
+        foreach (var _ in optimizer.EnumerateParetoFront([maxX, maxY]))
+            break;
+
+        var statuses = new[] { optimizer.Check(), optimizer.Check(), optimizer.Check() };
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(statuses, Has.All.EqualTo(Z3Status.Satisfiable));
+            Assert.That(optimizer.EnumerateParetoFront([maxX, maxY]).Count(), Is.EqualTo(3));
+        });
+    }
+
+    [Test]
+    public void EnumerateParetoFront_EarlyBreak_RestoresPreviousPriority()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var x = context.IntConst("x");
+        var y = context.IntConst("y");
+
+        optimizer.Assert(x >= 0);
+        optimizer.Assert(y >= 0);
+        optimizer.Assert(x + y <= 2);
+        var maxX = optimizer.Maximize(x);
+        var maxY = optimizer.Maximize(y);
+        optimizer.SetParams(new Z3Params { { "priority", "box" } });
+
+        foreach (var _ in optimizer.EnumerateParetoFront([maxX, maxY]))
+            break;
+
+        Assert.That(optimizer.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = optimizer.GetModel();
+
+        // Box priority optimizes each objective independently, which neither a Pareto point nor lex priority does
+        Assert.Multiple(() =>
+        {
+            Assert.That(model.GetIntValue(optimizer.GetUpper(maxX)), Is.EqualTo(new BigInteger(2)));
+            Assert.That(model.GetIntValue(optimizer.GetUpper(maxY)), Is.EqualTo(new BigInteger(2)));
+        });
+    }
+
     [Test]
     public void ModelInvalidation_AfterAssert_InvalidatesModel()
     {
@@ -591,4 +805,42 @@ public class Z3OptimizerTests
         Assert.That(model.GetIntValue(y), Is.EqualTo(new BigInteger(0)));
         Assert.That(model.GetIntValue(optimalValue), Is.EqualTo(new BigInteger(30)));
     }
+
+    [Test]
+    public void WriteSmtLib2_WithObjective_WritesAssertionsAndObjective()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var x = context.IntConst("x");
+        optimizer.Assert(x < 10);
+        optimizer.Maximize(x);
+
+        using var stream = new MemoryStream();
+        optimizer.WriteSmtLib2(stream);
+        var script = Encoding.UTF8.GetString(stream.ToArray());
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(script, Does.Contain("(declare-fun x () Int)"));
+            Assert.That(script, Does.Contain("(assert (< x 10))"));
+            Assert.That(script, Does.Contain("(minimize "));
+        });
+    }
+
+    [Test]
+    public void LoadSmtLib2_WithDeclarations_OptimizesLoadedConstraints()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        optimizer.LoadSmtLib2("(declare-const x Int) (assert (< x 10))"u8.ToArray(), out var declarations);
+        var x = declarations.Get<IntExpr>("x");
+        optimizer.Maximize(x);
+
+        Assert.That(optimizer.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(optimizer.GetModel().GetIntValue(x), Is.EqualTo(new BigInteger(9)));
+    }
 }
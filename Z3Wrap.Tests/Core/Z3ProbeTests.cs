@@ -0,0 +1,88 @@
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.BitVectors;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+using Spaceorc.Z3Wrap.Values.BitVectors;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3ProbeTests
+{
+    [Test]
+    public void Apply_SizeProbe_ReturnsFormulaCount()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var x = context.IntConst("x");
+        var goal = context.CreateGoal();
+        goal.Assert(x > 0);
+        goal.Assert(x < 10);
+        goal.Assert(x != 5);
+
+        Assert.That(context.CreateProbe("size").Apply(goal), Is.EqualTo(3.0));
+    }
+
+    [Test]
+    public void Operators_CombineProbes()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var x = context.IntConst("x");
+        var goal = context.CreateGoal();
+        goal.Assert(x > 0);
+        goal.Assert(x < 10);
+
+        var size = context.CreateProbe("size");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That((size > 1).Apply(goal), Is.EqualTo(1.0));
+            Assert.That((size < 1).Apply(goal), Is.EqualTo(0.0));
+            Assert.That((size >= 2 & size <= 2).Apply(goal), Is.EqualTo(1.0));
+            Assert.That((size > 5 | size.Eq(2)).Apply(goal), Is.EqualTo(1.0));
+            Assert.That((!(size > 1)).Apply(goal), Is.EqualTo(0.0));
+            Assert.That((size < Z3Probe.Const(context, 3)).Apply(goal), Is.EqualTo(1.0));
+        });
+    }
+
+    [Test]
+    public void Apply_LogicProbe_DetectsBitVectorGoal()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var bv = context.BvConst<Size8>("bv");
+        var bvGoal = context.CreateGoal();
+        bvGoal.Assert(bv + 1 == 8);
+
+        var x = context.IntConst("x");
+        var intGoal = context.CreateGoal();
+        intGoal.Assert(x + 1 == 8);
+
+        var isQfbv = context.CreateProbe("is-qfbv");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(isQfbv.Apply(bvGoal), Is.EqualTo(1.0));
+            Assert.That(isQfbv.Apply(intGoal), Is.EqualTo(0.0));
+        });
+    }
+
+    [Test]
+    public void CreateProbe_UnknownName_Throws()
+    {
+        using var context = new Z3Context();
+
+        Assert.Throws<Z3Exception>(() => context.CreateProbe("no-such-probe"));
+    }
+
+    [Test]
+    public void GetProbeNames_ContainsBuiltInProbes()
+    {
+        using var context = new Z3Context();
+
+        Assert.That(context.GetProbeNames(), Does.Contain("size").And.Contain("is-qfbv"));
+    }
+}
@@ -1,3 +1,4 @@
+using System.Text;
 using Spaceorc.Z3Wrap.Core;
 using Spaceorc.Z3Wrap.Expressions.Logic;
 using Spaceorc.Z3Wrap.Expressions.Numerics;
@@ -250,4 +251,39 @@ public class Z3SolverProofTests
             Assert.That(proof, Does.Contain("false"));
         });
     }
+
+    [Test]
+    public void WriteProof_SimpleContradiction_WritesProof()
+    {
+        using var context = new Z3Context(ProofParams);
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+
+        solver.Assert(x > 10);
+        solver.Assert(x < 5);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Unsatisfiable));
+
+        using var stream = new MemoryStream();
+        solver.WriteProof(stream);
+        var proof = Encoding.UTF8.GetString(stream.ToArray());
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(proof, Does.Contain("asserted"));
+            Assert.That(proof.Count(c => c == '('), Is.EqualTo(proof.Count(c => c == ')')));
+        });
+    }
+
+    [Test]
+    public void WriteProof_WithoutCheck_ThrowsInvalidOperationException()
+    {
+        using var context = new Z3Context(ProofParams);
+        using var solver = context.CreateSolver();
+        using var stream = new MemoryStream();
+
+        Assert.Throws<InvalidOperationException>(() => solver.WriteProof(stream));
+    }
 }
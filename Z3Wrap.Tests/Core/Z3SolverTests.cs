@@ -1,5 +1,7 @@
 using System.Numerics;
+using System.Text;
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Functions;
 using Spaceorc.Z3Wrap.Expressions.Logic;
 using Spaceorc.Z3Wrap.Expressions.Numerics;
 
@@ -227,4 +229,108 @@ public class Z3SolverTests
         // Last parameter wins - model=false returns default value 0, not actual solution 50
         Assert.That(model.GetIntValue(x), Is.EqualTo(new BigInteger(0)));
     }
+
+    [Test]
+    public void WriteSmtLib2_SharedSubterms_WritesLetBindingsAndDeclarations()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        var y = context.IntConst("y");
+        var f = context.Func<IntExpr, IntExpr>("f");
+        var shared = f.Apply(x + y);
+        solver.Assert(shared * shared == context.Ite(x > y, shared, y));
+
+        using var stream = new MemoryStream();
+        solver.WriteSmtLib2(stream);
+        var script = Encoding.UTF8.GetString(stream.ToArray());
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(script, Does.Contain("(declare-fun x () Int)"));
+            Assert.That(script, Does.Contain("(declare-fun f (Int) Int)"));
+            Assert.That(script, Does.Contain("(let ((z3w!1 (f (+ x y))))"));
+            Assert.That(script, Does.Contain("(ite (> x y) z3w!1 y)"));
+        });
+    }
+
+    [Test]
+    public void WriteSmtLib2_Unsatisfiable_RoundTripsThroughParser()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+        using var parsed = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        var sum = x + x;
+        solver.Assert(sum * sum > 100);
+        solver.Assert(sum < 5);
+        solver.Assert(sum > -5);
+
+        using var stream = new MemoryStream();
+        solver.WriteSmtLib2(stream);
+        context.Library.SolverFromString(context.Handle, parsed.Handle, Encoding.UTF8.GetString(stream.ToArray()));
+
+        Assert.That(parsed.Check(), Is.EqualTo(Z3Status.Unsatisfiable));
+    }
+
+    [Test]
+    public void LoadSmtLib2_Memory_LoadsAssertions()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        solver.LoadSmtLib2("(declare-const x Int) (assert (> x 10)) (assert (< x 5))"u8.ToArray());
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Unsatisfiable));
+    }
+
+    [Test]
+    public void LoadSmtLib2_File_LoadsAssertions()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+        var path = Path.GetTempFileName();
+        try
+        {
+            File.WriteAllText(path, "(declare-const x Int) (assert (> x 10)) (assert (< x 5))");
+
+            solver.LoadSmtLib2(path);
+
+            Assert.That(solver.Check(), Is.EqualTo(Z3Status.Unsatisfiable));
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+
+    [Test]
+    public void LoadSmtLib2_WithDeclarations_ReturnsTypedConstants()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        solver.LoadSmtLib2(
+            "(declare-const x Int) (declare-const b Bool) (assert (= x 42)) (assert b)"u8.ToArray(),
+            out var declarations
+        );
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+        Assert.Multiple(() =>
+        {
+            Assert.That(declarations.Count, Is.EqualTo(2));
+            Assert.That(model.GetIntValue(declarations.Get<IntExpr>("x")), Is.EqualTo(new BigInteger(42)));
+            Assert.That(model.GetBoolValue(declarations.Get<BoolExpr>("b")), Is.True);
+            Assert.That(declarations.TryGet<BoolExpr>("x", out _), Is.False);
+            Assert.Throws<KeyNotFoundException>(() => declarations.Get<IntExpr>("missing"));
+        });
+    }
 }
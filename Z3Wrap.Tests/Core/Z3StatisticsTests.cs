@@ -0,0 +1,141 @@
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3StatisticsTests
+{
+    [Test]
+    public void GetStatistics_AfterCheck_ReturnsNonEmptySnapshot()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        solver.Assert(x > 10);
+        solver.Check();
+
+        var stats = solver.GetStatistics();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(stats.Count, Is.GreaterThan(0));
+            Assert.That(stats.Keys.Count(), Is.EqualTo(stats.Count));
+            Assert.That(stats.GetKey(0), Is.Not.Empty);
+        });
+    }
+
+    [Test]
+    public void GetStatistics_DistinguishesIntegerAndFloatingPointValues()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        solver.Assert(context.IntConst("x") > 10);
+        solver.Check();
+
+        var stats = solver.GetStatistics();
+        var integral = Enumerable.Range(0, stats.Count).Select(stats.IsInteger).ToList();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(integral, Has.Some.True);
+            Assert.That(integral, Has.Some.False);
+            Assert.That(stats.IsInteger(stats.Keys.ToList().IndexOf("memory")), Is.False);
+        });
+    }
+
+    [Test]
+    public void Indexer_ExistingKey_MatchesTryGetValue()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        solver.Assert(context.IntConst("x") > 10);
+        solver.Check();
+
+        var stats = solver.GetStatistics();
+        var key = stats.GetKey(0);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(stats.ContainsKey(key), Is.True);
+            Assert.That(stats.TryGetValue(key, out var value), Is.True);
+            Assert.That(stats[key], Is.EqualTo(value));
+            Assert.That(stats[key], Is.EqualTo(stats.GetValue(0)));
+        });
+    }
+
+    [Test]
+    public void Indexer_MissingKey_ThrowsKeyNotFoundException()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var stats = solver.GetStatistics();
+
+        Assert.Multiple(() =>
+        {
+            Assert.Throws<KeyNotFoundException>(() => _ = stats["no such statistic"]);
+            Assert.That(stats.TryGetValue("no such statistic", out _), Is.False);
+        });
+    }
+
+    [Test]
+    public void GetStatistics_TwoSnapshots_ShareInternedKeys()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        solver.Assert(context.IntConst("x") > 10);
+        solver.Check();
+
+        var first = solver.GetStatistics();
+        var second = solver.GetStatistics();
+
+        Assert.That(second.GetKey(0), Is.SameAs(first.GetKey(0)));
+    }
+
+    [Test]
+    public void Diff_SameSnapshot_ReturnsZeroValues()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        solver.Assert(context.IntConst("x") > 10);
+        solver.Check();
+
+        var stats = solver.GetStatistics();
+        var diff = stats.Diff(stats);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(diff.Count, Is.EqualTo(stats.Count));
+            Assert.That(diff.Values, Is.All.EqualTo(0.0));
+        });
+    }
+
+    [Test]
+    public void GetStatistics_Optimizer_ReturnsSnapshot()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var optimizer = context.CreateOptimizer();
+
+        var x = context.IntConst("x");
+        optimizer.Assert(x < 10);
+        optimizer.Maximize(x);
+        optimizer.Check();
+
+        var stats = optimizer.GetStatistics();
+
+        Assert.That(stats.Count, Is.GreaterThan(0));
+    }
+}
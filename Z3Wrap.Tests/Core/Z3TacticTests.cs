@@ -0,0 +1,221 @@
+using System.Numerics;
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.BitVectors;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+using Spaceorc.Z3Wrap.Values.BitVectors;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3TacticTests
+{
+    [Test]
+    public void Apply_Smt_DecidesGoals()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var x = context.IntConst("x");
+        var sat = context.CreateGoal();
+        sat.Assert(x > 0);
+        var unsat = context.CreateGoal();
+        unsat.Assert(x > 0);
+        unsat.Assert(x < 0);
+
+        var smt = context.CreateTactic("smt");
+        var satResult = smt.Apply(sat);
+        var unsatResult = smt.Apply(unsat);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(satResult, Has.Length.EqualTo(1));
+            Assert.That(satResult[0].IsDecidedSat, Is.True);
+            Assert.That(unsatResult, Has.Length.EqualTo(1));
+            Assert.That(unsatResult[0].IsDecidedUnsat, Is.True);
+        });
+    }
+
+    [Test]
+    public void Then_AppliesTacticsInSequence()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var x = context.IntConst("x");
+        var y = context.IntConst("y");
+        var goal = context.CreateGoal();
+        goal.Assert(x == y + 1);
+        goal.Assert(y == 2);
+        goal.Assert(x > 0);
+
+        var pipeline = context.CreateTactic("simplify").Then(context.CreateTactic("solve-eqs"));
+        var subgoals = pipeline.Apply(goal);
+
+        Assert.That(subgoals, Has.Length.EqualTo(1));
+        Assert.That(subgoals[0].Size, Is.LessThan(goal.Size));
+    }
+
+    [Test]
+    public void OrElse_FailingTactic_UsesFallback()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var x = context.IntConst("x");
+        var goal = context.CreateGoal();
+        goal.Assert(x > 0);
+
+        var tactic = context.CreateTactic("fail").OrElse(context.CreateTactic("smt"));
+
+        Assert.That(tactic.Apply(goal)[0].IsDecidedSat, Is.True);
+    }
+
+    [Test]
+    public void Apply_FailingTactic_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var goal = context.CreateGoal();
+        goal.Assert(context.IntConst("x") > 0);
+
+        Assert.Throws<Z3Exception>(() => context.CreateTactic("fail").Apply(goal));
+    }
+
+    [Test]
+    public void When_ProbeDoesNotHold_LeavesGoalUnchanged()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var x = context.IntConst("x");
+        var goal = context.CreateGoal();
+        goal.Assert(x > 0);
+
+        var tactic = context.CreateTactic("fail").When(context.CreateProbe("size") > 100);
+        var subgoals = tactic.Apply(goal);
+
+        Assert.That(subgoals, Has.Length.EqualTo(1));
+        Assert.That(subgoals[0].Size, Is.EqualTo(1u));
+    }
+
+    [Test]
+    public void Cond_DispatchesOnProbe()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var bv = context.BvConst<Size8>("bv");
+        var goal = context.CreateGoal();
+        goal.Assert(bv + 1 == 8);
+
+        var bitBlast = context
+            .CreateTactic("simplify")
+            .Then(context.CreateTactic("bit-blast"))
+            .Then(context.CreateTactic("sat"));
+        var tactic = Z3Tactic.Cond(context.CreateProbe("is-qfbv"), bitBlast, context.CreateTactic("fail"));
+
+        Assert.That(tactic.Apply(goal)[0].IsDecidedSat, Is.True);
+    }
+
+    [Test]
+    public void ParOr_ReturnsFirstSuccessfulResult()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var x = context.IntConst("x");
+        var goal = context.CreateGoal();
+        goal.Assert(x * x == 16);
+        goal.Assert(x < 0);
+
+        var tactic = Z3Tactic.ParOr(context.CreateTactic("fail"), context.CreateTactic("smt"));
+
+        Assert.That(tactic.Apply(goal)[0].IsDecidedSat, Is.True);
+    }
+
+    [Test]
+    public void ParOr_NoTactics_Throws()
+    {
+        Assert.Throws<ArgumentException>(() => Z3Tactic.ParOr());
+    }
+
+    [Test]
+    public void TryFor_Repeat_AndUsingParams_CreateTactics()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var p = context.BoolConst("p");
+        var q = context.BoolConst("q");
+        var goal = context.CreateGoal();
+        goal.Assert(p & q);
+
+        var tactic = context
+            .CreateTactic("simplify")
+            .UsingParams(new Z3Params { { "elim_and", true } })
+            .Repeat(3)
+            .Then(context.CreateTactic("smt").TryFor(TimeSpan.FromSeconds(10)));
+
+        Assert.That(tactic.Apply(goal)[0].IsDecidedSat, Is.True);
+    }
+
+    [Test]
+    public void TryFor_TimeoutOutOfRange_Throws()
+    {
+        using var context = new Z3Context();
+
+        var tactic = context.CreateTactic("smt");
+
+        Assert.Multiple(() =>
+        {
+            Assert.Throws<ArgumentOutOfRangeException>(() => tactic.TryFor(TimeSpan.FromMilliseconds(-1)));
+            Assert.Throws<ArgumentOutOfRangeException>(() => tactic.TryFor(Timeout.InfiniteTimeSpan));
+            Assert.Throws<ArgumentOutOfRangeException>(() => tactic.TryFor(TimeSpan.FromDays(60)));
+        });
+    }
+
+    [Test]
+    public void CreateSolver_WithTactic_SolvesConstraints()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var tactic = context
+            .CreateTactic("simplify")
+            .Then(context.CreateTactic("bit-blast"))
+            .Then(context.CreateTactic("sat"));
+        using var solver = context.CreateSolver(tactic);
+
+        var bv = context.BvConst<Size8>("bv");
+        solver.Assert(bv + 1 == 8);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(solver.GetModel().GetBv(bv).Value, Is.EqualTo(new BigInteger(7)));
+    }
+
+    [Test]
+    public void CreateTactic_UnknownName_Throws()
+    {
+        using var context = new Z3Context();
+
+        Assert.Throws<Z3Exception>(() => context.CreateTactic("no-such-tactic"));
+    }
+
+    [Test]
+    public void GetTacticNames_ContainsBuiltInTactics()
+    {
+        using var context = new Z3Context();
+
+        Assert.That(context.GetTacticNames(), Does.Contain("simplify").And.Contain("smt"));
+    }
+
+    [Test]
+    public void GetHelp_DescribesParameters()
+    {
+        using var context = new Z3Context();
+
+        Assert.That(context.CreateTactic("simplify").GetHelp(), Is.Not.Empty);
+    }
+}
@@ -0,0 +1,148 @@
+using System.Numerics;
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Common;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+using Spaceorc.Z3Wrap.Expressions.Quantifiers;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3TemplateTests
+{
+    [Test]
+    public void Instantiate_SubstitutesPlaceholders()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var template = context.Template(p =>
+        {
+            var x = p.Param<IntExpr>();
+            var lo = p.Param<IntExpr>();
+            return (x >= lo) & (x < lo + 10);
+        });
+
+        var y = context.IntConst("y");
+        var instance = template.Instantiate(y, context.Int(5));
+
+        solver.Assert(instance);
+        solver.Assert(y > 13);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(template.ParameterCount, Is.EqualTo(2));
+            Assert.That(instance.ToString(), Does.Not.Contain(":var"));
+            Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+            Assert.That(solver.GetModel().GetIntValue(y), Is.EqualTo(new BigInteger(14)));
+        });
+    }
+
+    [Test]
+    public void Instantiate_UsedInSolver_ConstrainsValues()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var template = context.Template(p => p.Param<IntExpr>() == p.Param<IntExpr>() * 2);
+        var a = context.IntConst("a");
+        var b = context.IntConst("b");
+
+        solver.Assert(template.Instantiate(a, b));
+        solver.Assert(b == 21);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(solver.GetModel().GetIntValue(a), Is.EqualTo(new BigInteger(42)));
+    }
+
+    [Test]
+    public void Instantiate_QuantifiedBody_DoesNotCapturePlaceholders()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        var template = context.Template(p =>
+        {
+            var n = p.Param<IntExpr>();
+            return context.ForAll(x, (x == n).Implies(x > 0));
+        });
+
+        solver.Assert(template.Instantiate(context.Int(5)));
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+    }
+
+    [Test]
+    public void InstantiateMany_CreatesOneInstancePerRow()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var template = context.Template(p => p.Param<IntExpr>() > p.Param<IntExpr>());
+        var xs = context.IntConsts("x", 3);
+
+        var instances = template.InstantiateMany([xs[0], context.Int(1), xs[1], xs[0], xs[2], xs[1]]);
+        foreach (var instance in instances)
+            solver.Assert(instance);
+        solver.Assert(xs[2] <= 4);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(instances, Has.Length.EqualTo(3));
+            Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+            Assert.That(solver.GetModel().GetIntValue(xs[2]), Is.EqualTo(new BigInteger(4)));
+        });
+    }
+
+    [Test]
+    public void Instantiate_WrongCount_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var template = context.Template(p => p.Param<BoolExpr>() | p.Param<BoolExpr>());
+
+        Assert.Throws<ArgumentException>(() => template.Instantiate(context.True()));
+    }
+
+    [Test]
+    public void Instantiate_WrongSort_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var template = context.Template(p => !p.Param<BoolExpr>());
+
+        var ex = Assert.Throws<ArgumentException>(() => template.Instantiate(context.Int(1)));
+        Assert.That(ex.ParamName, Is.EqualTo("values"));
+    }
+
+    [Test]
+    public void InstantiateMany_PartialRow_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var template = context.Template(p => p.Param<BoolExpr>() & p.Param<BoolExpr>());
+
+        Assert.Throws<ArgumentException>(() =>
+            template.InstantiateMany([context.True(), context.False(), context.True()])
+        );
+    }
+
+    [Test]
+    public void InstantiateMany_NoPlaceholders_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var template = context.Template(_ => context.True());
+
+        Assert.Throws<InvalidOperationException>(() => template.InstantiateMany([]));
+    }
+}
@@ -0,0 +1,103 @@
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3TrackedSolverTests
+{
+    [Test]
+    public void Check_ConflictingGroups_ReportsLabelsInCore()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+        var tracked = new Z3TrackedSolver<string>(solver);
+
+        var x = context.IntConst("x");
+        tracked.AssertAndTrack(x > 10, "lower");
+        tracked.AssertAndTrack(x < 5, "upper");
+        tracked.AssertAndTrack(x != 0, "nonzero");
+
+        Assert.That(tracked.Check(), Is.EqualTo(Z3Status.Unsatisfiable));
+        Assert.That(tracked.GetUnsatCore(), Is.EquivalentTo(new[] { "lower", "upper" }));
+    }
+
+    [Test]
+    public void GetUnsatCore_AfterForeignAssumptionsCheck_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+        var tracked = new Z3TrackedSolver<string>(solver);
+
+        var x = context.IntConst("x");
+        var p = context.BoolConst("p");
+        tracked.AssertAndTrack(x > 10, "lower");
+        solver.Assert(x > 10);
+        solver.Assert(context.Implies(p, x < 5));
+
+        Assert.That(solver.CheckAssumptions(p), Is.EqualTo(Z3Status.Unsatisfiable));
+        Assert.Throws<InvalidOperationException>(() => tracked.GetUnsatCore());
+    }
+
+    [Test]
+    public void Disable_Group_RemovesItsConstraintsUntilEnabled()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+        var tracked = new Z3TrackedSolver<int>(solver);
+
+        var x = context.IntConst("x");
+        tracked.AssertAndTrack(x > 10, 1);
+        tracked.AssertAndTrack(x < 5, 2);
+        tracked.AssertAndTrack(x < 3, 2);
+
+        tracked.Disable(2);
+        Assert.Multiple(() =>
+        {
+            Assert.That(tracked.IsEnabled(2), Is.False);
+            Assert.That(tracked.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        });
+
+        tracked.Enable(2);
+        Assert.That(tracked.Check(), Is.EqualTo(Z3Status.Unsatisfiable));
+
+        tracked.Disable(1);
+        Assert.Multiple(() =>
+        {
+            Assert.That(tracked.Check(), Is.EqualTo(Z3Status.Satisfiable));
+            Assert.That(tracked.GroupCount, Is.EqualTo(2));
+        });
+    }
+
+    [Test]
+    public void AssertAndTrack_BeyondPool_DeclaresMoreIndicators()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+        var tracked = new Z3TrackedSolver<int>(solver, poolSize: 2);
+
+        var x = context.IntConst("x");
+        for (var i = 0; i < 10; i++)
+            tracked.AssertAndTrack(x != i, i);
+        tracked.AssertAndTrack(x >= 0, 100);
+        tracked.AssertAndTrack(x < 10, 101);
+
+        Assert.That(tracked.Check(), Is.EqualTo(Z3Status.Unsatisfiable));
+        Assert.That(tracked.GetUnsatCore(), Has.Length.EqualTo(12));
+    }
+
+    [Test]
+    public void Enable_UnknownLabel_Throws()
+    {
+        using var context = new Z3Context();
+        using var solver = context.CreateSolver();
+        var tracked = new Z3TrackedSolver<string>(solver);
+
+        Assert.Throws<ArgumentException>(() => tracked.Enable("missing"));
+    }
+}
@@ -0,0 +1,117 @@
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+
+namespace Z3Wrap.Tests.Core;
+
+[TestFixture]
+public class Z3UnsatCoreEngineTests
+{
+    [TestCase(Z3CoreMinimization.Deletion)]
+    [TestCase(Z3CoreMinimization.QuickXplain)]
+    public void Minimize_RedundantAssumptions_ReturnsMinimalSubset(Z3CoreMinimization strategy)
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        var y = context.IntConst("y");
+        BoolExpr[] assumptions = [x > 10, y > 0, x < 20, y < 100, x < 5, x > 7];
+
+        var engine = new Z3UnsatCoreEngine(solver, assumptions);
+        var core = engine.Minimize(strategy);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(core, Has.Length.EqualTo(2));
+            Assert.That(core, Does.Contain(assumptions[4]));
+            Assert.That(engine.CheckCount, Is.GreaterThan(1));
+            Assert.That(engine.CheckTime, Is.GreaterThanOrEqualTo(TimeSpan.Zero));
+        });
+        Assert.That(solver.CheckAssumptions(core), Is.EqualTo(Z3Status.Unsatisfiable));
+    }
+
+    [Test]
+    public void Minimize_SatisfiableAssumptions_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        var engine = new Z3UnsatCoreEngine(solver, [x > 0, x < 10]);
+
+        Assert.Throws<InvalidOperationException>(() => engine.Minimize());
+    }
+
+    [Test]
+    public void Enumerate_TwoConflicts_FindsAllSubsets()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        var a = x > 10;
+        var b = x < 5;
+        var c = x < 8;
+        var engine = new Z3UnsatCoreEngine(solver, [a, b, c]);
+
+        var subsets = engine.Enumerate().ToList();
+        var unsatisfiable = subsets
+            .Where(s => s.Kind == Z3SubsetKind.MinimalUnsatisfiableSubset)
+            .Select(s => s.Assumptions)
+            .ToList();
+        var corrections = subsets
+            .Where(s => s.Kind == Z3SubsetKind.MinimalCorrectionSet)
+            .Select(s => s.Assumptions)
+            .ToList();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(unsatisfiable, Has.Count.EqualTo(2));
+            Assert.That(unsatisfiable, Has.One.EquivalentTo(new[] { a, b }));
+            Assert.That(unsatisfiable, Has.One.EquivalentTo(new[] { a, c }));
+            Assert.That(corrections, Has.Count.EqualTo(2));
+            Assert.That(corrections, Has.One.EquivalentTo(new[] { a }));
+            Assert.That(corrections, Has.One.EquivalentTo(new[] { b, c }));
+        });
+    }
+
+    [Test]
+    public void Enumerate_DuplicateAssumptions_TreatsThemAsOne()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        var engine = new Z3UnsatCoreEngine(solver, [x < 0, x > 0, x < 0]);
+
+        var subsets = engine.Enumerate().ToList();
+        var unsatisfiable = subsets.Where(s => s.Kind == Z3SubsetKind.MinimalUnsatisfiableSubset).ToList();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(engine.Assumptions, Has.Count.EqualTo(3));
+            Assert.That(subsets, Has.Count.EqualTo(3));
+            Assert.That(unsatisfiable, Has.Count.EqualTo(1));
+            Assert.That(unsatisfiable[0].Assumptions, Has.Length.EqualTo(2));
+            Assert.That(engine.Minimize(), Has.Length.EqualTo(2));
+        });
+    }
+
+    [Test]
+    public void Enumerate_SatisfiableAssumptions_YieldsNothing()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        var engine = new Z3UnsatCoreEngine(solver, [x > 0, x < 10]);
+
+        Assert.That(engine.Enumerate(), Is.Empty);
+    }
+}
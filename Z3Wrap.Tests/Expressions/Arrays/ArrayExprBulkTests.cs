@@ -0,0 +1,103 @@
+using System.Numerics;
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Arrays;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+
+namespace Z3Wrap.Tests.Expressions.Arrays;
+
+[TestFixture]
+public class ArrayExprBulkTests
+{
+    [Test]
+    public void ArrayFrom_Entries_SelectsStoredAndDefaultValues()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var array = context.ArrayFrom<IntExpr, IntExpr>(
+            [(context.Int(1), context.Int(10)), (context.Int(5), context.Int(50)), (context.Int(1), context.Int(11))],
+            context.Int(-1)
+        );
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+        Assert.Multiple(() =>
+        {
+            Assert.That(model.GetIntValue(array[1]), Is.EqualTo(new BigInteger(11)));
+            Assert.That(model.GetIntValue(array[5]), Is.EqualTo(new BigInteger(50)));
+            Assert.That(model.GetIntValue(array[2]), Is.EqualTo(new BigInteger(-1)));
+        });
+    }
+
+    [Test]
+    public void ArrayFrom_Values_StoresAtPositions()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var values = Enumerable.Range(0, 100).Select(i => context.Int(i * i)).ToArray();
+        var array = context.ArrayFrom<IntExpr>(values, context.Int(0));
+        var i = context.IntConst("i");
+
+        solver.Assert(array[i] == 49);
+        solver.Assert(i > 0);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(solver.GetModel().GetIntValue(i), Is.EqualTo(new BigInteger(7)));
+    }
+
+    [Test]
+    public void GetArrayValues_ConstrainedArray_ReturnsEntriesAndDefault()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var array = context.ArrayConst<IntExpr, BoolExpr>("arr");
+        solver.Assert(array[3]);
+        solver.Assert(!array[4]);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+        var (entries, defaultValue) = model.GetArrayValues(array);
+
+        var table = new Dictionary<BigInteger, bool>();
+        foreach (var (index, value) in entries)
+            table[model.GetIntValue(index)] = model.GetBoolValue(value);
+        var fallback = model.GetBoolValue(defaultValue);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(table.GetValueOrDefault(3, fallback), Is.True);
+            Assert.That(table.GetValueOrDefault(4, fallback), Is.False);
+        });
+    }
+
+    [Test]
+    public void GetArrayValues_ArrayFrom_RoundTrips()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var array = context.ArrayFrom<IntExpr>([context.Int(7), context.Int(8), context.Int(9)], context.Int(0));
+        var copy = context.ArrayConst<IntExpr, IntExpr>("copy");
+        solver.Assert(copy == array);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+        var (entries, defaultValue) = model.GetArrayValues(copy);
+
+        var table = entries.ToDictionary(e => model.GetIntValue(e.Index), e => model.GetIntValue(e.Value));
+        var fallback = model.GetIntValue(defaultValue);
+        Assert.Multiple(() =>
+        {
+            Assert.That(table.GetValueOrDefault(0, fallback), Is.EqualTo(new BigInteger(7)));
+            Assert.That(table.GetValueOrDefault(2, fallback), Is.EqualTo(new BigInteger(9)));
+            Assert.That(table.GetValueOrDefault(3, fallback), Is.EqualTo(BigInteger.Zero));
+        });
+    }
+}
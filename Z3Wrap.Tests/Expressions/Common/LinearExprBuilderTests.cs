@@ -0,0 +1,113 @@
+using System.Numerics;
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Common;
+using Spaceorc.Z3Wrap.Expressions.Numerics;
+using Spaceorc.Z3Wrap.Values.Numerics;
+
+namespace Z3Wrap.Tests.Expressions.Common;
+
+[TestFixture]
+public class LinearExprBuilderTests
+{
+    [Test]
+    public void Build_IntTerms_EmitsSingleFlatSum()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var vars = Enumerable.Range(0, 50).Select(i => context.IntConst($"x{i}")).ToArray();
+        var builder = new LinearExprBuilder<IntExpr>(context);
+        for (var i = 0; i < vars.Length; i++)
+            builder.Add(i + 1, vars[i]);
+
+        var sum = builder.Build();
+
+        Assert.That(context.Library.GetAppNumArgs(context.Handle, sum.Handle), Is.EqualTo(50u));
+
+        foreach (var v in vars)
+            solver.Assert(v == 1);
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(solver.GetModel().GetIntValue(sum), Is.EqualTo(new BigInteger(50 * 51 / 2)));
+    }
+
+    [Test]
+    public void Add_DuplicateVariable_MergesCoefficients()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+        var y = context.IntConst("y");
+        var builder = new LinearExprBuilder<IntExpr>(context).Add(2, x).Add(y).Add(3, x).AddConstant(4);
+
+        var sum = builder.Build();
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(builder.Count, Is.EqualTo(2));
+            Assert.That(context.Library.GetAppNumArgs(context.Handle, sum.Handle), Is.EqualTo(3u));
+        });
+
+        solver.Assert(x == 1);
+        solver.Assert(y == 10);
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(solver.GetModel().GetIntValue(sum), Is.EqualTo(new BigInteger(19)));
+    }
+
+    [Test]
+    public void Build_CancelledTerms_ReturnsConstant()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.IntConst("x");
+
+        var sum = new LinearExprBuilder<IntExpr>(context).Add(x).Add(-1, x).Build();
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(solver.GetModel().GetIntValue(sum), Is.EqualTo(BigInteger.Zero));
+    }
+
+    [Test]
+    public void Add_FractionalCoefficientForInt_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var builder = new LinearExprBuilder<IntExpr>(context);
+
+        Assert.Throws<ArgumentException>(() => builder.Add(new Real(1, 2), context.IntConst("x")));
+    }
+
+    [Test]
+    public void Sum_RealCoefficients_ComputesCorrectResult()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var x = context.RealConst("x");
+        var y = context.RealConst("y");
+
+        var sum = context.Sum<RealExpr>([new Real(1, 2), new Real(-3, 4)], [x, y]);
+
+        solver.Assert(x == context.Real(3));
+        solver.Assert(y == context.Real(2));
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(solver.GetModel().GetRealValue(sum), Is.EqualTo(new Real(0)));
+    }
+
+    [Test]
+    public void Sum_MismatchedLengths_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        var x = context.IntConst("x");
+
+        Assert.Throws<ArgumentException>(() => context.Sum<IntExpr>([1, 2], [x]));
+    }
+}
@@ -478,6 +478,78 @@ public class FpExprCreationTests
         });
     }
 
+    [Test]
+    public void GetFpBits_Float32_MatchesIeeeBits()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var expr = context.Fp<Float32>(-3.14f);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+
+        Assert.That(model.GetFpBits(expr), Is.EqualTo((ulong)BitConverter.SingleToUInt32Bits(-3.14f)));
+    }
+
+    [Test]
+    public void GetDoubleValues_Batch_ReturnsExactBits()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        double[] expected = [1.0, -0.0, double.Epsilon, double.MaxValue, -123.456];
+        var exprs = expected.Select(value => context.Fp<Float64>(value)).ToArray();
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+
+        var values = new double[exprs.Length];
+        model.GetDoubleValues(exprs, values);
+
+        Assert.That(
+            values.Select(BitConverter.DoubleToInt64Bits),
+            Is.EqualTo(expected.Select(BitConverter.DoubleToInt64Bits))
+        );
+    }
+
+    [Test]
+    public void GetFloatValues_DestinationTooShort_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var exprs = new[] { context.Fp<Float32>(1.0), context.Fp<Float32>(2.0) };
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+
+        var ex = Assert.Throws<ArgumentException>(() => model.GetFloatValues(exprs, new float[1]));
+        Assert.That(ex.ParamName, Is.EqualTo("values"));
+    }
+
+    [Test]
+    public void GetFpBits_FormatWiderThan64Bits_Throws()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var expr = context.Fp<Float128>(1.0);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+
+        Assert.Multiple(() =>
+        {
+            Assert.Throws<NotSupportedException>(() => model.GetFpBits(expr));
+            Assert.That(model.GetFpComponents(expr), Is.EqualTo((false, 16383UL, 0UL)));
+        });
+    }
+
     [Test]
     public void FpFromComponents_Float32_PositiveValue()
     {
@@ -829,4 +901,11 @@ public class FpExprCreationTests
         var model = solver.GetModel();
         Assert.That(model.GetFloatValue(implicitExpr), Is.EqualTo(value));
     }
+
+    private struct Float128 : IFloatFormat
+    {
+        public static uint ExponentBits => 15;
+
+        public static uint SignificandBits => 113;
+    }
 }
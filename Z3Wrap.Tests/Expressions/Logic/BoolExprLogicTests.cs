@@ -114,6 +114,24 @@ public class BoolExprLogicTests
         });
     }
 
+    [Test]
+    public void And_ManyValuesFromLazySequence_ComputesCorrectResult()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        // More operands than the stack buffer holds, from a sequence without a known count
+        var operands = Enumerable.Range(0, 100).Select(i => context.Bool(i != 99));
+        var result = context.And(operands);
+
+        var status = solver.Check();
+        Assert.That(status, Is.EqualTo(Z3Status.Satisfiable));
+
+        var model = solver.GetModel();
+        Assert.That(model.GetBoolValue(result), Is.False);
+    }
+
     [TestCase(true, true, true)]
     [TestCase(true, false, true)]
     [TestCase(false, true, true)]
@@ -1,7 +1,9 @@
 using System.Numerics;
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.BitVectors;
 using Spaceorc.Z3Wrap.Expressions.Numerics;
 using Spaceorc.Z3Wrap.Expressions.Sequences;
+using Spaceorc.Z3Wrap.Values.BitVectors;
 
 namespace Z3Wrap.Tests.Expressions.Sequences;
 
@@ -163,4 +165,73 @@ public class SeqExprFactoryTests
 
         Assert.Throws<ArgumentException>(() => context.SeqConcat<IntExpr>());
     }
+
+    [Test]
+    public void Seq_FromSpanAndList_BuildSameSequence()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+
+        IntExpr[] elements = [context.Int(1), context.Int(2), context.Int(3)];
+        var fromSpan = context.Seq<IntExpr>(elements.AsSpan());
+        var fromArray = context.Seq(elements);
+        var fromList = context.Seq(elements.ToList());
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(fromArray.Handle, Is.EqualTo(fromSpan.Handle));
+            Assert.That(fromList.Handle, Is.EqualTo(fromSpan.Handle));
+            Assert.That(context.Seq<IntExpr>([context.Int(7)]).ToString(), Is.EqualTo("(seq.unit 7)"));
+        });
+    }
+
+    [Test]
+    public void Seq_FromIntegerValues_GetSeqValuesRoundTrips()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        BigInteger[] values = [5, -3, BigInteger.Pow(10, 30), 0];
+        var seq = context.Seq(values);
+        var copy = context.SeqConst<IntExpr>("copy");
+        solver.Assert(copy == seq);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+        var elements = model.GetSeqValues(copy);
+
+        Assert.That(elements.Select(model.GetIntValue), Is.EqualTo(values));
+    }
+
+    [Test]
+    public void Seq_FromBitVectorValues_StoresValues()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        Bv<Size8>[] values = [1, 255, 16];
+        var seq = context.Seq<Size8>(values);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        var model = solver.GetModel();
+        var elements = model.GetSeqValues(seq);
+
+        Assert.That(elements.Select(e => model.GetBv(e)), Is.EqualTo(values));
+    }
+
+    [Test]
+    public void GetSeqValues_EmptySequence_ReturnsEmptyArray()
+    {
+        using var context = new Z3Context();
+        using var scope = context.SetUp();
+        using var solver = context.CreateSolver();
+
+        var seq = context.SeqConst<IntExpr>("s");
+        solver.Assert(seq.Length() == 0);
+
+        Assert.That(solver.Check(), Is.EqualTo(Z3Status.Satisfiable));
+        Assert.That(solver.GetModel().GetSeqValues(seq), Is.Empty);
+    }
 }
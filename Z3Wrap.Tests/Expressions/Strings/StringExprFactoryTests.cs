@@ -117,4 +117,36 @@ public class StringExprFactoryTests
         var result = model.GetStringValue(stringExpr);
         Assert.That(result, Does.Contain("\\u{"));
     }
+
+    [Test]
+    public void CreateString_SameLiteral_ReturnsCachedExpression()
+    {
+        using var context = new Z3Context();
+
+        var first = context.String("pattern");
+        var second = context.String("pattern");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(second, Is.SameAs(first));
+            Assert.That(context.Regex("pattern"), Is.SameAs(context.Regex("pattern")));
+            Assert.That(context.Char('x'), Is.SameAs(context.Char('x')));
+        });
+    }
+
+    [Test]
+    public void CreateString_CacheDisabled_CreatesNewExpressions()
+    {
+        using var context = new Z3Context();
+        context.LiteralCacheCapacity = 0;
+
+        var first = context.String("pattern");
+        var second = context.String("pattern");
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(second, Is.Not.SameAs(first));
+            Assert.That(second.Handle, Is.EqualTo(first.Handle));
+        });
+    }
 }
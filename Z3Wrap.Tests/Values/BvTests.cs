@@ -1591,4 +1591,83 @@ public class BvTests
     }
 
     #endregion
+
+    #region Word Representation Tests
+
+    [Test]
+    public void SignedDiv_Size64MinValueByMinusOne_WrapsLikeBigInteger()
+    {
+        var min = Bv<Size64>.SignBit;
+        var minusOne = Bv<Size64>.Max;
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(min.Div(minusOne, signed: true), Is.EqualTo(min));
+            Assert.That(min.Rem(minusOne, signed: true), Is.EqualTo(Bv<Size64>.Zero));
+            Assert.That(min.SignedMod(minusOne), Is.EqualTo(Bv<Size64>.Zero));
+        });
+    }
+
+    [Test]
+    public void Shifts_AmountAtLeastSize64_MatchBigIntegerSemantics()
+    {
+        var value = new Bv<Size64>(ulong.MaxValue);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(value.Shl(64), Is.EqualTo(Bv<Size64>.Zero));
+            Assert.That(value.Shr(64), Is.EqualTo(Bv<Size64>.Zero));
+            Assert.That(value.Shr(100, signed: true), Is.EqualTo(Bv<Size64>.Max));
+            Assert.That(new Bv<Size64>(1).Shr(100, signed: true), Is.EqualTo(Bv<Size64>.Zero));
+        });
+    }
+
+    [Test]
+    public void Arithmetic_Size64_WrapsAroundLikeBigInteger()
+    {
+        var a = new Bv<Size64>(ulong.MaxValue - 5);
+        var b = new Bv<Size64>(12345678901234567UL);
+        var modulus = BigInteger.One << 64;
+
+        Assert.Multiple(() =>
+        {
+            Assert.That((a + b).Value, Is.EqualTo((a.Value + b.Value) % modulus));
+            Assert.That((b - a).Value, Is.EqualTo(((b.Value - a.Value) % modulus + modulus) % modulus));
+            Assert.That((a * b).Value, Is.EqualTo(a.Value * b.Value % modulus));
+            Assert.That((-b).Value, Is.EqualTo(modulus - b.Value));
+        });
+    }
+
+    [Test]
+    public void ImplicitNegative_WideSize_SignExtendsToFullWidth()
+    {
+        Bv<Size128> fromInt = -1;
+        Bv<Size128> fromLong = -1L;
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(fromInt, Is.EqualTo(Bv<Size128>.Max));
+            Assert.That(fromLong, Is.EqualTo(Bv<Size128>.Max));
+        });
+    }
+
+    [Test]
+    public void ResizeAndExtract_OddSizes_MatchBigIntegerSemantics()
+    {
+        var value = new Bv<Size12>(0x800);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(value.Resize<Size20>(signed: true).Value, Is.EqualTo(new BigInteger(0xFF800)));
+            Assert.That(value.Resize<Size20>(signed: false).Value, Is.EqualTo(new BigInteger(0x800)));
+            Assert.That(
+                value.Resize<Size128>(signed: true).ToBigInteger(signed: true),
+                Is.EqualTo(new BigInteger(-2048))
+            );
+            Assert.That(value.Extract<Size8>(4).Value, Is.EqualTo(new BigInteger(0x80)));
+            Assert.That(value.ToLong(signed: true), Is.EqualTo(-2048L));
+        });
+    }
+
+    #endregion
 }
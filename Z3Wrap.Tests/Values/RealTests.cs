@@ -1078,4 +1078,85 @@ public class RealTests
     }
 
     #endregion
+
+    #region Inline Representation Tests
+
+    [Test]
+    public void Add_OverflowingLongs_PromotesToBigInteger()
+    {
+        var result = new Real(long.MaxValue) + new Real(long.MaxValue);
+
+        Assert.That(result.Numerator, Is.EqualTo(new BigInteger(long.MaxValue) * 2));
+    }
+
+    [Test]
+    public void Multiply_OverflowingDenominators_PromotesAndReduces()
+    {
+        var third = new Real(1, 3);
+        var large = new Real(1, long.MaxValue);
+
+        var result = third * large;
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(result.Numerator, Is.EqualTo(BigInteger.One));
+            Assert.That(result.Denominator, Is.EqualTo(new BigInteger(long.MaxValue) * 3));
+        });
+    }
+
+    [Test]
+    public void Arithmetic_PromotedResultShrinksBack_EqualsInlineValue()
+    {
+        var big = new Real(long.MaxValue) + new Real(long.MaxValue);
+        var back = big - new Real(long.MaxValue);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(back, Is.EqualTo(new Real(long.MaxValue)));
+            Assert.That(back.GetHashCode(), Is.EqualTo(new Real(long.MaxValue).GetHashCode()));
+        });
+    }
+
+    [Test]
+    public void Equality_SameValueFromBigIntegerAndLong_EqualWithSameHash()
+    {
+        var fromLong = new Real(6L, -4L);
+        var fromBigInteger = new Real(new BigInteger(-3), new BigInteger(2));
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(fromLong, Is.EqualTo(fromBigInteger));
+            Assert.That(fromLong.GetHashCode(), Is.EqualTo(fromBigInteger.GetHashCode()));
+            Assert.That(fromLong.Denominator, Is.EqualTo(new BigInteger(2)));
+        });
+    }
+
+    [Test]
+    public void Negate_LongMinValue_DoesNotOverflow()
+    {
+        var min = new Real(long.MinValue);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That((-min).Numerator, Is.EqualTo(-new BigInteger(long.MinValue)));
+            Assert.That(min.Abs(), Is.EqualTo(-min));
+            Assert.That(min.ToLong(), Is.EqualTo(long.MinValue));
+        });
+    }
+
+    [Test]
+    public void Compare_LargeInlineValues_UsesExactCrossProducts()
+    {
+        var a = new Real(long.MaxValue - 1, long.MaxValue);
+        var b = new Real(long.MaxValue - 2, long.MaxValue - 1);
+
+        Assert.Multiple(() =>
+        {
+            Assert.That(a > b, Is.True);
+            Assert.That(a.CompareTo(b), Is.EqualTo(1));
+            Assert.That(b < a, Is.True);
+        });
+    }
+
+    #endregion
 }
@@ -0,0 +1,317 @@
+using Spaceorc.Z3Wrap.Expressions.Common;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Allocation-free reference to a Z3 term whose native reference is owned by a <see cref="Z3ExprArena"/>.
+/// </summary>
+/// <typeparam name="T">Expression type of the term.</typeparam>
+/// <remarks>
+/// Supports the same operators as the expression classes. Arithmetic operators and comparisons apply to integer and
+/// real terms and logical operators to boolean terms; Z3 rejects other sorts with a <see cref="Z3Exception"/>.
+/// A term is valid until its arena is disposed.
+/// </remarks>
+public readonly struct ExprRef<T> : IEquatable<ExprRef<T>>
+    where T : Z3Expr, IExprType<T>
+{
+    private readonly Z3ExprArena arena;
+
+    internal ExprRef(Z3ExprArena arena, IntPtr handle)
+    {
+        this.arena = arena;
+        Handle = handle;
+    }
+
+    /// <summary>
+    /// Gets the native Z3 handle pointer.
+    /// </summary>
+    public IntPtr Handle { get; }
+
+    /// <summary>
+    /// Gets the arena that owns the term.
+    /// </summary>
+    public Z3ExprArena Arena => arena;
+
+    private Z3Library Library => arena.Context.Library;
+
+    private IntPtr ContextHandle => arena.Context.Handle;
+
+    /// <summary>
+    /// Creates an expression object for the term that stays valid for the lifetime of the context.
+    /// </summary>
+    /// <returns>The typed expression.</returns>
+    /// <exception cref="ObjectDisposedException">Thrown if the arena has been disposed.</exception>
+    public T ToExpr()
+    {
+        arena.ThrowIfDisposed();
+        return Z3Expr.Create<T>(arena.Context, Handle);
+    }
+
+    /// <summary>
+    /// Determines whether two references point to the same term.
+    /// </summary>
+    /// <param name="other">The reference to compare with.</param>
+    /// <returns>True if both refer to the same native term; otherwise false.</returns>
+    public bool Equals(ExprRef<T> other) => Handle == other.Handle;
+
+    /// <summary>
+    /// Determines whether this reference equals another object.
+    /// </summary>
+    /// <param name="obj">The object to compare with.</param>
+    /// <returns>True if obj is a reference to the same term; otherwise false.</returns>
+    public override bool Equals(object? obj) => obj is ExprRef<T> other && Equals(other);
+
+    /// <summary>
+    /// Gets the hash code for this reference.
+    /// </summary>
+    /// <returns>The hash code of the native handle.</returns>
+    public override int GetHashCode() => Handle.GetHashCode();
+
+    /// <summary>
+    /// Returns the string representation of the term.
+    /// </summary>
+    /// <returns>The Z3 string representation.</returns>
+    public override string ToString() => Library.AstToString(ContextHandle, Handle);
+
+    /// <summary>
+    /// Addition of two terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Addition term.</returns>
+    public static ExprRef<T> operator +(ExprRef<T> left, ExprRef<T> right) => left.Add(left.Handle, right.Handle);
+
+    /// <summary>
+    /// Addition of a term and a numeral.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Addition term.</returns>
+    public static ExprRef<T> operator +(ExprRef<T> left, long right) => left.Add(left.Handle, left.Numeral(right));
+
+    /// <summary>
+    /// Addition of a numeral and a term.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Addition term.</returns>
+    public static ExprRef<T> operator +(long left, ExprRef<T> right) => right.Add(right.Numeral(left), right.Handle);
+
+    /// <summary>
+    /// Subtraction of two terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Subtraction term.</returns>
+    public static ExprRef<T> operator -(ExprRef<T> left, ExprRef<T> right) => left.Sub(left.Handle, right.Handle);
+
+    /// <summary>
+    /// Subtraction of a numeral from a term.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Subtraction term.</returns>
+    public static ExprRef<T> operator -(ExprRef<T> left, long right) => left.Sub(left.Handle, left.Numeral(right));
+
+    /// <summary>
+    /// Subtraction of a term from a numeral.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Subtraction term.</returns>
+    public static ExprRef<T> operator -(long left, ExprRef<T> right) => right.Sub(right.Numeral(left), right.Handle);
+
+    /// <summary>
+    /// Multiplication of two terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Multiplication term.</returns>
+    public static ExprRef<T> operator *(ExprRef<T> left, ExprRef<T> right) => left.Mul(left.Handle, right.Handle);
+
+    /// <summary>
+    /// Multiplication of a term and a numeral.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Multiplication term.</returns>
+    public static ExprRef<T> operator *(ExprRef<T> left, long right) => left.Mul(left.Handle, left.Numeral(right));
+
+    /// <summary>
+    /// Multiplication of a numeral and a term.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Multiplication term.</returns>
+    public static ExprRef<T> operator *(long left, ExprRef<T> right) => right.Mul(right.Numeral(left), right.Handle);
+
+    /// <summary>
+    /// Division of two terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Division term.</returns>
+    public static ExprRef<T> operator /(ExprRef<T> left, ExprRef<T> right) =>
+        left.Wrap<T>(left.Library.MkDiv(left.ContextHandle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Unary negation of a term.
+    /// </summary>
+    /// <param name="operand">The operand.</param>
+    /// <returns>Negation term.</returns>
+    public static ExprRef<T> operator -(ExprRef<T> operand) =>
+        operand.Wrap<T>(operand.Library.MkUnaryMinus(operand.ContextHandle, operand.Handle));
+
+    /// <summary>
+    /// Less-than comparison of two terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Comparison term.</returns>
+    public static ExprRef<BoolExpr> operator <(ExprRef<T> left, ExprRef<T> right) =>
+        left.Wrap<BoolExpr>(left.Library.MkLt(left.ContextHandle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Less-than comparison of a term and a numeral.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Comparison term.</returns>
+    public static ExprRef<BoolExpr> operator <(ExprRef<T> left, long right) =>
+        left.Wrap<BoolExpr>(left.Library.MkLt(left.ContextHandle, left.Handle, left.Numeral(right)));
+
+    /// <summary>
+    /// Less-than-or-equal comparison of two terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Comparison term.</returns>
+    public static ExprRef<BoolExpr> operator <=(ExprRef<T> left, ExprRef<T> right) =>
+        left.Wrap<BoolExpr>(left.Library.MkLe(left.ContextHandle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Less-than-or-equal comparison of a term and a numeral.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Comparison term.</returns>
+    public static ExprRef<BoolExpr> operator <=(ExprRef<T> left, long right) =>
+        left.Wrap<BoolExpr>(left.Library.MkLe(left.ContextHandle, left.Handle, left.Numeral(right)));
+
+    /// <summary>
+    /// Greater-than comparison of two terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Comparison term.</returns>
+    public static ExprRef<BoolExpr> operator >(ExprRef<T> left, ExprRef<T> right) =>
+        left.Wrap<BoolExpr>(left.Library.MkGt(left.ContextHandle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Greater-than comparison of a term and a numeral.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Comparison term.</returns>
+    public static ExprRef<BoolExpr> operator >(ExprRef<T> left, long right) =>
+        left.Wrap<BoolExpr>(left.Library.MkGt(left.ContextHandle, left.Handle, left.Numeral(right)));
+
+    /// <summary>
+    /// Greater-than-or-equal comparison of two terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Comparison term.</returns>
+    public static ExprRef<BoolExpr> operator >=(ExprRef<T> left, ExprRef<T> right) =>
+        left.Wrap<BoolExpr>(left.Library.MkGe(left.ContextHandle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Greater-than-or-equal comparison of a term and a numeral.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Comparison term.</returns>
+    public static ExprRef<BoolExpr> operator >=(ExprRef<T> left, long right) =>
+        left.Wrap<BoolExpr>(left.Library.MkGe(left.ContextHandle, left.Handle, left.Numeral(right)));
+
+    /// <summary>
+    /// Equality comparison of two terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Equality term.</returns>
+    public static ExprRef<BoolExpr> operator ==(ExprRef<T> left, ExprRef<T> right) =>
+        left.Wrap<BoolExpr>(left.Library.MkEq(left.ContextHandle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Equality comparison of a term and a numeral.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Equality term.</returns>
+    public static ExprRef<BoolExpr> operator ==(ExprRef<T> left, long right) =>
+        left.Wrap<BoolExpr>(left.Library.MkEq(left.ContextHandle, left.Handle, left.Numeral(right)));
+
+    /// <summary>
+    /// Inequality comparison of two terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Inequality term.</returns>
+    public static ExprRef<BoolExpr> operator !=(ExprRef<T> left, ExprRef<T> right) => !(left == right);
+
+    /// <summary>
+    /// Inequality comparison of a term and a numeral.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>Inequality term.</returns>
+    public static ExprRef<BoolExpr> operator !=(ExprRef<T> left, long right) => !(left == right);
+
+    /// <summary>
+    /// Logical AND of two boolean terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>AND term.</returns>
+    public static ExprRef<T> operator &(ExprRef<T> left, ExprRef<T> right) =>
+        left.Wrap<T>(left.Library.MkAnd(left.ContextHandle, 2, [left.Handle, right.Handle]));
+
+    /// <summary>
+    /// Logical OR of two boolean terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>OR term.</returns>
+    public static ExprRef<T> operator |(ExprRef<T> left, ExprRef<T> right) =>
+        left.Wrap<T>(left.Library.MkOr(left.ContextHandle, 2, [left.Handle, right.Handle]));
+
+    /// <summary>
+    /// Logical XOR of two boolean terms.
+    /// </summary>
+    /// <param name="left">Left operand.</param>
+    /// <param name="right">Right operand.</param>
+    /// <returns>XOR term.</returns>
+    public static ExprRef<T> operator ^(ExprRef<T> left, ExprRef<T> right) =>
+        left.Wrap<T>(left.Library.MkXor(left.ContextHandle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Logical NOT of a boolean term.
+    /// </summary>
+    /// <param name="operand">The operand.</param>
+    /// <returns>NOT term.</returns>
+    public static ExprRef<T> operator !(ExprRef<T> operand) =>
+        operand.Wrap<T>(operand.Library.MkNot(operand.ContextHandle, operand.Handle));
+
+    private ExprRef<TResult> Wrap<TResult>(IntPtr handle)
+        where TResult : Z3Expr, IExprType<TResult> => arena.Retain<TResult>(handle);
+
+    private IntPtr Numeral(long value) => Library.MkInt64(ContextHandle, value, T.Sort(arena.Context));
+
+    private ExprRef<T> Add(IntPtr left, IntPtr right) => Wrap<T>(Library.MkAdd(ContextHandle, 2, [left, right]));
+
+    private ExprRef<T> Sub(IntPtr left, IntPtr right) => Wrap<T>(Library.MkSub(ContextHandle, 2, [left, right]));
+
+    private ExprRef<T> Mul(IntPtr left, IntPtr right) => Wrap<T>(Library.MkMul(ContextHandle, 2, [left, right]));
+}
@@ -0,0 +1,76 @@
+using System.Buffers;
+
+namespace Spaceorc.Z3Wrap.Core.Interop;
+
+/// <summary>
+/// Growable buffer of native handles for building n-ary Z3 arguments without per-call array allocation.
+/// Starts in caller-provided (usually stack) memory and falls back to <see cref="ArrayPool{T}"/> when it overflows.
+/// </summary>
+/// <remarks>
+/// Always call <see cref="Dispose"/> in a finally block to return any rented array to the pool.
+/// </remarks>
+internal ref struct HandleBuffer
+{
+    /// <summary>
+    /// Recommended size of the initial stack buffer.
+    /// </summary>
+    public const int StackCapacity = 32;
+
+    private IntPtr[]? rented;
+    private Span<IntPtr> buffer;
+    private int length;
+
+    public HandleBuffer(Span<IntPtr> initialBuffer)
+    {
+        buffer = initialBuffer;
+        rented = null;
+        length = 0;
+    }
+
+    public readonly int Length => length;
+
+    public readonly ReadOnlySpan<IntPtr> Span => buffer[..length];
+
+    public void Add(IntPtr handle)
+    {
+        if (length == buffer.Length)
+            Grow(length + 1);
+
+        buffer[length++] = handle;
+    }
+
+    public void AddRange<T>(IEnumerable<T> items)
+        where T : Z3Handle
+    {
+        if (items.TryGetNonEnumeratedCount(out var count) && length + count > buffer.Length)
+            Grow(length + count);
+
+        foreach (var item in items)
+            Add(item.Handle);
+    }
+
+    public void Clear() => length = 0;
+
+    public void Dispose()
+    {
+        if (rented == null)
+            return;
+
+        ArrayPool<IntPtr>.Shared.Return(rented);
+        rented = null;
+        buffer = default;
+        length = 0;
+    }
+
+    private void Grow(int minimumCapacity)
+    {
+        var newArray = ArrayPool<IntPtr>.Shared.Rent(Math.Max(minimumCapacity, buffer.Length * 2));
+        buffer[..length].CopyTo(newArray);
+
+        if (rented != null)
+            ArrayPool<IntPtr>.Shared.Return(rented);
+
+        rented = newArray;
+        buffer = newArray;
+    }
+}
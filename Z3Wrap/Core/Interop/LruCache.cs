@@ -0,0 +1,82 @@
+namespace Spaceorc.Z3Wrap.Core.Interop;
+
+/// <summary>
+/// Bounded map that evicts the least recently used entry once it holds <see cref="Capacity"/> entries.
+/// </summary>
+/// <remarks>
+/// Not thread-safe; used for per-context caches, which share the context's threading rules.
+/// A capacity of zero disables the cache: lookups always miss and additions are ignored.
+/// </remarks>
+internal sealed class LruCache<TKey, TValue>
+    where TKey : notnull
+{
+    private readonly Dictionary<TKey, LinkedListNode<KeyValuePair<TKey, TValue>>> entries = [];
+    private readonly LinkedList<KeyValuePair<TKey, TValue>> order = new();
+    private int capacity;
+
+    public LruCache(int capacity)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegative(capacity);
+        this.capacity = capacity;
+    }
+
+    public int Count => entries.Count;
+
+    public int Capacity
+    {
+        get => capacity;
+        set
+        {
+            ArgumentOutOfRangeException.ThrowIfNegative(value);
+            capacity = value;
+            while (entries.Count > capacity)
+                EvictOldest();
+        }
+    }
+
+    public bool TryGetValue(TKey key, out TValue value)
+    {
+        if (entries.TryGetValue(key, out var node))
+        {
+            // Most recently used entries live at the front
+            order.Remove(node);
+            order.AddFirst(node);
+            value = node.Value.Value;
+            return true;
+        }
+
+        value = default!;
+        return false;
+    }
+
+    public void Add(TKey key, TValue value)
+    {
+        if (capacity == 0)
+            return;
+
+        if (entries.TryGetValue(key, out var existing))
+        {
+            order.Remove(existing);
+            entries.Remove(key);
+        }
+        else if (entries.Count == capacity)
+        {
+            EvictOldest();
+        }
+
+        entries.Add(key, order.AddFirst(new KeyValuePair<TKey, TValue>(key, value)));
+    }
+
+    public void Clear()
+    {
+        entries.Clear();
+        order.Clear();
+    }
+
+    private void EvictOldest()
+    {
+        var oldest = order.Last!;
+        order.RemoveLast();
+        entries.Remove(oldest.Value.Key);
+    }
+}
@@ -0,0 +1,104 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+
+namespace Spaceorc.Z3Wrap.Core.Interop;
+
+/// <summary>
+/// Records per-function call counts and latencies of native Z3 calls.
+/// Feeds the <c>Spaceorc.Z3Wrap</c> <see cref="Meter"/> and the in-process profile returned by
+/// <see cref="Z3Library.GetCallProfile"/>.
+/// </summary>
+/// <remarks>
+/// Disabled unless the <c>Spaceorc.Z3Wrap.EnableNativeCallProfiling</c> <see cref="AppContext"/> switch is set
+/// before the first native call. The switch is read once into a static readonly field, so the JIT removes
+/// the profiling path entirely when it is off.
+/// </remarks>
+internal static class NativeCallProfiler
+{
+    public const string SwitchName = "Spaceorc.Z3Wrap.EnableNativeCallProfiling";
+    public const string MeterName = Z3Metrics.MeterName;
+
+    private static readonly bool isEnabled = AppContext.TryGetSwitch(SwitchName, out var enabled) && enabled;
+    private static readonly ConcurrentDictionary<string, FunctionStats> functions = new();
+    private static readonly Counter<long> callCounter = Z3Metrics.Meter.CreateCounter<long>(
+        "z3.native.calls",
+        description: "Number of native Z3 calls"
+    );
+    private static readonly Histogram<double> callDuration = Z3Metrics.Meter.CreateHistogram<double>(
+        "z3.native.duration",
+        unit: "us",
+        description: "Latency of native Z3 calls"
+    );
+
+    public static bool IsEnabled => isEnabled;
+
+    public static CallScope Measure(string functionName) =>
+        isEnabled ? new CallScope(functionName, Stopwatch.GetTimestamp()) : default;
+
+    public static IReadOnlyList<Z3CallProfileEntry> Snapshot(int top)
+    {
+        return functions
+            .Select(pair => pair.Value.ToEntry(pair.Key))
+            .OrderByDescending(entry => entry.TotalTime)
+            .Take(top)
+            .ToArray();
+    }
+
+    public static void Reset() => functions.Clear();
+
+    private static void Record(string functionName, long startTimestamp)
+    {
+        var elapsed = Stopwatch.GetElapsedTime(startTimestamp);
+        functions.GetOrAdd(functionName, _ => new FunctionStats()).Add(elapsed.Ticks);
+
+        if (!callCounter.Enabled && !callDuration.Enabled)
+            return;
+
+        var tag = new KeyValuePair<string, object?>("z3.function", functionName);
+        callCounter.Add(1, tag);
+        callDuration.Record(elapsed.TotalMicroseconds, tag);
+    }
+
+    /// <summary>
+    /// Measures a single native call; empty (and free to dispose) when profiling is disabled.
+    /// </summary>
+    internal readonly struct CallScope(string functionName, long startTimestamp) : IDisposable
+    {
+        public void Dispose()
+        {
+            if (functionName != null)
+                Record(functionName, startTimestamp);
+        }
+    }
+
+    private sealed class FunctionStats
+    {
+        private long callCount;
+        private long totalTicks;
+        private long maxTicks;
+
+        public void Add(long ticks)
+        {
+            Interlocked.Increment(ref callCount);
+            Interlocked.Add(ref totalTicks, ticks);
+
+            var max = Volatile.Read(ref maxTicks);
+            while (ticks > max)
+            {
+                var previous = Interlocked.CompareExchange(ref maxTicks, ticks, max);
+                if (previous == max)
+                    break;
+                max = previous;
+            }
+        }
+
+        public Z3CallProfileEntry ToEntry(string functionName) =>
+            new(
+                functionName,
+                Volatile.Read(ref callCount),
+                TimeSpan.FromTicks(Volatile.Read(ref totalTicks)),
+                TimeSpan.FromTicks(Volatile.Read(ref maxTicks))
+            );
+    }
+}
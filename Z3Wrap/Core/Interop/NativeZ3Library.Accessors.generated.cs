@@ -17,7 +17,7 @@ internal sealed partial class NativeZ3Library
     private delegate SymbolKind GetSymbolKindDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
-    ///  Return <c>Z3_INT_SYMBOL</c> if the symbol was constructed using <see cref="MkIntSymbol"/> , and <c>Z3_STRING_SYMBOL</c> if the symbol was constructed using <see cref="MkStringSymbol"/> . 
+    ///  Return <c>Z3_INT_SYMBOL</c> if the symbol was constructed using <see cref="MkIntSymbol"/> , and <c>Z3_STRING_SYMBOL</c> if the symbol was constructed using <see cref="MkStringSymbol(IntPtr, IntPtr)"/> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_symbol">symbol parameter</param>
@@ -27,6 +27,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_symbol_kind");
         var func = Marshal.GetDelegateForFunctionPointer<GetSymbolKindDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_symbol_kind");
         return func(c, s);
     }
 
@@ -48,6 +49,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_symbol_int");
         var func = Marshal.GetDelegateForFunctionPointer<GetSymbolIntDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_symbol_int");
         return func(c, s);
     }
 
@@ -64,12 +66,13 @@ internal sealed partial class NativeZ3Library
     /// Precondition: Z3_get_symbol_kind(s) == Z3_STRING_SYMBOL 
     /// Warning: The returned buffer is statically allocated by Z3. It will be automatically deallocated when <see cref="DelContext"/> is invoked. So, the buffer is invalidated in the next call to <c>Z3_get_symbol_string</c> . 
     /// </remarks>
-    /// <seealso cref="MkStringSymbol"/>
+    /// <seealso cref="MkStringSymbol(IntPtr, IntPtr)"/>
     [Z3Function("Z3_get_symbol_string")]
     internal IntPtr GetSymbolString(IntPtr c, IntPtr s)
     {
         var funcPtr = GetFunctionPointer("Z3_get_symbol_string");
         var func = Marshal.GetDelegateForFunctionPointer<GetSymbolStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_symbol_string");
         return func(c, s);
     }
 
@@ -87,6 +90,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_sort_name");
         var func = Marshal.GetDelegateForFunctionPointer<GetSortNameDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_sort_name");
         return func(c, d);
     }
 
@@ -104,6 +108,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_sort_id");
         var func = Marshal.GetDelegateForFunctionPointer<GetSortIdDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_sort_id");
         return func(c, s);
     }
 
@@ -121,10 +126,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_sort_to_ast");
         var func = Marshal.GetDelegateForFunctionPointer<SortToAstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_sort_to_ast");
         return func(c, s);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsEqSortDelegate(IntPtr c, IntPtr s1, IntPtr s2);
 
     /// <summary>
@@ -139,6 +146,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_eq_sort");
         var func = Marshal.GetDelegateForFunctionPointer<IsEqSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_eq_sort");
         return func(c, s1, s2);
     }
 
@@ -157,6 +165,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_sort_kind");
         var func = Marshal.GetDelegateForFunctionPointer<GetSortKindDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_sort_kind");
         return func(c, t);
     }
 
@@ -179,10 +188,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_bv_sort_size");
         var func = Marshal.GetDelegateForFunctionPointer<GetBvSortSizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_bv_sort_size");
         return func(c, t);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GetFiniteDomainSortSizeDelegate(IntPtr c, IntPtr s, out ulong r);
 
     /// <summary>
@@ -197,6 +208,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_finite_domain_sort_size");
         var func = Marshal.GetDelegateForFunctionPointer<GetFiniteDomainSortSizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_finite_domain_sort_size");
         return func(c, s, out r);
     }
 
@@ -218,6 +230,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_array_arity");
         var func = Marshal.GetDelegateForFunctionPointer<GetArrayArityDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_array_arity");
         return func(c, s);
     }
 
@@ -241,6 +254,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_array_sort_domain");
         var func = Marshal.GetDelegateForFunctionPointer<GetArraySortDomainDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_array_sort_domain");
         return func(c, t);
     }
 
@@ -265,6 +279,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_array_sort_domain_n");
         var func = Marshal.GetDelegateForFunctionPointer<GetArraySortDomainNDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_array_sort_domain_n");
         return func(c, t, idx);
     }
 
@@ -287,6 +302,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_array_sort_range");
         var func = Marshal.GetDelegateForFunctionPointer<GetArraySortRangeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_array_sort_range");
         return func(c, t);
     }
 
@@ -302,13 +318,14 @@ internal sealed partial class NativeZ3Library
     /// <remarks>
     /// Precondition: Z3_get_sort_kind(c, t) == Z3_DATATYPE_SORT 
     /// </remarks>
-    /// <seealso cref="MkTupleSort"/>
+    /// <seealso cref="MkTupleSort(IntPtr, IntPtr, uint, IntPtr[], IntPtr[], out IntPtr, IntPtr[])"/>
     /// <seealso cref="GetSortKind"/>
     [Z3Function("Z3_get_tuple_sort_mk_decl")]
     internal IntPtr GetTupleSortMkDecl(IntPtr c, IntPtr t)
     {
         var funcPtr = GetFunctionPointer("Z3_get_tuple_sort_mk_decl");
         var func = Marshal.GetDelegateForFunctionPointer<GetTupleSortMkDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_tuple_sort_mk_decl");
         return func(c, t);
     }
 
@@ -324,13 +341,14 @@ internal sealed partial class NativeZ3Library
     /// <remarks>
     /// Precondition: Z3_get_sort_kind(c, t) == Z3_DATATYPE_SORT 
     /// </remarks>
-    /// <seealso cref="MkTupleSort"/>
+    /// <seealso cref="MkTupleSort(IntPtr, IntPtr, uint, IntPtr[], IntPtr[], out IntPtr, IntPtr[])"/>
     /// <seealso cref="GetSortKind"/>
     [Z3Function("Z3_get_tuple_sort_num_fields")]
     internal uint GetTupleSortNumFields(IntPtr c, IntPtr t)
     {
         var funcPtr = GetFunctionPointer("Z3_get_tuple_sort_num_fields");
         var func = Marshal.GetDelegateForFunctionPointer<GetTupleSortNumFieldsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_tuple_sort_num_fields");
         return func(c, t);
     }
 
@@ -348,17 +366,19 @@ internal sealed partial class NativeZ3Library
     /// Precondition: Z3_get_sort_kind(t) == Z3_DATATYPE_SORT 
     /// Precondition: i &lt; Z3_get_tuple_sort_num_fields(c, t) 
     /// </remarks>
-    /// <seealso cref="MkTupleSort"/>
+    /// <seealso cref="MkTupleSort(IntPtr, IntPtr, uint, IntPtr[], IntPtr[], out IntPtr, IntPtr[])"/>
     /// <seealso cref="GetSortKind"/>
     [Z3Function("Z3_get_tuple_sort_field_decl")]
     internal IntPtr GetTupleSortFieldDecl(IntPtr c, IntPtr t, uint i)
     {
         var funcPtr = GetFunctionPointer("Z3_get_tuple_sort_field_decl");
         var func = Marshal.GetDelegateForFunctionPointer<GetTupleSortFieldDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_tuple_sort_field_decl");
         return func(c, t, i);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsRecursiveDatatypeSortDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
@@ -372,6 +392,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_recursive_datatype_sort");
         var func = Marshal.GetDelegateForFunctionPointer<IsRecursiveDatatypeSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_recursive_datatype_sort");
         return func(c, s);
     }
 
@@ -395,6 +416,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_datatype_sort_num_constructors");
         var func = Marshal.GetDelegateForFunctionPointer<GetDatatypeSortNumConstructorsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_datatype_sort_num_constructors");
         return func(c, t);
     }
 
@@ -420,6 +442,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_datatype_sort_constructor");
         var func = Marshal.GetDelegateForFunctionPointer<GetDatatypeSortConstructorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_datatype_sort_constructor");
         return func(c, t, idx);
     }
 
@@ -445,6 +468,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_datatype_sort_recognizer");
         var func = Marshal.GetDelegateForFunctionPointer<GetDatatypeSortRecognizerDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_datatype_sort_recognizer");
         return func(c, t, idx);
     }
 
@@ -472,6 +496,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_datatype_sort_constructor_accessor");
         var func = Marshal.GetDelegateForFunctionPointer<GetDatatypeSortConstructorAccessorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_datatype_sort_constructor_accessor");
         return func(c, t, idxC, idxA);
     }
 
@@ -496,6 +521,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_datatype_update_field");
         var func = Marshal.GetDelegateForFunctionPointer<DatatypeUpdateFieldDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_datatype_update_field");
         return func(c, fieldAccess, t, value);
     }
 
@@ -517,6 +543,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_relation_arity");
         var func = Marshal.GetDelegateForFunctionPointer<GetRelationArityDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_relation_arity");
         return func(c, s);
     }
 
@@ -540,6 +567,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_relation_column");
         var func = Marshal.GetDelegateForFunctionPointer<GetRelationColumnDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_relation_column");
         return func(c, s, col);
     }
 
@@ -562,9 +590,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_atmost");
         var func = Marshal.GetDelegateForFunctionPointer<MkAtmostDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_atmost");
         return func(c, numArgs, args, k);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkAtmostSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args, uint k);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_atmost</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkAtmost(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args, uint k)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_atmost");
+        var func = Marshal.GetDelegateForFunctionPointer<MkAtmostSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_atmost");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args), k);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkAtleastDelegate(IntPtr c, uint numArgs, IntPtr[] args, uint k);
 
@@ -584,9 +627,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_atleast");
         var func = Marshal.GetDelegateForFunctionPointer<MkAtleastDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_atleast");
         return func(c, numArgs, args, k);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkAtleastSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args, uint k);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_atleast</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkAtleast(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args, uint k)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_atleast");
+        var func = Marshal.GetDelegateForFunctionPointer<MkAtleastSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_atleast");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args), k);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkPbleDelegate(IntPtr c, uint numArgs, IntPtr[] args, int[] coeffs, int k);
 
@@ -607,9 +665,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_pble");
         var func = Marshal.GetDelegateForFunctionPointer<MkPbleDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_pble");
         return func(c, numArgs, args, coeffs, k);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkPbleSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args, int[] coeffs, int k);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_pble</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkPble(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args, int[] coeffs, int k)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_pble");
+        var func = Marshal.GetDelegateForFunctionPointer<MkPbleSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_pble");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args), coeffs, k);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkPbgeDelegate(IntPtr c, uint numArgs, IntPtr[] args, int[] coeffs, int k);
 
@@ -630,9 +703,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_pbge");
         var func = Marshal.GetDelegateForFunctionPointer<MkPbgeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_pbge");
         return func(c, numArgs, args, coeffs, k);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkPbgeSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args, int[] coeffs, int k);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_pbge</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkPbge(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args, int[] coeffs, int k)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_pbge");
+        var func = Marshal.GetDelegateForFunctionPointer<MkPbgeSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_pbge");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args), coeffs, k);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkPbeqDelegate(IntPtr c, uint numArgs, IntPtr[] args, int[] coeffs, int k);
 
@@ -653,9 +741,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_pbeq");
         var func = Marshal.GetDelegateForFunctionPointer<MkPbeqDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_pbeq");
         return func(c, numArgs, args, coeffs, k);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkPbeqSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args, int[] coeffs, int k);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_pbeq</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkPbeq(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args, int[] coeffs, int k)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_pbeq");
+        var func = Marshal.GetDelegateForFunctionPointer<MkPbeqSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_pbeq");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args), coeffs, k);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr FuncDeclToAstDelegate(IntPtr c, IntPtr f);
 
@@ -670,10 +773,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_decl_to_ast");
         var func = Marshal.GetDelegateForFunctionPointer<FuncDeclToAstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_decl_to_ast");
         return func(c, f);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsEqFuncDeclDelegate(IntPtr c, IntPtr f1, IntPtr f2);
 
     /// <summary>
@@ -688,6 +793,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_eq_func_decl");
         var func = Marshal.GetDelegateForFunctionPointer<IsEqFuncDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_eq_func_decl");
         return func(c, f1, f2);
     }
 
@@ -705,6 +811,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_func_decl_id");
         var func = Marshal.GetDelegateForFunctionPointer<GetFuncDeclIdDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_func_decl_id");
         return func(c, f);
     }
 
@@ -722,6 +829,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_name");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclNameDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_name");
         return func(c, d);
     }
 
@@ -739,6 +847,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_kind");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclKindDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_kind");
         return func(c, d);
     }
 
@@ -757,6 +866,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_domain_size");
         var func = Marshal.GetDelegateForFunctionPointer<GetDomainSizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_domain_size");
         return func(c, d);
     }
 
@@ -775,6 +885,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_arity");
         var func = Marshal.GetDelegateForFunctionPointer<GetArityDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_arity");
         return func(c, d);
     }
 
@@ -797,6 +908,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_domain");
         var func = Marshal.GetDelegateForFunctionPointer<GetDomainDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_domain");
         return func(c, d, i);
     }
 
@@ -817,6 +929,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_range");
         var func = Marshal.GetDelegateForFunctionPointer<GetRangeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_range");
         return func(c, d);
     }
 
@@ -834,6 +947,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_num_parameters");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclNumParametersDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_num_parameters");
         return func(c, d);
     }
 
@@ -852,6 +966,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_parameter_kind");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclParameterKindDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_parameter_kind");
         return func(c, d, idx);
     }
 
@@ -873,6 +988,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_int_parameter");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclIntParameterDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_int_parameter");
         return func(c, d, idx);
     }
 
@@ -894,6 +1010,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_double_parameter");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclDoubleParameterDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_double_parameter");
         return func(c, d, idx);
     }
 
@@ -915,6 +1032,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_symbol_parameter");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclSymbolParameterDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_symbol_parameter");
         return func(c, d, idx);
     }
 
@@ -936,6 +1054,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_sort_parameter");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclSortParameterDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_sort_parameter");
         return func(c, d, idx);
     }
 
@@ -957,6 +1076,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_ast_parameter");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclAstParameterDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_ast_parameter");
         return func(c, d, idx);
     }
 
@@ -978,6 +1098,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_func_decl_parameter");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclFuncDeclParameterDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_func_decl_parameter");
         return func(c, d, idx);
     }
 
@@ -999,6 +1120,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_decl_rational_parameter");
         var func = Marshal.GetDelegateForFunctionPointer<GetDeclRationalParameterDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_decl_rational_parameter");
         return func(c, d, idx);
     }
 
@@ -1016,6 +1138,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_app_to_ast");
         var func = Marshal.GetDelegateForFunctionPointer<AppToAstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_app_to_ast");
         return func(c, a);
     }
 
@@ -1033,6 +1156,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_app_decl");
         var func = Marshal.GetDelegateForFunctionPointer<GetAppDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_app_decl");
         return func(c, a);
     }
 
@@ -1051,6 +1175,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_app_num_args");
         var func = Marshal.GetDelegateForFunctionPointer<GetAppNumArgsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_app_num_args");
         return func(c, a);
     }
 
@@ -1073,10 +1198,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_app_arg");
         var func = Marshal.GetDelegateForFunctionPointer<GetAppArgDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_app_arg");
         return func(c, a, i);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsEqAstDelegate(IntPtr c, IntPtr t1, IntPtr t2);
 
     /// <summary>
@@ -1091,6 +1218,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_eq_ast");
         var func = Marshal.GetDelegateForFunctionPointer<IsEqAstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_eq_ast");
         return func(c, t1, t2);
     }
 
@@ -1108,6 +1236,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_ast_id");
         var func = Marshal.GetDelegateForFunctionPointer<GetAstIdDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_ast_id");
         return func(c, t);
     }
 
@@ -1125,6 +1254,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_ast_hash");
         var func = Marshal.GetDelegateForFunctionPointer<GetAstHashDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_ast_hash");
         return func(c, a);
     }
 
@@ -1145,10 +1275,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_sort");
         var func = Marshal.GetDelegateForFunctionPointer<GetSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_sort");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsWellSortedDelegate(IntPtr c, IntPtr t);
 
     /// <summary>
@@ -1162,6 +1294,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_well_sorted");
         var func = Marshal.GetDelegateForFunctionPointer<IsWellSortedDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_well_sorted");
         return func(c, t);
     }
 
@@ -1179,6 +1312,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_bool_value");
         var func = Marshal.GetDelegateForFunctionPointer<GetBoolValueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_bool_value");
         return func(c, a);
     }
 
@@ -1196,10 +1330,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_ast_kind");
         var func = Marshal.GetDelegateForFunctionPointer<GetAstKindDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_ast_kind");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsAppDelegate(IntPtr c, IntPtr a);
 
     /// <param name="c" ctype="Z3_context">context parameter</param>
@@ -1210,10 +1346,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_app");
         var func = Marshal.GetDelegateForFunctionPointer<IsAppDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_app");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsGroundDelegate(IntPtr c, IntPtr a);
 
     /// <param name="c" ctype="Z3_context">context parameter</param>
@@ -1224,6 +1362,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_ground");
         var func = Marshal.GetDelegateForFunctionPointer<IsGroundDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_ground");
         return func(c, a);
     }
 
@@ -1238,10 +1377,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_depth");
         var func = Marshal.GetDelegateForFunctionPointer<GetDepthDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_depth");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsNumeralAstDelegate(IntPtr c, IntPtr a);
 
     /// <param name="c" ctype="Z3_context">context parameter</param>
@@ -1252,10 +1393,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_numeral_ast");
         var func = Marshal.GetDelegateForFunctionPointer<IsNumeralAstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_numeral_ast");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsAlgebraicNumberDelegate(IntPtr c, IntPtr a);
 
     /// <summary>
@@ -1269,6 +1412,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_algebraic_number");
         var func = Marshal.GetDelegateForFunctionPointer<IsAlgebraicNumberDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_algebraic_number");
         return func(c, a);
     }
 
@@ -1291,6 +1435,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_to_app");
         var func = Marshal.GetDelegateForFunctionPointer<ToAppDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_to_app");
         return func(c, a);
     }
 
@@ -1313,6 +1458,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_to_func_decl");
         var func = Marshal.GetDelegateForFunctionPointer<ToFuncDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_to_func_decl");
         return func(c, a);
     }
 
@@ -1333,6 +1479,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numeral_string");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeralStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numeral_string");
         return func(c, a);
     }
 
@@ -1354,6 +1501,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numeral_binary_string");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeralBinaryStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numeral_binary_string");
         return func(c, a);
     }
 
@@ -1375,6 +1523,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numeral_decimal_string");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeralDecimalStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numeral_decimal_string");
         return func(c, a, precision);
     }
 
@@ -1395,6 +1544,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numeral_double");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeralDoubleDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numeral_double");
         return func(c, a);
     }
 
@@ -1415,6 +1565,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numerator");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeratorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numerator");
         return func(c, a);
     }
 
@@ -1435,10 +1586,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_denominator");
         var func = Marshal.GetDelegateForFunctionPointer<GetDenominatorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_denominator");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GetNumeralSmallDelegate(IntPtr c, IntPtr a, out long num, out long den);
 
     /// <summary>
@@ -1458,10 +1611,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numeral_small");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeralSmallDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numeral_small");
         return func(c, a, out num, out den);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GetNumeralIntDelegate(IntPtr c, IntPtr v, out int i);
 
     /// <summary>
@@ -1480,10 +1635,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numeral_int");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeralIntDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numeral_int");
         return func(c, v, out i);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GetNumeralUintDelegate(IntPtr c, IntPtr v, out uint u);
 
     /// <summary>
@@ -1502,10 +1659,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numeral_uint");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeralUintDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numeral_uint");
         return func(c, v, out u);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GetNumeralUint64Delegate(IntPtr c, IntPtr v, out ulong u);
 
     /// <summary>
@@ -1524,10 +1683,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numeral_uint64");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeralUint64Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numeral_uint64");
         return func(c, v, out u);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GetNumeralInt64Delegate(IntPtr c, IntPtr v, out long i);
 
     /// <summary>
@@ -1546,10 +1707,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numeral_int64");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeralInt64Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numeral_int64");
         return func(c, v, out i);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GetNumeralRationalInt64Delegate(IntPtr c, IntPtr v, out long num, out long den);
 
     /// <summary>
@@ -1569,6 +1732,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_numeral_rational_int64");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumeralRationalInt64Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_numeral_rational_int64");
         return func(c, v, out num, out den);
     }
 
@@ -1590,6 +1754,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_algebraic_number_lower");
         var func = Marshal.GetDelegateForFunctionPointer<GetAlgebraicNumberLowerDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_algebraic_number_lower");
         return func(c, a, precision);
     }
 
@@ -1611,6 +1776,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_algebraic_number_upper");
         var func = Marshal.GetDelegateForFunctionPointer<GetAlgebraicNumberUpperDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_algebraic_number_upper");
         return func(c, a, precision);
     }
 
@@ -1628,6 +1794,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_pattern_to_ast");
         var func = Marshal.GetDelegateForFunctionPointer<PatternToAstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_pattern_to_ast");
         return func(c, p);
     }
 
@@ -1645,6 +1812,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_pattern_num_terms");
         var func = Marshal.GetDelegateForFunctionPointer<GetPatternNumTermsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_pattern_num_terms");
         return func(c, p);
     }
 
@@ -1663,6 +1831,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_pattern");
         var func = Marshal.GetDelegateForFunctionPointer<GetPatternDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_pattern");
         return func(c, p, idx);
     }
 
@@ -1683,10 +1852,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_index_value");
         var func = Marshal.GetDelegateForFunctionPointer<GetIndexValueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_index_value");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsQuantifierForallDelegate(IntPtr c, IntPtr a);
 
     /// <summary>
@@ -1700,10 +1871,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_quantifier_forall");
         var func = Marshal.GetDelegateForFunctionPointer<IsQuantifierForallDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_quantifier_forall");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsQuantifierExistsDelegate(IntPtr c, IntPtr a);
 
     /// <summary>
@@ -1717,10 +1890,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_quantifier_exists");
         var func = Marshal.GetDelegateForFunctionPointer<IsQuantifierExistsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_quantifier_exists");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsLambdaDelegate(IntPtr c, IntPtr a);
 
     /// <summary>
@@ -1737,6 +1912,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_lambda");
         var func = Marshal.GetDelegateForFunctionPointer<IsLambdaDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_lambda");
         return func(c, a);
     }
 
@@ -1757,6 +1933,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_weight");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierWeightDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_weight");
         return func(c, a);
     }
 
@@ -1777,6 +1954,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_skolem_id");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierSkolemIdDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_skolem_id");
         return func(c, a);
     }
 
@@ -1797,6 +1975,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_id");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierIdDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_id");
         return func(c, a);
     }
 
@@ -1817,6 +1996,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_num_patterns");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierNumPatternsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_num_patterns");
         return func(c, a);
     }
 
@@ -1838,6 +2018,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_pattern_ast");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierPatternAstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_pattern_ast");
         return func(c, a, i);
     }
 
@@ -1858,6 +2039,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_num_no_patterns");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierNumNoPatternsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_num_no_patterns");
         return func(c, a);
     }
 
@@ -1879,6 +2061,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_no_pattern_ast");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierNoPatternAstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_no_pattern_ast");
         return func(c, a, i);
     }
 
@@ -1899,6 +2082,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_num_bound");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierNumBoundDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_num_bound");
         return func(c, a);
     }
 
@@ -1920,6 +2104,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_bound_name");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierBoundNameDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_bound_name");
         return func(c, a, i);
     }
 
@@ -1941,6 +2126,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_bound_sort");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierBoundSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_bound_sort");
         return func(c, a, i);
     }
 
@@ -1961,6 +2147,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_quantifier_body");
         var func = Marshal.GetDelegateForFunctionPointer<GetQuantifierBodyDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_quantifier_body");
         return func(c, a);
     }
 
@@ -1982,6 +2169,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplify");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifyDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplify");
         return func(c, a);
     }
 
@@ -2006,6 +2194,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplify_ex");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifyExDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplify_ex");
         return func(c, a, p);
     }
 
@@ -2024,6 +2213,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplify_get_help");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifyGetHelpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplify_get_help");
         return func(c);
     }
 
@@ -2042,6 +2232,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplify_get_param_descrs");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifyGetParamDescrsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplify_get_param_descrs");
         return func(c);
     }
 
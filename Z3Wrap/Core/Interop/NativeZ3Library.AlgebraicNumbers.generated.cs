@@ -14,6 +14,7 @@ namespace Spaceorc.Z3Wrap.Core.Interop;
 internal sealed partial class NativeZ3Library
 {
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AlgebraicIsValueDelegate(IntPtr c, IntPtr a);
 
     /// <summary>
@@ -27,10 +28,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_is_value");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicIsValueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_is_value");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AlgebraicIsPosDelegate(IntPtr c, IntPtr a);
 
     /// <summary>
@@ -47,10 +50,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_is_pos");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicIsPosDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_is_pos");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AlgebraicIsNegDelegate(IntPtr c, IntPtr a);
 
     /// <summary>
@@ -67,10 +72,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_is_neg");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicIsNegDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_is_neg");
         return func(c, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AlgebraicIsZeroDelegate(IntPtr c, IntPtr a);
 
     /// <summary>
@@ -87,6 +94,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_is_zero");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicIsZeroDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_is_zero");
         return func(c, a);
     }
 
@@ -107,6 +115,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_sign");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicSignDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_sign");
         return func(c, a);
     }
 
@@ -129,6 +138,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_add");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicAddDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_add");
         return func(c, a, b);
     }
 
@@ -151,6 +161,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_sub");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicSubDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_sub");
         return func(c, a, b);
     }
 
@@ -173,6 +184,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_mul");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicMulDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_mul");
         return func(c, a, b);
     }
 
@@ -196,6 +208,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_div");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicDivDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_div");
         return func(c, a, b);
     }
 
@@ -218,6 +231,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_root");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicRootDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_root");
         return func(c, a, k);
     }
 
@@ -239,10 +253,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_power");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicPowerDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_power");
         return func(c, a, k);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AlgebraicLtDelegate(IntPtr c, IntPtr a, IntPtr b);
 
     /// <summary>
@@ -261,10 +277,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_lt");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicLtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_lt");
         return func(c, a, b);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AlgebraicGtDelegate(IntPtr c, IntPtr a, IntPtr b);
 
     /// <summary>
@@ -283,10 +301,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_gt");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicGtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_gt");
         return func(c, a, b);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AlgebraicLeDelegate(IntPtr c, IntPtr a, IntPtr b);
 
     /// <summary>
@@ -305,10 +325,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_le");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicLeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_le");
         return func(c, a, b);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AlgebraicGeDelegate(IntPtr c, IntPtr a, IntPtr b);
 
     /// <summary>
@@ -327,10 +349,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_ge");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicGeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_ge");
         return func(c, a, b);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AlgebraicEqDelegate(IntPtr c, IntPtr a, IntPtr b);
 
     /// <summary>
@@ -349,10 +373,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_eq");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicEqDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_eq");
         return func(c, a, b);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AlgebraicNeqDelegate(IntPtr c, IntPtr a, IntPtr b);
 
     /// <summary>
@@ -371,6 +397,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_neq");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicNeqDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_neq");
         return func(c, a, b);
     }
 
@@ -394,6 +421,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_roots");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicRootsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_roots");
         return func(c, p, n, a);
     }
 
@@ -417,6 +445,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_eval");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicEvalDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_eval");
         return func(c, p, n, a);
     }
 
@@ -437,6 +466,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_get_poly");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicGetPolyDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_get_poly");
         return func(c, a);
     }
 
@@ -457,6 +487,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_algebraic_get_i");
         var func = Marshal.GetDelegateForFunctionPointer<AlgebraicGetIDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_algebraic_get_i");
         return func(c, a);
     }
 
@@ -33,6 +33,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_select");
         var func = Marshal.GetDelegateForFunctionPointer<MkSelectDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_select");
         return func(c, a, i);
     }
 
@@ -52,9 +53,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_select_n");
         var func = Marshal.GetDelegateForFunctionPointer<MkSelectNDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_select_n");
         return func(c, a, n, idxs);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkSelectNSpanDelegate(IntPtr c, IntPtr a, uint n, ref IntPtr idxs);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_select_n</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkSelectN(IntPtr c, IntPtr a, uint n, ReadOnlySpan<IntPtr> idxs)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_select_n");
+        var func = Marshal.GetDelegateForFunctionPointer<MkSelectNSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_select_n");
+        return func(c, a, n, ref MemoryMarshal.GetReference(idxs));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkStoreDelegate(IntPtr c, IntPtr a, IntPtr i, IntPtr v);
 
@@ -76,6 +92,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_store");
         var func = Marshal.GetDelegateForFunctionPointer<MkStoreDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_store");
         return func(c, a, i, v);
     }
 
@@ -96,9 +113,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_store_n");
         var func = Marshal.GetDelegateForFunctionPointer<MkStoreNDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_store_n");
         return func(c, a, n, idxs, v);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkStoreNSpanDelegate(IntPtr c, IntPtr a, uint n, ref IntPtr idxs, IntPtr v);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_store_n</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkStoreN(IntPtr c, IntPtr a, uint n, ReadOnlySpan<IntPtr> idxs, IntPtr v)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_store_n");
+        var func = Marshal.GetDelegateForFunctionPointer<MkStoreNSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_store_n");
+        return func(c, a, n, ref MemoryMarshal.GetReference(idxs), v);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkConstArrayDelegate(IntPtr c, IntPtr domain, IntPtr v);
 
@@ -117,6 +149,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_const_array");
         var func = Marshal.GetDelegateForFunctionPointer<MkConstArrayDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_const_array");
         return func(c, domain, v);
     }
 
@@ -142,9 +175,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_map");
         var func = Marshal.GetDelegateForFunctionPointer<MkMapDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_map");
         return func(c, f, n, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkMapSpanDelegate(IntPtr c, IntPtr f, uint n, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_map</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkMap(IntPtr c, IntPtr f, uint n, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_map");
+        var func = Marshal.GetDelegateForFunctionPointer<MkMapSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_map");
+        return func(c, f, n, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkArrayDefaultDelegate(IntPtr c, IntPtr array);
 
@@ -159,6 +207,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_array_default");
         var func = Marshal.GetDelegateForFunctionPointer<MkArrayDefaultDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_array_default");
         return func(c, array);
     }
 
@@ -176,6 +225,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_as_array");
         var func = Marshal.GetDelegateForFunctionPointer<MkAsArrayDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_as_array");
         return func(c, f);
     }
 
@@ -194,6 +244,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_set_has_size");
         var func = Marshal.GetDelegateForFunctionPointer<MkSetHasSizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_has_size");
         return func(c, set, k);
     }
 
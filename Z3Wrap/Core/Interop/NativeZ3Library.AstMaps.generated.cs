@@ -29,6 +29,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_ast_map");
         var func = Marshal.GetDelegateForFunctionPointer<MkAstMapDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_ast_map");
         return func(c);
     }
 
@@ -45,6 +46,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_map_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<AstMapIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_map_inc_ref");
         func(c, m);
     }
 
@@ -61,10 +63,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_map_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<AstMapDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_map_dec_ref");
         func(c, m);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool AstMapContainsDelegate(IntPtr c, IntPtr m, IntPtr k);
 
     /// <summary>
@@ -79,6 +83,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_map_contains");
         var func = Marshal.GetDelegateForFunctionPointer<AstMapContainsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_map_contains");
         return func(c, m, k);
     }
 
@@ -100,6 +105,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_map_find");
         var func = Marshal.GetDelegateForFunctionPointer<AstMapFindDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_map_find");
         return func(c, m, k);
     }
 
@@ -118,6 +124,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_map_insert");
         var func = Marshal.GetDelegateForFunctionPointer<AstMapInsertDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_map_insert");
         func(c, m, k, v);
     }
 
@@ -135,6 +142,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_map_erase");
         var func = Marshal.GetDelegateForFunctionPointer<AstMapEraseDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_map_erase");
         func(c, m, k);
     }
 
@@ -151,6 +159,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_map_reset");
         var func = Marshal.GetDelegateForFunctionPointer<AstMapResetDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_map_reset");
         func(c, m);
     }
 
@@ -168,6 +177,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_map_size");
         var func = Marshal.GetDelegateForFunctionPointer<AstMapSizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_map_size");
         return func(c, m);
     }
 
@@ -185,6 +195,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_map_keys");
         var func = Marshal.GetDelegateForFunctionPointer<AstMapKeysDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_map_keys");
         return func(c, m);
     }
 
@@ -202,6 +213,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_map_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<AstMapToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_map_to_string");
         return func(c, m);
     }
 
@@ -29,6 +29,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_ast_vector");
         var func = Marshal.GetDelegateForFunctionPointer<MkAstVectorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_ast_vector");
         return func(c);
     }
 
@@ -45,6 +46,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_vector_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<AstVectorIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_vector_inc_ref");
         func(c, v);
     }
 
@@ -61,6 +63,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_vector_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<AstVectorDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_vector_dec_ref");
         func(c, v);
     }
 
@@ -78,6 +81,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_vector_size");
         var func = Marshal.GetDelegateForFunctionPointer<AstVectorSizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_vector_size");
         return func(c, v);
     }
 
@@ -99,6 +103,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_vector_get");
         var func = Marshal.GetDelegateForFunctionPointer<AstVectorGetDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_vector_get");
         return func(c, v, i);
     }
 
@@ -120,6 +125,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_vector_set");
         var func = Marshal.GetDelegateForFunctionPointer<AstVectorSetDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_vector_set");
         func(c, v, i, a);
     }
 
@@ -137,6 +143,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_vector_resize");
         var func = Marshal.GetDelegateForFunctionPointer<AstVectorResizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_vector_resize");
         func(c, v, n);
     }
 
@@ -154,6 +161,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_vector_push");
         var func = Marshal.GetDelegateForFunctionPointer<AstVectorPushDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_vector_push");
         func(c, v, a);
     }
 
@@ -172,6 +180,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_vector_translate");
         var func = Marshal.GetDelegateForFunctionPointer<AstVectorTranslateDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_vector_translate");
         return func(s, v, t);
     }
 
@@ -189,6 +198,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_vector_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<AstVectorToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_vector_to_string");
         return func(c, v);
     }
 
@@ -30,6 +30,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvnot");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvnotDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvnot");
         return func(c, t1);
     }
 
@@ -50,6 +51,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvredand");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvredandDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvredand");
         return func(c, t1);
     }
 
@@ -70,6 +72,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvredor");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvredorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvredor");
         return func(c, t1);
     }
 
@@ -91,6 +94,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvand");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvandDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvand");
         return func(c, t1, t2);
     }
 
@@ -112,6 +116,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvor");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvor");
         return func(c, t1, t2);
     }
 
@@ -133,6 +138,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvxor");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvxorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvxor");
         return func(c, t1, t2);
     }
 
@@ -154,6 +160,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvnand");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvnandDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvnand");
         return func(c, t1, t2);
     }
 
@@ -175,6 +182,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvnor");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvnorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvnor");
         return func(c, t1, t2);
     }
 
@@ -196,6 +204,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvxnor");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvxnorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvxnor");
         return func(c, t1, t2);
     }
 
@@ -216,6 +225,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvneg");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvnegDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvneg");
         return func(c, t1);
     }
 
@@ -237,6 +247,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvadd");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvaddDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvadd");
         return func(c, t1, t2);
     }
 
@@ -258,6 +269,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvsub");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsubDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvsub");
         return func(c, t1, t2);
     }
 
@@ -279,6 +291,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvmul");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvmulDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvmul");
         return func(c, t1, t2);
     }
 
@@ -300,6 +313,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvudiv");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvudivDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvudiv");
         return func(c, t1, t2);
     }
 
@@ -321,6 +335,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvsdiv");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsdivDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvsdiv");
         return func(c, t1, t2);
     }
 
@@ -342,6 +357,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvurem");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvuremDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvurem");
         return func(c, t1, t2);
     }
 
@@ -364,6 +380,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvsrem");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsremDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvsrem");
         return func(c, t1, t2);
     }
 
@@ -386,6 +403,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvsmod");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsmodDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvsmod");
         return func(c, t1, t2);
     }
 
@@ -407,6 +425,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvult");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvultDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvult");
         return func(c, t1, t2);
     }
 
@@ -433,6 +452,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvslt");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsltDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvslt");
         return func(c, t1, t2);
     }
 
@@ -454,6 +474,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvule");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvuleDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvule");
         return func(c, t1, t2);
     }
 
@@ -475,6 +496,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvsle");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsleDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvsle");
         return func(c, t1, t2);
     }
 
@@ -496,6 +518,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvuge");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvugeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvuge");
         return func(c, t1, t2);
     }
 
@@ -517,6 +540,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvsge");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsgeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvsge");
         return func(c, t1, t2);
     }
 
@@ -538,6 +562,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvugt");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvugtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvugt");
         return func(c, t1, t2);
     }
 
@@ -559,6 +584,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvsgt");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsgtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvsgt");
         return func(c, t1, t2);
     }
 
@@ -580,6 +606,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_concat");
         var func = Marshal.GetDelegateForFunctionPointer<MkConcatDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_concat");
         return func(c, t1, t2);
     }
 
@@ -602,6 +629,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_extract");
         var func = Marshal.GetDelegateForFunctionPointer<MkExtractDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_extract");
         return func(c, high, low, t1);
     }
 
@@ -623,6 +651,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_sign_ext");
         var func = Marshal.GetDelegateForFunctionPointer<MkSignExtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_sign_ext");
         return func(c, i, t1);
     }
 
@@ -644,6 +673,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_zero_ext");
         var func = Marshal.GetDelegateForFunctionPointer<MkZeroExtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_zero_ext");
         return func(c, i, t1);
     }
 
@@ -665,6 +695,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_repeat");
         var func = Marshal.GetDelegateForFunctionPointer<MkRepeatDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_repeat");
         return func(c, i, t1);
     }
 
@@ -686,6 +717,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bit2bool");
         var func = Marshal.GetDelegateForFunctionPointer<MkBit2boolDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bit2bool");
         return func(c, i, t1);
     }
 
@@ -707,6 +739,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvshl");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvshlDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvshl");
         return func(c, t1, t2);
     }
 
@@ -728,6 +761,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvlshr");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvlshrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvlshr");
         return func(c, t1, t2);
     }
 
@@ -749,6 +783,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvashr");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvashrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvashr");
         return func(c, t1, t2);
     }
 
@@ -770,6 +805,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_rotate_left");
         var func = Marshal.GetDelegateForFunctionPointer<MkRotateLeftDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_rotate_left");
         return func(c, i, t1);
     }
 
@@ -791,6 +827,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_rotate_right");
         var func = Marshal.GetDelegateForFunctionPointer<MkRotateRightDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_rotate_right");
         return func(c, i, t1);
     }
 
@@ -812,6 +849,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_ext_rotate_left");
         var func = Marshal.GetDelegateForFunctionPointer<MkExtRotateLeftDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_ext_rotate_left");
         return func(c, t1, t2);
     }
 
@@ -833,6 +871,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_ext_rotate_right");
         var func = Marshal.GetDelegateForFunctionPointer<MkExtRotateRightDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_ext_rotate_right");
         return func(c, t1, t2);
     }
 
@@ -854,11 +893,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_int2bv");
         var func = Marshal.GetDelegateForFunctionPointer<MkInt2bvDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_int2bv");
         return func(c, n, t1);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkBv2intDelegate(IntPtr c, IntPtr t1, bool isSigned);
+    private delegate IntPtr MkBv2intDelegate(IntPtr c, IntPtr t1, [MarshalAs(UnmanagedType.U1)] bool isSigned);
 
     /// <summary>
     ///  Create an integer from the bit-vector argument <c>t1</c> . If <c>is_signed</c> is false, then the bit-vector <c>t1</c> is treated as unsigned. So the result is non-negative and in the range <c>[0..2^N-1]</c> , where N are the number of bits in <c>t1</c> . If <c>is_signed</c> is true, <c>t1</c> is treated as a signed bit-vector. 
@@ -875,11 +915,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bv2int");
         var func = Marshal.GetDelegateForFunctionPointer<MkBv2intDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bv2int");
         return func(c, t1, isSigned);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkBvaddNoOverflowDelegate(IntPtr c, IntPtr t1, IntPtr t2, bool isSigned);
+    private delegate IntPtr MkBvaddNoOverflowDelegate(IntPtr c, IntPtr t1, IntPtr t2, [MarshalAs(UnmanagedType.U1)] bool isSigned);
 
     /// <summary>
     ///  Create a predicate that checks that the bit-wise addition of <c>t1</c> and <c>t2</c> does not overflow. 
@@ -897,6 +938,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvadd_no_overflow");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvaddNoOverflowDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvadd_no_overflow");
         return func(c, t1, t2, isSigned);
     }
 
@@ -918,6 +960,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvadd_no_underflow");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvaddNoUnderflowDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvadd_no_underflow");
         return func(c, t1, t2);
     }
 
@@ -939,11 +982,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvsub_no_overflow");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsubNoOverflowDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvsub_no_overflow");
         return func(c, t1, t2);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkBvsubNoUnderflowDelegate(IntPtr c, IntPtr t1, IntPtr t2, bool isSigned);
+    private delegate IntPtr MkBvsubNoUnderflowDelegate(IntPtr c, IntPtr t1, IntPtr t2, [MarshalAs(UnmanagedType.U1)] bool isSigned);
 
     /// <summary>
     ///  Create a predicate that checks that the bit-wise subtraction of <c>t1</c> and <c>t2</c> does not underflow. 
@@ -961,6 +1005,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvsub_no_underflow");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsubNoUnderflowDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvsub_no_underflow");
         return func(c, t1, t2, isSigned);
     }
 
@@ -982,6 +1027,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvsdiv_no_overflow");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvsdivNoOverflowDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvsdiv_no_overflow");
         return func(c, t1, t2);
     }
 
@@ -1002,11 +1048,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvneg_no_overflow");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvnegNoOverflowDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvneg_no_overflow");
         return func(c, t1);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkBvmulNoOverflowDelegate(IntPtr c, IntPtr t1, IntPtr t2, bool isSigned);
+    private delegate IntPtr MkBvmulNoOverflowDelegate(IntPtr c, IntPtr t1, IntPtr t2, [MarshalAs(UnmanagedType.U1)] bool isSigned);
 
     /// <summary>
     ///  Create a predicate that checks that the bit-wise multiplication of <c>t1</c> and <c>t2</c> does not overflow. 
@@ -1024,6 +1071,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvmul_no_overflow");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvmulNoOverflowDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvmul_no_overflow");
         return func(c, t1, t2, isSigned);
     }
 
@@ -1045,6 +1093,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bvmul_no_underflow");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvmulNoUnderflowDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bvmul_no_underflow");
         return func(c, t1, t2);
     }
 
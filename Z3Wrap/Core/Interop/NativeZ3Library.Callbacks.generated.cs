@@ -27,7 +27,7 @@ internal sealed partial class NativeZ3Library
     /// <param name="idx" ctype="unsigned">unsigned parameter</param>
     /// <param name="phase" ctype="bool">bool parameter</param>
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    internal delegate void DecideEhCallback(IntPtr ctx, IntPtr cb, IntPtr t, uint idx, bool phase);
+    internal delegate void DecideEhCallback(IntPtr ctx, IntPtr cb, IntPtr t, uint idx, [MarshalAs(UnmanagedType.U1)] bool phase);
 
     /// <summary>Z3_eq_eh</summary>
     /// <param name="ctx" ctype="void*">void* parameter</param>
@@ -73,6 +73,7 @@ internal sealed partial class NativeZ3Library
     /// <param name="inst" ctype="Z3_ast">Z3_ast parameter</param>
     /// <returns ctype="bool">bool value</returns>
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     internal delegate bool OnBindingEhCallback(IntPtr ctx, IntPtr cb, IntPtr q, IntPtr inst);
 
     /// <summary>Z3_on_clause_eh</summary>
@@ -26,19 +26,34 @@ internal sealed partial class NativeZ3Library
     /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
     /// <returns ctype="Z3_func_decl">func_decl value</returns>
     /// <remarks>
-    /// After declaring a constant or function, the function <see cref="MkApp"/> can be used to create a constant or function application.
+    /// After declaring a constant or function, the function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
     /// </remarks>
-    /// <seealso cref="MkApp"/>
-    /// <seealso cref="MkFreshFuncDecl"/>
-    /// <seealso cref="MkRecFuncDecl"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_func_decl")]
     internal IntPtr MkFuncDecl(IntPtr c, IntPtr s, uint domainSize, IntPtr[] domain, IntPtr range)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_func_decl");
         var func = Marshal.GetDelegateForFunctionPointer<MkFuncDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_func_decl");
         return func(c, s, domainSize, domain, range);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkFuncDeclSpanDelegate(IntPtr c, IntPtr s, uint domainSize, ref IntPtr domain, IntPtr range);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_func_decl</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkFuncDecl(IntPtr c, IntPtr s, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_func_decl");
+        var func = Marshal.GetDelegateForFunctionPointer<MkFuncDeclSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_func_decl");
+        return func(c, s, domainSize, ref MemoryMarshal.GetReference(domain), range);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkAppDelegate(IntPtr c, IntPtr d, uint numArgs, IntPtr[] args);
 
@@ -50,17 +65,32 @@ internal sealed partial class NativeZ3Library
     /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
     /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
-    /// <seealso cref="MkFreshFuncDecl"/>
-    /// <seealso cref="MkFuncDecl"/>
-    /// <seealso cref="MkRecFuncDecl"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_app")]
     internal IntPtr MkApp(IntPtr c, IntPtr d, uint numArgs, IntPtr[] args)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_app");
         var func = Marshal.GetDelegateForFunctionPointer<MkAppDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_app");
         return func(c, d, numArgs, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkAppSpanDelegate(IntPtr c, IntPtr d, uint numArgs, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_app</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkApp(IntPtr c, IntPtr d, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_app");
+        var func = Marshal.GetDelegateForFunctionPointer<MkAppSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_app");
+        return func(c, d, numArgs, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkConstDelegate(IntPtr c, IntPtr s, IntPtr ty);
 
@@ -77,14 +107,15 @@ internal sealed partial class NativeZ3Library
     /// Z3_ast n            = Z3_mk_app(c, d, 0, 0);
     /// </code>
     /// </remarks>
-    /// <seealso cref="MkApp"/>
-    /// <seealso cref="MkFreshConst"/>
-    /// <seealso cref="MkFuncDecl"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFreshConst(IntPtr, IntPtr, IntPtr)"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_const")]
     internal IntPtr MkConst(IntPtr c, IntPtr s, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_const");
         var func = Marshal.GetDelegateForFunctionPointer<MkConstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_const");
         return func(c, s, ty);
     }
 
@@ -104,15 +135,44 @@ internal sealed partial class NativeZ3Library
     /// Z3 will generate an unique name for this function declaration. If prefix is different from <c>NULL</c> , then the name generate by Z3 will start with <c>prefix</c> .
     /// If <c>prefix</c> is <c>NULL</c> , then it is assumed to be the empty string. 
     /// </remarks>
-    /// <seealso cref="MkFuncDecl"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_fresh_func_decl")]
     internal IntPtr MkFreshFuncDecl(IntPtr c, IntPtr prefix, uint domainSize, IntPtr[] domain, IntPtr range)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fresh_func_decl");
         var func = Marshal.GetDelegateForFunctionPointer<MkFreshFuncDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fresh_func_decl");
         return func(c, prefix, domainSize, domain, range);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkFreshFuncDeclSpanDelegate(IntPtr c, IntPtr prefix, uint domainSize, ref IntPtr domain, IntPtr range);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_fresh_func_decl</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkFreshFuncDecl(IntPtr c, IntPtr prefix, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_fresh_func_decl");
+        var func = Marshal.GetDelegateForFunctionPointer<MkFreshFuncDeclSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fresh_func_decl");
+        return func(c, prefix, domainSize, ref MemoryMarshal.GetReference(domain), range);
+    }
+
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkFreshFuncDeclUtf8Delegate(IntPtr c, ref byte prefix, uint domainSize, ref IntPtr domain, IntPtr range);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_mk_fresh_func_decl</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr MkFreshFuncDecl(IntPtr c, ReadOnlySpan<byte> prefix, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_fresh_func_decl");
+        var func = Marshal.GetDelegateForFunctionPointer<MkFreshFuncDeclUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fresh_func_decl");
+        return func(c, ref MemoryMarshal.GetReference(prefix), domainSize, ref MemoryMarshal.GetReference(domain), range);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkFreshConstDelegate(IntPtr c, IntPtr prefix, IntPtr ty);
 
@@ -129,18 +189,33 @@ internal sealed partial class NativeZ3Library
     /// </code>
     /// If <c>prefix</c> is <c>NULL</c> , then it is assumed to be the empty string. 
     /// </remarks>
-    /// <seealso cref="MkApp"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
     /// <seealso cref="MkConst"/>
-    /// <seealso cref="MkFreshFuncDecl"/>
-    /// <seealso cref="MkFuncDecl"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_fresh_const")]
     internal IntPtr MkFreshConst(IntPtr c, IntPtr prefix, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fresh_const");
         var func = Marshal.GetDelegateForFunctionPointer<MkFreshConstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fresh_const");
         return func(c, prefix, ty);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkFreshConstUtf8Delegate(IntPtr c, ref byte prefix, IntPtr ty);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_mk_fresh_const</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr MkFreshConst(IntPtr c, ReadOnlySpan<byte> prefix, IntPtr ty)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_fresh_const");
+        var func = Marshal.GetDelegateForFunctionPointer<MkFreshConstUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fresh_const");
+        return func(c, ref MemoryMarshal.GetReference(prefix), ty);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkRecFuncDeclDelegate(IntPtr c, IntPtr s, uint domainSize, IntPtr[] domain, IntPtr range);
 
@@ -154,19 +229,34 @@ internal sealed partial class NativeZ3Library
     /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
     /// <returns ctype="Z3_func_decl">func_decl value</returns>
     /// <remarks>
-    /// After declaring recursive function, it should be associated with a recursive definition <see cref="AddRecDef"/> . The function <see cref="MkApp"/> can be used to create a constant or function application.
+    /// After declaring recursive function, it should be associated with a recursive definition <see cref="AddRecDef"/> . The function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
     /// </remarks>
     /// <seealso cref="AddRecDef"/>
-    /// <seealso cref="MkApp"/>
-    /// <seealso cref="MkFuncDecl"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_rec_func_decl")]
     internal IntPtr MkRecFuncDecl(IntPtr c, IntPtr s, uint domainSize, IntPtr[] domain, IntPtr range)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_rec_func_decl");
         var func = Marshal.GetDelegateForFunctionPointer<MkRecFuncDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_rec_func_decl");
         return func(c, s, domainSize, domain, range);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkRecFuncDeclSpanDelegate(IntPtr c, IntPtr s, uint domainSize, ref IntPtr domain, IntPtr range);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_rec_func_decl</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkRecFuncDecl(IntPtr c, IntPtr s, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_rec_func_decl");
+        var func = Marshal.GetDelegateForFunctionPointer<MkRecFuncDeclSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_rec_func_decl");
+        return func(c, s, domainSize, ref MemoryMarshal.GetReference(domain), range);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void AddRecDefDelegate(IntPtr c, IntPtr f, uint n, IntPtr[] args, IntPtr body);
 
@@ -181,12 +271,13 @@ internal sealed partial class NativeZ3Library
     /// <remarks>
     /// After declaring a recursive function or a collection of mutually recursive functions, use this function to provide the definition for the recursive function.
     /// </remarks>
-    /// <seealso cref="MkRecFuncDecl"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_add_rec_def")]
     internal void AddRecDef(IntPtr c, IntPtr f, uint n, IntPtr[] args, IntPtr body)
     {
         var funcPtr = GetFunctionPointer("Z3_add_rec_def");
         var func = Marshal.GetDelegateForFunctionPointer<AddRecDefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_add_rec_def");
         func(c, f, n, args, body);
     }
 
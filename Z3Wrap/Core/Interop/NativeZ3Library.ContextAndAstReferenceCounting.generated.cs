@@ -22,7 +22,7 @@ internal sealed partial class NativeZ3Library
     /// <param name="c" ctype="Z3_config">config parameter</param>
     /// <returns ctype="Z3_context">context value</returns>
     /// <remarks>
-    /// After a context is created, the configuration cannot be changed, although some parameters can be changed using <see cref="UpdateParamValue"/> . All main interaction with Z3 happens in the context of a <c>Z3_context</c> . In contrast to <c>Z3_mk_context_rc</c> the life time of <c>Z3_ast</c> objects persists with the life time of the context. Note that all other reference counted objects, including <c>Z3_model</c> , <c>Z3_solver</c> , <c>Z3_func_interp</c> have to be managed by the caller. Their reference counts are not handled by the context.
+    /// After a context is created, the configuration cannot be changed, although some parameters can be changed using <see cref="UpdateParamValue(IntPtr, IntPtr, IntPtr)"/> . All main interaction with Z3 happens in the context of a <c>Z3_context</c> . In contrast to <c>Z3_mk_context_rc</c> the life time of <c>Z3_ast</c> objects persists with the life time of the context. Note that all other reference counted objects, including <c>Z3_model</c> , <c>Z3_solver</c> , <c>Z3_func_interp</c> have to be managed by the caller. Their reference counts are not handled by the context.
     /// Thread safety: objects created using a given context should not be accessed from different threads without synchronization. In other words, operations on a context are not thread safe. To use Z3 from different threads create separate context objects. The <c>Z3_translate</c> , <c>Z3_solver_translate</c> , <c>Z3_model_translate</c> , <c>Z3_goal_translate</c> methods are exposed to allow copying state from one context to another. 
     ///  <c>Z3_sort</c> , <c>Z3_func_decl</c> , <c>Z3_app</c> , <c>Z3_pattern</c> are <c>Z3_ast's</c> .  Z3 uses hash-consing, i.e., when the same <c>Z3_ast</c> is created twice, Z3 will return the same pointer twice.   
     /// </remarks>
@@ -32,6 +32,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_context");
         var func = Marshal.GetDelegateForFunctionPointer<MkContextDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_context");
         return func(c);
     }
 
@@ -51,6 +52,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_context_rc");
         var func = Marshal.GetDelegateForFunctionPointer<MkContextRcDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_context_rc");
         return func(c);
     }
 
@@ -67,6 +69,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_del_context");
         var func = Marshal.GetDelegateForFunctionPointer<DelContextDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_del_context");
         func(c);
     }
 
@@ -83,6 +86,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<IncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_inc_ref");
         func(c, a);
     }
 
@@ -99,6 +103,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<DecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_dec_ref");
         func(c, a);
     }
 
@@ -111,15 +116,30 @@ internal sealed partial class NativeZ3Library
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="paramId" ctype="Z3_string">string parameter</param>
     /// <param name="paramValue" ctype="Z3_string">string parameter</param>
-    /// <seealso cref="GlobalParamSet"/>
+    /// <seealso cref="GlobalParamSet(IntPtr, IntPtr)"/>
     [Z3Function("Z3_update_param_value")]
     internal void UpdateParamValue(IntPtr c, IntPtr paramId, IntPtr paramValue)
     {
         var funcPtr = GetFunctionPointer("Z3_update_param_value");
         var func = Marshal.GetDelegateForFunctionPointer<UpdateParamValueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_update_param_value");
         func(c, paramId, paramValue);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void UpdateParamValueUtf8Delegate(IntPtr c, ref byte paramId, ref byte paramValue);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_update_param_value</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal void UpdateParamValue(IntPtr c, ReadOnlySpan<byte> paramId, ReadOnlySpan<byte> paramValue)
+    {
+        var funcPtr = GetFunctionPointer("Z3_update_param_value");
+        var func = Marshal.GetDelegateForFunctionPointer<UpdateParamValueUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_update_param_value");
+        func(c, ref MemoryMarshal.GetReference(paramId), ref MemoryMarshal.GetReference(paramValue));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr GetGlobalParamDescrsDelegate(IntPtr c);
 
@@ -133,6 +153,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_global_param_descrs");
         var func = Marshal.GetDelegateForFunctionPointer<GetGlobalParamDescrsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_global_param_descrs");
         return func(c);
     }
 
@@ -148,6 +169,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_interrupt");
         var func = Marshal.GetDelegateForFunctionPointer<InterruptDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_interrupt");
         func(c);
     }
 
@@ -163,6 +185,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_enable_concurrent_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<EnableConcurrentDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_enable_concurrent_dec_ref");
         func(c);
     }
 
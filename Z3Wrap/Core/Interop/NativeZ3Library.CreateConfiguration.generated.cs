@@ -24,13 +24,14 @@ internal sealed partial class NativeZ3Library
     /// Configurations are created in order to assign parameters prior to creating contexts for Z3 interaction. For example, if the users wishes to use proof generation, then call: <c>Z3_set_param_value(cfg\, "proof"\, "true")</c>
     /// In previous versions of Z3, the <c>Z3_config</c> was used to store global and module configurations. Now, we should use <c>Z3_global_param_set</c> . 
     /// </remarks>
-    /// <seealso cref="SetParamValue"/>
+    /// <seealso cref="SetParamValue(IntPtr, IntPtr, IntPtr)"/>
     /// <seealso cref="DelConfig"/>
     [Z3Function("Z3_mk_config")]
     internal IntPtr MkConfig()
     {
         var funcPtr = GetFunctionPointer("Z3_mk_config");
         var func = Marshal.GetDelegateForFunctionPointer<MkConfigDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_config");
         return func();
     }
 
@@ -47,6 +48,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_del_config");
         var func = Marshal.GetDelegateForFunctionPointer<DelConfigDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_del_config");
         func(c);
     }
 
@@ -68,7 +70,22 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_set_param_value");
         var func = Marshal.GetDelegateForFunctionPointer<SetParamValueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_set_param_value");
         func(c, paramId, paramValue);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void SetParamValueUtf8Delegate(IntPtr c, ref byte paramId, ref byte paramValue);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_set_param_value</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal void SetParamValue(IntPtr c, ReadOnlySpan<byte> paramId, ReadOnlySpan<byte> paramValue)
+    {
+        var funcPtr = GetFunctionPointer("Z3_set_param_value");
+        var func = Marshal.GetDelegateForFunctionPointer<SetParamValueUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_set_param_value");
+        func(c, ref MemoryMarshal.GetReference(paramId), ref MemoryMarshal.GetReference(paramValue));
+    }
+
 }
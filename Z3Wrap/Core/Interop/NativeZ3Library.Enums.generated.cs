@@ -2276,7 +2276,7 @@ internal sealed partial class NativeZ3Library
         /// Z3_NO_PARSER
         /// </summary>
         /// <remarks>
-        /// Parser output is not available, that is, user didn't invoke <see cref="ParseSmtlib2String"/> or <see cref="ParseSmtlib2File"/>.
+        /// Parser output is not available, that is, user didn't invoke <see cref="ParseSmtlib2String(IntPtr, IntPtr, uint, IntPtr[], IntPtr[], uint, IntPtr[], IntPtr[])"/> or <see cref="ParseSmtlib2File(IntPtr, IntPtr, uint, IntPtr[], IntPtr[], uint, IntPtr[], IntPtr[])"/>.
         /// </remarks>
         Z3_NO_PARSER = 5,
         /// <summary>
@@ -2533,7 +2533,7 @@ internal sealed partial class NativeZ3Library
     /// In Z3, a symbol can be represented using integers and strings (See <see cref="GetSymbolKind"/>).
     /// </summary>
     /// <seealso cref="MkIntSymbol"/>
-    /// <seealso cref="MkStringSymbol"/>
+    /// <seealso cref="MkStringSymbol(IntPtr, IntPtr)"/>
     internal enum SymbolKind
     {
         /// <summary>Z3_INT_SYMBOL</summary>
@@ -30,6 +30,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_error_code");
         var func = Marshal.GetDelegateForFunctionPointer<GetErrorCodeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_error_code");
         return func(c);
     }
 
@@ -43,7 +44,7 @@ internal sealed partial class NativeZ3Library
     /// <param name="h" ctype="Z3_error_handler">error_handler parameter</param>
     /// <remarks>
     /// A call to a Z3 function may return a non <c>Z3_OK</c> error code, when it is not used correctly. An error handler can be registered and will be called in this case. To disable the use of the error handler, simply register with <c>h=NULL</c> .
-    /// Warning: Log files, created using <see cref="OpenLog"/> , may be potentially incomplete/incorrect if error handlers are used. 
+    /// Warning: Log files, created using <see cref="OpenLog(IntPtr)"/> , may be potentially incomplete/incorrect if error handlers are used. 
     /// </remarks>
     /// <seealso cref="GetErrorCode"/>
     [Z3Function("Z3_set_error_handler")]
@@ -51,6 +52,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_set_error_handler");
         var func = Marshal.GetDelegateForFunctionPointer<SetErrorHandlerDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_set_error_handler");
         func(c, h);
     }
 
@@ -67,6 +69,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_set_error");
         var func = Marshal.GetDelegateForFunctionPointer<SetErrorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_set_error");
         func(c, e);
     }
 
@@ -84,6 +87,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_error_msg");
         var func = Marshal.GetDelegateForFunctionPointer<GetErrorMsgDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_error_msg");
         return func(c, err);
     }
 
@@ -36,6 +36,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_rounding_mode_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRoundingModeSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_rounding_mode_sort");
         return func(c);
     }
 
@@ -60,6 +61,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_round_nearest_ties_to_even");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRoundNearestTiesToEvenDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_round_nearest_ties_to_even");
         return func(c);
     }
 
@@ -84,6 +86,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_rne");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRneDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_rne");
         return func(c);
     }
 
@@ -108,6 +111,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_round_nearest_ties_to_away");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRoundNearestTiesToAwayDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_round_nearest_ties_to_away");
         return func(c);
     }
 
@@ -132,6 +136,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_rna");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRnaDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_rna");
         return func(c);
     }
 
@@ -156,6 +161,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_round_toward_positive");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRoundTowardPositiveDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_round_toward_positive");
         return func(c);
     }
 
@@ -180,6 +186,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_rtp");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRtpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_rtp");
         return func(c);
     }
 
@@ -204,6 +211,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_round_toward_negative");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRoundTowardNegativeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_round_toward_negative");
         return func(c);
     }
 
@@ -228,6 +236,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_rtn");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRtnDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_rtn");
         return func(c);
     }
 
@@ -252,6 +261,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_round_toward_zero");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRoundTowardZeroDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_round_toward_zero");
         return func(c);
     }
 
@@ -276,6 +286,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_rtz");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRtzDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_rtz");
         return func(c);
     }
 
@@ -305,6 +316,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sort");
         return func(c, ebits, sbits);
     }
 
@@ -328,6 +340,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sort_half");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSortHalfDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sort_half");
         return func(c);
     }
 
@@ -351,6 +364,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sort_16");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSort16Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sort_16");
         return func(c);
     }
 
@@ -374,6 +388,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sort_single");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSortSingleDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sort_single");
         return func(c);
     }
 
@@ -397,6 +412,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sort_32");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSort32Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sort_32");
         return func(c);
     }
 
@@ -420,6 +436,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sort_double");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSortDoubleDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sort_double");
         return func(c);
     }
 
@@ -443,6 +460,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sort_64");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSort64Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sort_64");
         return func(c);
     }
 
@@ -466,6 +484,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sort_quadruple");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSortQuadrupleDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sort_quadruple");
         return func(c);
     }
 
@@ -489,6 +508,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sort_128");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSort128Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sort_128");
         return func(c);
     }
 
@@ -509,11 +529,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_nan");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaNanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_nan");
         return func(c, s);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkFpaInfDelegate(IntPtr c, IntPtr s, bool negative);
+    private delegate IntPtr MkFpaInfDelegate(IntPtr c, IntPtr s, [MarshalAs(UnmanagedType.U1)] bool negative);
 
     /// <summary>
     ///  Create a floating-point infinity of sort <c>s</c> . 
@@ -533,11 +554,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_inf");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaInfDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_inf");
         return func(c, s, negative);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkFpaZeroDelegate(IntPtr c, IntPtr s, bool negative);
+    private delegate IntPtr MkFpaZeroDelegate(IntPtr c, IntPtr s, [MarshalAs(UnmanagedType.U1)] bool negative);
 
     /// <summary>
     ///  Create a floating-point zero of sort <c>s</c> . 
@@ -557,6 +579,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_zero");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaZeroDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_zero");
         return func(c, s, negative);
     }
 
@@ -579,12 +602,13 @@ internal sealed partial class NativeZ3Library
     /// <seealso cref="MkFpaNumeralInt"/>
     /// <seealso cref="MkFpaNumeralIntUint"/>
     /// <seealso cref="MkFpaNumeralInt64Uint64"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_fpa_fp")]
     internal IntPtr MkFpaFp(IntPtr c, IntPtr sgn, IntPtr exp, IntPtr sig)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_fp");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaFpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_fp");
         return func(c, sgn, exp, sig);
     }
 
@@ -599,19 +623,20 @@ internal sealed partial class NativeZ3Library
     /// <param name="ty" ctype="Z3_sort"> sort </param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function is used to create numerals that fit in a float value. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string. <c>ty</c> must be a FloatingPoint sort
+    /// This function is used to create numerals that fit in a float value. It is slightly faster than <see cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/> since it is not necessary to parse a string. <c>ty</c> must be a FloatingPoint sort
     /// </remarks>
     /// <seealso cref="MkFpaFp"/>
     /// <seealso cref="MkFpaNumeralDouble"/>
     /// <seealso cref="MkFpaNumeralInt"/>
     /// <seealso cref="MkFpaNumeralIntUint"/>
     /// <seealso cref="MkFpaNumeralInt64Uint64"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_fpa_numeral_float")]
     internal IntPtr MkFpaNumeralFloat(IntPtr c, float v, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_numeral_float");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaNumeralFloatDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_numeral_float");
         return func(c, v, ty);
     }
 
@@ -626,19 +651,20 @@ internal sealed partial class NativeZ3Library
     /// <param name="ty" ctype="Z3_sort"> sort </param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function is used to create numerals that fit in a double value. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string. <c>ty</c> must be a FloatingPoint sort
+    /// This function is used to create numerals that fit in a double value. It is slightly faster than <see cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/> since it is not necessary to parse a string. <c>ty</c> must be a FloatingPoint sort
     /// </remarks>
     /// <seealso cref="MkFpaFp"/>
     /// <seealso cref="MkFpaNumeralFloat"/>
     /// <seealso cref="MkFpaNumeralInt"/>
     /// <seealso cref="MkFpaNumeralIntUint"/>
     /// <seealso cref="MkFpaNumeralInt64Uint64"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_fpa_numeral_double")]
     internal IntPtr MkFpaNumeralDouble(IntPtr c, double v, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_numeral_double");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaNumeralDoubleDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_numeral_double");
         return func(c, v, ty);
     }
 
@@ -660,17 +686,18 @@ internal sealed partial class NativeZ3Library
     /// <seealso cref="MkFpaNumeralFloat"/>
     /// <seealso cref="MkFpaNumeralIntUint"/>
     /// <seealso cref="MkFpaNumeralInt64Uint64"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_fpa_numeral_int")]
     internal IntPtr MkFpaNumeralInt(IntPtr c, int v, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_numeral_int");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaNumeralIntDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_numeral_int");
         return func(c, v, ty);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkFpaNumeralIntUintDelegate(IntPtr c, bool sgn, int exp, uint sig, IntPtr ty);
+    private delegate IntPtr MkFpaNumeralIntUintDelegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool sgn, int exp, uint sig, IntPtr ty);
 
     /// <summary>
     ///  Create a numeral of FloatingPoint sort from a sign bit and two integers. 
@@ -689,17 +716,18 @@ internal sealed partial class NativeZ3Library
     /// <seealso cref="MkFpaNumeralFloat"/>
     /// <seealso cref="MkFpaNumeralInt"/>
     /// <seealso cref="MkFpaNumeralInt64Uint64"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_fpa_numeral_int_uint")]
     internal IntPtr MkFpaNumeralIntUint(IntPtr c, bool sgn, int exp, uint sig, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_numeral_int_uint");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaNumeralIntUintDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_numeral_int_uint");
         return func(c, sgn, exp, sig, ty);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkFpaNumeralInt64Uint64Delegate(IntPtr c, bool sgn, long exp, ulong sig, IntPtr ty);
+    private delegate IntPtr MkFpaNumeralInt64Uint64Delegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool sgn, long exp, ulong sig, IntPtr ty);
 
     /// <summary>
     ///  Create a numeral of FloatingPoint sort from a sign bit and two 64-bit integers. 
@@ -718,12 +746,13 @@ internal sealed partial class NativeZ3Library
     /// <seealso cref="MkFpaNumeralFloat"/>
     /// <seealso cref="MkFpaNumeralInt"/>
     /// <seealso cref="MkFpaNumeralIntUint"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_fpa_numeral_int64_uint64")]
     internal IntPtr MkFpaNumeralInt64Uint64(IntPtr c, bool sgn, long exp, ulong sig, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_numeral_int64_uint64");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaNumeralInt64Uint64Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_numeral_int64_uint64");
         return func(c, sgn, exp, sig, ty);
     }
 
@@ -744,6 +773,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_abs");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaAbsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_abs");
         return func(c, t);
     }
 
@@ -764,6 +794,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_neg");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaNegDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_neg");
         return func(c, t);
     }
 
@@ -786,6 +817,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_add");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaAddDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_add");
         return func(c, rm, t1, t2);
     }
 
@@ -808,6 +840,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sub");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSubDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sub");
         return func(c, rm, t1, t2);
     }
 
@@ -830,6 +863,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_mul");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaMulDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_mul");
         return func(c, rm, t1, t2);
     }
 
@@ -852,6 +886,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_div");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaDivDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_div");
         return func(c, rm, t1, t2);
     }
 
@@ -875,6 +910,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_fma");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaFmaDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_fma");
         return func(c, rm, t1, t2, t3);
     }
 
@@ -896,6 +932,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_sqrt");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaSqrtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_sqrt");
         return func(c, rm, t);
     }
 
@@ -917,6 +954,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_rem");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRemDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_rem");
         return func(c, t1, t2);
     }
 
@@ -938,6 +976,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_round_to_integral");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaRoundToIntegralDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_round_to_integral");
         return func(c, rm, t);
     }
 
@@ -960,6 +999,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_min");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaMinDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_min");
         return func(c, t1, t2);
     }
 
@@ -982,6 +1022,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_max");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaMaxDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_max");
         return func(c, t1, t2);
     }
 
@@ -1007,6 +1048,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_leq");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaLeqDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_leq");
         return func(c, t1, t2);
     }
 
@@ -1032,6 +1074,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_lt");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaLtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_lt");
         return func(c, t1, t2);
     }
 
@@ -1057,6 +1100,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_geq");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaGeqDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_geq");
         return func(c, t1, t2);
     }
 
@@ -1082,6 +1126,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_gt");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaGtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_gt");
         return func(c, t1, t2);
     }
 
@@ -1107,6 +1152,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_eq");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaEqDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_eq");
         return func(c, t1, t2);
     }
 
@@ -1131,6 +1177,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_is_normal");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaIsNormalDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_is_normal");
         return func(c, t);
     }
 
@@ -1155,6 +1202,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_is_subnormal");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaIsSubnormalDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_is_subnormal");
         return func(c, t);
     }
 
@@ -1180,6 +1228,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_is_zero");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaIsZeroDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_is_zero");
         return func(c, t);
     }
 
@@ -1205,6 +1254,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_is_infinite");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaIsInfiniteDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_is_infinite");
         return func(c, t);
     }
 
@@ -1230,6 +1280,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_is_nan");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaIsNanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_is_nan");
         return func(c, t);
     }
 
@@ -1253,6 +1304,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_is_negative");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaIsNegativeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_is_negative");
         return func(c, t);
     }
 
@@ -1276,6 +1328,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_is_positive");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaIsPositiveDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_is_positive");
         return func(c, t);
     }
 
@@ -1297,6 +1350,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_to_fp_bv");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaToFpBvDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_to_fp_bv");
         return func(c, bv, s);
     }
 
@@ -1319,6 +1373,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_to_fp_float");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaToFpFloatDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_to_fp_float");
         return func(c, rm, t, s);
     }
 
@@ -1341,6 +1396,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_to_fp_real");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaToFpRealDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_to_fp_real");
         return func(c, rm, t, s);
     }
 
@@ -1363,6 +1419,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_to_fp_signed");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaToFpSignedDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_to_fp_signed");
         return func(c, rm, t, s);
     }
 
@@ -1385,6 +1442,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_to_fp_unsigned");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaToFpUnsignedDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_to_fp_unsigned");
         return func(c, rm, t, s);
     }
 
@@ -1407,6 +1465,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_to_ubv");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaToUbvDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_to_ubv");
         return func(c, rm, t, sz);
     }
 
@@ -1429,6 +1488,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_to_sbv");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaToSbvDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_to_sbv");
         return func(c, rm, t, sz);
     }
 
@@ -1449,6 +1509,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_to_real");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaToRealDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_to_real");
         return func(c, t);
     }
 
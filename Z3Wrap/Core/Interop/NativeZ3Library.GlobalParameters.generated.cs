@@ -24,33 +24,50 @@ internal sealed partial class NativeZ3Library
     /// <remarks>
     /// When a Z3 module is initialized it will use the value of these parameters when Z3_params objects are not provided. The name of parameter can be composed of characters [a-z][A-Z], digits [0-9], '-' and '_'. The character '.' is a delimiter (more later). The parameter names are case-insensitive. The character '-' should be viewed as an "alias" for '_'. Thus, the following parameter names are considered equivalent: "pp.decimal-precision" and "PP.DECIMAL_PRECISION". This function can be used to set parameters for a specific Z3 module. This can be done by using &lt;module-name&gt;.&lt;parameter-name&gt;. For example: Z3_global_param_set('pp.decimal', 'true') will set the parameter "decimal" in the module "pp" to true.
     /// </remarks>
-    /// <seealso cref="GlobalParamGet"/>
+    /// <seealso cref="GlobalParamGet(IntPtr, IntPtr)"/>
     /// <seealso cref="GlobalParamResetAll"/>
     [Z3Function("Z3_global_param_set")]
     internal void GlobalParamSet(IntPtr paramId, IntPtr paramValue)
     {
         var funcPtr = GetFunctionPointer("Z3_global_param_set");
         var func = Marshal.GetDelegateForFunctionPointer<GlobalParamSetDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_global_param_set");
         func(paramId, paramValue);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void GlobalParamSetUtf8Delegate(ref byte paramId, ref byte paramValue);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_global_param_set</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal void GlobalParamSet(ReadOnlySpan<byte> paramId, ReadOnlySpan<byte> paramValue)
+    {
+        var funcPtr = GetFunctionPointer("Z3_global_param_set");
+        var func = Marshal.GetDelegateForFunctionPointer<GlobalParamSetUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_global_param_set");
+        func(ref MemoryMarshal.GetReference(paramId), ref MemoryMarshal.GetReference(paramValue));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void GlobalParamResetAllDelegate();
 
     /// <summary>
     ///  Restore the value of all global (and module) parameters. This command will not affect already created objects (such as tactics and solvers). 
     /// </summary>
-    /// <seealso cref="GlobalParamGet"/>
-    /// <seealso cref="GlobalParamSet"/>
+    /// <seealso cref="GlobalParamGet(IntPtr, IntPtr)"/>
+    /// <seealso cref="GlobalParamSet(IntPtr, IntPtr)"/>
     [Z3Function("Z3_global_param_reset_all")]
     internal void GlobalParamResetAll()
     {
         var funcPtr = GetFunctionPointer("Z3_global_param_reset_all");
         var func = Marshal.GetDelegateForFunctionPointer<GlobalParamResetAllDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_global_param_reset_all");
         func();
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GlobalParamGetDelegate(IntPtr paramId, IntPtr paramValue);
 
     /// <summary>
@@ -64,13 +81,29 @@ internal sealed partial class NativeZ3Library
     /// This function cannot be invoked simultaneously from different threads without synchronization. The result string stored in param_value is stored in shared location. 
     /// </remarks>
     /// <seealso cref="GlobalParamResetAll"/>
-    /// <seealso cref="GlobalParamSet"/>
+    /// <seealso cref="GlobalParamSet(IntPtr, IntPtr)"/>
     [Z3Function("Z3_global_param_get")]
     internal bool GlobalParamGet(IntPtr paramId, IntPtr paramValue)
     {
         var funcPtr = GetFunctionPointer("Z3_global_param_get");
         var func = Marshal.GetDelegateForFunctionPointer<GlobalParamGetDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_global_param_get");
         return func(paramId, paramValue);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
+    private delegate bool GlobalParamGetUtf8Delegate(ref byte paramId, IntPtr paramValue);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_global_param_get</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal bool GlobalParamGet(ReadOnlySpan<byte> paramId, IntPtr paramValue)
+    {
+        var funcPtr = GetFunctionPointer("Z3_global_param_get");
+        var func = Marshal.GetDelegateForFunctionPointer<GlobalParamGetUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_global_param_get");
+        return func(ref MemoryMarshal.GetReference(paramId), paramValue);
+    }
+
 }
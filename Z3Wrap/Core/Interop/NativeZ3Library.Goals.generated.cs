@@ -14,7 +14,7 @@ namespace Spaceorc.Z3Wrap.Core.Interop;
 internal sealed partial class NativeZ3Library
 {
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkGoalDelegate(IntPtr c, bool models, bool unsatCores, bool proofs);
+    private delegate IntPtr MkGoalDelegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool models, [MarshalAs(UnmanagedType.U1)] bool unsatCores, [MarshalAs(UnmanagedType.U1)] bool proofs);
 
     /// <summary>
     ///  Create a goal (aka problem). A goal is essentially a set of formulas, that can be solved and/or transformed using tactics and solvers. 
@@ -33,6 +33,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_goal");
         var func = Marshal.GetDelegateForFunctionPointer<MkGoalDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_goal");
         return func(c, models, unsatCores, proofs);
     }
 
@@ -49,6 +50,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<GoalIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_inc_ref");
         func(c, g);
     }
 
@@ -65,6 +67,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<GoalDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_dec_ref");
         func(c, g);
     }
 
@@ -82,6 +85,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_precision");
         var func = Marshal.GetDelegateForFunctionPointer<GoalPrecisionDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_precision");
         return func(c, g);
     }
 
@@ -99,10 +103,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_assert");
         var func = Marshal.GetDelegateForFunctionPointer<GoalAssertDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_assert");
         func(c, g, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GoalInconsistentDelegate(IntPtr c, IntPtr g);
 
     /// <summary>
@@ -116,6 +122,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_inconsistent");
         var func = Marshal.GetDelegateForFunctionPointer<GoalInconsistentDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_inconsistent");
         return func(c, g);
     }
 
@@ -133,6 +140,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_depth");
         var func = Marshal.GetDelegateForFunctionPointer<GoalDepthDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_depth");
         return func(c, g);
     }
 
@@ -149,6 +157,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_reset");
         var func = Marshal.GetDelegateForFunctionPointer<GoalResetDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_reset");
         func(c, g);
     }
 
@@ -166,6 +175,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_size");
         var func = Marshal.GetDelegateForFunctionPointer<GoalSizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_size");
         return func(c, g);
     }
 
@@ -187,6 +197,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_formula");
         var func = Marshal.GetDelegateForFunctionPointer<GoalFormulaDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_formula");
         return func(c, g, idx);
     }
 
@@ -204,10 +215,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_num_exprs");
         var func = Marshal.GetDelegateForFunctionPointer<GoalNumExprsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_num_exprs");
         return func(c, g);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GoalIsDecidedSatDelegate(IntPtr c, IntPtr g);
 
     /// <summary>
@@ -221,10 +234,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_is_decided_sat");
         var func = Marshal.GetDelegateForFunctionPointer<GoalIsDecidedSatDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_is_decided_sat");
         return func(c, g);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool GoalIsDecidedUnsatDelegate(IntPtr c, IntPtr g);
 
     /// <summary>
@@ -238,6 +253,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_is_decided_unsat");
         var func = Marshal.GetDelegateForFunctionPointer<GoalIsDecidedUnsatDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_is_decided_unsat");
         return func(c, g);
     }
 
@@ -256,6 +272,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_translate");
         var func = Marshal.GetDelegateForFunctionPointer<GoalTranslateDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_translate");
         return func(source, g, target);
     }
 
@@ -277,6 +294,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_convert_model");
         var func = Marshal.GetDelegateForFunctionPointer<GoalConvertModelDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_convert_model");
         return func(c, g, m);
     }
 
@@ -294,11 +312,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<GoalToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_to_string");
         return func(c, g);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr GoalToDimacsStringDelegate(IntPtr c, IntPtr g, bool includeNames);
+    private delegate IntPtr GoalToDimacsStringDelegate(IntPtr c, IntPtr g, [MarshalAs(UnmanagedType.U1)] bool includeNames);
 
     /// <summary>
     ///  Convert a goal into a DIMACS formatted string. The goal must be in CNF. You can convert a goal to CNF by applying the tseitin-cnf tactic. Bit-vectors are not automatically converted to Booleans either, so if the caller intends to preserve satisfiability, it should apply bit-blasting tactics. Quantifiers and theory atoms will not be encoded. 
@@ -312,6 +331,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_goal_to_dimacs_string");
         var func = Marshal.GetDelegateForFunctionPointer<GoalToDimacsStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_goal_to_dimacs_string");
         return func(c, g, includeNames);
     }
 
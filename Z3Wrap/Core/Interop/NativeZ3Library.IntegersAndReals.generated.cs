@@ -32,9 +32,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_add");
         var func = Marshal.GetDelegateForFunctionPointer<MkAddDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_add");
         return func(c, numArgs, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkAddSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_add</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkAdd(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_add");
+        var func = Marshal.GetDelegateForFunctionPointer<MkAddSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_add");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkMulDelegate(IntPtr c, uint numArgs, IntPtr[] args);
 
@@ -55,9 +70,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_mul");
         var func = Marshal.GetDelegateForFunctionPointer<MkMulDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_mul");
         return func(c, numArgs, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkMulSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_mul</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkMul(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_mul");
+        var func = Marshal.GetDelegateForFunctionPointer<MkMulSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_mul");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkSubDelegate(IntPtr c, uint numArgs, IntPtr[] args);
 
@@ -77,9 +107,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_sub");
         var func = Marshal.GetDelegateForFunctionPointer<MkSubDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_sub");
         return func(c, numArgs, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkSubSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_sub</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkSub(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_sub");
+        var func = Marshal.GetDelegateForFunctionPointer<MkSubSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_sub");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkUnaryMinusDelegate(IntPtr c, IntPtr arg);
 
@@ -97,6 +142,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_unary_minus");
         var func = Marshal.GetDelegateForFunctionPointer<MkUnaryMinusDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_unary_minus");
         return func(c, arg);
     }
 
@@ -118,6 +164,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_div");
         var func = Marshal.GetDelegateForFunctionPointer<MkDivDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_div");
         return func(c, arg1, arg2);
     }
 
@@ -139,6 +186,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_mod");
         var func = Marshal.GetDelegateForFunctionPointer<MkModDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_mod");
         return func(c, arg1, arg2);
     }
 
@@ -160,6 +208,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_rem");
         var func = Marshal.GetDelegateForFunctionPointer<MkRemDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_rem");
         return func(c, arg1, arg2);
     }
 
@@ -181,6 +230,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_power");
         var func = Marshal.GetDelegateForFunctionPointer<MkPowerDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_power");
         return func(c, arg1, arg2);
     }
 
@@ -198,6 +248,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_abs");
         var func = Marshal.GetDelegateForFunctionPointer<MkAbsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_abs");
         return func(c, arg);
     }
 
@@ -219,6 +270,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_lt");
         var func = Marshal.GetDelegateForFunctionPointer<MkLtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_lt");
         return func(c, t1, t2);
     }
 
@@ -240,6 +292,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_le");
         var func = Marshal.GetDelegateForFunctionPointer<MkLeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_le");
         return func(c, t1, t2);
     }
 
@@ -261,6 +314,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_gt");
         var func = Marshal.GetDelegateForFunctionPointer<MkGtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_gt");
         return func(c, t1, t2);
     }
 
@@ -282,6 +336,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_ge");
         var func = Marshal.GetDelegateForFunctionPointer<MkGeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_ge");
         return func(c, t1, t2);
     }
 
@@ -303,6 +358,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_divides");
         var func = Marshal.GetDelegateForFunctionPointer<MkDividesDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_divides");
         return func(c, t1, t2);
     }
 
@@ -325,6 +381,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_int2real");
         var func = Marshal.GetDelegateForFunctionPointer<MkInt2realDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_int2real");
         return func(c, t1);
     }
 
@@ -347,6 +404,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_real2int");
         var func = Marshal.GetDelegateForFunctionPointer<MkReal2intDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_real2int");
         return func(c, t1);
     }
 
@@ -366,6 +424,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_is_int");
         var func = Marshal.GetDelegateForFunctionPointer<MkIsIntDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_is_int");
         return func(c, t1);
     }
 
@@ -14,6 +14,7 @@ namespace Spaceorc.Z3Wrap.Core.Interop;
 internal sealed partial class NativeZ3Library
 {
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool OpenLogDelegate(IntPtr filename);
 
     /// <summary>
@@ -21,16 +22,32 @@ internal sealed partial class NativeZ3Library
     /// </summary>
     /// <param name="filename" ctype="Z3_string">string parameter</param>
     /// <returns ctype="bool">bool value</returns>
-    /// <seealso cref="AppendLog"/>
+    /// <seealso cref="AppendLog(IntPtr)"/>
     /// <seealso cref="CloseLog"/>
     [Z3Function("Z3_open_log")]
     internal bool OpenLog(IntPtr filename)
     {
         var funcPtr = GetFunctionPointer("Z3_open_log");
         var func = Marshal.GetDelegateForFunctionPointer<OpenLogDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_open_log");
         return func(filename);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
+    private delegate bool OpenLogUtf8Delegate(ref byte filename);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_open_log</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal bool OpenLog(ReadOnlySpan<byte> filename)
+    {
+        var funcPtr = GetFunctionPointer("Z3_open_log");
+        var func = Marshal.GetDelegateForFunctionPointer<OpenLogUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_open_log");
+        return func(ref MemoryMarshal.GetReference(filename));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void AppendLogDelegate(IntPtr @string);
 
@@ -39,36 +56,52 @@ internal sealed partial class NativeZ3Library
     /// </summary>
     /// <param name="string" ctype="Z3_string">string parameter</param>
     /// <remarks>
-    /// The interaction log is opened using <see cref="OpenLog"/> . It contains the formulas that are checked using Z3. You can use this command to append comments, for instance.
+    /// The interaction log is opened using <see cref="OpenLog(IntPtr)"/> . It contains the formulas that are checked using Z3. You can use this command to append comments, for instance.
     /// </remarks>
-    /// <seealso cref="OpenLog"/>
+    /// <seealso cref="OpenLog(IntPtr)"/>
     /// <seealso cref="CloseLog"/>
     [Z3Function("Z3_append_log")]
     internal void AppendLog(IntPtr @string)
     {
         var funcPtr = GetFunctionPointer("Z3_append_log");
         var func = Marshal.GetDelegateForFunctionPointer<AppendLogDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_append_log");
         func(@string);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void AppendLogUtf8Delegate(ref byte @string);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_append_log</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal void AppendLog(ReadOnlySpan<byte> @string)
+    {
+        var funcPtr = GetFunctionPointer("Z3_append_log");
+        var func = Marshal.GetDelegateForFunctionPointer<AppendLogUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_append_log");
+        func(ref MemoryMarshal.GetReference(@string));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void CloseLogDelegate();
 
     /// <summary>
     ///  Close interaction log. 
     /// </summary>
-    /// <seealso cref="OpenLog"/>
-    /// <seealso cref="AppendLog"/>
+    /// <seealso cref="OpenLog(IntPtr)"/>
+    /// <seealso cref="AppendLog(IntPtr)"/>
     [Z3Function("Z3_close_log")]
     internal void CloseLog()
     {
         var funcPtr = GetFunctionPointer("Z3_close_log");
         var func = Marshal.GetDelegateForFunctionPointer<CloseLogDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_close_log");
         func();
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate void ToggleWarningMessagesDelegate(bool enabled);
+    private delegate void ToggleWarningMessagesDelegate([MarshalAs(UnmanagedType.U1)] bool enabled);
 
     /// <summary>
     ///  Enable/disable printing warning messages to the console. 
@@ -82,6 +115,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_toggle_warning_messages");
         var func = Marshal.GetDelegateForFunctionPointer<ToggleWarningMessagesDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_toggle_warning_messages");
         func(enabled);
     }
 
@@ -29,6 +29,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_version");
         var func = Marshal.GetDelegateForFunctionPointer<GetVersionDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_version");
         func(out major, out minor, out buildNumber, out revisionNumber);
     }
 
@@ -45,6 +46,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_full_version");
         var func = Marshal.GetDelegateForFunctionPointer<GetFullVersionDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_full_version");
         return func();
     }
 
@@ -55,15 +57,30 @@ internal sealed partial class NativeZ3Library
     ///  Enable tracing messages tagged as <c>tag</c> when Z3 is compiled in debug mode. It is a NOOP otherwise. 
     /// </summary>
     /// <param name="tag" ctype="Z3_string">string parameter</param>
-    /// <seealso cref="DisableTrace"/>
+    /// <seealso cref="DisableTrace(IntPtr)"/>
     [Z3Function("Z3_enable_trace")]
     internal void EnableTrace(IntPtr tag)
     {
         var funcPtr = GetFunctionPointer("Z3_enable_trace");
         var func = Marshal.GetDelegateForFunctionPointer<EnableTraceDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_enable_trace");
         func(tag);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void EnableTraceUtf8Delegate(ref byte tag);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_enable_trace</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal void EnableTrace(ReadOnlySpan<byte> tag)
+    {
+        var funcPtr = GetFunctionPointer("Z3_enable_trace");
+        var func = Marshal.GetDelegateForFunctionPointer<EnableTraceUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_enable_trace");
+        func(ref MemoryMarshal.GetReference(tag));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void DisableTraceDelegate(IntPtr tag);
 
@@ -71,15 +88,30 @@ internal sealed partial class NativeZ3Library
     ///  Disable tracing messages tagged as <c>tag</c> when Z3 is compiled in debug mode. It is a NOOP otherwise. 
     /// </summary>
     /// <param name="tag" ctype="Z3_string">string parameter</param>
-    /// <seealso cref="EnableTrace"/>
+    /// <seealso cref="EnableTrace(IntPtr)"/>
     [Z3Function("Z3_disable_trace")]
     internal void DisableTrace(IntPtr tag)
     {
         var funcPtr = GetFunctionPointer("Z3_disable_trace");
         var func = Marshal.GetDelegateForFunctionPointer<DisableTraceDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_disable_trace");
         func(tag);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void DisableTraceUtf8Delegate(ref byte tag);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_disable_trace</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal void DisableTrace(ReadOnlySpan<byte> tag)
+    {
+        var funcPtr = GetFunctionPointer("Z3_disable_trace");
+        var func = Marshal.GetDelegateForFunctionPointer<DisableTraceUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_disable_trace");
+        func(ref MemoryMarshal.GetReference(tag));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void ResetMemoryDelegate();
 
@@ -94,6 +126,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_reset_memory");
         var func = Marshal.GetDelegateForFunctionPointer<ResetMemoryDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_reset_memory");
         func();
     }
 
@@ -111,6 +144,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_finalize_memory");
         var func = Marshal.GetDelegateForFunctionPointer<FinalizeMemoryDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_finalize_memory");
         func();
     }
 
@@ -26,6 +26,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_model");
         var func = Marshal.GetDelegateForFunctionPointer<MkModelDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_model");
         return func(c);
     }
 
@@ -42,6 +43,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ModelIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_inc_ref");
         func(c, m);
     }
 
@@ -58,11 +60,13 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ModelDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_dec_ref");
         func(c, m);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate bool ModelEvalDelegate(IntPtr c, IntPtr m, IntPtr t, bool modelCompletion, out IntPtr v);
+    [return: MarshalAs(UnmanagedType.U1)]
+    private delegate bool ModelEvalDelegate(IntPtr c, IntPtr m, IntPtr t, [MarshalAs(UnmanagedType.U1)] bool modelCompletion, out IntPtr v);
 
     /// <summary>
     ///  Evaluate the AST node <c>t</c> in the given model. Return <c>true</c> if succeeded, and store the result in <c>v</c> . 
@@ -81,6 +85,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_eval");
         var func = Marshal.GetDelegateForFunctionPointer<ModelEvalDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_eval");
         return func(c, m, t, modelCompletion, out v);
     }
 
@@ -102,10 +107,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_get_const_interp");
         var func = Marshal.GetDelegateForFunctionPointer<ModelGetConstInterpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_get_const_interp");
         return func(c, m, a);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool ModelHasInterpDelegate(IntPtr c, IntPtr m, IntPtr a);
 
     /// <summary>
@@ -120,6 +127,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_has_interp");
         var func = Marshal.GetDelegateForFunctionPointer<ModelHasInterpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_has_interp");
         return func(c, m, a);
     }
 
@@ -142,6 +150,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_get_func_interp");
         var func = Marshal.GetDelegateForFunctionPointer<ModelGetFuncInterpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_get_func_interp");
         return func(c, m, f);
     }
 
@@ -160,6 +169,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_get_num_consts");
         var func = Marshal.GetDelegateForFunctionPointer<ModelGetNumConstsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_get_num_consts");
         return func(c, m);
     }
 
@@ -183,6 +193,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_get_const_decl");
         var func = Marshal.GetDelegateForFunctionPointer<ModelGetConstDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_get_const_decl");
         return func(c, m, i);
     }
 
@@ -204,6 +215,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_get_num_funcs");
         var func = Marshal.GetDelegateForFunctionPointer<ModelGetNumFuncsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_get_num_funcs");
         return func(c, m);
     }
 
@@ -226,6 +238,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_get_func_decl");
         var func = Marshal.GetDelegateForFunctionPointer<ModelGetFuncDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_get_func_decl");
         return func(c, m, i);
     }
 
@@ -248,6 +261,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_get_num_sorts");
         var func = Marshal.GetDelegateForFunctionPointer<ModelGetNumSortsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_get_num_sorts");
         return func(c, m);
     }
 
@@ -271,6 +285,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_get_sort");
         var func = Marshal.GetDelegateForFunctionPointer<ModelGetSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_get_sort");
         return func(c, m, i);
     }
 
@@ -291,6 +306,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_get_sort_universe");
         var func = Marshal.GetDelegateForFunctionPointer<ModelGetSortUniverseDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_get_sort_universe");
         return func(c, m, s);
     }
 
@@ -312,10 +328,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_translate");
         var func = Marshal.GetDelegateForFunctionPointer<ModelTranslateDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_translate");
         return func(c, m, dst);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsAsArrayDelegate(IntPtr c, IntPtr a);
 
     /// <summary>
@@ -333,6 +351,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_as_array");
         var func = Marshal.GetDelegateForFunctionPointer<IsAsArrayDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_as_array");
         return func(c, a);
     }
 
@@ -351,6 +370,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_as_array_func_decl");
         var func = Marshal.GetDelegateForFunctionPointer<GetAsArrayFuncDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_as_array_func_decl");
         return func(c, a);
     }
 
@@ -370,6 +390,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_add_func_interp");
         var func = Marshal.GetDelegateForFunctionPointer<AddFuncInterpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_add_func_interp");
         return func(c, m, f, defaultValue);
     }
 
@@ -388,6 +409,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_add_const_interp");
         var func = Marshal.GetDelegateForFunctionPointer<AddConstInterpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_add_const_interp");
         func(c, m, f, a);
     }
 
@@ -404,6 +426,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_interp_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<FuncInterpIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_interp_inc_ref");
         func(c, f);
     }
 
@@ -420,6 +443,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_interp_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<FuncInterpDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_interp_dec_ref");
         func(c, f);
     }
 
@@ -441,6 +465,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_interp_get_num_entries");
         var func = Marshal.GetDelegateForFunctionPointer<FuncInterpGetNumEntriesDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_interp_get_num_entries");
         return func(c, f);
     }
 
@@ -463,6 +488,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_interp_get_entry");
         var func = Marshal.GetDelegateForFunctionPointer<FuncInterpGetEntryDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_interp_get_entry");
         return func(c, f, i);
     }
 
@@ -483,6 +509,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_interp_get_else");
         var func = Marshal.GetDelegateForFunctionPointer<FuncInterpGetElseDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_interp_get_else");
         return func(c, f);
     }
 
@@ -503,6 +530,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_interp_set_else");
         var func = Marshal.GetDelegateForFunctionPointer<FuncInterpSetElseDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_interp_set_else");
         func(c, f, elseValue);
     }
 
@@ -520,6 +548,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_interp_get_arity");
         var func = Marshal.GetDelegateForFunctionPointer<FuncInterpGetArityDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_interp_get_arity");
         return func(c, f);
     }
 
@@ -541,6 +570,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_interp_add_entry");
         var func = Marshal.GetDelegateForFunctionPointer<FuncInterpAddEntryDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_interp_add_entry");
         func(c, fi, args, value);
     }
 
@@ -557,6 +587,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_entry_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<FuncEntryIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_entry_inc_ref");
         func(c, e);
     }
 
@@ -573,6 +604,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_entry_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<FuncEntryDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_entry_dec_ref");
         func(c, e);
     }
 
@@ -594,6 +626,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_entry_get_value");
         var func = Marshal.GetDelegateForFunctionPointer<FuncEntryGetValueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_entry_get_value");
         return func(c, e);
     }
 
@@ -613,6 +646,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_entry_get_num_args");
         var func = Marshal.GetDelegateForFunctionPointer<FuncEntryGetNumArgsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_entry_get_num_args");
         return func(c, e);
     }
 
@@ -636,6 +670,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_entry_get_arg");
         var func = Marshal.GetDelegateForFunctionPointer<FuncEntryGetArgDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_entry_get_arg");
         return func(c, e, i);
     }
 
@@ -29,9 +29,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_update_term");
         var func = Marshal.GetDelegateForFunctionPointer<UpdateTermDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_update_term");
         return func(c, a, numArgs, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr UpdateTermSpanDelegate(IntPtr c, IntPtr a, uint numArgs, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_update_term</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr UpdateTerm(IntPtr c, IntPtr a, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_update_term");
+        var func = Marshal.GetDelegateForFunctionPointer<UpdateTermSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_update_term");
+        return func(c, a, numArgs, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr SubstituteDelegate(IntPtr c, IntPtr a, uint numExprs, IntPtr[] from, IntPtr[] to);
 
@@ -49,9 +64,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_substitute");
         var func = Marshal.GetDelegateForFunctionPointer<SubstituteDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_substitute");
         return func(c, a, numExprs, from, to);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr SubstituteSpanDelegate(IntPtr c, IntPtr a, uint numExprs, ref IntPtr from, ref IntPtr to);
+
+    /// <summary>
+    /// Span overload of <c>Z3_substitute</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr Substitute(IntPtr c, IntPtr a, uint numExprs, ReadOnlySpan<IntPtr> from, ReadOnlySpan<IntPtr> to)
+    {
+        var funcPtr = GetFunctionPointer("Z3_substitute");
+        var func = Marshal.GetDelegateForFunctionPointer<SubstituteSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_substitute");
+        return func(c, a, numExprs, ref MemoryMarshal.GetReference(from), ref MemoryMarshal.GetReference(to));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr SubstituteVarsDelegate(IntPtr c, IntPtr a, uint numExprs, IntPtr[] to);
 
@@ -68,9 +98,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_substitute_vars");
         var func = Marshal.GetDelegateForFunctionPointer<SubstituteVarsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_substitute_vars");
         return func(c, a, numExprs, to);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr SubstituteVarsSpanDelegate(IntPtr c, IntPtr a, uint numExprs, ref IntPtr to);
+
+    /// <summary>
+    /// Span overload of <c>Z3_substitute_vars</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr SubstituteVars(IntPtr c, IntPtr a, uint numExprs, ReadOnlySpan<IntPtr> to)
+    {
+        var funcPtr = GetFunctionPointer("Z3_substitute_vars");
+        var func = Marshal.GetDelegateForFunctionPointer<SubstituteVarsSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_substitute_vars");
+        return func(c, a, numExprs, ref MemoryMarshal.GetReference(to));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr SubstituteFunsDelegate(IntPtr c, IntPtr a, uint numFuns, IntPtr[] from, IntPtr[] to);
 
@@ -91,9 +136,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_substitute_funs");
         var func = Marshal.GetDelegateForFunctionPointer<SubstituteFunsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_substitute_funs");
         return func(c, a, numFuns, from, to);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr SubstituteFunsSpanDelegate(IntPtr c, IntPtr a, uint numFuns, ref IntPtr from, ref IntPtr to);
+
+    /// <summary>
+    /// Span overload of <c>Z3_substitute_funs</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr SubstituteFuns(IntPtr c, IntPtr a, uint numFuns, ReadOnlySpan<IntPtr> from, ReadOnlySpan<IntPtr> to)
+    {
+        var funcPtr = GetFunctionPointer("Z3_substitute_funs");
+        var func = Marshal.GetDelegateForFunctionPointer<SubstituteFunsSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_substitute_funs");
+        return func(c, a, numFuns, ref MemoryMarshal.GetReference(from), ref MemoryMarshal.GetReference(to));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr TranslateDelegate(IntPtr source, IntPtr a, IntPtr target);
 
@@ -112,6 +172,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_translate");
         var func = Marshal.GetDelegateForFunctionPointer<TranslateDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_translate");
         return func(source, a, target);
     }
 
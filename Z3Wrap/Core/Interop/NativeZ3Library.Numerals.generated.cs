@@ -30,9 +30,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_numeral");
         var func = Marshal.GetDelegateForFunctionPointer<MkNumeralDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_numeral");
         return func(c, numeral, ty);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkNumeralUtf8Delegate(IntPtr c, ref byte numeral, IntPtr ty);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_mk_numeral</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr MkNumeral(IntPtr c, ReadOnlySpan<byte> numeral, IntPtr ty)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_numeral");
+        var func = Marshal.GetDelegateForFunctionPointer<MkNumeralUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_numeral");
+        return func(c, ref MemoryMarshal.GetReference(numeral), ty);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkRealDelegate(IntPtr c, int num, int den);
 
@@ -46,7 +61,7 @@ internal sealed partial class NativeZ3Library
     /// <remarks>
     /// Precondition: den != 0 
     /// </remarks>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     /// <seealso cref="MkInt"/>
     /// <seealso cref="MkRealInt64"/>
     /// <seealso cref="MkUnsignedInt"/>
@@ -55,6 +70,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_real");
         var func = Marshal.GetDelegateForFunctionPointer<MkRealDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_real");
         return func(c, num, den);
     }
 
@@ -75,6 +91,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_real_int64");
         var func = Marshal.GetDelegateForFunctionPointer<MkRealInt64Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_real_int64");
         return func(c, num, den);
     }
 
@@ -89,14 +106,15 @@ internal sealed partial class NativeZ3Library
     /// <param name="ty" ctype="Z3_sort">sort parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function can be used to create numerals that fit in a machine integer. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string.
+    /// This function can be used to create numerals that fit in a machine integer. It is slightly faster than <see cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/> since it is not necessary to parse a string.
     /// </remarks>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_int")]
     internal IntPtr MkInt(IntPtr c, int v, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_int");
         var func = Marshal.GetDelegateForFunctionPointer<MkIntDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_int");
         return func(c, v, ty);
     }
 
@@ -111,14 +129,15 @@ internal sealed partial class NativeZ3Library
     /// <param name="ty" ctype="Z3_sort">sort parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function can be used to create numerals that fit in a machine unsigned integer. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string.
+    /// This function can be used to create numerals that fit in a machine unsigned integer. It is slightly faster than <see cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/> since it is not necessary to parse a string.
     /// </remarks>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_unsigned_int")]
     internal IntPtr MkUnsignedInt(IntPtr c, uint v, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_unsigned_int");
         var func = Marshal.GetDelegateForFunctionPointer<MkUnsignedIntDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_unsigned_int");
         return func(c, v, ty);
     }
 
@@ -133,14 +152,15 @@ internal sealed partial class NativeZ3Library
     /// <param name="ty" ctype="Z3_sort">sort parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function can be used to create numerals that fit in a machine <c>int64_t</c> integer. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string.
+    /// This function can be used to create numerals that fit in a machine <c>int64_t</c> integer. It is slightly faster than <see cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/> since it is not necessary to parse a string.
     /// </remarks>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_int64")]
     internal IntPtr MkInt64(IntPtr c, long v, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_int64");
         var func = Marshal.GetDelegateForFunctionPointer<MkInt64Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_int64");
         return func(c, v, ty);
     }
 
@@ -155,14 +175,15 @@ internal sealed partial class NativeZ3Library
     /// <param name="ty" ctype="Z3_sort">sort parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function can be used to create numerals that fit in a machine <c>uint64_t</c> integer. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string.
+    /// This function can be used to create numerals that fit in a machine <c>uint64_t</c> integer. It is slightly faster than <see cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/> since it is not necessary to parse a string.
     /// </remarks>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_unsigned_int64")]
     internal IntPtr MkUnsignedInt64(IntPtr c, ulong v, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_unsigned_int64");
         var func = Marshal.GetDelegateForFunctionPointer<MkUnsignedInt64Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_unsigned_int64");
         return func(c, v, ty);
     }
 
@@ -176,13 +197,14 @@ internal sealed partial class NativeZ3Library
     /// <param name="sz" ctype="unsigned">unsigned parameter</param>
     /// <param name="bits" ctype="bool const*">bool parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, IntPtr, IntPtr)"/>
     /// <seealso cref="MkBvNumeral"/>
     [Z3Function("Z3_mk_bv_numeral")]
     internal IntPtr MkBvNumeral(IntPtr c, uint sz, bool[] bits)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bv_numeral");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvNumeralDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bv_numeral");
         return func(c, sz, bits);
     }
 
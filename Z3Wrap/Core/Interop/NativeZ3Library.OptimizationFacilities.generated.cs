@@ -29,6 +29,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_optimize");
         var func = Marshal.GetDelegateForFunctionPointer<MkOptimizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_optimize");
         return func(c);
     }
 
@@ -45,6 +46,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_inc_ref");
         func(c, d);
     }
 
@@ -61,6 +63,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_dec_ref");
         func(c, d);
     }
 
@@ -73,13 +76,14 @@ internal sealed partial class NativeZ3Library
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="o" ctype="Z3_optimize">optimize parameter</param>
     /// <param name="a" ctype="Z3_ast">ast parameter</param>
-    /// <seealso cref="OptimizeAssertSoft"/>
+    /// <seealso cref="OptimizeAssertSoft(IntPtr, IntPtr, IntPtr, IntPtr, IntPtr)"/>
     /// <seealso cref="OptimizeAssertAndTrack"/>
     [Z3Function("Z3_optimize_assert")]
     internal void OptimizeAssert(IntPtr c, IntPtr o, IntPtr a)
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_assert");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeAssertDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_assert");
         func(c, o, a);
     }
 
@@ -94,12 +98,13 @@ internal sealed partial class NativeZ3Library
     /// <param name="a" ctype="Z3_ast">ast parameter</param>
     /// <param name="t" ctype="Z3_ast">ast parameter</param>
     /// <seealso cref="OptimizeAssert"/>
-    /// <seealso cref="OptimizeAssertSoft"/>
+    /// <seealso cref="OptimizeAssertSoft(IntPtr, IntPtr, IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_optimize_assert_and_track")]
     internal void OptimizeAssertAndTrack(IntPtr c, IntPtr o, IntPtr a, IntPtr t)
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_assert_and_track");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeAssertAndTrackDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_assert_and_track");
         func(c, o, a, t);
     }
 
@@ -122,9 +127,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_assert_soft");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeAssertSoftDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_assert_soft");
         return func(c, o, a, weight, id);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate uint OptimizeAssertSoftUtf8Delegate(IntPtr c, IntPtr o, IntPtr a, ref byte weight, IntPtr id);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_optimize_assert_soft</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal uint OptimizeAssertSoft(IntPtr c, IntPtr o, IntPtr a, ReadOnlySpan<byte> weight, IntPtr id)
+    {
+        var funcPtr = GetFunctionPointer("Z3_optimize_assert_soft");
+        var func = Marshal.GetDelegateForFunctionPointer<OptimizeAssertSoftUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_assert_soft");
+        return func(c, o, a, ref MemoryMarshal.GetReference(weight), id);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate uint OptimizeMaximizeDelegate(IntPtr c, IntPtr o, IntPtr t);
 
@@ -141,6 +161,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_maximize");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeMaximizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_maximize");
         return func(c, o, t);
     }
 
@@ -160,6 +181,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_minimize");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeMinimizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_minimize");
         return func(c, o, t);
     }
 
@@ -180,6 +202,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_push");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizePushDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_push");
         func(c, d);
     }
 
@@ -200,6 +223,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_pop");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizePopDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_pop");
         func(c, d);
     }
 
@@ -218,6 +242,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_set_initial_value");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeSetInitialValueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_set_initial_value");
         func(c, o, v, val);
     }
 
@@ -241,26 +266,42 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_check");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeCheckDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_check");
         return func(c, o, numAssumptions, assumptions);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate Lbool OptimizeCheckSpanDelegate(IntPtr c, IntPtr o, uint numAssumptions, ref IntPtr assumptions);
+
+    /// <summary>
+    /// Span overload of <c>Z3_optimize_check</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal Lbool OptimizeCheck(IntPtr c, IntPtr o, uint numAssumptions, ReadOnlySpan<IntPtr> assumptions)
+    {
+        var funcPtr = GetFunctionPointer("Z3_optimize_check");
+        var func = Marshal.GetDelegateForFunctionPointer<OptimizeCheckSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_check");
+        return func(c, o, numAssumptions, ref MemoryMarshal.GetReference(assumptions));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr OptimizeGetReasonUnknownDelegate(IntPtr c, IntPtr d);
 
     /// <summary>
-    ///  Retrieve a string that describes the last status returned by <see cref="OptimizeCheck"/> . 
+    ///  Retrieve a string that describes the last status returned by <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="d" ctype="Z3_optimize">optimize parameter</param>
     /// <returns ctype="Z3_string">string value</returns>
     /// <remarks>
-    /// Use this method when <see cref="OptimizeCheck"/> returns <c>Z3_L_UNDEF</c> .
+    /// Use this method when <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> returns <c>Z3_L_UNDEF</c> .
     /// </remarks>
     [Z3Function("Z3_optimize_get_reason_unknown")]
     internal IntPtr OptimizeGetReasonUnknown(IntPtr c, IntPtr d)
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_reason_unknown");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetReasonUnknownDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_reason_unknown");
         return func(c, d);
     }
 
@@ -268,7 +309,7 @@ internal sealed partial class NativeZ3Library
     private delegate IntPtr OptimizeGetModelDelegate(IntPtr c, IntPtr o);
 
     /// <summary>
-    ///  Retrieve the model for the last <see cref="OptimizeCheck"/> . 
+    ///  Retrieve the model for the last <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="o" ctype="Z3_optimize">optimize parameter</param>
@@ -281,6 +322,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_model");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetModelDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_model");
         return func(c, o);
     }
 
@@ -288,7 +330,7 @@ internal sealed partial class NativeZ3Library
     private delegate IntPtr OptimizeGetUnsatCoreDelegate(IntPtr c, IntPtr o);
 
     /// <summary>
-    ///  Retrieve the unsat core for the last <see cref="OptimizeCheck"/> The unsat core is a subset of the assumptions <c>a</c> . 
+    ///  Retrieve the unsat core for the last <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> The unsat core is a subset of the assumptions <c>a</c> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="o" ctype="Z3_optimize">optimize parameter</param>
@@ -298,6 +340,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_unsat_core");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetUnsatCoreDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_unsat_core");
         return func(c, o);
     }
 
@@ -317,6 +360,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_set_params");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeSetParamsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_set_params");
         func(c, o, p);
     }
 
@@ -336,6 +380,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_param_descrs");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetParamDescrsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_param_descrs");
         return func(c, o);
     }
 
@@ -357,6 +402,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_lower");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetLowerDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_lower");
         return func(c, o, idx);
     }
 
@@ -378,6 +424,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_upper");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetUpperDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_upper");
         return func(c, o, idx);
     }
 
@@ -399,6 +446,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_lower_as_vector");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetLowerAsVectorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_lower_as_vector");
         return func(c, o, idx);
     }
 
@@ -420,6 +468,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_upper_as_vector");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetUpperAsVectorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_upper_as_vector");
         return func(c, o, idx);
     }
 
@@ -432,13 +481,14 @@ internal sealed partial class NativeZ3Library
     /// <param name="c" ctype="Z3_context"> - context. </param>
     /// <param name="o" ctype="Z3_optimize"> - optimization context. </param>
     /// <returns ctype="Z3_string">string value</returns>
-    /// <seealso cref="OptimizeFromFile"/>
-    /// <seealso cref="OptimizeFromString"/>
+    /// <seealso cref="OptimizeFromFile(IntPtr, IntPtr, IntPtr)"/>
+    /// <seealso cref="OptimizeFromString(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_optimize_to_string")]
     internal IntPtr OptimizeToString(IntPtr c, IntPtr o)
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_to_string");
         return func(c, o);
     }
 
@@ -451,16 +501,31 @@ internal sealed partial class NativeZ3Library
     /// <param name="c" ctype="Z3_context"> - context. </param>
     /// <param name="o" ctype="Z3_optimize"> - optimize context. </param>
     /// <param name="s" ctype="Z3_string"> - string containing SMT2 specification. </param>
-    /// <seealso cref="OptimizeFromFile"/>
+    /// <seealso cref="OptimizeFromFile(IntPtr, IntPtr, IntPtr)"/>
     /// <seealso cref="OptimizeToString"/>
     [Z3Function("Z3_optimize_from_string")]
     internal void OptimizeFromString(IntPtr c, IntPtr o, IntPtr s)
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_from_string");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeFromStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_from_string");
         func(c, o, s);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void OptimizeFromStringUtf8Delegate(IntPtr c, IntPtr o, ref byte s);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_optimize_from_string</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal void OptimizeFromString(IntPtr c, IntPtr o, ReadOnlySpan<byte> s)
+    {
+        var funcPtr = GetFunctionPointer("Z3_optimize_from_string");
+        var func = Marshal.GetDelegateForFunctionPointer<OptimizeFromStringUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_from_string");
+        func(c, o, ref MemoryMarshal.GetReference(s));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void OptimizeFromFileDelegate(IntPtr c, IntPtr o, IntPtr s);
 
@@ -470,16 +535,31 @@ internal sealed partial class NativeZ3Library
     /// <param name="c" ctype="Z3_context"> - context. </param>
     /// <param name="o" ctype="Z3_optimize"> - optimize context. </param>
     /// <param name="s" ctype="Z3_string"> - path to file containing SMT2 specification. </param>
-    /// <seealso cref="OptimizeFromString"/>
+    /// <seealso cref="OptimizeFromString(IntPtr, IntPtr, IntPtr)"/>
     /// <seealso cref="OptimizeToString"/>
     [Z3Function("Z3_optimize_from_file")]
     internal void OptimizeFromFile(IntPtr c, IntPtr o, IntPtr s)
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_from_file");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeFromFileDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_from_file");
         func(c, o, s);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void OptimizeFromFileUtf8Delegate(IntPtr c, IntPtr o, ref byte s);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_optimize_from_file</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal void OptimizeFromFile(IntPtr c, IntPtr o, ReadOnlySpan<byte> s)
+    {
+        var funcPtr = GetFunctionPointer("Z3_optimize_from_file");
+        var func = Marshal.GetDelegateForFunctionPointer<OptimizeFromFileUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_from_file");
+        func(c, o, ref MemoryMarshal.GetReference(s));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr OptimizeGetHelpDelegate(IntPtr c, IntPtr t);
 
@@ -496,6 +576,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_help");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetHelpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_help");
         return func(c, t);
     }
 
@@ -503,7 +584,7 @@ internal sealed partial class NativeZ3Library
     private delegate IntPtr OptimizeGetStatisticsDelegate(IntPtr c, IntPtr d);
 
     /// <summary>
-    ///  Retrieve statistics information from the last call to <see cref="OptimizeCheck"/> . 
+    ///  Retrieve statistics information from the last call to <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="d" ctype="Z3_optimize">optimize parameter</param>
@@ -513,6 +594,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_statistics");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetStatisticsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_statistics");
         return func(c, d);
     }
 
@@ -530,6 +612,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_assertions");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetAssertionsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_assertions");
         return func(c, o);
     }
 
@@ -547,6 +630,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_get_objectives");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeGetObjectivesDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_get_objectives");
         return func(c, o);
     }
 
@@ -566,6 +650,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_optimize_register_model_eh");
         var func = Marshal.GetDelegateForFunctionPointer<OptimizeRegisterModelEhDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_optimize_register_model_eh");
         func(c, o, m, ctx, modelEh);
     }
 
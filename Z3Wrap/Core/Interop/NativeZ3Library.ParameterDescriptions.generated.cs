@@ -26,6 +26,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_param_descrs_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ParamDescrsIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_param_descrs_inc_ref");
         func(c, p);
     }
 
@@ -42,6 +43,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_param_descrs_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ParamDescrsDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_param_descrs_dec_ref");
         func(c, p);
     }
 
@@ -60,6 +62,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_param_descrs_get_kind");
         var func = Marshal.GetDelegateForFunctionPointer<ParamDescrsGetKindDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_param_descrs_get_kind");
         return func(c, p, n);
     }
 
@@ -77,6 +80,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_param_descrs_size");
         var func = Marshal.GetDelegateForFunctionPointer<ParamDescrsSizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_param_descrs_size");
         return func(c, p);
     }
 
@@ -98,6 +102,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_param_descrs_get_name");
         var func = Marshal.GetDelegateForFunctionPointer<ParamDescrsGetNameDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_param_descrs_get_name");
         return func(c, p, i);
     }
 
@@ -116,6 +121,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_param_descrs_get_documentation");
         var func = Marshal.GetDelegateForFunctionPointer<ParamDescrsGetDocumentationDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_param_descrs_get_documentation");
         return func(c, p, s);
     }
 
@@ -133,6 +139,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_param_descrs_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<ParamDescrsToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_param_descrs_to_string");
         return func(c, p);
     }
 
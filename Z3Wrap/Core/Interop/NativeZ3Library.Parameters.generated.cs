@@ -29,6 +29,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_params");
         var func = Marshal.GetDelegateForFunctionPointer<MkParamsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_params");
         return func(c);
     }
 
@@ -45,6 +46,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_params_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ParamsIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_params_inc_ref");
         func(c, p);
     }
 
@@ -61,11 +63,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_params_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ParamsDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_params_dec_ref");
         func(c, p);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate void ParamsSetBoolDelegate(IntPtr c, IntPtr p, IntPtr k, bool v);
+    private delegate void ParamsSetBoolDelegate(IntPtr c, IntPtr p, IntPtr k, [MarshalAs(UnmanagedType.U1)] bool v);
 
     /// <summary>
     ///  Add a Boolean parameter <c>k</c> with value <c>v</c> to the parameter set <c>p</c> . 
@@ -79,6 +82,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_params_set_bool");
         var func = Marshal.GetDelegateForFunctionPointer<ParamsSetBoolDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_params_set_bool");
         func(c, p, k, v);
     }
 
@@ -97,6 +101,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_params_set_uint");
         var func = Marshal.GetDelegateForFunctionPointer<ParamsSetUintDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_params_set_uint");
         func(c, p, k, v);
     }
 
@@ -115,6 +120,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_params_set_double");
         var func = Marshal.GetDelegateForFunctionPointer<ParamsSetDoubleDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_params_set_double");
         func(c, p, k, v);
     }
 
@@ -133,6 +139,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_params_set_symbol");
         var func = Marshal.GetDelegateForFunctionPointer<ParamsSetSymbolDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_params_set_symbol");
         func(c, p, k, v);
     }
 
@@ -150,6 +157,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_params_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<ParamsToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_params_to_string");
         return func(c, p);
     }
 
@@ -170,6 +178,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_params_validate");
         var func = Marshal.GetDelegateForFunctionPointer<ParamsValidateDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_params_validate");
         func(c, p, d);
     }
 
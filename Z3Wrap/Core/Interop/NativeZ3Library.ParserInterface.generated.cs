@@ -36,14 +36,43 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_parse_smtlib2_string");
         var func = Marshal.GetDelegateForFunctionPointer<ParseSmtlib2StringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parse_smtlib2_string");
         return func(c, str, numSorts, sortNames, sorts, numDecls, declNames, decls);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr ParseSmtlib2StringSpanDelegate(IntPtr c, IntPtr str, uint numSorts, ref IntPtr sortNames, ref IntPtr sorts, uint numDecls, ref IntPtr declNames, ref IntPtr decls);
+
+    /// <summary>
+    /// Span overload of <c>Z3_parse_smtlib2_string</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr ParseSmtlib2String(IntPtr c, IntPtr str, uint numSorts, ReadOnlySpan<IntPtr> sortNames, ReadOnlySpan<IntPtr> sorts, uint numDecls, ReadOnlySpan<IntPtr> declNames, ReadOnlySpan<IntPtr> decls)
+    {
+        var funcPtr = GetFunctionPointer("Z3_parse_smtlib2_string");
+        var func = Marshal.GetDelegateForFunctionPointer<ParseSmtlib2StringSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parse_smtlib2_string");
+        return func(c, str, numSorts, ref MemoryMarshal.GetReference(sortNames), ref MemoryMarshal.GetReference(sorts), numDecls, ref MemoryMarshal.GetReference(declNames), ref MemoryMarshal.GetReference(decls));
+    }
+
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr ParseSmtlib2StringUtf8Delegate(IntPtr c, ref byte str, uint numSorts, ref IntPtr sortNames, ref IntPtr sorts, uint numDecls, ref IntPtr declNames, ref IntPtr decls);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_parse_smtlib2_string</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr ParseSmtlib2String(IntPtr c, ReadOnlySpan<byte> str, uint numSorts, ReadOnlySpan<IntPtr> sortNames, ReadOnlySpan<IntPtr> sorts, uint numDecls, ReadOnlySpan<IntPtr> declNames, ReadOnlySpan<IntPtr> decls)
+    {
+        var funcPtr = GetFunctionPointer("Z3_parse_smtlib2_string");
+        var func = Marshal.GetDelegateForFunctionPointer<ParseSmtlib2StringUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parse_smtlib2_string");
+        return func(c, ref MemoryMarshal.GetReference(str), numSorts, ref MemoryMarshal.GetReference(sortNames), ref MemoryMarshal.GetReference(sorts), numDecls, ref MemoryMarshal.GetReference(declNames), ref MemoryMarshal.GetReference(decls));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr ParseSmtlib2FileDelegate(IntPtr c, IntPtr fileName, uint numSorts, IntPtr[] sortNames, IntPtr[] sorts, uint numDecls, IntPtr[] declNames, IntPtr[] decls);
 
     /// <summary>
-    ///  Similar to <see cref="ParseSmtlib2String"/> , but reads the benchmark from a file. 
+    ///  Similar to <see cref="ParseSmtlib2String(IntPtr, IntPtr, uint, IntPtr[], IntPtr[], uint, IntPtr[], IntPtr[])"/> , but reads the benchmark from a file. 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="fileName" ctype="Z3_string">string parameter</param>
@@ -59,9 +88,38 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_parse_smtlib2_file");
         var func = Marshal.GetDelegateForFunctionPointer<ParseSmtlib2FileDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parse_smtlib2_file");
         return func(c, fileName, numSorts, sortNames, sorts, numDecls, declNames, decls);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr ParseSmtlib2FileSpanDelegate(IntPtr c, IntPtr fileName, uint numSorts, ref IntPtr sortNames, ref IntPtr sorts, uint numDecls, ref IntPtr declNames, ref IntPtr decls);
+
+    /// <summary>
+    /// Span overload of <c>Z3_parse_smtlib2_file</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr ParseSmtlib2File(IntPtr c, IntPtr fileName, uint numSorts, ReadOnlySpan<IntPtr> sortNames, ReadOnlySpan<IntPtr> sorts, uint numDecls, ReadOnlySpan<IntPtr> declNames, ReadOnlySpan<IntPtr> decls)
+    {
+        var funcPtr = GetFunctionPointer("Z3_parse_smtlib2_file");
+        var func = Marshal.GetDelegateForFunctionPointer<ParseSmtlib2FileSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parse_smtlib2_file");
+        return func(c, fileName, numSorts, ref MemoryMarshal.GetReference(sortNames), ref MemoryMarshal.GetReference(sorts), numDecls, ref MemoryMarshal.GetReference(declNames), ref MemoryMarshal.GetReference(decls));
+    }
+
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr ParseSmtlib2FileUtf8Delegate(IntPtr c, ref byte fileName, uint numSorts, ref IntPtr sortNames, ref IntPtr sorts, uint numDecls, ref IntPtr declNames, ref IntPtr decls);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_parse_smtlib2_file</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr ParseSmtlib2File(IntPtr c, ReadOnlySpan<byte> fileName, uint numSorts, ReadOnlySpan<IntPtr> sortNames, ReadOnlySpan<IntPtr> sorts, uint numDecls, ReadOnlySpan<IntPtr> declNames, ReadOnlySpan<IntPtr> decls)
+    {
+        var funcPtr = GetFunctionPointer("Z3_parse_smtlib2_file");
+        var func = Marshal.GetDelegateForFunctionPointer<ParseSmtlib2FileUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parse_smtlib2_file");
+        return func(c, ref MemoryMarshal.GetReference(fileName), numSorts, ref MemoryMarshal.GetReference(sortNames), ref MemoryMarshal.GetReference(sorts), numDecls, ref MemoryMarshal.GetReference(declNames), ref MemoryMarshal.GetReference(decls));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr EvalSmtlib2StringDelegate(IntPtr c, IntPtr str);
 
@@ -76,9 +134,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_eval_smtlib2_string");
         var func = Marshal.GetDelegateForFunctionPointer<EvalSmtlib2StringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_eval_smtlib2_string");
         return func(c, str);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr EvalSmtlib2StringUtf8Delegate(IntPtr c, ref byte str);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_eval_smtlib2_string</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr EvalSmtlib2String(IntPtr c, ReadOnlySpan<byte> str)
+    {
+        var funcPtr = GetFunctionPointer("Z3_eval_smtlib2_string");
+        var func = Marshal.GetDelegateForFunctionPointer<EvalSmtlib2StringUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_eval_smtlib2_string");
+        return func(c, ref MemoryMarshal.GetReference(str));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkParserContextDelegate(IntPtr c);
 
@@ -95,6 +168,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_parser_context");
         var func = Marshal.GetDelegateForFunctionPointer<MkParserContextDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_parser_context");
         return func(c);
     }
 
@@ -111,6 +185,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_parser_context_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ParserContextIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parser_context_inc_ref");
         func(c, pc);
     }
 
@@ -127,6 +202,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_parser_context_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ParserContextDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parser_context_dec_ref");
         func(c, pc);
     }
 
@@ -144,6 +220,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_parser_context_add_sort");
         var func = Marshal.GetDelegateForFunctionPointer<ParserContextAddSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parser_context_add_sort");
         func(c, pc, s);
     }
 
@@ -161,6 +238,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_parser_context_add_decl");
         var func = Marshal.GetDelegateForFunctionPointer<ParserContextAddDeclDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parser_context_add_decl");
         func(c, pc, f);
     }
 
@@ -179,7 +257,22 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_parser_context_from_string");
         var func = Marshal.GetDelegateForFunctionPointer<ParserContextFromStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parser_context_from_string");
         return func(c, pc, s);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr ParserContextFromStringUtf8Delegate(IntPtr c, IntPtr pc, ref byte s);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_parser_context_from_string</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr ParserContextFromString(IntPtr c, IntPtr pc, ReadOnlySpan<byte> s)
+    {
+        var funcPtr = GetFunctionPointer("Z3_parser_context_from_string");
+        var func = Marshal.GetDelegateForFunctionPointer<ParserContextFromStringUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_parser_context_from_string");
+        return func(c, pc, ref MemoryMarshal.GetReference(s));
+    }
+
 }
@@ -26,6 +26,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_true");
         var func = Marshal.GetDelegateForFunctionPointer<MkTrueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_true");
         return func(c);
     }
 
@@ -42,6 +43,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_false");
         var func = Marshal.GetDelegateForFunctionPointer<MkFalseDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_false");
         return func(c);
     }
 
@@ -63,6 +65,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_eq");
         var func = Marshal.GetDelegateForFunctionPointer<MkEqDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_eq");
         return func(c, l, r);
     }
 
@@ -85,9 +88,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_distinct");
         var func = Marshal.GetDelegateForFunctionPointer<MkDistinctDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_distinct");
         return func(c, numArgs, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkDistinctSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_distinct</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkDistinct(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_distinct");
+        var func = Marshal.GetDelegateForFunctionPointer<MkDistinctSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_distinct");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkNotDelegate(IntPtr c, IntPtr a);
 
@@ -105,6 +123,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_not");
         var func = Marshal.GetDelegateForFunctionPointer<MkNotDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_not");
         return func(c, a);
     }
 
@@ -127,6 +146,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_ite");
         var func = Marshal.GetDelegateForFunctionPointer<MkIteDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_ite");
         return func(c, t1, t2, t3);
     }
 
@@ -148,6 +168,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_iff");
         var func = Marshal.GetDelegateForFunctionPointer<MkIffDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_iff");
         return func(c, t1, t2);
     }
 
@@ -169,6 +190,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_implies");
         var func = Marshal.GetDelegateForFunctionPointer<MkImpliesDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_implies");
         return func(c, t1, t2);
     }
 
@@ -190,6 +212,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_xor");
         var func = Marshal.GetDelegateForFunctionPointer<MkXorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_xor");
         return func(c, t1, t2);
     }
 
@@ -212,9 +235,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_and");
         var func = Marshal.GetDelegateForFunctionPointer<MkAndDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_and");
         return func(c, numArgs, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkAndSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_and</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkAnd(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_and");
+        var func = Marshal.GetDelegateForFunctionPointer<MkAndSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_and");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkOrDelegate(IntPtr c, uint numArgs, IntPtr[] args);
 
@@ -234,7 +272,22 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_or");
         var func = Marshal.GetDelegateForFunctionPointer<MkOrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_or");
         return func(c, numArgs, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkOrSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_or</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkOr(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_or");
+        var func = Marshal.GetDelegateForFunctionPointer<MkOrSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_or");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args));
+    }
+
 }
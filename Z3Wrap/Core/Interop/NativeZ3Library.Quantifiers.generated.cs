@@ -26,16 +26,31 @@ internal sealed partial class NativeZ3Library
     /// <remarks>
     /// Z3 uses pattern matching to instantiate quantifiers. If a pattern is not provided for a quantifier, then Z3 will automatically compute a set of patterns for it. However, for optimal performance, the user should provide the patterns. Patterns comprise a list of terms. The list should be non-empty. If the list comprises of more than one term, it is a called a multi-pattern. In general, one can pass in a list of (multi-)patterns in the quantifier constructor.
     /// </remarks>
-    /// <seealso cref="MkForall"/>
-    /// <seealso cref="MkExists"/>
+    /// <seealso cref="MkForall(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkExists(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_pattern")]
     internal IntPtr MkPattern(IntPtr c, uint numPatterns, IntPtr[] terms)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_pattern");
         var func = Marshal.GetDelegateForFunctionPointer<MkPatternDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_pattern");
         return func(c, numPatterns, terms);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkPatternSpanDelegate(IntPtr c, uint numPatterns, ref IntPtr terms);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_pattern</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkPattern(IntPtr c, uint numPatterns, ReadOnlySpan<IntPtr> terms)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_pattern");
+        var func = Marshal.GetDelegateForFunctionPointer<MkPatternSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_pattern");
+        return func(c, numPatterns, ref MemoryMarshal.GetReference(terms));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkBoundDelegate(IntPtr c, uint index, IntPtr ty);
 
@@ -57,13 +72,14 @@ internal sealed partial class NativeZ3Library
     ///
     /// </code> The last line is significant: the index of a bound variable is different depending on the scope in which it appears. The deeper x appears, the higher is its index.
     /// </remarks>
-    /// <seealso cref="MkForall"/>
-    /// <seealso cref="MkExists"/>
+    /// <seealso cref="MkForall(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkExists(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_bound")]
     internal IntPtr MkBound(IntPtr c, uint index, IntPtr ty)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bound");
         var func = Marshal.GetDelegateForFunctionPointer<MkBoundDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bound");
         return func(c, index, ty);
     }
 
@@ -76,28 +92,43 @@ internal sealed partial class NativeZ3Library
     /// <param name="c" ctype="Z3_context"> logical context. </param>
     /// <param name="weight" ctype="unsigned"> quantifiers are associated with weights indicating the importance of using the quantifier during instantiation. By default, pass the weight 0. </param>
     /// <param name="numPatterns" ctype="unsigned"> number of patterns. </param>
-    /// <param name="patterns" ctype="Z3_pattern const[]"> array containing the patterns created using <see cref="MkPattern"/> . </param>
+    /// <param name="patterns" ctype="Z3_pattern const[]"> array containing the patterns created using <see cref="MkPattern(IntPtr, uint, IntPtr[])"/> . </param>
     /// <param name="numDecls" ctype="unsigned"> number of variables to be bound. </param>
     /// <param name="sorts" ctype="Z3_sort const[]"> the sorts of the bound variables. </param>
     /// <param name="declNames" ctype="Z3_symbol const[]"> names of the bound variables </param>
     /// <param name="body" ctype="Z3_ast"> the body of the quantifier. </param>
     /// <returns ctype="Z3_ast">ast value</returns>
-    /// <seealso cref="MkPattern"/>
+    /// <seealso cref="MkPattern(IntPtr, uint, IntPtr[])"/>
     /// <seealso cref="MkBound"/>
-    /// <seealso cref="MkExists"/>
+    /// <seealso cref="MkExists(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_forall")]
     internal IntPtr MkForall(IntPtr c, uint weight, uint numPatterns, IntPtr[] patterns, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_forall");
         var func = Marshal.GetDelegateForFunctionPointer<MkForallDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_forall");
         return func(c, weight, numPatterns, patterns, numDecls, sorts, declNames, body);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkForallSpanDelegate(IntPtr c, uint weight, uint numPatterns, ref IntPtr patterns, uint numDecls, ref IntPtr sorts, ref IntPtr declNames, IntPtr body);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_forall</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkForall(IntPtr c, uint weight, uint numPatterns, ReadOnlySpan<IntPtr> patterns, uint numDecls, ReadOnlySpan<IntPtr> sorts, ReadOnlySpan<IntPtr> declNames, IntPtr body)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_forall");
+        var func = Marshal.GetDelegateForFunctionPointer<MkForallSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_forall");
+        return func(c, weight, numPatterns, ref MemoryMarshal.GetReference(patterns), numDecls, ref MemoryMarshal.GetReference(sorts), ref MemoryMarshal.GetReference(declNames), body);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkExistsDelegate(IntPtr c, uint weight, uint numPatterns, IntPtr[] patterns, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body);
 
     /// <summary>
-    ///  Create an exists formula. Similar to <see cref="MkForall"/> . 
+    ///  Create an exists formula. Similar to <see cref="MkForall(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="weight" ctype="unsigned">unsigned parameter</param>
@@ -108,48 +139,78 @@ internal sealed partial class NativeZ3Library
     /// <param name="declNames" ctype="Z3_symbol const[]">symbol parameter</param>
     /// <param name="body" ctype="Z3_ast">ast parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
-    /// <seealso cref="MkPattern"/>
+    /// <seealso cref="MkPattern(IntPtr, uint, IntPtr[])"/>
     /// <seealso cref="MkBound"/>
-    /// <seealso cref="MkForall"/>
-    /// <seealso cref="MkQuantifier"/>
+    /// <seealso cref="MkForall(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkQuantifier(IntPtr, bool, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_exists")]
     internal IntPtr MkExists(IntPtr c, uint weight, uint numPatterns, IntPtr[] patterns, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_exists");
         var func = Marshal.GetDelegateForFunctionPointer<MkExistsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_exists");
         return func(c, weight, numPatterns, patterns, numDecls, sorts, declNames, body);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkQuantifierDelegate(IntPtr c, bool isForall, uint weight, uint numPatterns, IntPtr[] patterns, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body);
+    private delegate IntPtr MkExistsSpanDelegate(IntPtr c, uint weight, uint numPatterns, ref IntPtr patterns, uint numDecls, ref IntPtr sorts, ref IntPtr declNames, IntPtr body);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_exists</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkExists(IntPtr c, uint weight, uint numPatterns, ReadOnlySpan<IntPtr> patterns, uint numDecls, ReadOnlySpan<IntPtr> sorts, ReadOnlySpan<IntPtr> declNames, IntPtr body)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_exists");
+        var func = Marshal.GetDelegateForFunctionPointer<MkExistsSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_exists");
+        return func(c, weight, numPatterns, ref MemoryMarshal.GetReference(patterns), numDecls, ref MemoryMarshal.GetReference(sorts), ref MemoryMarshal.GetReference(declNames), body);
+    }
+
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkQuantifierDelegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool isForall, uint weight, uint numPatterns, IntPtr[] patterns, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body);
 
     /// <summary>
-    ///  Create a quantifier - universal or existential, with pattern hints. See the documentation for <see cref="MkForall"/> for an explanation of the parameters. 
+    ///  Create a quantifier - universal or existential, with pattern hints. See the documentation for <see cref="MkForall(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/> for an explanation of the parameters. 
     /// </summary>
     /// <param name="c" ctype="Z3_context"> logical context. </param>
     /// <param name="isForall" ctype="bool"> flag to indicate if this is a universal or existential quantifier. </param>
     /// <param name="weight" ctype="unsigned"> quantifiers are associated with weights indicating the importance of using the quantifier during instantiation. By default, pass the weight 0. </param>
     /// <param name="numPatterns" ctype="unsigned"> number of patterns. </param>
-    /// <param name="patterns" ctype="Z3_pattern const[]"> array containing the patterns created using <see cref="MkPattern"/> . </param>
+    /// <param name="patterns" ctype="Z3_pattern const[]"> array containing the patterns created using <see cref="MkPattern(IntPtr, uint, IntPtr[])"/> . </param>
     /// <param name="numDecls" ctype="unsigned"> number of variables to be bound. </param>
     /// <param name="sorts" ctype="Z3_sort const[]"> array of sorts of the bound variables. </param>
     /// <param name="declNames" ctype="Z3_symbol const[]"> names of the bound variables. </param>
     /// <param name="body" ctype="Z3_ast"> the body of the quantifier. </param>
     /// <returns ctype="Z3_ast">ast value</returns>
-    /// <seealso cref="MkPattern"/>
+    /// <seealso cref="MkPattern(IntPtr, uint, IntPtr[])"/>
     /// <seealso cref="MkBound"/>
-    /// <seealso cref="MkForall"/>
-    /// <seealso cref="MkExists"/>
+    /// <seealso cref="MkForall(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkExists(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_quantifier")]
     internal IntPtr MkQuantifier(IntPtr c, bool isForall, uint weight, uint numPatterns, IntPtr[] patterns, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_quantifier");
         var func = Marshal.GetDelegateForFunctionPointer<MkQuantifierDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_quantifier");
         return func(c, isForall, weight, numPatterns, patterns, numDecls, sorts, declNames, body);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkQuantifierExDelegate(IntPtr c, bool isForall, uint weight, IntPtr quantifierId, IntPtr skolemId, uint numPatterns, IntPtr[] patterns, uint numNoPatterns, IntPtr[] noPatterns, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body);
+    private delegate IntPtr MkQuantifierSpanDelegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool isForall, uint weight, uint numPatterns, ref IntPtr patterns, uint numDecls, ref IntPtr sorts, ref IntPtr declNames, IntPtr body);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_quantifier</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkQuantifier(IntPtr c, bool isForall, uint weight, uint numPatterns, ReadOnlySpan<IntPtr> patterns, uint numDecls, ReadOnlySpan<IntPtr> sorts, ReadOnlySpan<IntPtr> declNames, IntPtr body)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_quantifier");
+        var func = Marshal.GetDelegateForFunctionPointer<MkQuantifierSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_quantifier");
+        return func(c, isForall, weight, numPatterns, ref MemoryMarshal.GetReference(patterns), numDecls, ref MemoryMarshal.GetReference(sorts), ref MemoryMarshal.GetReference(declNames), body);
+    }
+
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkQuantifierExDelegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool isForall, uint weight, IntPtr quantifierId, IntPtr skolemId, uint numPatterns, IntPtr[] patterns, uint numNoPatterns, IntPtr[] noPatterns, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body);
 
     /// <summary>
     ///  Create a quantifier - universal or existential, with pattern hints, no patterns, and attributes. 
@@ -160,7 +221,7 @@ internal sealed partial class NativeZ3Library
     /// <param name="quantifierId" ctype="Z3_symbol"> identifier to identify quantifier </param>
     /// <param name="skolemId" ctype="Z3_symbol"> identifier to identify skolem constants introduced by quantifier. </param>
     /// <param name="numPatterns" ctype="unsigned"> number of patterns. </param>
-    /// <param name="patterns" ctype="Z3_pattern const[]"> array containing the patterns created using <see cref="MkPattern"/> . </param>
+    /// <param name="patterns" ctype="Z3_pattern const[]"> array containing the patterns created using <see cref="MkPattern(IntPtr, uint, IntPtr[])"/> . </param>
     /// <param name="numNoPatterns" ctype="unsigned"> number of no_patterns. </param>
     /// <param name="noPatterns" ctype="Z3_ast const[]"> array containing subexpressions to be excluded from inferred patterns. </param>
     /// <param name="numDecls" ctype="unsigned"> number of variables to be bound. </param>
@@ -168,18 +229,33 @@ internal sealed partial class NativeZ3Library
     /// <param name="declNames" ctype="Z3_symbol const[]"> names of the bound variables. </param>
     /// <param name="body" ctype="Z3_ast"> the body of the quantifier. </param>
     /// <returns ctype="Z3_ast">ast value</returns>
-    /// <seealso cref="MkPattern"/>
+    /// <seealso cref="MkPattern(IntPtr, uint, IntPtr[])"/>
     /// <seealso cref="MkBound"/>
-    /// <seealso cref="MkForall"/>
-    /// <seealso cref="MkExists"/>
+    /// <seealso cref="MkForall(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkExists(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_quantifier_ex")]
     internal IntPtr MkQuantifierEx(IntPtr c, bool isForall, uint weight, IntPtr quantifierId, IntPtr skolemId, uint numPatterns, IntPtr[] patterns, uint numNoPatterns, IntPtr[] noPatterns, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_quantifier_ex");
         var func = Marshal.GetDelegateForFunctionPointer<MkQuantifierExDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_quantifier_ex");
         return func(c, isForall, weight, quantifierId, skolemId, numPatterns, patterns, numNoPatterns, noPatterns, numDecls, sorts, declNames, body);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkQuantifierExSpanDelegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool isForall, uint weight, IntPtr quantifierId, IntPtr skolemId, uint numPatterns, ref IntPtr patterns, uint numNoPatterns, ref IntPtr noPatterns, uint numDecls, ref IntPtr sorts, ref IntPtr declNames, IntPtr body);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_quantifier_ex</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkQuantifierEx(IntPtr c, bool isForall, uint weight, IntPtr quantifierId, IntPtr skolemId, uint numPatterns, ReadOnlySpan<IntPtr> patterns, uint numNoPatterns, ReadOnlySpan<IntPtr> noPatterns, uint numDecls, ReadOnlySpan<IntPtr> sorts, ReadOnlySpan<IntPtr> declNames, IntPtr body)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_quantifier_ex");
+        var func = Marshal.GetDelegateForFunctionPointer<MkQuantifierExSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_quantifier_ex");
+        return func(c, isForall, weight, quantifierId, skolemId, numPatterns, ref MemoryMarshal.GetReference(patterns), numNoPatterns, ref MemoryMarshal.GetReference(noPatterns), numDecls, ref MemoryMarshal.GetReference(sorts), ref MemoryMarshal.GetReference(declNames), body);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkForallConstDelegate(IntPtr c, uint weight, uint numBound, IntPtr[] bound, uint numPatterns, IntPtr[] patterns, IntPtr body);
 
@@ -191,48 +267,78 @@ internal sealed partial class NativeZ3Library
     /// <param name="numBound" ctype="unsigned"> number of constants to be abstracted into bound variables. </param>
     /// <param name="bound" ctype="Z3_app const[]"> array of constants to be abstracted into bound variables. </param>
     /// <param name="numPatterns" ctype="unsigned"> number of patterns. </param>
-    /// <param name="patterns" ctype="Z3_pattern const[]"> array containing the patterns created using <see cref="MkPattern"/> . </param>
+    /// <param name="patterns" ctype="Z3_pattern const[]"> array containing the patterns created using <see cref="MkPattern(IntPtr, uint, IntPtr[])"/> . </param>
     /// <param name="body" ctype="Z3_ast"> the body of the quantifier. </param>
     /// <returns ctype="Z3_ast">ast value</returns>
-    /// <seealso cref="MkPattern"/>
-    /// <seealso cref="MkExistsConst"/>
+    /// <seealso cref="MkPattern(IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkExistsConst(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_forall_const")]
     internal IntPtr MkForallConst(IntPtr c, uint weight, uint numBound, IntPtr[] bound, uint numPatterns, IntPtr[] patterns, IntPtr body)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_forall_const");
         var func = Marshal.GetDelegateForFunctionPointer<MkForallConstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_forall_const");
         return func(c, weight, numBound, bound, numPatterns, patterns, body);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkForallConstSpanDelegate(IntPtr c, uint weight, uint numBound, ref IntPtr bound, uint numPatterns, ref IntPtr patterns, IntPtr body);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_forall_const</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkForallConst(IntPtr c, uint weight, uint numBound, ReadOnlySpan<IntPtr> bound, uint numPatterns, ReadOnlySpan<IntPtr> patterns, IntPtr body)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_forall_const");
+        var func = Marshal.GetDelegateForFunctionPointer<MkForallConstSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_forall_const");
+        return func(c, weight, numBound, ref MemoryMarshal.GetReference(bound), numPatterns, ref MemoryMarshal.GetReference(patterns), body);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkExistsConstDelegate(IntPtr c, uint weight, uint numBound, IntPtr[] bound, uint numPatterns, IntPtr[] patterns, IntPtr body);
 
     /// <summary>
-    ///  Similar to <see cref="MkForallConst"/> . 
+    ///  Similar to <see cref="MkForallConst(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr)"/> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context"> logical context. </param>
     /// <param name="weight" ctype="unsigned"> quantifiers are associated with weights indicating the importance of using the quantifier during instantiation. By default, pass the weight 0. </param>
     /// <param name="numBound" ctype="unsigned"> number of constants to be abstracted into bound variables. </param>
     /// <param name="bound" ctype="Z3_app const[]"> array of constants to be abstracted into bound variables. </param>
     /// <param name="numPatterns" ctype="unsigned"> number of patterns. </param>
-    /// <param name="patterns" ctype="Z3_pattern const[]"> array containing the patterns created using <see cref="MkPattern"/> . </param>
+    /// <param name="patterns" ctype="Z3_pattern const[]"> array containing the patterns created using <see cref="MkPattern(IntPtr, uint, IntPtr[])"/> . </param>
     /// <param name="body" ctype="Z3_ast"> the body of the quantifier. </param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
     /// Create an existential quantifier using a list of constants that will form the set of bound variables.
     /// </remarks>
-    /// <seealso cref="MkPattern"/>
-    /// <seealso cref="MkForallConst"/>
+    /// <seealso cref="MkPattern(IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkForallConst(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_exists_const")]
     internal IntPtr MkExistsConst(IntPtr c, uint weight, uint numBound, IntPtr[] bound, uint numPatterns, IntPtr[] patterns, IntPtr body)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_exists_const");
         var func = Marshal.GetDelegateForFunctionPointer<MkExistsConstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_exists_const");
         return func(c, weight, numBound, bound, numPatterns, patterns, body);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkQuantifierConstDelegate(IntPtr c, bool isForall, uint weight, uint numBound, IntPtr[] bound, uint numPatterns, IntPtr[] patterns, IntPtr body);
+    private delegate IntPtr MkExistsConstSpanDelegate(IntPtr c, uint weight, uint numBound, ref IntPtr bound, uint numPatterns, ref IntPtr patterns, IntPtr body);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_exists_const</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkExistsConst(IntPtr c, uint weight, uint numBound, ReadOnlySpan<IntPtr> bound, uint numPatterns, ReadOnlySpan<IntPtr> patterns, IntPtr body)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_exists_const");
+        var func = Marshal.GetDelegateForFunctionPointer<MkExistsConstSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_exists_const");
+        return func(c, weight, numBound, ref MemoryMarshal.GetReference(bound), numPatterns, ref MemoryMarshal.GetReference(patterns), body);
+    }
+
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkQuantifierConstDelegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool isForall, uint weight, uint numBound, IntPtr[] bound, uint numPatterns, IntPtr[] patterns, IntPtr body);
 
     /// <summary>
     ///  Create a universal or existential quantifier using a list of constants that will form the set of bound variables. 
@@ -251,11 +357,26 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_quantifier_const");
         var func = Marshal.GetDelegateForFunctionPointer<MkQuantifierConstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_quantifier_const");
         return func(c, isForall, weight, numBound, bound, numPatterns, patterns, body);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr MkQuantifierConstExDelegate(IntPtr c, bool isForall, uint weight, IntPtr quantifierId, IntPtr skolemId, uint numBound, IntPtr[] bound, uint numPatterns, IntPtr[] patterns, uint numNoPatterns, IntPtr[] noPatterns, IntPtr body);
+    private delegate IntPtr MkQuantifierConstSpanDelegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool isForall, uint weight, uint numBound, ref IntPtr bound, uint numPatterns, ref IntPtr patterns, IntPtr body);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_quantifier_const</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkQuantifierConst(IntPtr c, bool isForall, uint weight, uint numBound, ReadOnlySpan<IntPtr> bound, uint numPatterns, ReadOnlySpan<IntPtr> patterns, IntPtr body)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_quantifier_const");
+        var func = Marshal.GetDelegateForFunctionPointer<MkQuantifierConstSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_quantifier_const");
+        return func(c, isForall, weight, numBound, ref MemoryMarshal.GetReference(bound), numPatterns, ref MemoryMarshal.GetReference(patterns), body);
+    }
+
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkQuantifierConstExDelegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool isForall, uint weight, IntPtr quantifierId, IntPtr skolemId, uint numBound, IntPtr[] bound, uint numPatterns, IntPtr[] patterns, uint numNoPatterns, IntPtr[] noPatterns, IntPtr body);
 
     /// <summary>
     ///  Create a universal or existential quantifier using a list of constants that will form the set of bound variables. 
@@ -278,9 +399,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_quantifier_const_ex");
         var func = Marshal.GetDelegateForFunctionPointer<MkQuantifierConstExDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_quantifier_const_ex");
         return func(c, isForall, weight, quantifierId, skolemId, numBound, bound, numPatterns, patterns, numNoPatterns, noPatterns, body);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkQuantifierConstExSpanDelegate(IntPtr c, [MarshalAs(UnmanagedType.U1)] bool isForall, uint weight, IntPtr quantifierId, IntPtr skolemId, uint numBound, ref IntPtr bound, uint numPatterns, ref IntPtr patterns, uint numNoPatterns, ref IntPtr noPatterns, IntPtr body);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_quantifier_const_ex</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkQuantifierConstEx(IntPtr c, bool isForall, uint weight, IntPtr quantifierId, IntPtr skolemId, uint numBound, ReadOnlySpan<IntPtr> bound, uint numPatterns, ReadOnlySpan<IntPtr> patterns, uint numNoPatterns, ReadOnlySpan<IntPtr> noPatterns, IntPtr body)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_quantifier_const_ex");
+        var func = Marshal.GetDelegateForFunctionPointer<MkQuantifierConstExSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_quantifier_const_ex");
+        return func(c, isForall, weight, quantifierId, skolemId, numBound, ref MemoryMarshal.GetReference(bound), numPatterns, ref MemoryMarshal.GetReference(patterns), numNoPatterns, ref MemoryMarshal.GetReference(noPatterns), body);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkLambdaDelegate(IntPtr c, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body);
 
@@ -294,16 +430,31 @@ internal sealed partial class NativeZ3Library
     /// <param name="body" ctype="Z3_ast"> the body of the lambda expression.  </param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <seealso cref="MkBound"/>
-    /// <seealso cref="MkForall"/>
-    /// <seealso cref="MkLambdaConst"/>
+    /// <seealso cref="MkForall(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkLambdaConst(IntPtr, uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_lambda")]
     internal IntPtr MkLambda(IntPtr c, uint numDecls, IntPtr[] sorts, IntPtr[] declNames, IntPtr body)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_lambda");
         var func = Marshal.GetDelegateForFunctionPointer<MkLambdaDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_lambda");
         return func(c, numDecls, sorts, declNames, body);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkLambdaSpanDelegate(IntPtr c, uint numDecls, ref IntPtr sorts, ref IntPtr declNames, IntPtr body);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_lambda</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkLambda(IntPtr c, uint numDecls, ReadOnlySpan<IntPtr> sorts, ReadOnlySpan<IntPtr> declNames, IntPtr body)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_lambda");
+        var func = Marshal.GetDelegateForFunctionPointer<MkLambdaSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_lambda");
+        return func(c, numDecls, ref MemoryMarshal.GetReference(sorts), ref MemoryMarshal.GetReference(declNames), body);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkLambdaConstDelegate(IntPtr c, uint numBound, IntPtr[] bound, IntPtr body);
 
@@ -316,14 +467,29 @@ internal sealed partial class NativeZ3Library
     /// <param name="body" ctype="Z3_ast"> the body of the lambda expression. </param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <seealso cref="MkBound"/>
-    /// <seealso cref="MkForall"/>
-    /// <seealso cref="MkLambda"/>
+    /// <seealso cref="MkForall(IntPtr, uint, uint, IntPtr[], uint, IntPtr[], IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkLambda(IntPtr, uint, IntPtr[], IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_lambda_const")]
     internal IntPtr MkLambdaConst(IntPtr c, uint numBound, IntPtr[] bound, IntPtr body)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_lambda_const");
         var func = Marshal.GetDelegateForFunctionPointer<MkLambdaConstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_lambda_const");
         return func(c, numBound, bound, body);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkLambdaConstSpanDelegate(IntPtr c, uint numBound, ref IntPtr bound, IntPtr body);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_lambda_const</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkLambdaConst(IntPtr c, uint numBound, ReadOnlySpan<IntPtr> bound, IntPtr body)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_lambda_const");
+        var func = Marshal.GetDelegateForFunctionPointer<MkLambdaConstSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_lambda_const");
+        return func(c, numBound, ref MemoryMarshal.GetReference(bound), body);
+    }
+
 }
@@ -27,10 +27,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_sort");
         return func(c, s);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsSeqSortDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
@@ -44,6 +46,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_seq_sort");
         var func = Marshal.GetDelegateForFunctionPointer<IsSeqSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_seq_sort");
         return func(c, s);
     }
 
@@ -61,6 +64,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_seq_sort_basis");
         var func = Marshal.GetDelegateForFunctionPointer<GetSeqSortBasisDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_seq_sort_basis");
         return func(c, s);
     }
 
@@ -78,10 +82,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkReSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_sort");
         return func(c, seq);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsReSortDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
@@ -95,6 +101,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_re_sort");
         var func = Marshal.GetDelegateForFunctionPointer<IsReSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_re_sort");
         return func(c, s);
     }
 
@@ -112,6 +119,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_re_sort_basis");
         var func = Marshal.GetDelegateForFunctionPointer<GetReSortBasisDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_re_sort_basis");
         return func(c, s);
     }
 
@@ -131,6 +139,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_string_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkStringSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_string_sort");
         return func(c);
     }
 
@@ -150,10 +159,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_char_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkCharSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_char_sort");
         return func(c);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsStringSortDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
@@ -167,10 +178,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_string_sort");
         var func = Marshal.GetDelegateForFunctionPointer<IsStringSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_string_sort");
         return func(c, s);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsCharSortDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
@@ -184,6 +197,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_char_sort");
         var func = Marshal.GetDelegateForFunctionPointer<IsCharSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_char_sort");
         return func(c, s);
     }
 
@@ -201,9 +215,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_string");
         var func = Marshal.GetDelegateForFunctionPointer<MkStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_string");
         return func(c, s);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkStringUtf8Delegate(IntPtr c, ref byte s);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_mk_string</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr MkString(IntPtr c, ReadOnlySpan<byte> s)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_string");
+        var func = Marshal.GetDelegateForFunctionPointer<MkStringUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_string");
+        return func(c, ref MemoryMarshal.GetReference(s));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkLstringDelegate(IntPtr c, uint len, IntPtr s);
 
@@ -219,9 +248,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_lstring");
         var func = Marshal.GetDelegateForFunctionPointer<MkLstringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_lstring");
         return func(c, len, s);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkLstringUtf8Delegate(IntPtr c, uint len, ref byte s);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_mk_lstring</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr MkLstring(IntPtr c, uint len, ReadOnlySpan<byte> s)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_lstring");
+        var func = Marshal.GetDelegateForFunctionPointer<MkLstringUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_lstring");
+        return func(c, len, ref MemoryMarshal.GetReference(s));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkU32stringDelegate(IntPtr c, uint len, uint[] chars);
 
@@ -237,10 +281,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_u32string");
         var func = Marshal.GetDelegateForFunctionPointer<MkU32stringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_u32string");
         return func(c, len, chars);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool IsStringDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
@@ -254,6 +300,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_is_string");
         var func = Marshal.GetDelegateForFunctionPointer<IsStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_is_string");
         return func(c, s);
     }
 
@@ -274,6 +321,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_string");
         var func = Marshal.GetDelegateForFunctionPointer<GetStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_string");
         return func(c, s);
     }
 
@@ -295,6 +343,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_lstring");
         var func = Marshal.GetDelegateForFunctionPointer<GetLstringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_lstring");
         return func(c, s, out length);
     }
 
@@ -315,6 +364,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_string_length");
         var func = Marshal.GetDelegateForFunctionPointer<GetStringLengthDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_string_length");
         return func(c, s);
     }
 
@@ -337,6 +387,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_string_contents");
         var func = Marshal.GetDelegateForFunctionPointer<GetStringContentsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_string_contents");
         func(c, s, length, contents);
     }
 
@@ -357,6 +408,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_empty");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqEmptyDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_empty");
         return func(c, seq);
     }
 
@@ -374,6 +426,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_unit");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqUnitDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_unit");
         return func(c, a);
     }
 
@@ -395,9 +448,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_concat");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqConcatDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_concat");
         return func(c, n, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkSeqConcatSpanDelegate(IntPtr c, uint n, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_seq_concat</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkSeqConcat(IntPtr c, uint n, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_seq_concat");
+        var func = Marshal.GetDelegateForFunctionPointer<MkSeqConcatSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_concat");
+        return func(c, n, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkSeqPrefixDelegate(IntPtr c, IntPtr prefix, IntPtr s);
 
@@ -416,6 +484,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_prefix");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqPrefixDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_prefix");
         return func(c, prefix, s);
     }
 
@@ -437,6 +506,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_suffix");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqSuffixDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_suffix");
         return func(c, suffix, s);
     }
 
@@ -458,6 +528,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_contains");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqContainsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_contains");
         return func(c, container, containee);
     }
 
@@ -479,6 +550,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_str_lt");
         var func = Marshal.GetDelegateForFunctionPointer<MkStrLtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_str_lt");
         return func(c, prefix, s);
     }
 
@@ -500,6 +572,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_str_le");
         var func = Marshal.GetDelegateForFunctionPointer<MkStrLeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_str_le");
         return func(c, prefix, s);
     }
 
@@ -519,6 +592,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_extract");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqExtractDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_extract");
         return func(c, s, offset, length);
     }
 
@@ -538,6 +612,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_replace");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqReplaceDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_replace");
         return func(c, s, src, dst);
     }
 
@@ -556,6 +631,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_at");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqAtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_at");
         return func(c, s, index);
     }
 
@@ -574,6 +650,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_nth");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqNthDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_nth");
         return func(c, s, index);
     }
 
@@ -591,6 +668,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_length");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqLengthDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_length");
         return func(c, s);
     }
 
@@ -610,6 +688,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_index");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqIndexDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_index");
         return func(c, s, substr, offset);
     }
 
@@ -628,6 +707,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_last_index");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqLastIndexDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_last_index");
         return func(c, s, substr);
     }
 
@@ -646,6 +726,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_map");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqMapDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_map");
         return func(c, f, s);
     }
 
@@ -665,6 +746,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_mapi");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqMapiDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_mapi");
         return func(c, f, i, s);
     }
 
@@ -684,6 +766,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_foldl");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqFoldlDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_foldl");
         return func(c, f, a, s);
     }
 
@@ -704,6 +787,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_foldli");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqFoldliDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_foldli");
         return func(c, f, i, a, s);
     }
 
@@ -721,6 +805,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_str_to_int");
         var func = Marshal.GetDelegateForFunctionPointer<MkStrToIntDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_str_to_int");
         return func(c, s);
     }
 
@@ -738,6 +823,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_int_to_str");
         var func = Marshal.GetDelegateForFunctionPointer<MkIntToStrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_int_to_str");
         return func(c, s);
     }
 
@@ -755,6 +841,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_string_to_code");
         var func = Marshal.GetDelegateForFunctionPointer<MkStringToCodeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_string_to_code");
         return func(c, a);
     }
 
@@ -772,6 +859,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_string_from_code");
         var func = Marshal.GetDelegateForFunctionPointer<MkStringFromCodeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_string_from_code");
         return func(c, a);
     }
 
@@ -789,6 +877,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_ubv_to_str");
         var func = Marshal.GetDelegateForFunctionPointer<MkUbvToStrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_ubv_to_str");
         return func(c, s);
     }
 
@@ -806,6 +895,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_sbv_to_str");
         var func = Marshal.GetDelegateForFunctionPointer<MkSbvToStrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_sbv_to_str");
         return func(c, s);
     }
 
@@ -823,6 +913,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_to_re");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqToReDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_to_re");
         return func(c, seq);
     }
 
@@ -841,6 +932,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_seq_in_re");
         var func = Marshal.GetDelegateForFunctionPointer<MkSeqInReDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_seq_in_re");
         return func(c, seq, re);
     }
 
@@ -858,6 +950,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_plus");
         var func = Marshal.GetDelegateForFunctionPointer<MkRePlusDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_plus");
         return func(c, re);
     }
 
@@ -875,6 +968,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_star");
         var func = Marshal.GetDelegateForFunctionPointer<MkReStarDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_star");
         return func(c, re);
     }
 
@@ -892,6 +986,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_option");
         var func = Marshal.GetDelegateForFunctionPointer<MkReOptionDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_option");
         return func(c, re);
     }
 
@@ -913,9 +1008,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_union");
         var func = Marshal.GetDelegateForFunctionPointer<MkReUnionDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_union");
         return func(c, n, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkReUnionSpanDelegate(IntPtr c, uint n, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_re_union</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkReUnion(IntPtr c, uint n, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_re_union");
+        var func = Marshal.GetDelegateForFunctionPointer<MkReUnionSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_union");
+        return func(c, n, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkReConcatDelegate(IntPtr c, uint n, IntPtr[] args);
 
@@ -934,9 +1044,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_concat");
         var func = Marshal.GetDelegateForFunctionPointer<MkReConcatDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_concat");
         return func(c, n, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkReConcatSpanDelegate(IntPtr c, uint n, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_re_concat</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkReConcat(IntPtr c, uint n, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_re_concat");
+        var func = Marshal.GetDelegateForFunctionPointer<MkReConcatSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_concat");
+        return func(c, n, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkReRangeDelegate(IntPtr c, IntPtr lo, IntPtr hi);
 
@@ -952,6 +1077,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_range");
         var func = Marshal.GetDelegateForFunctionPointer<MkReRangeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_range");
         return func(c, lo, hi);
     }
 
@@ -969,6 +1095,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_allchar");
         var func = Marshal.GetDelegateForFunctionPointer<MkReAllcharDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_allchar");
         return func(c, regexSort);
     }
 
@@ -988,6 +1115,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_loop");
         var func = Marshal.GetDelegateForFunctionPointer<MkReLoopDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_loop");
         return func(c, r, lo, hi);
     }
 
@@ -1006,6 +1134,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_power");
         var func = Marshal.GetDelegateForFunctionPointer<MkRePowerDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_power");
         return func(c, re, n);
     }
 
@@ -1027,9 +1156,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_intersect");
         var func = Marshal.GetDelegateForFunctionPointer<MkReIntersectDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_intersect");
         return func(c, n, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkReIntersectSpanDelegate(IntPtr c, uint n, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_re_intersect</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkReIntersect(IntPtr c, uint n, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_re_intersect");
+        var func = Marshal.GetDelegateForFunctionPointer<MkReIntersectSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_intersect");
+        return func(c, n, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkReComplementDelegate(IntPtr c, IntPtr re);
 
@@ -1044,6 +1188,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_complement");
         var func = Marshal.GetDelegateForFunctionPointer<MkReComplementDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_complement");
         return func(c, re);
     }
 
@@ -1062,6 +1207,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_diff");
         var func = Marshal.GetDelegateForFunctionPointer<MkReDiffDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_diff");
         return func(c, re1, re2);
     }
 
@@ -1082,6 +1228,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_empty");
         var func = Marshal.GetDelegateForFunctionPointer<MkReEmptyDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_empty");
         return func(c, re);
     }
 
@@ -1102,6 +1249,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_re_full");
         var func = Marshal.GetDelegateForFunctionPointer<MkReFullDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_re_full");
         return func(c, re);
     }
 
@@ -1119,6 +1267,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_char");
         var func = Marshal.GetDelegateForFunctionPointer<MkCharDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_char");
         return func(c, ch);
     }
 
@@ -1137,6 +1286,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_char_le");
         var func = Marshal.GetDelegateForFunctionPointer<MkCharLeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_char_le");
         return func(c, ch1, ch2);
     }
 
@@ -1154,6 +1304,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_char_to_int");
         var func = Marshal.GetDelegateForFunctionPointer<MkCharToIntDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_char_to_int");
         return func(c, ch);
     }
 
@@ -1171,6 +1322,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_char_to_bv");
         var func = Marshal.GetDelegateForFunctionPointer<MkCharToBvDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_char_to_bv");
         return func(c, ch);
     }
 
@@ -1188,6 +1340,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_char_from_bv");
         var func = Marshal.GetDelegateForFunctionPointer<MkCharFromBvDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_char_from_bv");
         return func(c, bv);
     }
 
@@ -1205,6 +1358,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_char_is_digit");
         var func = Marshal.GetDelegateForFunctionPointer<MkCharIsDigitDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_char_is_digit");
         return func(c, ch);
     }
 
@@ -27,6 +27,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_set_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkSetSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_sort");
         return func(c, ty);
     }
 
@@ -44,6 +45,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_empty_set");
         var func = Marshal.GetDelegateForFunctionPointer<MkEmptySetDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_empty_set");
         return func(c, domain);
     }
 
@@ -61,6 +63,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_full_set");
         var func = Marshal.GetDelegateForFunctionPointer<MkFullSetDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_full_set");
         return func(c, domain);
     }
 
@@ -82,6 +85,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_set_add");
         var func = Marshal.GetDelegateForFunctionPointer<MkSetAddDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_add");
         return func(c, set, elem);
     }
 
@@ -103,6 +107,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_set_del");
         var func = Marshal.GetDelegateForFunctionPointer<MkSetDelDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_del");
         return func(c, set, elem);
     }
 
@@ -121,9 +126,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_set_union");
         var func = Marshal.GetDelegateForFunctionPointer<MkSetUnionDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_union");
         return func(c, numArgs, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkSetUnionSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_set_union</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkSetUnion(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_set_union");
+        var func = Marshal.GetDelegateForFunctionPointer<MkSetUnionSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_union");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkSetIntersectDelegate(IntPtr c, uint numArgs, IntPtr[] args);
 
@@ -139,9 +159,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_set_intersect");
         var func = Marshal.GetDelegateForFunctionPointer<MkSetIntersectDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_intersect");
         return func(c, numArgs, args);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkSetIntersectSpanDelegate(IntPtr c, uint numArgs, ref IntPtr args);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_set_intersect</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkSetIntersect(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_set_intersect");
+        var func = Marshal.GetDelegateForFunctionPointer<MkSetIntersectSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_intersect");
+        return func(c, numArgs, ref MemoryMarshal.GetReference(args));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkSetDifferenceDelegate(IntPtr c, IntPtr arg1, IntPtr arg2);
 
@@ -157,6 +192,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_set_difference");
         var func = Marshal.GetDelegateForFunctionPointer<MkSetDifferenceDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_difference");
         return func(c, arg1, arg2);
     }
 
@@ -174,6 +210,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_set_complement");
         var func = Marshal.GetDelegateForFunctionPointer<MkSetComplementDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_complement");
         return func(c, arg);
     }
 
@@ -195,6 +232,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_set_member");
         var func = Marshal.GetDelegateForFunctionPointer<MkSetMemberDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_member");
         return func(c, elem, set);
     }
 
@@ -213,6 +251,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_set_subset");
         var func = Marshal.GetDelegateForFunctionPointer<MkSetSubsetDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_set_subset");
         return func(c, arg1, arg2);
     }
 
@@ -231,6 +270,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_array_ext");
         var func = Marshal.GetDelegateForFunctionPointer<MkArrayExtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_array_ext");
         return func(c, arg1, arg2);
     }
 
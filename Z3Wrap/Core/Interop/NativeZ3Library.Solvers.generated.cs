@@ -33,6 +33,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_solver");
         var func = Marshal.GetDelegateForFunctionPointer<MkSolverDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_solver");
         return func(c);
     }
 
@@ -56,6 +57,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_simple_solver");
         var func = Marshal.GetDelegateForFunctionPointer<MkSimpleSolverDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_simple_solver");
         return func(c);
     }
 
@@ -79,6 +81,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_solver_for_logic");
         var func = Marshal.GetDelegateForFunctionPointer<MkSolverForLogicDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_solver_for_logic");
         return func(c, logic);
     }
 
@@ -102,6 +105,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_solver_from_tactic");
         var func = Marshal.GetDelegateForFunctionPointer<MkSolverFromTacticDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_solver_from_tactic");
         return func(c, t);
     }
 
@@ -120,6 +124,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_translate");
         var func = Marshal.GetDelegateForFunctionPointer<SolverTranslateDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_translate");
         return func(source, s, target);
     }
 
@@ -140,6 +145,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_import_model_converter");
         var func = Marshal.GetDelegateForFunctionPointer<SolverImportModelConverterDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_import_model_converter");
         func(ctx, src, dst);
     }
 
@@ -159,6 +165,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_help");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetHelpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_help");
         return func(c, s);
     }
 
@@ -178,6 +185,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_param_descrs");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetParamDescrsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_param_descrs");
         return func(c, s);
     }
 
@@ -197,6 +205,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_set_params");
         var func = Marshal.GetDelegateForFunctionPointer<SolverSetParamsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_set_params");
         func(c, s, p);
     }
 
@@ -213,6 +222,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<SolverIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_inc_ref");
         func(c, s);
     }
 
@@ -229,6 +239,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<SolverDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_dec_ref");
         func(c, s);
     }
 
@@ -245,6 +256,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_interrupt");
         var func = Marshal.GetDelegateForFunctionPointer<SolverInterruptDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_interrupt");
         func(c, s);
     }
 
@@ -266,6 +278,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_push");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPushDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_push");
         func(c, s);
     }
 
@@ -288,6 +301,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_pop");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPopDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_pop");
         func(c, s, n);
     }
 
@@ -306,6 +320,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_reset");
         var func = Marshal.GetDelegateForFunctionPointer<SolverResetDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_reset");
         func(c, s);
     }
 
@@ -325,6 +340,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_num_scopes");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetNumScopesDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_num_scopes");
         return func(c, s);
     }
 
@@ -338,7 +354,7 @@ internal sealed partial class NativeZ3Library
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
     /// <param name="a" ctype="Z3_ast">ast parameter</param>
     /// <remarks>
-    /// The functions <see cref="SolverCheck"/> and <see cref="SolverCheckAssumptions"/> should be used to check whether the logical context is consistent or not.
+    /// The functions <see cref="SolverCheck"/> and <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> should be used to check whether the logical context is consistent or not.
     /// </remarks>
     /// <seealso cref="SolverAssertAndTrack"/>
     /// <seealso cref="SolverReset"/>
@@ -347,6 +363,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_assert");
         var func = Marshal.GetDelegateForFunctionPointer<SolverAssertDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_assert");
         func(c, s, a);
     }
 
@@ -361,7 +378,7 @@ internal sealed partial class NativeZ3Library
     /// <param name="a" ctype="Z3_ast">ast parameter</param>
     /// <param name="p" ctype="Z3_ast">ast parameter</param>
     /// <remarks>
-    /// This API is an alternative to <see cref="SolverCheckAssumptions"/> for extracting unsat cores. Both APIs can be used in the same solver. The unsat core will contain a combination of the Boolean variables provided using Z3_solver_assert_and_track and the Boolean literals provided using <see cref="SolverCheckAssumptions"/> .
+    /// This API is an alternative to <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> for extracting unsat cores. Both APIs can be used in the same solver. The unsat core will contain a combination of the Boolean variables provided using Z3_solver_assert_and_track and the Boolean literals provided using <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> .
     /// Precondition: <c>a</c> must be a Boolean expression 
     /// Precondition: <c>p</c> must be a Boolean constant (aka variable). 
     /// </remarks>
@@ -372,6 +389,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_assert_and_track");
         var func = Marshal.GetDelegateForFunctionPointer<SolverAssertAndTrackDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_assert_and_track");
         func(c, s, a, p);
     }
 
@@ -384,16 +402,31 @@ internal sealed partial class NativeZ3Library
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
     /// <param name="fileName" ctype="Z3_string">string parameter</param>
-    /// <seealso cref="SolverFromString"/>
+    /// <seealso cref="SolverFromString(IntPtr, IntPtr, IntPtr)"/>
     /// <seealso cref="SolverToString"/>
     [Z3Function("Z3_solver_from_file")]
     internal void SolverFromFile(IntPtr c, IntPtr s, IntPtr fileName)
     {
         var funcPtr = GetFunctionPointer("Z3_solver_from_file");
         var func = Marshal.GetDelegateForFunctionPointer<SolverFromFileDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_from_file");
         func(c, s, fileName);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void SolverFromFileUtf8Delegate(IntPtr c, IntPtr s, ref byte fileName);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_solver_from_file</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal void SolverFromFile(IntPtr c, IntPtr s, ReadOnlySpan<byte> fileName)
+    {
+        var funcPtr = GetFunctionPointer("Z3_solver_from_file");
+        var func = Marshal.GetDelegateForFunctionPointer<SolverFromFileUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_from_file");
+        func(c, s, ref MemoryMarshal.GetReference(fileName));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void SolverFromStringDelegate(IntPtr c, IntPtr s, IntPtr str);
 
@@ -403,16 +436,31 @@ internal sealed partial class NativeZ3Library
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
     /// <param name="str" ctype="Z3_string">string parameter</param>
-    /// <seealso cref="SolverFromFile"/>
+    /// <seealso cref="SolverFromFile(IntPtr, IntPtr, IntPtr)"/>
     /// <seealso cref="SolverToString"/>
     [Z3Function("Z3_solver_from_string")]
     internal void SolverFromString(IntPtr c, IntPtr s, IntPtr str)
     {
         var funcPtr = GetFunctionPointer("Z3_solver_from_string");
         var func = Marshal.GetDelegateForFunctionPointer<SolverFromStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_from_string");
         func(c, s, str);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void SolverFromStringUtf8Delegate(IntPtr c, IntPtr s, ref byte str);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_solver_from_string</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal void SolverFromString(IntPtr c, IntPtr s, ReadOnlySpan<byte> str)
+    {
+        var funcPtr = GetFunctionPointer("Z3_solver_from_string");
+        var func = Marshal.GetDelegateForFunctionPointer<SolverFromStringUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_from_string");
+        func(c, s, ref MemoryMarshal.GetReference(str));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr SolverGetAssertionsDelegate(IntPtr c, IntPtr s);
 
@@ -427,6 +475,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_assertions");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetAssertionsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_assertions");
         return func(c, s);
     }
 
@@ -444,6 +493,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_units");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetUnitsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_units");
         return func(c, s);
     }
 
@@ -461,6 +511,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_trail");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetTrailDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_trail");
         return func(c, s);
     }
 
@@ -478,6 +529,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_non_units");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetNonUnitsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_non_units");
         return func(c, s);
     }
 
@@ -497,6 +549,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_levels");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetLevelsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_levels");
         func(c, s, literals, sz, levels);
     }
 
@@ -515,6 +568,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_congruence_root");
         var func = Marshal.GetDelegateForFunctionPointer<SolverCongruenceRootDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_congruence_root");
         return func(c, s, a);
     }
 
@@ -533,6 +587,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_congruence_next");
         var func = Marshal.GetDelegateForFunctionPointer<SolverCongruenceNextDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_congruence_next");
         return func(c, s, a);
     }
 
@@ -555,6 +610,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_congruence_explain");
         var func = Marshal.GetDelegateForFunctionPointer<SolverCongruenceExplainDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_congruence_explain");
         return func(c, s, a, b);
     }
 
@@ -574,6 +630,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_solve_for");
         var func = Marshal.GetDelegateForFunctionPointer<SolverSolveForDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_solve_for");
         func(c, s, variables, terms, guards);
     }
 
@@ -592,6 +649,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_register_on_clause");
         var func = Marshal.GetDelegateForFunctionPointer<SolverRegisterOnClauseDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_register_on_clause");
         func(c, s, userContext, onClauseEh);
     }
 
@@ -612,6 +670,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_init");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateInitDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_init");
         func(c, s, userContext, pushEh, popEh, freshEh);
     }
 
@@ -632,6 +691,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_fixed");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateFixedDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_fixed");
         func(c, s, fixedEh);
     }
 
@@ -652,6 +712,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_final");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateFinalDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_final");
         func(c, s, finalEh);
     }
 
@@ -669,6 +730,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_eq");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateEqDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_eq");
         func(c, s, eqEh);
     }
 
@@ -686,6 +748,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_diseq");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateDiseqDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_diseq");
         func(c, s, eqEh);
     }
 
@@ -703,6 +766,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_created");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateCreatedDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_created");
         func(c, s, createdEh);
     }
 
@@ -720,6 +784,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_decide");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateDecideDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_decide");
         func(c, s, decideEh);
     }
 
@@ -737,10 +802,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_on_binding");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateOnBindingDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_on_binding");
         func(c, s, onBindingEh);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool SolverNextSplitDelegate(IntPtr c, IntPtr cb, IntPtr t, uint idx, Lbool phase);
 
     /// <param name="c" ctype="Z3_context">context parameter</param>
@@ -757,6 +824,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_next_split");
         var func = Marshal.GetDelegateForFunctionPointer<SolverNextSplitDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_next_split");
         return func(c, cb, t, idx, phase);
     }
 
@@ -777,6 +845,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_declare");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateDeclareDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_declare");
         return func(c, name, n, out domain, range);
     }
 
@@ -794,6 +863,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_register");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateRegisterDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_register");
         func(c, s, e);
     }
 
@@ -811,10 +881,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_register_cb");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateRegisterCbDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_register_cb");
         func(c, cb, e);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool SolverPropagateConsequenceDelegate(IntPtr c, IntPtr cb, uint numFixed, IntPtr[] @fixed, uint numEqs, IntPtr[] eqLhs, out IntPtr eqRhs, IntPtr conseq);
 
     /// <summary>
@@ -837,9 +909,25 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_propagate_consequence");
         var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateConsequenceDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_consequence");
         return func(c, cb, numFixed, @fixed, numEqs, eqLhs, out eqRhs, conseq);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
+    private delegate bool SolverPropagateConsequenceSpanDelegate(IntPtr c, IntPtr cb, uint numFixed, ref IntPtr @fixed, uint numEqs, ref IntPtr eqLhs, out IntPtr eqRhs, IntPtr conseq);
+
+    /// <summary>
+    /// Span overload of <c>Z3_solver_propagate_consequence</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal bool SolverPropagateConsequence(IntPtr c, IntPtr cb, uint numFixed, ReadOnlySpan<IntPtr> @fixed, uint numEqs, ReadOnlySpan<IntPtr> eqLhs, out IntPtr eqRhs, IntPtr conseq)
+    {
+        var funcPtr = GetFunctionPointer("Z3_solver_propagate_consequence");
+        var func = Marshal.GetDelegateForFunctionPointer<SolverPropagateConsequenceSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_propagate_consequence");
+        return func(c, cb, numFixed, ref MemoryMarshal.GetReference(@fixed), numEqs, ref MemoryMarshal.GetReference(eqLhs), out eqRhs, conseq);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void SolverSetInitialValueDelegate(IntPtr c, IntPtr s, IntPtr v, IntPtr val);
 
@@ -855,6 +943,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_set_initial_value");
         var func = Marshal.GetDelegateForFunctionPointer<SolverSetInitialValueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_set_initial_value");
         func(c, s, v, val);
     }
 
@@ -870,12 +959,13 @@ internal sealed partial class NativeZ3Library
     /// <remarks>
     /// The function <see cref="SolverGetModel"/> retrieves a model if the assertions is satisfiable (i.e., the result is <c>Z3_L_TRUE</c> ) and model construction is enabled. Note that if the call returns <c>Z3_L_UNDEF</c> , Z3 does not ensure that calls to <see cref="SolverGetModel"/> succeed and any models produced in this case are not guaranteed to satisfy the assertions. The function <see cref="SolverGetProof"/> retrieves a proof if proof generation was enabled when the context was created, and the assertions are unsatisfiable (i.e., the result is <c>Z3_L_FALSE</c> ).
     /// </remarks>
-    /// <seealso cref="SolverCheckAssumptions"/>
+    /// <seealso cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/>
     [Z3Function("Z3_solver_check")]
     internal Lbool SolverCheck(IntPtr c, IntPtr s)
     {
         var funcPtr = GetFunctionPointer("Z3_solver_check");
         var func = Marshal.GetDelegateForFunctionPointer<SolverCheckDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_check");
         return func(c, s);
     }
 
@@ -899,9 +989,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_check_assumptions");
         var func = Marshal.GetDelegateForFunctionPointer<SolverCheckAssumptionsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_check_assumptions");
         return func(c, s, numAssumptions, assumptions);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate Lbool SolverCheckAssumptionsSpanDelegate(IntPtr c, IntPtr s, uint numAssumptions, ref IntPtr assumptions);
+
+    /// <summary>
+    /// Span overload of <c>Z3_solver_check_assumptions</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal Lbool SolverCheckAssumptions(IntPtr c, IntPtr s, uint numAssumptions, ReadOnlySpan<IntPtr> assumptions)
+    {
+        var funcPtr = GetFunctionPointer("Z3_solver_check_assumptions");
+        var func = Marshal.GetDelegateForFunctionPointer<SolverCheckAssumptionsSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_check_assumptions");
+        return func(c, s, numAssumptions, ref MemoryMarshal.GetReference(assumptions));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate Lbool GetImpliedEqualitiesDelegate(IntPtr c, IntPtr s, uint numTerms, IntPtr[] terms, uint[] classIds);
 
@@ -922,9 +1027,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_implied_equalities");
         var func = Marshal.GetDelegateForFunctionPointer<GetImpliedEqualitiesDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_implied_equalities");
         return func(c, s, numTerms, terms, classIds);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate Lbool GetImpliedEqualitiesSpanDelegate(IntPtr c, IntPtr s, uint numTerms, ref IntPtr terms, uint[] classIds);
+
+    /// <summary>
+    /// Span overload of <c>Z3_get_implied_equalities</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal Lbool GetImpliedEqualities(IntPtr c, IntPtr s, uint numTerms, ReadOnlySpan<IntPtr> terms, uint[] classIds)
+    {
+        var funcPtr = GetFunctionPointer("Z3_get_implied_equalities");
+        var func = Marshal.GetDelegateForFunctionPointer<GetImpliedEqualitiesSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_implied_equalities");
+        return func(c, s, numTerms, ref MemoryMarshal.GetReference(terms), classIds);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate Lbool SolverGetConsequencesDelegate(IntPtr c, IntPtr s, IntPtr assumptions, IntPtr variables, IntPtr consequences);
 
@@ -942,6 +1062,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_consequences");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetConsequencesDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_consequences");
         return func(c, s, assumptions, variables, consequences);
     }
 
@@ -964,6 +1085,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_cube");
         var func = Marshal.GetDelegateForFunctionPointer<SolverCubeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_cube");
         return func(c, s, vars, backtrackLevel);
     }
 
@@ -971,7 +1093,7 @@ internal sealed partial class NativeZ3Library
     private delegate IntPtr SolverGetModelDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
-    ///  Retrieve the model for the last <see cref="SolverCheck"/> or <see cref="SolverCheckAssumptions"/> . 
+    ///  Retrieve the model for the last <see cref="SolverCheck"/> or <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
@@ -984,6 +1106,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_model");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetModelDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_model");
         return func(c, s);
     }
 
@@ -991,7 +1114,7 @@ internal sealed partial class NativeZ3Library
     private delegate IntPtr SolverGetProofDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
-    ///  Retrieve the proof for the last <see cref="SolverCheck"/> or <see cref="SolverCheckAssumptions"/> . 
+    ///  Retrieve the proof for the last <see cref="SolverCheck"/> or <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
@@ -1004,6 +1127,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_proof");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetProofDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_proof");
         return func(c, s);
     }
 
@@ -1011,7 +1135,7 @@ internal sealed partial class NativeZ3Library
     private delegate IntPtr SolverGetUnsatCoreDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
-    ///  Retrieve the unsat core for the last <see cref="SolverCheckAssumptions"/> The unsat core is a subset of the assumptions <c>a</c> . 
+    ///  Retrieve the unsat core for the last <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> The unsat core is a subset of the assumptions <c>a</c> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
@@ -1024,6 +1148,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_unsat_core");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetUnsatCoreDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_unsat_core");
         return func(c, s);
     }
 
@@ -1031,7 +1156,7 @@ internal sealed partial class NativeZ3Library
     private delegate IntPtr SolverGetReasonUnknownDelegate(IntPtr c, IntPtr s);
 
     /// <summary>
-    ///  Return a brief justification for an "unknown" result (i.e., <c>Z3_L_UNDEF</c> ) for the commands <see cref="SolverCheck"/> and <see cref="SolverCheckAssumptions"/> . 
+    ///  Return a brief justification for an "unknown" result (i.e., <c>Z3_L_UNDEF</c> ) for the commands <see cref="SolverCheck"/> and <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> . 
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
@@ -1041,6 +1166,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_reason_unknown");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetReasonUnknownDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_reason_unknown");
         return func(c, s);
     }
 
@@ -1061,6 +1187,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_get_statistics");
         var func = Marshal.GetDelegateForFunctionPointer<SolverGetStatisticsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_get_statistics");
         return func(c, s);
     }
 
@@ -1073,18 +1200,19 @@ internal sealed partial class NativeZ3Library
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
     /// <returns ctype="Z3_string">string value</returns>
-    /// <seealso cref="SolverFromFile"/>
-    /// <seealso cref="SolverFromString"/>
+    /// <seealso cref="SolverFromFile(IntPtr, IntPtr, IntPtr)"/>
+    /// <seealso cref="SolverFromString(IntPtr, IntPtr, IntPtr)"/>
     [Z3Function("Z3_solver_to_string")]
     internal IntPtr SolverToString(IntPtr c, IntPtr s)
     {
         var funcPtr = GetFunctionPointer("Z3_solver_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<SolverToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_to_string");
         return func(c, s);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr SolverToDimacsStringDelegate(IntPtr c, IntPtr s, bool includeNames);
+    private delegate IntPtr SolverToDimacsStringDelegate(IntPtr c, IntPtr s, [MarshalAs(UnmanagedType.U1)] bool includeNames);
 
     /// <summary>
     ///  Convert a solver into a DIMACS formatted string. 
@@ -1098,6 +1226,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_to_dimacs_string");
         var func = Marshal.GetDelegateForFunctionPointer<SolverToDimacsStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_to_dimacs_string");
         return func(c, s, includeNames);
     }
 
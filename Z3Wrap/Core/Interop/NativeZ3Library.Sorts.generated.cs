@@ -30,6 +30,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_uninterpreted_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkUninterpretedSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_uninterpreted_sort");
         return func(c, s);
     }
 
@@ -50,6 +51,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_type_variable");
         var func = Marshal.GetDelegateForFunctionPointer<MkTypeVariableDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_type_variable");
         return func(c, s);
     }
 
@@ -69,6 +71,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bool_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkBoolSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bool_sort");
         return func(c);
     }
 
@@ -89,6 +92,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_int_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkIntSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_int_sort");
         return func(c);
     }
 
@@ -108,6 +112,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_real_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkRealSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_real_sort");
         return func(c);
     }
 
@@ -129,6 +134,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_bv_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkBvSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_bv_sort");
         return func(c, sz);
     }
 
@@ -151,6 +157,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_finite_domain_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkFiniteDomainSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_finite_domain_sort");
         return func(c, name, size);
     }
 
@@ -174,6 +181,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_array_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkArraySortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_array_sort");
         return func(c, domain, range);
     }
 
@@ -188,16 +196,31 @@ internal sealed partial class NativeZ3Library
     /// <param name="domain" ctype="Z3_sort const *">sort parameter</param>
     /// <param name="range" ctype="Z3_sort">sort parameter</param>
     /// <returns ctype="Z3_sort">sort value</returns>
-    /// <seealso cref="MkSelectN"/>
-    /// <seealso cref="MkStoreN"/>
+    /// <seealso cref="MkSelectN(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkStoreN(IntPtr, IntPtr, uint, IntPtr[], IntPtr)"/>
     [Z3Function("Z3_mk_array_sort_n")]
     internal IntPtr MkArraySortN(IntPtr c, uint n, IntPtr[] domain, IntPtr range)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_array_sort_n");
         var func = Marshal.GetDelegateForFunctionPointer<MkArraySortNDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_array_sort_n");
         return func(c, n, domain, range);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkArraySortNSpanDelegate(IntPtr c, uint n, ref IntPtr domain, IntPtr range);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_array_sort_n</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkArraySortN(IntPtr c, uint n, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_array_sort_n");
+        var func = Marshal.GetDelegateForFunctionPointer<MkArraySortNSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_array_sort_n");
+        return func(c, n, ref MemoryMarshal.GetReference(domain), range);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkTupleSortDelegate(IntPtr c, IntPtr mkTupleName, uint numFields, IntPtr[] fieldNames, IntPtr[] fieldSorts, out IntPtr mkTupleDecl, IntPtr[] projDecl);
 
@@ -220,9 +243,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_tuple_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkTupleSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_tuple_sort");
         return func(c, mkTupleName, numFields, fieldNames, fieldSorts, out mkTupleDecl, projDecl);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkTupleSortSpanDelegate(IntPtr c, IntPtr mkTupleName, uint numFields, ref IntPtr fieldNames, ref IntPtr fieldSorts, out IntPtr mkTupleDecl, IntPtr[] projDecl);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_tuple_sort</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkTupleSort(IntPtr c, IntPtr mkTupleName, uint numFields, ReadOnlySpan<IntPtr> fieldNames, ReadOnlySpan<IntPtr> fieldSorts, out IntPtr mkTupleDecl, IntPtr[] projDecl)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_tuple_sort");
+        var func = Marshal.GetDelegateForFunctionPointer<MkTupleSortSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_tuple_sort");
+        return func(c, mkTupleName, numFields, ref MemoryMarshal.GetReference(fieldNames), ref MemoryMarshal.GetReference(fieldSorts), out mkTupleDecl, projDecl);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkEnumerationSortDelegate(IntPtr c, IntPtr name, uint n, IntPtr[] enumNames, IntPtr[] enumConsts, IntPtr[] enumTesters);
 
@@ -244,9 +282,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_enumeration_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkEnumerationSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_enumeration_sort");
         return func(c, name, n, enumNames, enumConsts, enumTesters);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkEnumerationSortSpanDelegate(IntPtr c, IntPtr name, uint n, ref IntPtr enumNames, IntPtr[] enumConsts, IntPtr[] enumTesters);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_enumeration_sort</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkEnumerationSort(IntPtr c, IntPtr name, uint n, ReadOnlySpan<IntPtr> enumNames, IntPtr[] enumConsts, IntPtr[] enumTesters)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_enumeration_sort");
+        var func = Marshal.GetDelegateForFunctionPointer<MkEnumerationSortSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_enumeration_sort");
+        return func(c, name, n, ref MemoryMarshal.GetReference(enumNames), enumConsts, enumTesters);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkListSortDelegate(IntPtr c, IntPtr name, IntPtr elemSort, out IntPtr nilDecl, out IntPtr isNilDecl, out IntPtr consDecl, out IntPtr isConsDecl, out IntPtr headDecl, out IntPtr tailDecl);
 
@@ -271,6 +324,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_list_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkListSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_list_sort");
         return func(c, name, elemSort, out nilDecl, out isNilDecl, out consDecl, out isConsDecl, out headDecl, out tailDecl);
     }
 
@@ -289,16 +343,31 @@ internal sealed partial class NativeZ3Library
     /// <param name="sortRefs" ctype="unsigned[]"> reference to datatype sort that is an argument to the constructor; if the corresponding sort reference is 0, then the value in sort_refs should be an index referring to one of the recursive datatypes that is declared. </param>
     /// <returns ctype="Z3_constructor">ructor value</returns>
     /// <seealso cref="DelConstructor"/>
-    /// <seealso cref="MkConstructorList"/>
+    /// <seealso cref="MkConstructorList(IntPtr, uint, IntPtr[])"/>
     /// <seealso cref="QueryConstructor"/>
     [Z3Function("Z3_mk_constructor")]
     internal IntPtr MkConstructor(IntPtr c, IntPtr name, IntPtr recognizer, uint numFields, IntPtr[] fieldNames, IntPtr[] sorts, uint[] sortRefs)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_constructor");
         var func = Marshal.GetDelegateForFunctionPointer<MkConstructorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_constructor");
         return func(c, name, recognizer, numFields, fieldNames, sorts, sortRefs);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkConstructorSpanDelegate(IntPtr c, IntPtr name, IntPtr recognizer, uint numFields, ref IntPtr fieldNames, ref IntPtr sorts, uint[] sortRefs);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_constructor</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkConstructor(IntPtr c, IntPtr name, IntPtr recognizer, uint numFields, ReadOnlySpan<IntPtr> fieldNames, ReadOnlySpan<IntPtr> sorts, uint[] sortRefs)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_constructor");
+        var func = Marshal.GetDelegateForFunctionPointer<MkConstructorSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_constructor");
+        return func(c, name, recognizer, numFields, ref MemoryMarshal.GetReference(fieldNames), ref MemoryMarshal.GetReference(sorts), sortRefs);
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate uint ConstructorNumFieldsDelegate(IntPtr c, IntPtr constr);
 
@@ -313,6 +382,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_constructor_num_fields");
         var func = Marshal.GetDelegateForFunctionPointer<ConstructorNumFieldsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_constructor_num_fields");
         return func(c, constr);
     }
 
@@ -324,12 +394,13 @@ internal sealed partial class NativeZ3Library
     /// </summary>
     /// <param name="c" ctype="Z3_context"> logical context. </param>
     /// <param name="constr" ctype="Z3_constructor"> constructor. </param>
-    /// <seealso cref="MkConstructor"/>
+    /// <seealso cref="MkConstructor(IntPtr, IntPtr, IntPtr, uint, IntPtr[], IntPtr[], uint[])"/>
     [Z3Function("Z3_del_constructor")]
     internal void DelConstructor(IntPtr c, IntPtr constr)
     {
         var funcPtr = GetFunctionPointer("Z3_del_constructor");
         var func = Marshal.GetDelegateForFunctionPointer<DelConstructorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_del_constructor");
         func(c, constr);
     }
 
@@ -344,17 +415,32 @@ internal sealed partial class NativeZ3Library
     /// <param name="numConstructors" ctype="unsigned"> number of constructors passed in. </param>
     /// <param name="constructors" ctype="Z3_constructor[]"> array of constructor containers. </param>
     /// <returns ctype="Z3_sort">sort value</returns>
-    /// <seealso cref="MkConstructor"/>
-    /// <seealso cref="MkConstructorList"/>
-    /// <seealso cref="MkDatatypes"/>
+    /// <seealso cref="MkConstructor(IntPtr, IntPtr, IntPtr, uint, IntPtr[], IntPtr[], uint[])"/>
+    /// <seealso cref="MkConstructorList(IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkDatatypes(IntPtr, uint, IntPtr[], IntPtr[], IntPtr[])"/>
     [Z3Function("Z3_mk_datatype")]
     internal IntPtr MkDatatype(IntPtr c, IntPtr name, uint numConstructors, IntPtr[] constructors)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_datatype");
         var func = Marshal.GetDelegateForFunctionPointer<MkDatatypeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_datatype");
         return func(c, name, numConstructors, constructors);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkDatatypeSpanDelegate(IntPtr c, IntPtr name, uint numConstructors, ref IntPtr constructors);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_datatype</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkDatatype(IntPtr c, IntPtr name, uint numConstructors, ReadOnlySpan<IntPtr> constructors)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_datatype");
+        var func = Marshal.GetDelegateForFunctionPointer<MkDatatypeSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_datatype");
+        return func(c, name, numConstructors, ref MemoryMarshal.GetReference(constructors));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr MkDatatypeSortDelegate(IntPtr c, IntPtr name);
 
@@ -372,6 +458,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_datatype_sort");
         var func = Marshal.GetDelegateForFunctionPointer<MkDatatypeSortDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_datatype_sort");
         return func(c, name);
     }
 
@@ -386,15 +473,30 @@ internal sealed partial class NativeZ3Library
     /// <param name="constructors" ctype="Z3_constructor const[]"> list of constructors. </param>
     /// <returns ctype="Z3_constructor_list">ructor_list value</returns>
     /// <seealso cref="DelConstructorList"/>
-    /// <seealso cref="MkConstructor"/>
+    /// <seealso cref="MkConstructor(IntPtr, IntPtr, IntPtr, uint, IntPtr[], IntPtr[], uint[])"/>
     [Z3Function("Z3_mk_constructor_list")]
     internal IntPtr MkConstructorList(IntPtr c, uint numConstructors, IntPtr[] constructors)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_constructor_list");
         var func = Marshal.GetDelegateForFunctionPointer<MkConstructorListDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_constructor_list");
         return func(c, numConstructors, constructors);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkConstructorListSpanDelegate(IntPtr c, uint numConstructors, ref IntPtr constructors);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_constructor_list</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr MkConstructorList(IntPtr c, uint numConstructors, ReadOnlySpan<IntPtr> constructors)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_constructor_list");
+        var func = Marshal.GetDelegateForFunctionPointer<MkConstructorListSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_constructor_list");
+        return func(c, numConstructors, ref MemoryMarshal.GetReference(constructors));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void DelConstructorListDelegate(IntPtr c, IntPtr clist);
 
@@ -406,12 +508,13 @@ internal sealed partial class NativeZ3Library
     /// <remarks>
     /// Each constructor inside the constructor list must be independently reclaimed using <see cref="DelConstructor"/> .
     /// </remarks>
-    /// <seealso cref="MkConstructorList"/>
+    /// <seealso cref="MkConstructorList(IntPtr, uint, IntPtr[])"/>
     [Z3Function("Z3_del_constructor_list")]
     internal void DelConstructorList(IntPtr c, IntPtr clist)
     {
         var funcPtr = GetFunctionPointer("Z3_del_constructor_list");
         var func = Marshal.GetDelegateForFunctionPointer<DelConstructorListDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_del_constructor_list");
         func(c, clist);
     }
 
@@ -426,17 +529,32 @@ internal sealed partial class NativeZ3Library
     /// <param name="sortNames" ctype="Z3_symbol const[]"> names of datatype sorts. </param>
     /// <param name="sorts" ctype="Z3_sort[]"> array of datatype sorts. </param>
     /// <param name="constructorLists" ctype="Z3_constructor_list[]"> list of constructors, one list per sort. </param>
-    /// <seealso cref="MkConstructor"/>
-    /// <seealso cref="MkConstructorList"/>
-    /// <seealso cref="MkDatatype"/>
+    /// <seealso cref="MkConstructor(IntPtr, IntPtr, IntPtr, uint, IntPtr[], IntPtr[], uint[])"/>
+    /// <seealso cref="MkConstructorList(IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkDatatype(IntPtr, IntPtr, uint, IntPtr[])"/>
     [Z3Function("Z3_mk_datatypes")]
     internal void MkDatatypes(IntPtr c, uint numSorts, IntPtr[] sortNames, IntPtr[] sorts, IntPtr[] constructorLists)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_datatypes");
         var func = Marshal.GetDelegateForFunctionPointer<MkDatatypesDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_datatypes");
         func(c, numSorts, sortNames, sorts, constructorLists);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate void MkDatatypesSpanDelegate(IntPtr c, uint numSorts, ref IntPtr sortNames, IntPtr[] sorts, ref IntPtr constructorLists);
+
+    /// <summary>
+    /// Span overload of <c>Z3_mk_datatypes</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal void MkDatatypes(IntPtr c, uint numSorts, ReadOnlySpan<IntPtr> sortNames, IntPtr[] sorts, ReadOnlySpan<IntPtr> constructorLists)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_datatypes");
+        var func = Marshal.GetDelegateForFunctionPointer<MkDatatypesSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_datatypes");
+        func(c, numSorts, ref MemoryMarshal.GetReference(sortNames), sorts, ref MemoryMarshal.GetReference(constructorLists));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void QueryConstructorDelegate(IntPtr c, IntPtr constr, uint numFields, out IntPtr constructor, out IntPtr tester, IntPtr[] accessors);
 
@@ -444,17 +562,18 @@ internal sealed partial class NativeZ3Library
     ///  Query constructor for declared functions. 
     /// </summary>
     /// <param name="c" ctype="Z3_context"> logical context. </param>
-    /// <param name="constr" ctype="Z3_constructor"> constructor container. The container must have been passed into a <see cref="MkDatatype"/> call. </param>
+    /// <param name="constr" ctype="Z3_constructor"> constructor container. The container must have been passed into a <see cref="MkDatatype(IntPtr, IntPtr, uint, IntPtr[])"/> call. </param>
     /// <param name="numFields" ctype="unsigned"> number of accessor fields in the constructor. </param>
     /// <param name="constructor" ctype="Z3_func_decl*"> constructor function declaration, allocated by user. </param>
     /// <param name="tester" ctype="Z3_func_decl*"> constructor test function declaration, allocated by user. </param>
     /// <param name="accessors" ctype="Z3_func_decl[]"> array of accessor function declarations allocated by user. The array must contain num_fields elements. </param>
-    /// <seealso cref="MkConstructor"/>
+    /// <seealso cref="MkConstructor(IntPtr, IntPtr, IntPtr, uint, IntPtr[], IntPtr[], uint[])"/>
     [Z3Function("Z3_query_constructor")]
     internal void QueryConstructor(IntPtr c, IntPtr constr, uint numFields, out IntPtr constructor, out IntPtr tester, IntPtr[] accessors)
     {
         var funcPtr = GetFunctionPointer("Z3_query_constructor");
         var func = Marshal.GetDelegateForFunctionPointer<QueryConstructorDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_query_constructor");
         func(c, constr, numFields, out constructor, out tester, accessors);
     }
 
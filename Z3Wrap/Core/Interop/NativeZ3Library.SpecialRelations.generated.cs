@@ -28,6 +28,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_linear_order");
         var func = Marshal.GetDelegateForFunctionPointer<MkLinearOrderDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_linear_order");
         return func(c, a, id);
     }
 
@@ -46,6 +47,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_partial_order");
         var func = Marshal.GetDelegateForFunctionPointer<MkPartialOrderDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_partial_order");
         return func(c, a, id);
     }
 
@@ -64,6 +66,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_piecewise_linear_order");
         var func = Marshal.GetDelegateForFunctionPointer<MkPiecewiseLinearOrderDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_piecewise_linear_order");
         return func(c, a, id);
     }
 
@@ -82,6 +85,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_tree_order");
         var func = Marshal.GetDelegateForFunctionPointer<MkTreeOrderDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_tree_order");
         return func(c, a, id);
     }
 
@@ -102,6 +106,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_transitive_closure");
         var func = Marshal.GetDelegateForFunctionPointer<MkTransitiveClosureDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_transitive_closure");
         return func(c, f);
     }
 
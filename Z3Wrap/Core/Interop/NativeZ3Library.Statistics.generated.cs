@@ -27,6 +27,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_stats_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<StatsToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_stats_to_string");
         return func(c, s);
     }
 
@@ -43,6 +44,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_stats_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<StatsIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_stats_inc_ref");
         func(c, s);
     }
 
@@ -59,6 +61,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_stats_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<StatsDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_stats_dec_ref");
         func(c, s);
     }
 
@@ -76,6 +79,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_stats_size");
         var func = Marshal.GetDelegateForFunctionPointer<StatsSizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_stats_size");
         return func(c, s);
     }
 
@@ -97,10 +101,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_stats_get_key");
         var func = Marshal.GetDelegateForFunctionPointer<StatsGetKeyDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_stats_get_key");
         return func(c, s, idx);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool StatsIsUintDelegate(IntPtr c, IntPtr s, uint idx);
 
     /// <summary>
@@ -118,10 +124,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_stats_is_uint");
         var func = Marshal.GetDelegateForFunctionPointer<StatsIsUintDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_stats_is_uint");
         return func(c, s, idx);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool StatsIsDoubleDelegate(IntPtr c, IntPtr s, uint idx);
 
     /// <summary>
@@ -139,6 +147,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_stats_is_double");
         var func = Marshal.GetDelegateForFunctionPointer<StatsIsDoubleDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_stats_is_double");
         return func(c, s, idx);
     }
 
@@ -160,6 +169,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_stats_get_uint_value");
         var func = Marshal.GetDelegateForFunctionPointer<StatsGetUintValueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_stats_get_uint_value");
         return func(c, s, idx);
     }
 
@@ -181,6 +191,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_stats_get_double_value");
         var func = Marshal.GetDelegateForFunctionPointer<StatsGetDoubleValueDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_stats_get_double_value");
         return func(c, s, idx);
     }
 
@@ -196,6 +207,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_estimated_alloc_size");
         var func = Marshal.GetDelegateForFunctionPointer<GetEstimatedAllocSizeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_estimated_alloc_size");
         return func();
     }
 
@@ -32,6 +32,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_set_ast_print_mode");
         var func = Marshal.GetDelegateForFunctionPointer<SetAstPrintModeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_set_ast_print_mode");
         func(c, mode);
     }
 
@@ -54,6 +55,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_ast_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<AstToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_ast_to_string");
         return func(c, a);
     }
 
@@ -68,6 +70,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_pattern_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<PatternToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_pattern_to_string");
         return func(c, p);
     }
 
@@ -82,6 +85,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_sort_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<SortToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_sort_to_string");
         return func(c, s);
     }
 
@@ -96,6 +100,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_func_decl_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<FuncDeclToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_func_decl_to_string");
         return func(c, d);
     }
 
@@ -116,6 +121,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_model_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<ModelToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_model_to_string");
         return func(c, m);
     }
 
@@ -142,7 +148,36 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_benchmark_to_smtlib_string");
         var func = Marshal.GetDelegateForFunctionPointer<BenchmarkToSmtlibStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_benchmark_to_smtlib_string");
         return func(c, name, logic, status, attributes, numAssumptions, assumptions, formula);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr BenchmarkToSmtlibStringSpanDelegate(IntPtr c, IntPtr name, IntPtr logic, IntPtr status, IntPtr attributes, uint numAssumptions, ref IntPtr assumptions, IntPtr formula);
+
+    /// <summary>
+    /// Span overload of <c>Z3_benchmark_to_smtlib_string</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr BenchmarkToSmtlibString(IntPtr c, IntPtr name, IntPtr logic, IntPtr status, IntPtr attributes, uint numAssumptions, ReadOnlySpan<IntPtr> assumptions, IntPtr formula)
+    {
+        var funcPtr = GetFunctionPointer("Z3_benchmark_to_smtlib_string");
+        var func = Marshal.GetDelegateForFunctionPointer<BenchmarkToSmtlibStringSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_benchmark_to_smtlib_string");
+        return func(c, name, logic, status, attributes, numAssumptions, ref MemoryMarshal.GetReference(assumptions), formula);
+    }
+
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr BenchmarkToSmtlibStringUtf8Delegate(IntPtr c, ref byte name, ref byte logic, ref byte status, ref byte attributes, uint numAssumptions, ref IntPtr assumptions, IntPtr formula);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_benchmark_to_smtlib_string</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr BenchmarkToSmtlibString(IntPtr c, ReadOnlySpan<byte> name, ReadOnlySpan<byte> logic, ReadOnlySpan<byte> status, ReadOnlySpan<byte> attributes, uint numAssumptions, ReadOnlySpan<IntPtr> assumptions, IntPtr formula)
+    {
+        var funcPtr = GetFunctionPointer("Z3_benchmark_to_smtlib_string");
+        var func = Marshal.GetDelegateForFunctionPointer<BenchmarkToSmtlibStringUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_benchmark_to_smtlib_string");
+        return func(c, ref MemoryMarshal.GetReference(name), ref MemoryMarshal.GetReference(logic), ref MemoryMarshal.GetReference(status), ref MemoryMarshal.GetReference(attributes), numAssumptions, ref MemoryMarshal.GetReference(assumptions), formula);
+    }
+
 }
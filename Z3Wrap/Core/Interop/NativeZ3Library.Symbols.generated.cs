@@ -26,12 +26,13 @@ internal sealed partial class NativeZ3Library
     /// Symbols are used to name several term and type constructors. NB. Not all integers can be passed to this function. The legal range of unsigned integers is 0 to 2^30-1.
     /// </remarks>
     /// <seealso cref="GetSymbolInt"/>
-    /// <seealso cref="MkStringSymbol"/>
+    /// <seealso cref="MkStringSymbol(IntPtr, IntPtr)"/>
     [Z3Function("Z3_mk_int_symbol")]
     internal IntPtr MkIntSymbol(IntPtr c, int i)
     {
         var funcPtr = GetFunctionPointer("Z3_mk_int_symbol");
         var func = Marshal.GetDelegateForFunctionPointer<MkIntSymbolDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_int_symbol");
         return func(c, i);
     }
 
@@ -54,7 +55,22 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_string_symbol");
         var func = Marshal.GetDelegateForFunctionPointer<MkStringSymbolDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_string_symbol");
         return func(c, s);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkStringSymbolUtf8Delegate(IntPtr c, ref byte s);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_mk_string_symbol</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr MkStringSymbol(IntPtr c, ReadOnlySpan<byte> s)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_string_symbol");
+        var func = Marshal.GetDelegateForFunctionPointer<MkStringSymbolUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_string_symbol");
+        return func(c, ref MemoryMarshal.GetReference(s));
+    }
+
 }
@@ -30,9 +30,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_tactic");
         var func = Marshal.GetDelegateForFunctionPointer<MkTacticDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_tactic");
         return func(c, name);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkTacticUtf8Delegate(IntPtr c, ref byte name);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_mk_tactic</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr MkTactic(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_tactic");
+        var func = Marshal.GetDelegateForFunctionPointer<MkTacticUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_tactic");
+        return func(c, ref MemoryMarshal.GetReference(name));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void TacticIncRefDelegate(IntPtr c, IntPtr t);
 
@@ -46,6 +61,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<TacticIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_inc_ref");
         func(c, t);
     }
 
@@ -62,6 +78,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<TacticDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_dec_ref");
         func(c, g);
     }
 
@@ -82,9 +99,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_probe");
         var func = Marshal.GetDelegateForFunctionPointer<MkProbeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_probe");
         return func(c, name);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkProbeUtf8Delegate(IntPtr c, ref byte name);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_mk_probe</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr MkProbe(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_probe");
+        var func = Marshal.GetDelegateForFunctionPointer<MkProbeUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_probe");
+        return func(c, ref MemoryMarshal.GetReference(name));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void ProbeIncRefDelegate(IntPtr c, IntPtr p);
 
@@ -98,6 +130,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_inc_ref");
         func(c, p);
     }
 
@@ -114,6 +147,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_dec_ref");
         func(c, p);
     }
 
@@ -132,6 +166,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_and_then");
         var func = Marshal.GetDelegateForFunctionPointer<TacticAndThenDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_and_then");
         return func(c, t1, t2);
     }
 
@@ -150,6 +185,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_or_else");
         var func = Marshal.GetDelegateForFunctionPointer<TacticOrElseDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_or_else");
         return func(c, t1, t2);
     }
 
@@ -168,9 +204,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_par_or");
         var func = Marshal.GetDelegateForFunctionPointer<TacticParOrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_par_or");
         return func(c, num, ts);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr TacticParOrSpanDelegate(IntPtr c, uint num, ref IntPtr ts);
+
+    /// <summary>
+    /// Span overload of <c>Z3_tactic_par_or</c>; input handle arrays are pinned in place.
+    /// </summary>
+    internal IntPtr TacticParOr(IntPtr c, uint num, ReadOnlySpan<IntPtr> ts)
+    {
+        var funcPtr = GetFunctionPointer("Z3_tactic_par_or");
+        var func = Marshal.GetDelegateForFunctionPointer<TacticParOrSpanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_par_or");
+        return func(c, num, ref MemoryMarshal.GetReference(ts));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr TacticParAndThenDelegate(IntPtr c, IntPtr t1, IntPtr t2);
 
@@ -186,6 +237,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_par_and_then");
         var func = Marshal.GetDelegateForFunctionPointer<TacticParAndThenDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_par_and_then");
         return func(c, t1, t2);
     }
 
@@ -204,6 +256,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_try_for");
         var func = Marshal.GetDelegateForFunctionPointer<TacticTryForDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_try_for");
         return func(c, t, ms);
     }
 
@@ -222,6 +275,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_when");
         var func = Marshal.GetDelegateForFunctionPointer<TacticWhenDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_when");
         return func(c, p, t);
     }
 
@@ -241,6 +295,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_cond");
         var func = Marshal.GetDelegateForFunctionPointer<TacticCondDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_cond");
         return func(c, p, t1, t2);
     }
 
@@ -259,6 +314,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_repeat");
         var func = Marshal.GetDelegateForFunctionPointer<TacticRepeatDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_repeat");
         return func(c, t, max);
     }
 
@@ -275,6 +331,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_skip");
         var func = Marshal.GetDelegateForFunctionPointer<TacticSkipDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_skip");
         return func(c);
     }
 
@@ -291,6 +348,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_fail");
         var func = Marshal.GetDelegateForFunctionPointer<TacticFailDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_fail");
         return func(c);
     }
 
@@ -308,6 +366,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_fail_if");
         var func = Marshal.GetDelegateForFunctionPointer<TacticFailIfDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_fail_if");
         return func(c, p);
     }
 
@@ -324,6 +383,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_fail_if_not_decided");
         var func = Marshal.GetDelegateForFunctionPointer<TacticFailIfNotDecidedDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_fail_if_not_decided");
         return func(c);
     }
 
@@ -342,6 +402,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_using_params");
         var func = Marshal.GetDelegateForFunctionPointer<TacticUsingParamsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_using_params");
         return func(c, t, p);
     }
 
@@ -362,9 +423,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_simplifier");
         var func = Marshal.GetDelegateForFunctionPointer<MkSimplifierDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_simplifier");
         return func(c, name);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr MkSimplifierUtf8Delegate(IntPtr c, ref byte name);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_mk_simplifier</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr MkSimplifier(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        var funcPtr = GetFunctionPointer("Z3_mk_simplifier");
+        var func = Marshal.GetDelegateForFunctionPointer<MkSimplifierUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_simplifier");
+        return func(c, ref MemoryMarshal.GetReference(name));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate void SimplifierIncRefDelegate(IntPtr c, IntPtr t);
 
@@ -378,6 +454,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplifier_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifierIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplifier_inc_ref");
         func(c, t);
     }
 
@@ -394,6 +471,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplifier_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifierDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplifier_dec_ref");
         func(c, g);
     }
 
@@ -412,6 +490,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_solver_add_simplifier");
         var func = Marshal.GetDelegateForFunctionPointer<SolverAddSimplifierDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_solver_add_simplifier");
         return func(c, solver, simplifier);
     }
 
@@ -430,6 +509,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplifier_and_then");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifierAndThenDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplifier_and_then");
         return func(c, t1, t2);
     }
 
@@ -448,6 +528,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplifier_using_params");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifierUsingParamsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplifier_using_params");
         return func(c, t, p);
     }
 
@@ -465,6 +546,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_num_simplifiers");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumSimplifiersDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_num_simplifiers");
         return func(c);
     }
 
@@ -486,6 +568,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_simplifier_name");
         var func = Marshal.GetDelegateForFunctionPointer<GetSimplifierNameDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_simplifier_name");
         return func(c, i);
     }
 
@@ -503,6 +586,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplifier_get_help");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifierGetHelpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplifier_get_help");
         return func(c, t);
     }
 
@@ -520,6 +604,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplifier_get_param_descrs");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifierGetParamDescrsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplifier_get_param_descrs");
         return func(c, t);
     }
 
@@ -537,9 +622,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_simplifier_get_descr");
         var func = Marshal.GetDelegateForFunctionPointer<SimplifierGetDescrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplifier_get_descr");
         return func(c, name);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr SimplifierGetDescrUtf8Delegate(IntPtr c, ref byte name);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_simplifier_get_descr</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr SimplifierGetDescr(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        var funcPtr = GetFunctionPointer("Z3_simplifier_get_descr");
+        var func = Marshal.GetDelegateForFunctionPointer<SimplifierGetDescrUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_simplifier_get_descr");
+        return func(c, ref MemoryMarshal.GetReference(name));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr ProbeConstDelegate(IntPtr x, double val);
 
@@ -554,6 +654,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_const");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeConstDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_const");
         return func(x, val);
     }
 
@@ -575,6 +676,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_lt");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeLtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_lt");
         return func(x, p1, p2);
     }
 
@@ -596,6 +698,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_gt");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeGtDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_gt");
         return func(x, p1, p2);
     }
 
@@ -617,6 +720,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_le");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeLeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_le");
         return func(x, p1, p2);
     }
 
@@ -638,6 +742,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_ge");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeGeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_ge");
         return func(x, p1, p2);
     }
 
@@ -659,6 +764,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_eq");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeEqDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_eq");
         return func(x, p1, p2);
     }
 
@@ -680,6 +786,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_and");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeAndDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_and");
         return func(x, p1, p2);
     }
 
@@ -701,6 +808,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_or");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeOrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_or");
         return func(x, p1, p2);
     }
 
@@ -721,6 +829,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_not");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeNotDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_not");
         return func(x, p);
     }
 
@@ -738,6 +847,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_num_tactics");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumTacticsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_num_tactics");
         return func(c);
     }
 
@@ -759,6 +869,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_tactic_name");
         var func = Marshal.GetDelegateForFunctionPointer<GetTacticNameDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_tactic_name");
         return func(c, i);
     }
 
@@ -776,6 +887,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_num_probes");
         var func = Marshal.GetDelegateForFunctionPointer<GetNumProbesDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_num_probes");
         return func(c);
     }
 
@@ -797,6 +909,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_get_probe_name");
         var func = Marshal.GetDelegateForFunctionPointer<GetProbeNameDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_get_probe_name");
         return func(c, i);
     }
 
@@ -814,6 +927,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_get_help");
         var func = Marshal.GetDelegateForFunctionPointer<TacticGetHelpDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_get_help");
         return func(c, t);
     }
 
@@ -831,6 +945,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_get_param_descrs");
         var func = Marshal.GetDelegateForFunctionPointer<TacticGetParamDescrsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_get_param_descrs");
         return func(c, t);
     }
 
@@ -848,9 +963,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_get_descr");
         var func = Marshal.GetDelegateForFunctionPointer<TacticGetDescrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_get_descr");
         return func(c, name);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr TacticGetDescrUtf8Delegate(IntPtr c, ref byte name);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_tactic_get_descr</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr TacticGetDescr(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        var funcPtr = GetFunctionPointer("Z3_tactic_get_descr");
+        var func = Marshal.GetDelegateForFunctionPointer<TacticGetDescrUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_get_descr");
+        return func(c, ref MemoryMarshal.GetReference(name));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate IntPtr ProbeGetDescrDelegate(IntPtr c, IntPtr name);
 
@@ -865,9 +995,24 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_get_descr");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeGetDescrDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_get_descr");
         return func(c, name);
     }
 
+    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    private delegate IntPtr ProbeGetDescrUtf8Delegate(IntPtr c, ref byte name);
+
+    /// <summary>
+    /// UTF-8 overload of <c>Z3_probe_get_descr</c>; string spans must be NUL-terminated and are pinned in place.
+    /// </summary>
+    internal IntPtr ProbeGetDescr(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        var funcPtr = GetFunctionPointer("Z3_probe_get_descr");
+        var func = Marshal.GetDelegateForFunctionPointer<ProbeGetDescrUtf8Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_get_descr");
+        return func(c, ref MemoryMarshal.GetReference(name));
+    }
+
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
     private delegate double ProbeApplyDelegate(IntPtr c, IntPtr p, IntPtr g);
 
@@ -883,6 +1028,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_probe_apply");
         var func = Marshal.GetDelegateForFunctionPointer<ProbeApplyDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_probe_apply");
         return func(c, p, g);
     }
 
@@ -902,6 +1048,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_apply");
         var func = Marshal.GetDelegateForFunctionPointer<TacticApplyDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_apply");
         return func(c, t, g);
     }
 
@@ -922,6 +1069,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_tactic_apply_ex");
         var func = Marshal.GetDelegateForFunctionPointer<TacticApplyExDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_tactic_apply_ex");
         return func(c, t, g, p);
     }
 
@@ -938,6 +1086,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_apply_result_inc_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ApplyResultIncRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_apply_result_inc_ref");
         func(c, r);
     }
 
@@ -954,6 +1103,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_apply_result_dec_ref");
         var func = Marshal.GetDelegateForFunctionPointer<ApplyResultDecRefDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_apply_result_dec_ref");
         func(c, r);
     }
 
@@ -971,6 +1121,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_apply_result_to_string");
         var func = Marshal.GetDelegateForFunctionPointer<ApplyResultToStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_apply_result_to_string");
         return func(c, r);
     }
 
@@ -989,6 +1140,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_apply_result_get_num_subgoals");
         var func = Marshal.GetDelegateForFunctionPointer<ApplyResultGetNumSubgoalsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_apply_result_get_num_subgoals");
         return func(c, r);
     }
 
@@ -1011,6 +1163,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_apply_result_get_subgoal");
         var func = Marshal.GetDelegateForFunctionPointer<ApplyResultGetSubgoalDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_apply_result_get_subgoal");
         return func(c, r, i);
     }
 
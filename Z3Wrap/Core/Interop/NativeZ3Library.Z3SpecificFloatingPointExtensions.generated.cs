@@ -28,6 +28,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_get_ebits");
         var func = Marshal.GetDelegateForFunctionPointer<FpaGetEbitsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_get_ebits");
         return func(c, s);
     }
 
@@ -46,10 +47,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_get_sbits");
         var func = Marshal.GetDelegateForFunctionPointer<FpaGetSbitsDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_get_sbits");
         return func(c, s);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool FpaIsNumeralNanDelegate(IntPtr c, IntPtr t);
 
     /// <summary>
@@ -67,10 +70,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_is_numeral_nan");
         var func = Marshal.GetDelegateForFunctionPointer<FpaIsNumeralNanDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_is_numeral_nan");
         return func(c, t);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool FpaIsNumeralInfDelegate(IntPtr c, IntPtr t);
 
     /// <summary>
@@ -88,10 +93,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_is_numeral_inf");
         var func = Marshal.GetDelegateForFunctionPointer<FpaIsNumeralInfDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_is_numeral_inf");
         return func(c, t);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool FpaIsNumeralZeroDelegate(IntPtr c, IntPtr t);
 
     /// <summary>
@@ -109,10 +116,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_is_numeral_zero");
         var func = Marshal.GetDelegateForFunctionPointer<FpaIsNumeralZeroDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_is_numeral_zero");
         return func(c, t);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool FpaIsNumeralNormalDelegate(IntPtr c, IntPtr t);
 
     /// <summary>
@@ -130,10 +139,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_is_numeral_normal");
         var func = Marshal.GetDelegateForFunctionPointer<FpaIsNumeralNormalDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_is_numeral_normal");
         return func(c, t);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool FpaIsNumeralSubnormalDelegate(IntPtr c, IntPtr t);
 
     /// <summary>
@@ -151,10 +162,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_is_numeral_subnormal");
         var func = Marshal.GetDelegateForFunctionPointer<FpaIsNumeralSubnormalDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_is_numeral_subnormal");
         return func(c, t);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool FpaIsNumeralPositiveDelegate(IntPtr c, IntPtr t);
 
     /// <summary>
@@ -169,10 +182,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_is_numeral_positive");
         var func = Marshal.GetDelegateForFunctionPointer<FpaIsNumeralPositiveDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_is_numeral_positive");
         return func(c, t);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool FpaIsNumeralNegativeDelegate(IntPtr c, IntPtr t);
 
     /// <summary>
@@ -187,6 +202,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_is_numeral_negative");
         var func = Marshal.GetDelegateForFunctionPointer<FpaIsNumeralNegativeDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_is_numeral_negative");
         return func(c, t);
     }
 
@@ -207,6 +223,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_get_numeral_sign_bv");
         var func = Marshal.GetDelegateForFunctionPointer<FpaGetNumeralSignBvDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_get_numeral_sign_bv");
         return func(c, t);
     }
 
@@ -227,10 +244,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_get_numeral_significand_bv");
         var func = Marshal.GetDelegateForFunctionPointer<FpaGetNumeralSignificandBvDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_get_numeral_significand_bv");
         return func(c, t);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool FpaGetNumeralSignDelegate(IntPtr c, IntPtr t, out int sgn);
 
     /// <summary>
@@ -245,6 +264,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_get_numeral_sign");
         var func = Marshal.GetDelegateForFunctionPointer<FpaGetNumeralSignDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_get_numeral_sign");
         return func(c, t, out sgn);
     }
 
@@ -262,10 +282,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_get_numeral_significand_string");
         var func = Marshal.GetDelegateForFunctionPointer<FpaGetNumeralSignificandStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_get_numeral_significand_string");
         return func(c, t);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+    [return: MarshalAs(UnmanagedType.U1)]
     private delegate bool FpaGetNumeralSignificandUint64Delegate(IntPtr c, IntPtr t, out ulong n);
 
     /// <summary>
@@ -283,11 +305,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_get_numeral_significand_uint64");
         var func = Marshal.GetDelegateForFunctionPointer<FpaGetNumeralSignificandUint64Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_get_numeral_significand_uint64");
         return func(c, t, out n);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr FpaGetNumeralExponentStringDelegate(IntPtr c, IntPtr t, bool biased);
+    private delegate IntPtr FpaGetNumeralExponentStringDelegate(IntPtr c, IntPtr t, [MarshalAs(UnmanagedType.U1)] bool biased);
 
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="t" ctype="Z3_ast">ast parameter</param>
@@ -312,11 +335,13 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_get_numeral_exponent_string");
         var func = Marshal.GetDelegateForFunctionPointer<FpaGetNumeralExponentStringDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_get_numeral_exponent_string");
         return func(c, t, biased);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate bool FpaGetNumeralExponentInt64Delegate(IntPtr c, IntPtr t, out long n, bool biased);
+    [return: MarshalAs(UnmanagedType.U1)]
+    private delegate bool FpaGetNumeralExponentInt64Delegate(IntPtr c, IntPtr t, out long n, [MarshalAs(UnmanagedType.U1)] bool biased);
 
     /// <summary>
     ///  Return the exponent value of a floating-point numeral as a signed 64-bit integer. 
@@ -331,11 +356,12 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_get_numeral_exponent_int64");
         var func = Marshal.GetDelegateForFunctionPointer<FpaGetNumeralExponentInt64Delegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_get_numeral_exponent_int64");
         return func(c, t, out n, biased);
     }
 
     [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
-    private delegate IntPtr FpaGetNumeralExponentBvDelegate(IntPtr c, IntPtr t, bool biased);
+    private delegate IntPtr FpaGetNumeralExponentBvDelegate(IntPtr c, IntPtr t, [MarshalAs(UnmanagedType.U1)] bool biased);
 
     /// <summary>
     ///  Retrieves the exponent of a floating-point literal as a bit-vector expression. 
@@ -352,6 +378,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_fpa_get_numeral_exponent_bv");
         var func = Marshal.GetDelegateForFunctionPointer<FpaGetNumeralExponentBvDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_fpa_get_numeral_exponent_bv");
         return func(c, t, biased);
     }
 
@@ -372,6 +399,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_to_ieee_bv");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaToIeeeBvDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_to_ieee_bv");
         return func(c, t);
     }
 
@@ -395,6 +423,7 @@ internal sealed partial class NativeZ3Library
     {
         var funcPtr = GetFunctionPointer("Z3_mk_fpa_to_fp_int_real");
         var func = Marshal.GetDelegateForFunctionPointer<MkFpaToFpIntRealDelegate>(funcPtr);
+        using var call = NativeCallProfiler.Measure("Z3_mk_fpa_to_fp_int_real");
         return func(c, rm, exp, sig, s);
     }
 
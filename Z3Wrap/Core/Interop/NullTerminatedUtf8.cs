@@ -0,0 +1,70 @@
+using System.Buffers;
+using System.Text;
+
+namespace Spaceorc.Z3Wrap.Core.Interop;
+
+/// <summary>
+/// NUL-terminated UTF-8 view of a string argument for native Z3 calls without per-call HGlobal allocation.
+/// Uses caller-provided (usually stack) memory and falls back to <see cref="ArrayPool{T}"/> for long strings.
+/// </summary>
+/// <remarks>
+/// Input spans that already end with a NUL byte are passed through without copying.
+/// </remarks>
+internal readonly ref struct NullTerminatedUtf8
+{
+    /// <summary>
+    /// Recommended size of the initial stack buffer.
+    /// </summary>
+    public const int StackCapacity = 256;
+
+    private readonly byte[]? rented;
+
+    public NullTerminatedUtf8(ReadOnlySpan<byte> utf8, Span<byte> initialBuffer)
+    {
+        rented = null;
+
+        if (!utf8.IsEmpty && utf8[^1] == 0)
+        {
+            Span = utf8;
+            return;
+        }
+
+        var buffer = Rent(utf8.Length + 1, initialBuffer, out rented);
+        utf8.CopyTo(buffer);
+        buffer[utf8.Length] = 0;
+        Span = buffer[..(utf8.Length + 1)];
+    }
+
+    public NullTerminatedUtf8(string value, Span<byte> initialBuffer)
+    {
+        var maxLength = value.Length < initialBuffer.Length / 3 ? initialBuffer.Length : Encoding.UTF8.GetByteCount(value) + 1;
+
+        var buffer = Rent(maxLength, initialBuffer, out rented);
+        var length = Encoding.UTF8.GetBytes(value, buffer);
+        buffer[length] = 0;
+        Span = buffer[..(length + 1)];
+    }
+
+    /// <summary>
+    /// Encoded bytes including the trailing NUL terminator.
+    /// </summary>
+    public ReadOnlySpan<byte> Span { get; }
+
+    public void Dispose()
+    {
+        if (rented != null)
+            ArrayPool<byte>.Shared.Return(rented);
+    }
+
+    private static Span<byte> Rent(int length, Span<byte> initialBuffer, out byte[]? rented)
+    {
+        if (length <= initialBuffer.Length)
+        {
+            rented = null;
+            return initialBuffer;
+        }
+
+        rented = ArrayPool<byte>.Shared.Rent(length);
+        return rented;
+    }
+}
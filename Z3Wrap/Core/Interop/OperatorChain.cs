@@ -0,0 +1,91 @@
+namespace Spaceorc.Z3Wrap.Core.Interop;
+
+/// <summary>
+/// Pending n-ary application of an associative operator (<c>and</c>, <c>or</c>, <c>+</c>, <c>*</c>) whose native
+/// term is created only when its handle is first needed.
+/// </summary>
+/// <remarks>
+/// Chains built by repeated binary operators share one operand buffer: appending to the longest chain over a buffer
+/// extends it in place, while appending to a shorter prefix (a chain that was branched from) copies first, so every
+/// chain keeps seeing exactly its own operands. Operand handles are tracked by the context and outlive the chain.
+/// Only the left operand is ever extended; the right operand is always added as a single (materialized) handle, so
+/// an operand shared between both sides (<c>t * t</c>) adds one argument instead of duplicating its operands.
+/// </remarks>
+internal sealed class OperatorChain
+{
+    private const int InitialCapacity = 4;
+
+    private readonly Operands operands;
+    private readonly int count;
+
+    private OperatorChain(Z3Library.DeclKind kind, Operands operands, int count)
+    {
+        Kind = kind;
+        this.operands = operands;
+        this.count = count;
+    }
+
+    public Z3Library.DeclKind Kind { get; }
+
+    /// <summary>
+    /// Combines two operands under the given operator, extending the left operand if it is a pending chain of the
+    /// same operator. The right operand, and a left operand chained under another operator, are materialized.
+    /// </summary>
+    public static OperatorChain Combine(Z3Library.DeclKind kind, Z3Handle left, Z3Handle right)
+    {
+        var chain = left.PendingChain is { } leftChain && leftChain.Kind == kind ? leftChain : Start(kind, left.Handle);
+
+        return chain.Append(right.Handle);
+    }
+
+    /// <summary>
+    /// Creates the native n-ary term for this chain.
+    /// </summary>
+    public IntPtr Build(Z3Context context)
+    {
+        var library = context.Library;
+        var args = new ReadOnlySpan<IntPtr>(operands.Items, 0, count);
+
+        return Kind switch
+        {
+            Z3Library.DeclKind.Z3_OP_AND => library.MkAnd(context.Handle, (uint)count, args),
+            Z3Library.DeclKind.Z3_OP_OR => library.MkOr(context.Handle, (uint)count, args),
+            Z3Library.DeclKind.Z3_OP_ADD => library.MkAdd(context.Handle, (uint)count, args),
+            Z3Library.DeclKind.Z3_OP_MUL => library.MkMul(context.Handle, (uint)count, args),
+            _ => throw new InvalidOperationException($"Operator {Kind} cannot be chained"),
+        };
+    }
+
+    private static OperatorChain Start(Z3Library.DeclKind kind, IntPtr first)
+    {
+        var operands = new Operands(new IntPtr[InitialCapacity]);
+        operands.Items[0] = first;
+        operands.Length = 1;
+        return new OperatorChain(kind, operands, 1);
+    }
+
+    private OperatorChain Append(IntPtr handle)
+    {
+        var target = operands;
+        var required = count + 1;
+
+        if (target.Length != count || required > target.Items.Length)
+        {
+            // Either another chain already extended this buffer past our end, or it is full
+            var items = new IntPtr[Math.Max(required, target.Items.Length * 2)];
+            target.Items.AsSpan(0, count).CopyTo(items);
+            target = new Operands(items);
+        }
+
+        target.Items[count] = handle;
+        target.Length = required;
+        return new OperatorChain(Kind, target, required);
+    }
+
+    private sealed class Operands(IntPtr[] items)
+    {
+        public IntPtr[] Items { get; } = items;
+
+        public int Length { get; set; }
+    }
+}
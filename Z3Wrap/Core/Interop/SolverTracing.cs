@@ -0,0 +1,79 @@
+using System.Diagnostics;
+using System.Diagnostics.Tracing;
+
+namespace Spaceorc.Z3Wrap.Core.Interop;
+
+/// <summary>
+/// Traces solver and optimizer operations through the <c>Spaceorc.Z3Wrap</c> <see cref="ActivitySource"/>
+/// and <see cref="Z3EventSource"/>.
+/// </summary>
+/// <remarks>
+/// <see cref="Start"/> returns null unless an activity listener samples the operation or the event source is
+/// enabled, so untraced calls allocate nothing. Tag values that need extra native calls (assertion count,
+/// statistics) are only computed when <see cref="Operation.IsRecording"/> is set, so an event-only or
+/// propagation-only trace does not pay for them.
+/// </remarks>
+internal static class SolverTracing
+{
+    public const string SourceName = "Spaceorc.Z3Wrap";
+
+    private static readonly ActivitySource activitySource = new(SourceName);
+
+    public static Operation? Start(string name)
+    {
+        var activity = activitySource.StartActivity(name, ActivityKind.Internal);
+        var eventsEnabled = Z3EventSource.Log.IsEnabled(EventLevel.Informational, EventKeywords.None);
+        if (activity == null && !eventsEnabled)
+            return null;
+
+        if (eventsEnabled)
+            Z3EventSource.Log.OperationStart(name);
+
+        return new Operation(name, activity, eventsEnabled);
+    }
+
+    /// <summary>
+    /// A single traced operation; disposing it stops the activity and writes the stop event.
+    /// </summary>
+    internal sealed class Operation(string name, Activity? activity, bool eventsEnabled) : IDisposable
+    {
+        private string status = "";
+
+        /// <summary>
+        /// Gets whether the activity records tags; when false, tag values need not be computed.
+        /// </summary>
+        public bool IsRecording => activity is { IsAllDataRequested: true };
+
+        public void SetAssertionCount(int count) => activity?.SetTag("z3.assertions", count);
+
+        public void SetCoreSize(int size) => activity?.SetTag("z3.core_size", size);
+
+        public void SetResult(Z3Status result)
+        {
+            status = result.ToString();
+            activity?.SetTag("z3.status", status);
+        }
+
+        public void SetDetails(string? reasonUnknown, Z3Statistics statistics)
+        {
+            if (activity == null)
+                return;
+
+            if (reasonUnknown != null)
+                activity.SetTag("z3.reason_unknown", reasonUnknown);
+            if (statistics.Conflicts is { } conflicts)
+                activity.SetTag("z3.conflicts", conflicts);
+            if (statistics.Decisions is { } decisions)
+                activity.SetTag("z3.decisions", decisions);
+            if (statistics.MaxMemory is { } maxMemory)
+                activity.SetTag("z3.max_memory_mb", maxMemory);
+        }
+
+        public void Dispose()
+        {
+            activity?.Dispose();
+            if (eventsEnabled)
+                Z3EventSource.Log.OperationStop(name, status);
+        }
+    }
+}
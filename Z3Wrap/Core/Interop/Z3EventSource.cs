@@ -0,0 +1,28 @@
+using System.Diagnostics.Tracing;
+
+namespace Spaceorc.Z3Wrap.Core.Interop;
+
+/// <summary>
+/// <see cref="EventSource"/> named <c>Spaceorc.Z3Wrap</c> emitting start/stop events for solver operations
+/// and errors of background work.
+/// </summary>
+/// <remarks>
+/// Events are written only while a listener (dotnet-trace, PerfView, an in-process <see cref="EventListener"/>)
+/// has enabled the source, so the events cost a single flag check otherwise.
+/// </remarks>
+[EventSource(Name = SolverTracing.SourceName)]
+internal sealed class Z3EventSource : EventSource
+{
+    public static readonly Z3EventSource Log = new();
+
+    private Z3EventSource() { }
+
+    [Event(1, Level = EventLevel.Informational, Opcode = EventOpcode.Start)]
+    public void OperationStart(string operation) => WriteEvent(1, operation);
+
+    [Event(2, Level = EventLevel.Informational, Opcode = EventOpcode.Stop)]
+    public void OperationStop(string operation, string status) => WriteEvent(2, operation, status);
+
+    [Event(3, Level = EventLevel.Error)]
+    public void MemorySampleFailed(string error) => WriteEvent(3, error);
+}
@@ -0,0 +1,18 @@
+using System.Diagnostics.Metrics;
+
+namespace Spaceorc.Z3Wrap.Core.Interop;
+
+/// <summary>
+/// Holds the single <c>Spaceorc.Z3Wrap</c> <see cref="System.Diagnostics.Metrics.Meter"/> shared by all
+/// instruments of the library.
+/// </summary>
+/// <remarks>
+/// Instruments cannot be removed from a meter individually, so they are created once per process on this meter
+/// rather than per object.
+/// </remarks>
+internal static class Z3Metrics
+{
+    public const string MeterName = "Spaceorc.Z3Wrap";
+
+    public static readonly Meter Meter = new(MeterName);
+}
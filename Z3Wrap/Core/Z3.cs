@@ -6,6 +6,7 @@ namespace Spaceorc.Z3Wrap.Core;
 public static class Z3
 {
     private static Z3Library? library;
+    private static Z3MemoryGovernor? memoryGovernor;
 
     /// <summary>
     /// Gets or sets the default Z3 library instance.
@@ -41,6 +42,24 @@ public static class Z3
         }
     }
 
+    /// <summary>
+    /// Gets or sets the memory governor applied to newly created contexts, or null for no budget.
+    /// <para>
+    /// Contexts created while a governor is set are refused when the budget is exceeded and are interrupted
+    /// while it stays exceeded. Ownership of the governor is transferred to this class: the previous governor
+    /// (if any) is automatically disposed. Thread-safe using atomic exchange.
+    /// </para>
+    /// </summary>
+    public static Z3MemoryGovernor? MemoryGovernor
+    {
+        get => Volatile.Read(ref memoryGovernor);
+        set
+        {
+            var oldGovernor = Interlocked.Exchange(ref memoryGovernor, value);
+            oldGovernor?.Dispose();
+        }
+    }
+
     /// <summary>
     /// Loads Z3 native library from the specified path and sets it as the default.
     /// <para>
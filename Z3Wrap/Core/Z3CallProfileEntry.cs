@@ -0,0 +1,47 @@
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Aggregated call statistics of a single native Z3 function.
+/// </summary>
+public sealed class Z3CallProfileEntry
+{
+    internal Z3CallProfileEntry(string functionName, long callCount, TimeSpan totalTime, TimeSpan maxTime)
+    {
+        FunctionName = functionName;
+        CallCount = callCount;
+        TotalTime = totalTime;
+        MaxTime = maxTime;
+    }
+
+    /// <summary>
+    /// Gets the native function name (for example <c>Z3_solver_check</c>).
+    /// </summary>
+    public string FunctionName { get; }
+
+    /// <summary>
+    /// Gets the number of recorded calls.
+    /// </summary>
+    public long CallCount { get; }
+
+    /// <summary>
+    /// Gets the total time spent in native code.
+    /// </summary>
+    public TimeSpan TotalTime { get; }
+
+    /// <summary>
+    /// Gets the longest single call.
+    /// </summary>
+    public TimeSpan MaxTime { get; }
+
+    /// <summary>
+    /// Gets the average time per call.
+    /// </summary>
+    public TimeSpan AverageTime => CallCount == 0 ? TimeSpan.Zero : TotalTime / CallCount;
+
+    /// <summary>
+    /// Returns a one-line summary of the entry.
+    /// </summary>
+    /// <returns>Function name, call count, total and average time.</returns>
+    public override string ToString() =>
+        $"{FunctionName}: {CallCount} calls, total {TotalTime.TotalMilliseconds:0.###} ms, avg {AverageTime.TotalMicroseconds:0.###} us";
+}
@@ -0,0 +1,90 @@
+using System.Collections;
+using System.Text;
+using Spaceorc.Z3Wrap.Expressions.Common;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Fixed-size array of fresh uninterpreted constants of one sort, declared in a single pass.
+/// </summary>
+/// <typeparam name="T">Expression type of the constants.</typeparam>
+/// <remarks>
+/// Constants are created with <c>Z3_mk_fresh_const</c>, so Z3 names them <c>prefix!N</c> and they never clash
+/// with other constants. The prefix is encoded once and the sort created once for the whole array, and
+/// <see cref="IndexOf"/> maps a constant back to its position by native handle without building any names.
+/// </remarks>
+public sealed class Z3ConstArray<T> : IReadOnlyList<T>
+    where T : Z3Expr, IExprType<T>
+{
+    private readonly T[] items;
+    private Dictionary<IntPtr, int>? indices;
+
+    private Z3ConstArray(string prefix, T[] items)
+    {
+        Prefix = prefix;
+        this.items = items;
+    }
+
+    /// <summary>
+    /// Gets the name prefix of the constants.
+    /// </summary>
+    public string Prefix { get; }
+
+    /// <summary>
+    /// Gets the number of constants.
+    /// </summary>
+    public int Count => items.Length;
+
+    /// <summary>
+    /// Gets the constant at the given index.
+    /// </summary>
+    /// <param name="index">Zero-based index.</param>
+    public T this[int index] => items[index];
+
+    /// <summary>
+    /// Gets the constants as a read-only span.
+    /// </summary>
+    /// <returns>Span over all constants in declaration order.</returns>
+    public ReadOnlySpan<T> AsSpan() => items;
+
+    /// <summary>
+    /// Gets the index of a constant in this array.
+    /// </summary>
+    /// <param name="constant">The constant to look up, for example one taken from an unsat core.</param>
+    /// <returns>Zero-based index of the constant, or -1 if it does not belong to this array.</returns>
+    public int IndexOf(T constant)
+    {
+        if (indices == null)
+        {
+            indices = new Dictionary<IntPtr, int>(items.Length);
+            for (var i = 0; i < items.Length; i++)
+                indices.Add(items[i].Handle, i);
+        }
+
+        return indices.TryGetValue(constant.Handle, out var index) ? index : -1;
+    }
+
+    /// <summary>
+    /// Returns an enumerator over the constants in declaration order.
+    /// </summary>
+    /// <returns>An enumerator of constants.</returns>
+    public IEnumerator<T> GetEnumerator() => ((IEnumerable<T>)items).GetEnumerator();
+
+    IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+
+    internal static Z3ConstArray<T> Create(Z3Context context, string prefix, int count)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegative(count);
+
+        var library = context.Library;
+        var sort = T.Sort(context);
+        var prefixUtf8 = Encoding.UTF8.GetBytes(prefix + "\0");
+        var items = new T[count];
+
+        // The sort is fixed by construction, so the per-constant sort check of Z3Expr.Create is skipped
+        for (var i = 0; i < count; i++)
+            items[i] = T.Create(context, library.MkFreshConst(context.Handle, prefixUtf8, sort));
+
+        return new Z3ConstArray<T>(prefix, items);
+    }
+}
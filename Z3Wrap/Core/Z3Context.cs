@@ -1,4 +1,6 @@
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Common;
+using Spaceorc.Z3Wrap.Expressions.Strings;
 
 namespace Spaceorc.Z3Wrap.Core;
 
@@ -7,12 +9,22 @@ namespace Spaceorc.Z3Wrap.Core;
 /// </summary>
 public sealed class Z3Context : IDisposable
 {
+    private const int DefaultLiteralCacheCapacity = 1024;
+
     private static readonly ThreadLocal<Z3Context?> currentContext = new(() => null);
 
     private readonly HashSet<IntPtr> trackedHandles = [];
     private readonly HashSet<Z3Solver> trackedSolvers = [];
     private readonly HashSet<Z3Optimizer> trackedOptimizers = [];
+    private readonly HashSet<IntPtr> trackedGoals = [];
+    private readonly HashSet<IntPtr> trackedTactics = [];
+    private readonly HashSet<IntPtr> trackedProbes = [];
+    private readonly Dictionary<string, IntPtr> symbols = [];
+    private readonly LruCache<string, StringExpr> stringLiterals = new(DefaultLiteralCacheCapacity);
+    private readonly LruCache<string, RegexExpr> regexLiterals = new(DefaultLiteralCacheCapacity);
+    private readonly LruCache<uint, CharExpr> charLiterals = new(DefaultLiteralCacheCapacity);
     private readonly Z3Library library;
+    private readonly Z3MemoryGovernor? memoryGovernor;
     private readonly IntPtr contextHandle;
     private bool disposed;
 
@@ -22,10 +34,23 @@ public sealed class Z3Context : IDisposable
     /// <param name="parameters">Configuration parameters to set. If null, uses default configuration.
     ///     Parameters must be set at context creation time as some can only be configured this way.</param>
     /// <param name="library">The Z3Library to use for Z3 operations. If null, uses <see cref="Z3.Library"/>.</param>
+    /// <exception cref="Z3Exception">Thrown if <see cref="Z3.MemoryGovernor"/> reports the native memory budget exceeded.</exception>
     public Z3Context(Dictionary<string, string>? parameters = null, Z3Library? library = null)
     {
         this.library = library ?? Z3.Library;
 
+        memoryGovernor = Z3.MemoryGovernor;
+        try
+        {
+            memoryGovernor?.ThrowIfOverBudget();
+        }
+        catch
+        {
+            // No native context exists yet, so there is nothing for the finalizer to clean up
+            GC.SuppressFinalize(this);
+            throw;
+        }
+
         // Create temporary config object
         var configHandle = this.library.MkConfig();
         try
@@ -45,6 +70,8 @@ public sealed class Z3Context : IDisposable
             // Always delete config after context creation
             this.library.DelConfig(configHandle);
         }
+
+        memoryGovernor?.Register(contextHandle, this.library);
     }
 
     /// <summary>
@@ -71,6 +98,26 @@ public sealed class Z3Context : IDisposable
         }
     }
 
+    /// <summary>
+    /// Gets or sets how many string, regex and character literals the context keeps for reuse, per literal kind.
+    /// </summary>
+    /// <remarks>
+    /// Creating a literal that is already cached returns the cached expression without any native call.
+    /// The least recently used literals are evicted first; zero disables caching. Defaults to 1024.
+    /// </remarks>
+    /// <exception cref="ArgumentOutOfRangeException">Thrown if the value is negative.</exception>
+    public int LiteralCacheCapacity
+    {
+        get => stringLiterals.Capacity;
+        set
+        {
+            ThrowIfDisposed();
+            stringLiterals.Capacity = value;
+            regexLiterals.Capacity = value;
+            charLiterals.Capacity = value;
+        }
+    }
+
     /// <summary>
     /// Releases all resources used by this Z3 context.
     /// </summary>
@@ -118,6 +165,21 @@ public sealed class Z3Context : IDisposable
         return solver;
     }
 
+    /// <summary>
+    /// Creates a new solver that decides its constraints with a tactic.
+    /// </summary>
+    /// <param name="tactic">The tactic that preprocesses and solves the constraints.</param>
+    /// <returns>A new solver instance.</returns>
+    /// <remarks>
+    /// The solver is not incremental: every check applies the tactic to all assertions.
+    /// </remarks>
+    public Z3Solver CreateSolver(Z3Tactic tactic)
+    {
+        var solver = new Z3Solver(this, tactic);
+        TrackSolver(solver);
+        return solver;
+    }
+
     /// <summary>
     /// Creates a new optimizer instance for this context.
     /// </summary>
@@ -129,6 +191,83 @@ public sealed class Z3Context : IDisposable
         return optimizer;
     }
 
+    /// <summary>
+    /// Creates a new expression arena for building value-type <see cref="ExprRef{T}"/> terms in this context.
+    /// </summary>
+    /// <returns>A new expression arena. Dispose it to release the terms built through it.</returns>
+    public Z3ExprArena CreateArena()
+    {
+        ThrowIfDisposed();
+        return new Z3ExprArena(this);
+    }
+
+    /// <summary>
+    /// Creates a new empty goal for applying tactics.
+    /// </summary>
+    /// <param name="models">Whether model generation is enabled for the goal.</param>
+    /// <param name="unsatCores">Whether unsat core generation is enabled for the goal.</param>
+    /// <param name="proofs">Whether proof generation is enabled for the goal; requires a context created with proofs enabled.</param>
+    /// <returns>A new goal owned by this context.</returns>
+    public Z3Goal CreateGoal(bool models = true, bool unsatCores = false, bool proofs = false)
+    {
+        ThrowIfDisposed();
+        return new Z3Goal(this, library.MkGoal(contextHandle, models, unsatCores, proofs));
+    }
+
+    /// <summary>
+    /// Creates a built-in tactic by name, such as <c>simplify</c>, <c>bit-blast</c> or <c>smt</c>.
+    /// </summary>
+    /// <param name="name">The tactic name; see <see cref="GetTacticNames"/>.</param>
+    /// <returns>The tactic, owned by this context.</returns>
+    public Z3Tactic CreateTactic(string name)
+    {
+        ThrowIfDisposed();
+        return new Z3Tactic(this, library.MkTactic(contextHandle, name));
+    }
+
+    /// <summary>
+    /// Creates a built-in probe by name, such as <c>size</c>, <c>num-consts</c> or <c>is-qfbv</c>.
+    /// </summary>
+    /// <param name="name">The probe name; see <see cref="GetProbeNames"/>.</param>
+    /// <returns>The probe, owned by this context.</returns>
+    public Z3Probe CreateProbe(string name)
+    {
+        ThrowIfDisposed();
+        return new Z3Probe(this, library.MkProbe(contextHandle, name));
+    }
+
+    /// <summary>
+    /// Gets the names of the built-in tactics.
+    /// </summary>
+    /// <returns>The tactic names.</returns>
+    public string[] GetTacticNames()
+    {
+        ThrowIfDisposed();
+
+        var names = new string[library.GetNumTactics(contextHandle)];
+        for (var i = 0u; i < names.Length; i++)
+            names[i] = library.GetTacticName(contextHandle, i);
+
+        return names;
+    }
+
+    /// <summary>
+    /// Gets the names of the built-in probes.
+    /// </summary>
+    /// <returns>The probe names.</returns>
+    public string[] GetProbeNames()
+    {
+        ThrowIfDisposed();
+
+        var names = new string[library.GetNumProbes(contextHandle)];
+        for (var i = 0u; i < names.Length; i++)
+            names[i] = library.GetProbeName(contextHandle, i);
+
+        return names;
+    }
+
+    internal bool IsDisposed => disposed;
+
     internal void TrackHandle(IntPtr handle)
     {
         ThrowIfDisposed();
@@ -136,6 +275,70 @@ public sealed class Z3Context : IDisposable
             library.IncRef(contextHandle, handle);
     }
 
+    internal void TrackGoal(IntPtr handle)
+    {
+        ThrowIfDisposed();
+        if (trackedGoals.Add(handle))
+            library.GoalIncRef(contextHandle, handle);
+    }
+
+    internal void TrackTactic(IntPtr handle)
+    {
+        ThrowIfDisposed();
+        if (trackedTactics.Add(handle))
+            library.TacticIncRef(contextHandle, handle);
+    }
+
+    internal void TrackProbe(IntPtr handle)
+    {
+        ThrowIfDisposed();
+        if (trackedProbes.Add(handle))
+            library.ProbeIncRef(contextHandle, handle);
+    }
+
+    /// <summary>
+    /// Gets the string symbol for a name, creating it on first use.
+    /// Symbols are not reference counted and live as long as the context, so they are cached by name.
+    /// </summary>
+    internal IntPtr GetSymbol(string name)
+    {
+        ThrowIfDisposed();
+        if (symbols.TryGetValue(name, out var symbol))
+            return symbol;
+
+        using var utf8 = new NullTerminatedUtf8(name, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        symbol = library.MkStringSymbol(contextHandle, utf8.Span);
+        symbols.Add(name, symbol);
+        return symbol;
+    }
+
+    internal LruCache<string, StringExpr> StringLiterals
+    {
+        get
+        {
+            ThrowIfDisposed();
+            return stringLiterals;
+        }
+    }
+
+    internal LruCache<string, RegexExpr> RegexLiterals
+    {
+        get
+        {
+            ThrowIfDisposed();
+            return regexLiterals;
+        }
+    }
+
+    internal LruCache<uint, CharExpr> CharLiterals
+    {
+        get
+        {
+            ThrowIfDisposed();
+            return charLiterals;
+        }
+    }
+
     private void TrackSolver(Z3Solver solver)
     {
         ThrowIfDisposed();
@@ -195,13 +398,32 @@ public sealed class Z3Context : IDisposable
 
         trackedOptimizers.Clear();
 
+        // Release goals, tactics and probes before the expressions they refer to
+        foreach (var goal in trackedGoals)
+            library.GoalDecRef(contextHandle, goal);
+
+        foreach (var tactic in trackedTactics)
+            library.TacticDecRef(contextHandle, tactic);
+
+        foreach (var probe in trackedProbes)
+            library.ProbeDecRef(contextHandle, probe);
+
+        trackedGoals.Clear();
+        trackedTactics.Clear();
+        trackedProbes.Clear();
+
         // Then clean up all tracked handles
         foreach (var handle in trackedHandles)
             library.DecRef(contextHandle, handle);
 
         trackedHandles.Clear();
+        symbols.Clear();
+        stringLiterals.Clear();
+        regexLiterals.Clear();
+        charLiterals.Clear();
 
         // Finally dispose the context itself
+        memoryGovernor?.Unregister(contextHandle);
         library.DelContext(contextHandle);
 
         disposed = true;
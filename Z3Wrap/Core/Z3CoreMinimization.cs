@@ -0,0 +1,19 @@
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Strategy used by <see cref="Z3UnsatCoreEngine"/> to reduce an unsat core to a minimal one.
+/// </summary>
+public enum Z3CoreMinimization
+{
+    /// <summary>
+    /// Drops one assumption at a time and keeps the refined core whenever the rest stays unsatisfiable.
+    /// Takes at most one check per core element.
+    /// </summary>
+    Deletion,
+
+    /// <summary>
+    /// Splits the core recursively (QuickXplain). Takes fewer checks than deletion when the minimal core is much
+    /// smaller than the initial one.
+    /// </summary>
+    QuickXplain,
+}
@@ -0,0 +1,118 @@
+using System.Diagnostics.CodeAnalysis;
+using Spaceorc.Z3Wrap.Expressions.Common;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Table of uninterpreted constants declared by a loaded SMT-LIB2 script, keyed by name.
+/// </summary>
+/// <remarks>
+/// The table stores native handles only; typed expressions are created on demand by <see cref="Get{T}"/>,
+/// so loading a script costs one entry per distinct constant rather than one wrapper per assertion.
+/// </remarks>
+public sealed class Z3Declarations
+{
+    private readonly Z3Context context;
+    private readonly Dictionary<string, IntPtr> constants;
+
+    private Z3Declarations(Z3Context context, Dictionary<string, IntPtr> constants)
+    {
+        this.context = context;
+        this.constants = constants;
+    }
+
+    /// <summary>
+    /// Gets the number of declared constants.
+    /// </summary>
+    public int Count => constants.Count;
+
+    /// <summary>
+    /// Gets the names of all declared constants.
+    /// </summary>
+    public IEnumerable<string> Names => constants.Keys;
+
+    /// <summary>
+    /// Determines whether a constant with the given name was declared.
+    /// </summary>
+    /// <param name="name">The constant name.</param>
+    /// <returns>True if the constant was declared; otherwise false.</returns>
+    public bool Contains(string name) => constants.ContainsKey(name);
+
+    /// <summary>
+    /// Gets a declared constant as a typed expression.
+    /// </summary>
+    /// <typeparam name="T">Expected expression type.</typeparam>
+    /// <param name="name">The constant name.</param>
+    /// <returns>The constant expression.</returns>
+    /// <exception cref="KeyNotFoundException">Thrown if no constant with the given name was declared.</exception>
+    /// <exception cref="InvalidOperationException">Thrown if the constant's sort does not match <typeparamref name="T"/>.</exception>
+    public T Get<T>(string name)
+        where T : Z3Expr, IExprType<T>
+    {
+        if (!constants.TryGetValue(name, out var handle))
+            throw new KeyNotFoundException($"Constant '{name}' was not declared");
+
+        return Z3Expr.Create<T>(context, handle);
+    }
+
+    /// <summary>
+    /// Tries to get a declared constant as a typed expression.
+    /// </summary>
+    /// <typeparam name="T">Expected expression type.</typeparam>
+    /// <param name="name">The constant name.</param>
+    /// <param name="value">The constant expression, if declared with a matching sort.</param>
+    /// <returns>True if the constant was declared with the sort of <typeparamref name="T"/>; otherwise false.</returns>
+    public bool TryGet<T>(string name, [NotNullWhen(true)] out T? value)
+        where T : Z3Expr, IExprType<T>
+    {
+        value = null;
+        if (!constants.TryGetValue(name, out var handle))
+            return false;
+
+        if (context.Library.GetSort(context.Handle, handle) != T.Sort(context))
+            return false;
+
+        value = Z3Expr.Create<T>(context, handle);
+        return true;
+    }
+
+    internal static Z3Declarations Collect(Z3Context context, IReadOnlyList<IntPtr> terms)
+    {
+        var library = context.Library;
+        var constants = new Dictionary<string, IntPtr>();
+        var visited = new HashSet<uint>();
+        var pending = new Stack<IntPtr>(terms);
+
+        while (pending.TryPop(out var term))
+        {
+            if (!visited.Add(library.GetAstId(context.Handle, term)))
+                continue;
+
+            switch (library.GetAstKind(context.Handle, term))
+            {
+                case Z3Library.AstKind.Z3_APP_AST:
+                    var numArgs = library.GetAppNumArgs(context.Handle, term);
+                    if (numArgs == 0)
+                    {
+                        var decl = library.GetAppDecl(context.Handle, term);
+                        if (library.GetDeclKind(context.Handle, decl) == Z3Library.DeclKind.Z3_OP_UNINTERPRETED)
+                        {
+                            var name = library.GetSymbolString(context.Handle, library.GetDeclName(context.Handle, decl));
+                            if (constants.TryAdd(name, term))
+                                context.TrackHandle(term);
+                        }
+                    }
+
+                    for (var i = numArgs; i > 0; i--)
+                        pending.Push(library.GetAppArg(context.Handle, term, i - 1));
+                    break;
+
+                case Z3Library.AstKind.Z3_QUANTIFIER_AST:
+                    pending.Push(library.GetQuantifierBody(context.Handle, term));
+                    break;
+            }
+        }
+
+        return new Z3Declarations(context, constants);
+    }
+}
@@ -1,3 +1,4 @@
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Common;
 
 namespace Spaceorc.Z3Wrap.Core;
@@ -5,8 +6,19 @@ namespace Spaceorc.Z3Wrap.Core;
 /// <summary>
 /// Represents the base class for all Z3 expressions in the theorem prover.
 /// </summary>
-public abstract class Z3Expr(Z3Context context, IntPtr handle) : Z3Handle(context, handle)
+public abstract class Z3Expr : Z3Handle
 {
+    /// <summary>
+    /// Initializes a new expression wrapping a native Z3 handle.
+    /// </summary>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="handle">The Z3 expression handle.</param>
+    protected Z3Expr(Z3Context context, IntPtr handle)
+        : base(context, handle) { }
+
+    private protected Z3Expr(Z3Context context, OperatorChain chain)
+        : base(context, chain) { }
+
     internal static T Create<T>(Z3Context context, IntPtr handle)
         where T : Z3Expr, IExprType<T>
     {
@@ -0,0 +1,158 @@
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Expressions.Common;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Region that owns the native references of <see cref="ExprRef{T}"/> terms and releases them all at once.
+/// </summary>
+/// <remarks>
+/// Terms built through an arena are plain values: each one costs a slot in a handle array rather than a
+/// tracked wrapper object, which keeps garbage collection out of generators producing millions of terms.
+/// Terms stay valid until the arena is disposed; convert a term with <see cref="ExprRef{T}.ToExpr"/> to keep it
+/// for the lifetime of the context. Like the context, an arena is not thread-safe.
+/// </remarks>
+public sealed class Z3ExprArena : IDisposable
+{
+    private const int InitialCapacity = 64;
+
+    private IntPtr[] handles = new IntPtr[InitialCapacity];
+    private int count;
+    private bool disposed;
+
+    internal Z3ExprArena(Z3Context context)
+    {
+        Context = context;
+    }
+
+    /// <summary>
+    /// Gets the context the arena builds terms in.
+    /// </summary>
+    public Z3Context Context { get; }
+
+    /// <summary>
+    /// Gets the number of native references held by the arena.
+    /// </summary>
+    public int Count => count;
+
+    /// <summary>
+    /// Creates a term referring to an existing expression.
+    /// </summary>
+    /// <typeparam name="T">Expression type.</typeparam>
+    /// <param name="expr">The expression, already kept alive by its context.</param>
+    /// <returns>Term for the expression.</returns>
+    public ExprRef<T> Ref<T>(T expr)
+        where T : Z3Expr, IExprType<T>
+    {
+        ThrowIfDisposed();
+        return new ExprRef<T>(this, expr.Handle);
+    }
+
+    /// <summary>
+    /// Creates a named constant term.
+    /// </summary>
+    /// <typeparam name="T">Expression type.</typeparam>
+    /// <param name="name">The constant name.</param>
+    /// <returns>Constant term.</returns>
+    public ExprRef<T> Const<T>(string name)
+        where T : Z3Expr, IExprType<T> =>
+        Retain<T>(Context.Library.MkConstOriginal(Context.Handle, Context.GetSymbol(name), T.Sort(Context)));
+
+    /// <summary>
+    /// Creates a numeral term of an integer, real or bit-vector sort.
+    /// </summary>
+    /// <typeparam name="T">Expression type.</typeparam>
+    /// <param name="value">The numeral value.</param>
+    /// <returns>Numeral term.</returns>
+    public ExprRef<T> Numeral<T>(long value)
+        where T : Z3Expr, IExprType<T> => Retain<T>(Context.Library.MkInt64(Context.Handle, value, T.Sort(Context)));
+
+    /// <summary>
+    /// Creates a boolean literal term.
+    /// </summary>
+    /// <param name="value">The boolean value.</param>
+    /// <returns>Boolean term.</returns>
+    public ExprRef<BoolExpr> Bool(bool value) =>
+        Retain<BoolExpr>(value ? Context.Library.MkTrue(Context.Handle) : Context.Library.MkFalse(Context.Handle));
+
+    /// <summary>
+    /// Creates the sum of arithmetic terms as one n-ary application.
+    /// </summary>
+    /// <typeparam name="T">Arithmetic expression type.</typeparam>
+    /// <param name="terms">The terms to add.</param>
+    /// <returns>Sum term, or zero for no terms.</returns>
+    public ExprRef<T> Sum<T>(params ReadOnlySpan<ExprRef<T>> terms)
+        where T : Z3Expr, IArithmeticExpr<T>, IExprType<T> =>
+        terms.IsEmpty ? Numeral<T>(0) : Nary(terms, static (library, c, n, args) => library.MkAdd(c, n, args));
+
+    /// <summary>
+    /// Creates the conjunction of boolean terms as one n-ary application.
+    /// </summary>
+    /// <param name="terms">The terms to conjoin.</param>
+    /// <returns>Conjunction term, or true for no terms.</returns>
+    public ExprRef<BoolExpr> And(params ReadOnlySpan<ExprRef<BoolExpr>> terms) =>
+        terms.IsEmpty ? Bool(true) : Nary(terms, static (library, c, n, args) => library.MkAnd(c, n, args));
+
+    /// <summary>
+    /// Creates the disjunction of boolean terms as one n-ary application.
+    /// </summary>
+    /// <param name="terms">The terms to disjoin.</param>
+    /// <returns>Disjunction term, or false for no terms.</returns>
+    public ExprRef<BoolExpr> Or(params ReadOnlySpan<ExprRef<BoolExpr>> terms) =>
+        terms.IsEmpty ? Bool(false) : Nary(terms, static (library, c, n, args) => library.MkOr(c, n, args));
+
+    /// <summary>
+    /// Releases all native references held by the arena. Terms built through it must not be used afterwards.
+    /// </summary>
+    public void Dispose()
+    {
+        if (disposed)
+            return;
+
+        // Deleting the context already released everything it owned
+        if (!Context.IsDisposed)
+        {
+            for (var i = 0; i < count; i++)
+                Context.Library.DecRef(Context.Handle, handles[i]);
+        }
+
+        handles = [];
+        count = 0;
+        disposed = true;
+    }
+
+    internal ExprRef<T> Retain<T>(IntPtr handle)
+        where T : Z3Expr, IExprType<T>
+    {
+        ThrowIfDisposed();
+        Context.Library.IncRef(Context.Handle, handle);
+
+        if (count == handles.Length)
+            Array.Resize(ref handles, handles.Length * 2);
+
+        handles[count++] = handle;
+        return new ExprRef<T>(this, handle);
+    }
+
+    internal void ThrowIfDisposed() => ObjectDisposedException.ThrowIf(disposed, this);
+
+    private ExprRef<T> Nary<T>(ReadOnlySpan<ExprRef<T>> terms, NaryFactory factory)
+        where T : Z3Expr, IExprType<T>
+    {
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            foreach (var term in terms)
+                args.Add(term.Handle);
+
+            return Retain<T>(factory(Context.Library, Context.Handle, (uint)args.Length, args.Span));
+        }
+        finally
+        {
+            args.Dispose();
+        }
+    }
+
+    private delegate IntPtr NaryFactory(Z3Library library, IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args);
+}
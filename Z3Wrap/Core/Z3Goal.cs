@@ -0,0 +1,106 @@
+using Spaceorc.Z3Wrap.Expressions.Logic;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Represents a Z3 goal: a set of formulas that tactics transform into subgoals.
+/// </summary>
+/// <remarks>
+/// Goals are owned by their context and released when it is disposed.
+/// Create them with <see cref="Z3Context.CreateGoal"/> and transform them with <see cref="Z3Tactic.Apply"/>.
+/// </remarks>
+public sealed class Z3Goal
+{
+    internal Z3Goal(Z3Context context, IntPtr handle)
+    {
+        context.TrackGoal(handle);
+        Context = context;
+        Handle = handle;
+    }
+
+    /// <summary>
+    /// Gets the Z3 context that owns this goal.
+    /// </summary>
+    public Z3Context Context { get; }
+
+    /// <summary>
+    /// Gets the native Z3 goal handle.
+    /// </summary>
+    public IntPtr Handle { get; }
+
+    /// <summary>
+    /// Gets the number of formulas in the goal.
+    /// </summary>
+    public uint Size => Context.Library.GoalSize(Context.Handle, Handle);
+
+    /// <summary>
+    /// Gets the number of tactic applications that produced this goal.
+    /// </summary>
+    public uint Depth => Context.Library.GoalDepth(Context.Handle, Handle);
+
+    /// <summary>
+    /// Gets the number of subterms of the goal's formulas.
+    /// </summary>
+    public uint NumExprs => Context.Library.GoalNumExprs(Context.Handle, Handle);
+
+    /// <summary>
+    /// Gets whether the goal contains the formula false.
+    /// </summary>
+    public bool IsInconsistent => Context.Library.GoalInconsistent(Context.Handle, Handle);
+
+    /// <summary>
+    /// Gets whether the goal is empty, meaning it was decided satisfiable.
+    /// </summary>
+    public bool IsDecidedSat => Context.Library.GoalIsDecidedSat(Context.Handle, Handle);
+
+    /// <summary>
+    /// Gets whether the goal contains false, meaning it was decided unsatisfiable.
+    /// </summary>
+    public bool IsDecidedUnsat => Context.Library.GoalIsDecidedUnsat(Context.Handle, Handle);
+
+    /// <summary>
+    /// Adds a formula to the goal.
+    /// </summary>
+    /// <param name="constraint">The boolean formula to add.</param>
+    public void Assert(BoolExpr constraint)
+    {
+        Context.Library.GoalAssert(Context.Handle, Handle, constraint.Handle);
+    }
+
+    /// <summary>
+    /// Removes all formulas from the goal.
+    /// </summary>
+    public void Reset()
+    {
+        Context.Library.GoalReset(Context.Handle, Handle);
+    }
+
+    /// <summary>
+    /// Gets the formulas of the goal.
+    /// </summary>
+    /// <returns>The formulas in goal order.</returns>
+    public BoolExpr[] GetFormulas()
+    {
+        var formulas = new BoolExpr[Size];
+        for (var i = 0u; i < formulas.Length; i++)
+            formulas[i] = Z3Expr.Create<BoolExpr>(Context, Context.Library.GoalFormula(Context.Handle, Handle, i));
+
+        return formulas;
+    }
+
+    /// <summary>
+    /// Returns a string representation of the goal.
+    /// </summary>
+    /// <returns>The goal's formulas in Z3 format.</returns>
+    public override string ToString()
+    {
+        try
+        {
+            return Context.Library.GoalToString(Context.Handle, Handle);
+        }
+        catch (ObjectDisposedException)
+        {
+            return "<disposed>";
+        }
+    }
+}
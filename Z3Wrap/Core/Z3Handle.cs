@@ -1,3 +1,5 @@
+using Spaceorc.Z3Wrap.Core.Interop;
+
 namespace Spaceorc.Z3Wrap.Core;
 
 /// <summary>
@@ -5,6 +7,9 @@ namespace Spaceorc.Z3Wrap.Core;
 /// </summary>
 public abstract class Z3Handle
 {
+    private IntPtr handle;
+    private OperatorChain? pendingChain;
+
     /// <summary>
     /// Initializes a new Z3Handle with context and handle.
     /// </summary>
@@ -12,15 +17,28 @@ public abstract class Z3Handle
     /// <param name="handle">Native Z3 handle.</param>
     protected Z3Handle(Z3Context context, IntPtr handle)
     {
-        Handle = handle;
+        this.handle = handle;
         context.TrackHandle(handle);
         Context = context;
     }
 
+    private protected Z3Handle(Z3Context context, OperatorChain chain)
+    {
+        pendingChain = chain;
+        Context = context;
+    }
+
     /// <summary>
     /// Gets the native Z3 handle pointer.
     /// </summary>
-    public IntPtr Handle { get; }
+    /// <remarks>
+    /// Chains of the same associative operator built with <c>&amp;</c>, <c>|</c>, <c>+</c> or <c>*</c> create their
+    /// single n-ary native term on first access, so reading this property (directly, or through <see cref="Equals"/>,
+    /// <see cref="GetHashCode"/> or <see cref="ToString"/>) may call into Z3.
+    /// </remarks>
+    public IntPtr Handle => pendingChain == null ? handle : Materialize();
+
+    internal OperatorChain? PendingChain => pendingChain;
 
     /// <summary>
     /// Gets the Z3 context that owns this handle.
@@ -32,6 +50,7 @@ public abstract class Z3Handle
     /// </summary>
     /// <param name="obj">The object to compare with.</param>
     /// <returns>True if objects are equal; otherwise false.</returns>
+    /// <remarks>Creates the native terms of pending operator chains, see <see cref="Handle"/>.</remarks>
     public override bool Equals(object? obj)
     {
         if (obj is Z3Handle expr)
@@ -43,6 +62,7 @@ public abstract class Z3Handle
     /// Gets the hash code for this handle.
     /// </summary>
     /// <returns>The hash code of the native handle.</returns>
+    /// <remarks>Creates the native term of a pending operator chain, see <see cref="Handle"/>.</remarks>
     public override int GetHashCode()
     {
         return Handle.GetHashCode();
@@ -63,4 +83,13 @@ public abstract class Z3Handle
             return "<disposed>";
         }
     }
+
+    private IntPtr Materialize()
+    {
+        var chainHandle = pendingChain!.Build(Context);
+        Context.TrackHandle(chainHandle);
+        handle = chainHandle;
+        pendingChain = null;
+        return handle;
+    }
 }
@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -14,7 +15,7 @@ namespace Spaceorc.Z3Wrap.Core;
 public sealed partial class Z3Library
 {
     /// <summary>
-    ///  Return <c>Z3_INT_SYMBOL</c> if the symbol was constructed using <see cref="MkIntSymbol"/> , and <c>Z3_STRING_SYMBOL</c> if the symbol was constructed using <see cref="MkStringSymbol"/> .
+    ///  Return <c>Z3_INT_SYMBOL</c> if the symbol was constructed using <see cref="MkIntSymbol"/> , and <c>Z3_STRING_SYMBOL</c> if the symbol was constructed using <see cref="MkStringSymbol(IntPtr, string)"/> .
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_symbol">symbol parameter</param>
@@ -53,7 +54,7 @@ public sealed partial class Z3Library
     /// Precondition: Z3_get_symbol_kind(s) == Z3_STRING_SYMBOL
     /// Warning: The returned buffer is statically allocated by Z3. It will be automatically deallocated when <see cref="DelContext"/> is invoked. So, the buffer is invalidated in the next call to <c>Z3_get_symbol_string</c> .
     /// </remarks>
-    /// <seealso cref="MkStringSymbol"/>
+    /// <seealso cref="MkStringSymbol(IntPtr, string)"/>
     public string GetSymbolString(IntPtr c, IntPtr s)
     {
         var result = nativeLibrary.GetSymbolString(c, s);
@@ -62,6 +63,47 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return the symbol name.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_symbol">symbol parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Precondition: Z3_get_symbol_kind(s) == Z3_STRING_SYMBOL
+    /// Warning: The returned buffer is statically allocated by Z3. It will be automatically deallocated when <see cref="DelContext"/> is invoked. So, the buffer is invalidated in the next call to <c>Z3_get_symbol_string</c> .
+    /// </remarks>
+    /// <seealso cref="MkStringSymbol(IntPtr, string)"/>
+    public ReadOnlySpan<byte> GetSymbolStringUtf8(IntPtr c, IntPtr s)
+    {
+        var result = nativeLibrary.GetSymbolString(c, s);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GetSymbolString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetSymbolStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_symbol">symbol parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GetSymbolString(IntPtr c, IntPtr s, IBufferWriter<byte> destination)
+    {
+        destination.Write(GetSymbolStringUtf8(c, s));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetSymbolStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_symbol">symbol parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GetSymbolString(IntPtr c, IntPtr s, Stream destination)
+    {
+        destination.Write(GetSymbolStringUtf8(c, s));
+    }
+
     /// <summary>
     ///  Return the sort name as a symbol.
     /// </summary>
@@ -244,7 +286,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// Precondition: Z3_get_sort_kind(c, t) == Z3_DATATYPE_SORT
     /// </remarks>
-    /// <seealso cref="MkTupleSort"/>
+    /// <seealso cref="MkTupleSort(IntPtr, string, uint, IntPtr[], IntPtr[], out IntPtr, IntPtr[])"/>
     /// <seealso cref="GetSortKind"/>
     public IntPtr GetTupleSortMkDecl(IntPtr c, IntPtr t)
     {
@@ -262,7 +304,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// Precondition: Z3_get_sort_kind(c, t) == Z3_DATATYPE_SORT
     /// </remarks>
-    /// <seealso cref="MkTupleSort"/>
+    /// <seealso cref="MkTupleSort(IntPtr, string, uint, IntPtr[], IntPtr[], out IntPtr, IntPtr[])"/>
     /// <seealso cref="GetSortKind"/>
     public uint GetTupleSortNumFields(IntPtr c, IntPtr t)
     {
@@ -282,7 +324,7 @@ public sealed partial class Z3Library
     /// Precondition: Z3_get_sort_kind(t) == Z3_DATATYPE_SORT
     /// Precondition: i &lt; Z3_get_tuple_sort_num_fields(c, t)
     /// </remarks>
-    /// <seealso cref="MkTupleSort"/>
+    /// <seealso cref="MkTupleSort(IntPtr, string, uint, IntPtr[], IntPtr[], out IntPtr, IntPtr[])"/>
     /// <seealso cref="GetSortKind"/>
     public IntPtr GetTupleSortFieldDecl(IntPtr c, IntPtr t, uint i)
     {
@@ -462,6 +504,24 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkAtmost));
     }
 
+    /// <summary>
+    ///  Pseudo-Boolean relations.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <param name="k" ctype="unsigned">unsigned parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// Encode p1 + p2 + ... + pn &lt;= k
+    /// </remarks>
+    public IntPtr MkAtmost(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args, uint k)
+    {
+        var result = nativeLibrary.MkAtmost(c, numArgs, args, k);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkAtmost));
+    }
+
     /// <summary>
     ///  Pseudo-Boolean relations.
     /// </summary>
@@ -480,6 +540,24 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkAtleast));
     }
 
+    /// <summary>
+    ///  Pseudo-Boolean relations.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <param name="k" ctype="unsigned">unsigned parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// Encode p1 + p2 + ... + pn &gt;= k
+    /// </remarks>
+    public IntPtr MkAtleast(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args, uint k)
+    {
+        var result = nativeLibrary.MkAtleast(c, numArgs, args, k);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkAtleast));
+    }
+
     /// <summary>
     ///  Pseudo-Boolean relations.
     /// </summary>
@@ -499,6 +577,25 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkPble));
     }
 
+    /// <summary>
+    ///  Pseudo-Boolean relations.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <param name="coeffs" ctype="int const[]">int parameter</param>
+    /// <param name="k" ctype="int">int parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// Encode k1*p1 + k2*p2 + ... + kn*pn &lt;= k
+    /// </remarks>
+    public IntPtr MkPble(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args, int[] coeffs, int k)
+    {
+        var result = nativeLibrary.MkPble(c, numArgs, args, coeffs, k);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkPble));
+    }
+
     /// <summary>
     ///  Pseudo-Boolean relations.
     /// </summary>
@@ -518,6 +615,25 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkPbge));
     }
 
+    /// <summary>
+    ///  Pseudo-Boolean relations.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <param name="coeffs" ctype="int const[]">int parameter</param>
+    /// <param name="k" ctype="int">int parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// Encode k1*p1 + k2*p2 + ... + kn*pn &gt;= k
+    /// </remarks>
+    public IntPtr MkPbge(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args, int[] coeffs, int k)
+    {
+        var result = nativeLibrary.MkPbge(c, numArgs, args, coeffs, k);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkPbge));
+    }
+
     /// <summary>
     ///  Pseudo-Boolean relations.
     /// </summary>
@@ -537,6 +653,25 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkPbeq));
     }
 
+    /// <summary>
+    ///  Pseudo-Boolean relations.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <param name="coeffs" ctype="int const[]">int parameter</param>
+    /// <param name="k" ctype="int">int parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// Encode k1*p1 + k2*p2 + ... + kn*pn = k
+    /// </remarks>
+    public IntPtr MkPbeq(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args, int[] coeffs, int k)
+    {
+        var result = nativeLibrary.MkPbeq(c, numArgs, args, coeffs, k);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkPbeq));
+    }
+
     /// <summary>
     ///  Convert a <c>Z3_func_decl</c> into <c>Z3_ast</c> . This is just type casting.
     /// </summary>
@@ -812,6 +947,48 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return the rational value, as a string, associated with a rational parameter.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="d" ctype="Z3_func_decl">func_decl parameter</param>
+    /// <param name="idx" ctype="unsigned">unsigned parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Precondition: Z3_get_decl_parameter_kind(c, d, idx) == Z3_PARAMETER_RATIONAL
+    /// </remarks>
+    public ReadOnlySpan<byte> GetDeclRationalParameterUtf8(IntPtr c, IntPtr d, uint idx)
+    {
+        var result = nativeLibrary.GetDeclRationalParameter(c, d, idx);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GetDeclRationalParameter));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetDeclRationalParameterUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="d" ctype="Z3_func_decl">func_decl parameter</param>
+    /// <param name="idx" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GetDeclRationalParameter(IntPtr c, IntPtr d, uint idx, IBufferWriter<byte> destination)
+    {
+        destination.Write(GetDeclRationalParameterUtf8(c, d, idx));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetDeclRationalParameterUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="d" ctype="Z3_func_decl">func_decl parameter</param>
+    /// <param name="idx" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GetDeclRationalParameter(IntPtr c, IntPtr d, uint idx, Stream destination)
+    {
+        destination.Write(GetDeclRationalParameterUtf8(c, d, idx));
+    }
+
     /// <summary>
     ///  Convert a <c>Z3_app</c> into <c>Z3_ast</c> . This is just type casting.
     /// </summary>
@@ -1075,6 +1252,45 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return numeral value, as a decimal string of a numeric constant term.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Precondition: Z3_get_ast_kind(c, a) == Z3_NUMERAL_AST
+    /// </remarks>
+    public ReadOnlySpan<byte> GetNumeralStringUtf8(IntPtr c, IntPtr a)
+    {
+        var result = nativeLibrary.GetNumeralString(c, a);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GetNumeralString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetNumeralStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GetNumeralString(IntPtr c, IntPtr a, IBufferWriter<byte> destination)
+    {
+        destination.Write(GetNumeralStringUtf8(c, a));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetNumeralStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GetNumeralString(IntPtr c, IntPtr a, Stream destination)
+    {
+        destination.Write(GetNumeralStringUtf8(c, a));
+    }
+
     /// <summary>
     ///  Return numeral value, as a binary string of a numeric constant term.
     /// </summary>
@@ -1093,6 +1309,46 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return numeral value, as a binary string of a numeric constant term.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Precondition: Z3_get_ast_kind(c, a) == Z3_NUMERAL_AST
+    /// Precondition: a represents a non-negative integer
+    /// </remarks>
+    public ReadOnlySpan<byte> GetNumeralBinaryStringUtf8(IntPtr c, IntPtr a)
+    {
+        var result = nativeLibrary.GetNumeralBinaryString(c, a);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GetNumeralBinaryString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetNumeralBinaryStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GetNumeralBinaryString(IntPtr c, IntPtr a, IBufferWriter<byte> destination)
+    {
+        destination.Write(GetNumeralBinaryStringUtf8(c, a));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetNumeralBinaryStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GetNumeralBinaryString(IntPtr c, IntPtr a, Stream destination)
+    {
+        destination.Write(GetNumeralBinaryStringUtf8(c, a));
+    }
+
     /// <summary>
     ///  Return numeral as a string in decimal notation. The result has at most <c>precision</c> decimal places.
     /// </summary>
@@ -1111,6 +1367,48 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return numeral as a string in decimal notation. The result has at most <c>precision</c> decimal places.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="precision" ctype="unsigned">unsigned parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Precondition: Z3_get_ast_kind(c, a) == Z3_NUMERAL_AST || Z3_is_algebraic_number(c, a)
+    /// </remarks>
+    public ReadOnlySpan<byte> GetNumeralDecimalStringUtf8(IntPtr c, IntPtr a, uint precision)
+    {
+        var result = nativeLibrary.GetNumeralDecimalString(c, a, precision);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GetNumeralDecimalString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetNumeralDecimalStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="precision" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GetNumeralDecimalString(IntPtr c, IntPtr a, uint precision, IBufferWriter<byte> destination)
+    {
+        destination.Write(GetNumeralDecimalStringUtf8(c, a, precision));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetNumeralDecimalStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="precision" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GetNumeralDecimalString(IntPtr c, IntPtr a, uint precision, Stream destination)
+    {
+        destination.Write(GetNumeralDecimalStringUtf8(c, a, precision));
+    }
+
     /// <summary>
     ///  Return numeral as a double.
     /// </summary>
@@ -1179,7 +1477,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Similar to <see cref="GetNumeralString"/> , but only succeeds if the value can fit in a machine int. Return <c>true</c> if the call succeeded.
+    ///  Similar to <see cref="GetNumeralString(IntPtr, IntPtr)"/> , but only succeeds if the value can fit in a machine int. Return <c>true</c> if the call succeeded.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="v" ctype="Z3_ast">ast parameter</param>
@@ -1188,7 +1486,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// Precondition: Z3_get_ast_kind(c, v) == Z3_NUMERAL_AST
     /// </remarks>
-    /// <seealso cref="GetNumeralString"/>
+    /// <seealso cref="GetNumeralString(IntPtr, IntPtr)"/>
     public bool GetNumeralInt(IntPtr c, IntPtr v, out int i)
     {
         var result = nativeLibrary.GetNumeralInt(c, v, out i);
@@ -1197,7 +1495,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Similar to <see cref="GetNumeralString"/> , but only succeeds if the value can fit in a machine unsigned int. Return <c>true</c> if the call succeeded.
+    ///  Similar to <see cref="GetNumeralString(IntPtr, IntPtr)"/> , but only succeeds if the value can fit in a machine unsigned int. Return <c>true</c> if the call succeeded.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="v" ctype="Z3_ast">ast parameter</param>
@@ -1206,7 +1504,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// Precondition: Z3_get_ast_kind(c, v) == Z3_NUMERAL_AST
     /// </remarks>
-    /// <seealso cref="GetNumeralString"/>
+    /// <seealso cref="GetNumeralString(IntPtr, IntPtr)"/>
     public bool GetNumeralUint(IntPtr c, IntPtr v, out uint u)
     {
         var result = nativeLibrary.GetNumeralUint(c, v, out u);
@@ -1215,7 +1513,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Similar to <see cref="GetNumeralString"/> , but only succeeds if the value can fit in a machine <c>uint64_t</c> int. Return <c>true</c> if the call succeeded.
+    ///  Similar to <see cref="GetNumeralString(IntPtr, IntPtr)"/> , but only succeeds if the value can fit in a machine <c>uint64_t</c> int. Return <c>true</c> if the call succeeded.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="v" ctype="Z3_ast">ast parameter</param>
@@ -1224,7 +1522,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// Precondition: Z3_get_ast_kind(c, v) == Z3_NUMERAL_AST
     /// </remarks>
-    /// <seealso cref="GetNumeralString"/>
+    /// <seealso cref="GetNumeralString(IntPtr, IntPtr)"/>
     public bool GetNumeralUint64(IntPtr c, IntPtr v, out ulong u)
     {
         var result = nativeLibrary.GetNumeralUint64(c, v, out u);
@@ -1233,7 +1531,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Similar to <see cref="GetNumeralString"/> , but only succeeds if the value can fit in a machine <c>int64_t</c> int. Return <c>true</c> if the call succeeded.
+    ///  Similar to <see cref="GetNumeralString(IntPtr, IntPtr)"/> , but only succeeds if the value can fit in a machine <c>int64_t</c> int. Return <c>true</c> if the call succeeded.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="v" ctype="Z3_ast">ast parameter</param>
@@ -1242,7 +1540,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// Precondition: Z3_get_ast_kind(c, v) == Z3_NUMERAL_AST
     /// </remarks>
-    /// <seealso cref="GetNumeralString"/>
+    /// <seealso cref="GetNumeralString(IntPtr, IntPtr)"/>
     public bool GetNumeralInt64(IntPtr c, IntPtr v, out long i)
     {
         var result = nativeLibrary.GetNumeralInt64(c, v, out i);
@@ -1251,7 +1549,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Similar to <see cref="GetNumeralString"/> , but only succeeds if the value can fit as a rational number as machine <c>int64_t</c> int. Return <c>true</c> if the call succeeded.
+    ///  Similar to <see cref="GetNumeralString(IntPtr, IntPtr)"/> , but only succeeds if the value can fit as a rational number as machine <c>int64_t</c> int. Return <c>true</c> if the call succeeded.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="v" ctype="Z3_ast">ast parameter</param>
@@ -1261,7 +1559,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// Precondition: Z3_get_ast_kind(c, v) == Z3_NUMERAL_AST
     /// </remarks>
-    /// <seealso cref="GetNumeralString"/>
+    /// <seealso cref="GetNumeralString(IntPtr, IntPtr)"/>
     public bool GetNumeralRationalInt64(IntPtr c, IntPtr v, out long num, out long den)
     {
         var result = nativeLibrary.GetNumeralRationalInt64(c, v, out num, out den);
@@ -1609,7 +1907,7 @@ public sealed partial class Z3Library
     /// Provides an interface to the AST simplifier used by Z3. This procedure is similar to <see cref="Simplify"/> , but the behavior of the simplifier can be configured using the given parameter set.
     /// </remarks>
     /// <seealso cref="Simplify"/>
-    /// <seealso cref="SimplifyGetHelp"/>
+    /// <seealso cref="SimplifyGetHelp(IntPtr)"/>
     /// <seealso cref="SimplifyGetParamDescrs"/>
     public IntPtr SimplifyEx(IntPtr c, IntPtr a, IntPtr p)
     {
@@ -1633,13 +1931,48 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return a string describing all available parameters.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <seealso cref="SimplifyEx"/>
+    /// <seealso cref="SimplifyGetParamDescrs"/>
+    public ReadOnlySpan<byte> SimplifyGetHelpUtf8(IntPtr c)
+    {
+        var result = nativeLibrary.SimplifyGetHelp(c);
+        CheckError(c);
+        result = CheckHandle(result, nameof(SimplifyGetHelp));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SimplifyGetHelpUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void SimplifyGetHelp(IntPtr c, IBufferWriter<byte> destination)
+    {
+        destination.Write(SimplifyGetHelpUtf8(c));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SimplifyGetHelpUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void SimplifyGetHelp(IntPtr c, Stream destination)
+    {
+        destination.Write(SimplifyGetHelpUtf8(c));
+    }
+
     /// <summary>
     ///  Return the parameter description set for the simplify procedure.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <returns ctype="Z3_param_descrs">param_descrs value</returns>
     /// <seealso cref="SimplifyEx"/>
-    /// <seealso cref="SimplifyGetHelp"/>
+    /// <seealso cref="SimplifyGetHelp(IntPtr)"/>
     public IntPtr SimplifyGetParamDescrs(IntPtr c)
     {
         var result = nativeLibrary.SimplifyGetParamDescrs(c);
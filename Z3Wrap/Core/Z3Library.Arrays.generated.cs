@@ -47,6 +47,21 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkSelectN));
     }
 
+    /// <summary>
+    ///  n-ary Array read. The argument <c>a</c> is the array and <c>idxs</c> are the indices of the array that gets read.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="n" ctype="unsigned">unsigned parameter</param>
+    /// <param name="idxs" ctype="Z3_ast const*">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    public IntPtr MkSelectN(IntPtr c, IntPtr a, uint n, ReadOnlySpan<IntPtr> idxs)
+    {
+        var result = nativeLibrary.MkSelectN(c, a, n, idxs);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkSelectN));
+    }
+
     /// <summary>
     ///  Array update.
     /// </summary>
@@ -83,6 +98,22 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkStoreN));
     }
 
+    /// <summary>
+    ///  n-ary Array update.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="n" ctype="unsigned">unsigned parameter</param>
+    /// <param name="idxs" ctype="Z3_ast const*">ast parameter</param>
+    /// <param name="v" ctype="Z3_ast">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    public IntPtr MkStoreN(IntPtr c, IntPtr a, uint n, ReadOnlySpan<IntPtr> idxs, IntPtr v)
+    {
+        var result = nativeLibrary.MkStoreN(c, a, n, idxs, v);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkStoreN));
+    }
+
     /// <summary>
     ///  Create the constant array.
     /// </summary>
@@ -121,6 +152,27 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkMap));
     }
 
+    /// <summary>
+    ///  Map f on the argument arrays.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="f" ctype="Z3_func_decl">func_decl parameter</param>
+    /// <param name="n" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const*">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// The <c>n</c> nodes <c>args</c> must be of array sorts <c>[domain_i -&gt; range_i]</c> . The function declaration <c>f</c> must have type <c> range_1 .. range_n -&gt; range</c> . <c>v</c> must have sort range. The sort of the result is <c>[domain_i -&gt; range]</c> .
+    /// </remarks>
+    /// <seealso cref="MkArraySort"/>
+    /// <seealso cref="MkStore"/>
+    /// <seealso cref="MkSelect"/>
+    public IntPtr MkMap(IntPtr c, IntPtr f, uint n, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkMap(c, f, n, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkMap));
+    }
+
     /// <summary>
     ///  Access the array default value. Produces the default range value, for arrays that can be represented as finite maps with a default range value.
     /// </summary>
@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -156,4 +157,40 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert the given map into a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="m" ctype="Z3_ast_map">ast_map parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> AstMapToStringUtf8(IntPtr c, IntPtr m)
+    {
+        var result = nativeLibrary.AstMapToString(c, m);
+        CheckError(c);
+        result = CheckHandle(result, nameof(AstMapToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="AstMapToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="m" ctype="Z3_ast_map">ast_map parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void AstMapToString(IntPtr c, IntPtr m, IBufferWriter<byte> destination)
+    {
+        destination.Write(AstMapToStringUtf8(c, m));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="AstMapToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="m" ctype="Z3_ast_map">ast_map parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void AstMapToString(IntPtr c, IntPtr m, Stream destination)
+    {
+        destination.Write(AstMapToStringUtf8(c, m));
+    }
+
 }
@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -148,4 +149,40 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert AST vector into a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="v" ctype="Z3_ast_vector">ast_vector parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> AstVectorToStringUtf8(IntPtr c, IntPtr v)
+    {
+        var result = nativeLibrary.AstVectorToString(c, v);
+        CheckError(c);
+        result = CheckHandle(result, nameof(AstVectorToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="AstVectorToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="v" ctype="Z3_ast_vector">ast_vector parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void AstVectorToString(IntPtr c, IntPtr v, IBufferWriter<byte> destination)
+    {
+        destination.Write(AstVectorToStringUtf8(c, v));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="AstVectorToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="v" ctype="Z3_ast_vector">ast_vector parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void AstVectorToString(IntPtr c, IntPtr v, Stream destination)
+    {
+        destination.Write(AstVectorToStringUtf8(c, v));
+    }
+
 }
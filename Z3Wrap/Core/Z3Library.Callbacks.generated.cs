@@ -7,6 +7,7 @@
 #nullable enable
 
 using System;
+using System.Runtime.InteropServices;
 
 namespace Spaceorc.Z3Wrap.Core;
 
@@ -24,7 +25,7 @@ public sealed partial class Z3Library
     /// <param name="t" ctype="Z3_ast">Z3_ast parameter</param>
     /// <param name="idx" ctype="unsigned">unsigned parameter</param>
     /// <param name="phase" ctype="bool">bool parameter</param>
-    public delegate void DecideEhCallback(IntPtr ctx, IntPtr cb, IntPtr t, uint idx, bool phase);
+    public delegate void DecideEhCallback(IntPtr ctx, IntPtr cb, IntPtr t, uint idx, [MarshalAs(UnmanagedType.U1)] bool phase);
 
     /// <summary>Z3_eq_eh</summary>
     /// <param name="ctx" ctype="void*">void* parameter</param>
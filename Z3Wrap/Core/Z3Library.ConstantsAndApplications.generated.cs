@@ -23,11 +23,11 @@ public sealed partial class Z3Library
     /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
     /// <returns ctype="Z3_func_decl">func_decl value</returns>
     /// <remarks>
-    /// After declaring a constant or function, the function <see cref="MkApp"/> can be used to create a constant or function application.
+    /// After declaring a constant or function, the function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
     /// </remarks>
-    /// <seealso cref="MkApp"/>
-    /// <seealso cref="MkFreshFuncDecl"/>
-    /// <seealso cref="MkRecFuncDecl"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
     public IntPtr MkFuncDecl(IntPtr c, string s, uint domainSize, IntPtr[] domain, IntPtr range)
     {
         using var sAnsi = new AnsiStringPtr(s);
@@ -38,6 +38,56 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkFuncDecl));
     }
 
+    /// <summary>
+    ///  Declare a constant or function.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> logical context. </param>
+    /// <param name="s"> name of the constant or function. </param>
+    /// <param name="domainSize" ctype="unsigned"> number of arguments. It is 0 when declaring a constant. </param>
+    /// <param name="domain" ctype="Z3_sort const[]"> array containing the sort of each argument. The array must contain domain_size elements. It is 0 when declaring a constant. </param>
+    /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
+    /// <returns ctype="Z3_func_decl">func_decl value</returns>
+    /// <remarks>
+    /// After declaring a constant or function, the function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
+    /// </remarks>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkFuncDecl(IntPtr c, string s, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        using var sAnsi = new AnsiStringPtr(s);
+        var sSymbol = nativeLibrary.MkStringSymbol(c, sAnsi);
+        CheckError(c);
+        var result = nativeLibrary.MkFuncDecl(c, sSymbol, domainSize, domain, range);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkFuncDecl));
+    }
+
+    /// <summary>
+    ///  Declare a constant or function.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> logical context. </param>
+    /// <param name="s"> name of the constant or function. </param>
+    /// <param name="domainSize" ctype="unsigned"> number of arguments. It is 0 when declaring a constant. </param>
+    /// <param name="domain" ctype="Z3_sort const[]"> array containing the sort of each argument. The array must contain domain_size elements. It is 0 when declaring a constant. </param>
+    /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
+    /// <returns ctype="Z3_func_decl">func_decl value</returns>
+    /// <remarks>
+    /// After declaring a constant or function, the function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
+    /// </remarks>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkFuncDecl(IntPtr c, ReadOnlySpan<byte> s, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        using var sUtf8 = new NullTerminatedUtf8(s, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var sSymbol = nativeLibrary.MkStringSymbol(c, sUtf8.Span);
+        CheckError(c);
+        var result = nativeLibrary.MkFuncDecl(c, sSymbol, domainSize, domain, range);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkFuncDecl));
+    }
+
     /// <summary>
     ///  Declare a constant or function.
     /// </summary>
@@ -48,11 +98,11 @@ public sealed partial class Z3Library
     /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
     /// <returns ctype="Z3_func_decl">func_decl value</returns>
     /// <remarks>
-    /// After declaring a constant or function, the function <see cref="MkApp"/> can be used to create a constant or function application.
+    /// After declaring a constant or function, the function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
     /// </remarks>
-    /// <seealso cref="MkApp"/>
-    /// <seealso cref="MkFreshFuncDecl"/>
-    /// <seealso cref="MkRecFuncDecl"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
     public IntPtr MkFuncDeclOriginal(IntPtr c, IntPtr s, uint domainSize, IntPtr[] domain, IntPtr range)
     {
         var result = nativeLibrary.MkFuncDecl(c, s, domainSize, domain, range);
@@ -60,6 +110,28 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkFuncDecl));
     }
 
+    /// <summary>
+    ///  Declare a constant or function.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> logical context. </param>
+    /// <param name="s" ctype="Z3_symbol"> name of the constant or function. </param>
+    /// <param name="domainSize" ctype="unsigned"> number of arguments. It is 0 when declaring a constant. </param>
+    /// <param name="domain" ctype="Z3_sort const[]"> array containing the sort of each argument. The array must contain domain_size elements. It is 0 when declaring a constant. </param>
+    /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
+    /// <returns ctype="Z3_func_decl">func_decl value</returns>
+    /// <remarks>
+    /// After declaring a constant or function, the function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
+    /// </remarks>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkFuncDeclOriginal(IntPtr c, IntPtr s, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        var result = nativeLibrary.MkFuncDecl(c, s, domainSize, domain, range);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkFuncDecl));
+    }
+
     /// <summary>
     ///  Create a constant or function application.
     /// </summary>
@@ -68,9 +140,9 @@ public sealed partial class Z3Library
     /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
     /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
-    /// <seealso cref="MkFreshFuncDecl"/>
-    /// <seealso cref="MkFuncDecl"/>
-    /// <seealso cref="MkRecFuncDecl"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
     public IntPtr MkApp(IntPtr c, IntPtr d, uint numArgs, IntPtr[] args)
     {
         var result = nativeLibrary.MkApp(c, d, numArgs, args);
@@ -78,6 +150,24 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkApp));
     }
 
+    /// <summary>
+    ///  Create a constant or function application.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="d" ctype="Z3_func_decl">func_decl parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkApp(IntPtr c, IntPtr d, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkApp(c, d, numArgs, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkApp));
+    }
+
     /// <summary>
     ///  Declare and create a constant.
     /// </summary>
@@ -91,9 +181,9 @@ public sealed partial class Z3Library
     /// Z3_ast n            = Z3_mk_app(c, d, 0, 0);
     /// </code>
     /// </remarks>
-    /// <seealso cref="MkApp"/>
-    /// <seealso cref="MkFreshConst"/>
-    /// <seealso cref="MkFuncDecl"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFreshConst(IntPtr, string, IntPtr)"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
     public IntPtr MkConst(IntPtr c, string s, IntPtr ty)
     {
         using var sAnsi = new AnsiStringPtr(s);
@@ -104,6 +194,32 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkConst));
     }
 
+    /// <summary>
+    ///  Declare and create a constant.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s">symbol parameter</param>
+    /// <param name="ty" ctype="Z3_sort">sort parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// This function is a shorthand for: <code>
+    /// Z3_func_decl d = Z3_mk_func_decl(c, s, 0, 0, ty);
+    /// Z3_ast n            = Z3_mk_app(c, d, 0, 0);
+    /// </code>
+    /// </remarks>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFreshConst(IntPtr, string, IntPtr)"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkConst(IntPtr c, ReadOnlySpan<byte> s, IntPtr ty)
+    {
+        using var sUtf8 = new NullTerminatedUtf8(s, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var sSymbol = nativeLibrary.MkStringSymbol(c, sUtf8.Span);
+        CheckError(c);
+        var result = nativeLibrary.MkConst(c, sSymbol, ty);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkConst));
+    }
+
     /// <summary>
     ///  Declare and create a constant.
     /// </summary>
@@ -117,9 +233,9 @@ public sealed partial class Z3Library
     /// Z3_ast n            = Z3_mk_app(c, d, 0, 0);
     /// </code>
     /// </remarks>
-    /// <seealso cref="MkApp"/>
-    /// <seealso cref="MkFreshConst"/>
-    /// <seealso cref="MkFuncDecl"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFreshConst(IntPtr, string, IntPtr)"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
     public IntPtr MkConstOriginal(IntPtr c, IntPtr s, IntPtr ty)
     {
         var result = nativeLibrary.MkConst(c, s, ty);
@@ -140,7 +256,7 @@ public sealed partial class Z3Library
     /// Z3 will generate an unique name for this function declaration. If prefix is different from <c>NULL</c> , then the name generate by Z3 will start with <c>prefix</c> .
     /// If <c>prefix</c> is <c>NULL</c> , then it is assumed to be the empty string.
     /// </remarks>
-    /// <seealso cref="MkFuncDecl"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
     public IntPtr MkFreshFuncDecl(IntPtr c, string prefix, uint domainSize, IntPtr[] domain, IntPtr range)
     {
         using var prefixAnsi = new AnsiStringPtr(prefix);
@@ -149,6 +265,50 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkFreshFuncDecl));
     }
 
+    /// <summary>
+    ///  Declare a fresh constant or function.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="prefix" ctype="Z3_string">string parameter</param>
+    /// <param name="domainSize" ctype="unsigned">unsigned parameter</param>
+    /// <param name="domain" ctype="Z3_sort const[]">sort parameter</param>
+    /// <param name="range" ctype="Z3_sort">sort parameter</param>
+    /// <returns ctype="Z3_func_decl">func_decl value</returns>
+    /// <remarks>
+    /// Z3 will generate an unique name for this function declaration. If prefix is different from <c>NULL</c> , then the name generate by Z3 will start with <c>prefix</c> .
+    /// If <c>prefix</c> is <c>NULL</c> , then it is assumed to be the empty string.
+    /// </remarks>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkFreshFuncDecl(IntPtr c, string prefix, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        using var prefixAnsi = new AnsiStringPtr(prefix);
+        var result = nativeLibrary.MkFreshFuncDecl(c, prefixAnsi, domainSize, domain, range);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkFreshFuncDecl));
+    }
+
+    /// <summary>
+    ///  Declare a fresh constant or function.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="prefix" ctype="Z3_string">string parameter</param>
+    /// <param name="domainSize" ctype="unsigned">unsigned parameter</param>
+    /// <param name="domain" ctype="Z3_sort const[]">sort parameter</param>
+    /// <param name="range" ctype="Z3_sort">sort parameter</param>
+    /// <returns ctype="Z3_func_decl">func_decl value</returns>
+    /// <remarks>
+    /// Z3 will generate an unique name for this function declaration. If prefix is different from <c>NULL</c> , then the name generate by Z3 will start with <c>prefix</c> .
+    /// If <c>prefix</c> is <c>NULL</c> , then it is assumed to be the empty string.
+    /// </remarks>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkFreshFuncDecl(IntPtr c, ReadOnlySpan<byte> prefix, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        using var prefixUtf8 = new NullTerminatedUtf8(prefix, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.MkFreshFuncDecl(c, prefixUtf8.Span, domainSize, domain, range);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkFreshFuncDecl));
+    }
+
     /// <summary>
     ///  Declare and create a fresh constant.
     /// </summary>
@@ -162,10 +322,10 @@ public sealed partial class Z3Library
     /// </code>
     /// If <c>prefix</c> is <c>NULL</c> , then it is assumed to be the empty string.
     /// </remarks>
-    /// <seealso cref="MkApp"/>
-    /// <seealso cref="MkConst"/>
-    /// <seealso cref="MkFreshFuncDecl"/>
-    /// <seealso cref="MkFuncDecl"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkConst(IntPtr, string, IntPtr)"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
     public IntPtr MkFreshConst(IntPtr c, string prefix, IntPtr ty)
     {
         using var prefixAnsi = new AnsiStringPtr(prefix);
@@ -174,6 +334,31 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkFreshConst));
     }
 
+    /// <summary>
+    ///  Declare and create a fresh constant.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="prefix" ctype="Z3_string">string parameter</param>
+    /// <param name="ty" ctype="Z3_sort">sort parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// This function is a shorthand for: <code>
+    /// Z3_func_decl d = Z3_mk_fresh_func_decl(c, prefix, 0, 0, ty); Z3_ast n = Z3_mk_app(c, d, 0, 0);
+    /// </code>
+    /// If <c>prefix</c> is <c>NULL</c> , then it is assumed to be the empty string.
+    /// </remarks>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkConst(IntPtr, string, IntPtr)"/>
+    /// <seealso cref="MkFreshFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkFreshConst(IntPtr c, ReadOnlySpan<byte> prefix, IntPtr ty)
+    {
+        using var prefixUtf8 = new NullTerminatedUtf8(prefix, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.MkFreshConst(c, prefixUtf8.Span, ty);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkFreshConst));
+    }
+
     /// <summary>
     ///  Declare a recursive function.
     /// </summary>
@@ -184,11 +369,11 @@ public sealed partial class Z3Library
     /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
     /// <returns ctype="Z3_func_decl">func_decl value</returns>
     /// <remarks>
-    /// After declaring recursive function, it should be associated with a recursive definition <see cref="AddRecDef"/> . The function <see cref="MkApp"/> can be used to create a constant or function application.
+    /// After declaring recursive function, it should be associated with a recursive definition <see cref="AddRecDef"/> . The function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
     /// </remarks>
     /// <seealso cref="AddRecDef"/>
-    /// <seealso cref="MkApp"/>
-    /// <seealso cref="MkFuncDecl"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
     public IntPtr MkRecFuncDecl(IntPtr c, string s, uint domainSize, IntPtr[] domain, IntPtr range)
     {
         using var sAnsi = new AnsiStringPtr(s);
@@ -199,6 +384,56 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkRecFuncDecl));
     }
 
+    /// <summary>
+    ///  Declare a recursive function.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> logical context. </param>
+    /// <param name="s"> name of the function. </param>
+    /// <param name="domainSize" ctype="unsigned"> number of arguments. It should be greater than 0. </param>
+    /// <param name="domain" ctype="Z3_sort const[]"> array containing the sort of each argument. The array must contain domain_size elements. </param>
+    /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
+    /// <returns ctype="Z3_func_decl">func_decl value</returns>
+    /// <remarks>
+    /// After declaring recursive function, it should be associated with a recursive definition <see cref="AddRecDef"/> . The function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
+    /// </remarks>
+    /// <seealso cref="AddRecDef"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkRecFuncDecl(IntPtr c, string s, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        using var sAnsi = new AnsiStringPtr(s);
+        var sSymbol = nativeLibrary.MkStringSymbol(c, sAnsi);
+        CheckError(c);
+        var result = nativeLibrary.MkRecFuncDecl(c, sSymbol, domainSize, domain, range);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkRecFuncDecl));
+    }
+
+    /// <summary>
+    ///  Declare a recursive function.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> logical context. </param>
+    /// <param name="s"> name of the function. </param>
+    /// <param name="domainSize" ctype="unsigned"> number of arguments. It should be greater than 0. </param>
+    /// <param name="domain" ctype="Z3_sort const[]"> array containing the sort of each argument. The array must contain domain_size elements. </param>
+    /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
+    /// <returns ctype="Z3_func_decl">func_decl value</returns>
+    /// <remarks>
+    /// After declaring recursive function, it should be associated with a recursive definition <see cref="AddRecDef"/> . The function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
+    /// </remarks>
+    /// <seealso cref="AddRecDef"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkRecFuncDecl(IntPtr c, ReadOnlySpan<byte> s, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        using var sUtf8 = new NullTerminatedUtf8(s, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var sSymbol = nativeLibrary.MkStringSymbol(c, sUtf8.Span);
+        CheckError(c);
+        var result = nativeLibrary.MkRecFuncDecl(c, sSymbol, domainSize, domain, range);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkRecFuncDecl));
+    }
+
     /// <summary>
     ///  Declare a recursive function.
     /// </summary>
@@ -209,11 +444,11 @@ public sealed partial class Z3Library
     /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
     /// <returns ctype="Z3_func_decl">func_decl value</returns>
     /// <remarks>
-    /// After declaring recursive function, it should be associated with a recursive definition <see cref="AddRecDef"/> . The function <see cref="MkApp"/> can be used to create a constant or function application.
+    /// After declaring recursive function, it should be associated with a recursive definition <see cref="AddRecDef"/> . The function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
     /// </remarks>
     /// <seealso cref="AddRecDef"/>
-    /// <seealso cref="MkApp"/>
-    /// <seealso cref="MkFuncDecl"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
     public IntPtr MkRecFuncDeclOriginal(IntPtr c, IntPtr s, uint domainSize, IntPtr[] domain, IntPtr range)
     {
         var result = nativeLibrary.MkRecFuncDecl(c, s, domainSize, domain, range);
@@ -221,6 +456,28 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkRecFuncDecl));
     }
 
+    /// <summary>
+    ///  Declare a recursive function.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> logical context. </param>
+    /// <param name="s" ctype="Z3_symbol"> name of the function. </param>
+    /// <param name="domainSize" ctype="unsigned"> number of arguments. It should be greater than 0. </param>
+    /// <param name="domain" ctype="Z3_sort const[]"> array containing the sort of each argument. The array must contain domain_size elements. </param>
+    /// <param name="range" ctype="Z3_sort"> sort of the constant or the return sort of the function. </param>
+    /// <returns ctype="Z3_func_decl">func_decl value</returns>
+    /// <remarks>
+    /// After declaring recursive function, it should be associated with a recursive definition <see cref="AddRecDef"/> . The function <see cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/> can be used to create a constant or function application.
+    /// </remarks>
+    /// <seealso cref="AddRecDef"/>
+    /// <seealso cref="MkApp(IntPtr, IntPtr, uint, IntPtr[])"/>
+    /// <seealso cref="MkFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
+    public IntPtr MkRecFuncDeclOriginal(IntPtr c, IntPtr s, uint domainSize, ReadOnlySpan<IntPtr> domain, IntPtr range)
+    {
+        var result = nativeLibrary.MkRecFuncDecl(c, s, domainSize, domain, range);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkRecFuncDecl));
+    }
+
     /// <summary>
     ///  Define the body of a recursive function.
     /// </summary>
@@ -232,7 +489,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// After declaring a recursive function or a collection of mutually recursive functions, use this function to provide the definition for the recursive function.
     /// </remarks>
-    /// <seealso cref="MkRecFuncDecl"/>
+    /// <seealso cref="MkRecFuncDecl(IntPtr, string, uint, IntPtr[], IntPtr)"/>
     public void AddRecDef(IntPtr c, IntPtr f, uint n, IntPtr[] args, IntPtr body)
     {
         nativeLibrary.AddRecDef(c, f, n, args, body);
@@ -47,6 +47,20 @@ public sealed partial class Z3Library
         CheckError(c);
     }
 
+    /// <summary>
+    ///  Set a value of a context parameter.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="paramId" ctype="Z3_string">string parameter</param>
+    /// <param name="paramValue" ctype="Z3_string">string parameter</param>
+    public void UpdateParamValue(IntPtr c, ReadOnlySpan<byte> paramId, ReadOnlySpan<byte> paramValue)
+    {
+        using var paramIdUtf8 = new NullTerminatedUtf8(paramId, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        using var paramValueUtf8 = new NullTerminatedUtf8(paramValue, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        nativeLibrary.UpdateParamValue(c, paramIdUtf8.Span, paramValueUtf8.Span);
+        CheckError(c);
+    }
+
     /// <summary>
     ///  Retrieve description of global parameters.
     /// </summary>
@@ -2567,7 +2567,7 @@ public sealed partial class Z3Library
         /// Z3_NO_PARSER
         /// </summary>
         /// <remarks>
-        /// Parser output is not available, that is, user didn't invoke <see cref="ParseSmtlib2String"/> or <see cref="ParseSmtlib2File"/>.
+        /// Parser output is not available, that is, user didn't invoke <see cref="ParseSmtlib2String(IntPtr, string, uint, IntPtr[], IntPtr[], uint, IntPtr[], IntPtr[])"/> or <see cref="ParseSmtlib2File(IntPtr, string, uint, IntPtr[], IntPtr[], uint, IntPtr[], IntPtr[])"/>.
         /// </remarks>
         Z3_NO_PARSER = 5,
 
@@ -2865,7 +2865,7 @@ public sealed partial class Z3Library
     /// In Z3, a symbol can be represented using integers and strings (See <see cref="GetSymbolKind"/>).
     /// </summary>
     /// <seealso cref="MkIntSymbol"/>
-    /// <seealso cref="MkStringSymbol"/>
+    /// <seealso cref="MkStringSymbol(IntPtr, string)"/>
     public enum SymbolKind
     {
         /// <summary>Z3_INT_SYMBOL</summary>
@@ -484,7 +484,7 @@ public sealed partial class Z3Library
     /// <seealso cref="MkFpaNumeralInt"/>
     /// <seealso cref="MkFpaNumeralIntUint"/>
     /// <seealso cref="MkFpaNumeralInt64Uint64"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     public IntPtr MkFpaFp(IntPtr c, IntPtr sgn, IntPtr exp, IntPtr sig)
     {
         var result = nativeLibrary.MkFpaFp(c, sgn, exp, sig);
@@ -500,14 +500,14 @@ public sealed partial class Z3Library
     /// <param name="ty" ctype="Z3_sort"> sort </param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function is used to create numerals that fit in a float value. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string. <c>ty</c> must be a FloatingPoint sort
+    /// This function is used to create numerals that fit in a float value. It is slightly faster than <see cref="MkNumeral(IntPtr, string, IntPtr)"/> since it is not necessary to parse a string. <c>ty</c> must be a FloatingPoint sort
     /// </remarks>
     /// <seealso cref="MkFpaFp"/>
     /// <seealso cref="MkFpaNumeralDouble"/>
     /// <seealso cref="MkFpaNumeralInt"/>
     /// <seealso cref="MkFpaNumeralIntUint"/>
     /// <seealso cref="MkFpaNumeralInt64Uint64"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     public IntPtr MkFpaNumeralFloat(IntPtr c, float v, IntPtr ty)
     {
         var result = nativeLibrary.MkFpaNumeralFloat(c, v, ty);
@@ -523,14 +523,14 @@ public sealed partial class Z3Library
     /// <param name="ty" ctype="Z3_sort"> sort </param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function is used to create numerals that fit in a double value. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string. <c>ty</c> must be a FloatingPoint sort
+    /// This function is used to create numerals that fit in a double value. It is slightly faster than <see cref="MkNumeral(IntPtr, string, IntPtr)"/> since it is not necessary to parse a string. <c>ty</c> must be a FloatingPoint sort
     /// </remarks>
     /// <seealso cref="MkFpaFp"/>
     /// <seealso cref="MkFpaNumeralFloat"/>
     /// <seealso cref="MkFpaNumeralInt"/>
     /// <seealso cref="MkFpaNumeralIntUint"/>
     /// <seealso cref="MkFpaNumeralInt64Uint64"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     public IntPtr MkFpaNumeralDouble(IntPtr c, double v, IntPtr ty)
     {
         var result = nativeLibrary.MkFpaNumeralDouble(c, v, ty);
@@ -553,7 +553,7 @@ public sealed partial class Z3Library
     /// <seealso cref="MkFpaNumeralFloat"/>
     /// <seealso cref="MkFpaNumeralIntUint"/>
     /// <seealso cref="MkFpaNumeralInt64Uint64"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     public IntPtr MkFpaNumeralInt(IntPtr c, int v, IntPtr ty)
     {
         var result = nativeLibrary.MkFpaNumeralInt(c, v, ty);
@@ -578,7 +578,7 @@ public sealed partial class Z3Library
     /// <seealso cref="MkFpaNumeralFloat"/>
     /// <seealso cref="MkFpaNumeralInt"/>
     /// <seealso cref="MkFpaNumeralInt64Uint64"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     public IntPtr MkFpaNumeralIntUint(IntPtr c, bool sgn, int exp, uint sig, IntPtr ty)
     {
         var result = nativeLibrary.MkFpaNumeralIntUint(c, sgn, exp, sig, ty);
@@ -603,7 +603,7 @@ public sealed partial class Z3Library
     /// <seealso cref="MkFpaNumeralFloat"/>
     /// <seealso cref="MkFpaNumeralInt"/>
     /// <seealso cref="MkFpaNumeralIntUint"/>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     public IntPtr MkFpaNumeralInt64Uint64(IntPtr c, bool sgn, long exp, ulong sig, IntPtr ty)
     {
         var result = nativeLibrary.MkFpaNumeralInt64Uint64(c, sgn, exp, sig, ty);
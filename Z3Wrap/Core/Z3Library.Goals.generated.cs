@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -228,6 +229,42 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert a goal into a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="g" ctype="Z3_goal">goal parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> GoalToStringUtf8(IntPtr c, IntPtr g)
+    {
+        var result = nativeLibrary.GoalToString(c, g);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GoalToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GoalToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="g" ctype="Z3_goal">goal parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GoalToString(IntPtr c, IntPtr g, IBufferWriter<byte> destination)
+    {
+        destination.Write(GoalToStringUtf8(c, g));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GoalToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="g" ctype="Z3_goal">goal parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GoalToString(IntPtr c, IntPtr g, Stream destination)
+    {
+        destination.Write(GoalToStringUtf8(c, g));
+    }
+
     /// <summary>
     ///  Convert a goal into a DIMACS formatted string. The goal must be in CNF. You can convert a goal to CNF by applying the tseitin-cnf tactic. Bit-vectors are not automatically converted to Booleans either, so if the caller intends to preserve satisfiability, it should apply bit-blasting tactics. Quantifiers and theory atoms will not be encoded.
     /// </summary>
@@ -243,4 +280,43 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert a goal into a DIMACS formatted string. The goal must be in CNF. You can convert a goal to CNF by applying the tseitin-cnf tactic. Bit-vectors are not automatically converted to Booleans either, so if the caller intends to preserve satisfiability, it should apply bit-blasting tactics. Quantifiers and theory atoms will not be encoded.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="g" ctype="Z3_goal">goal parameter</param>
+    /// <param name="includeNames" ctype="bool">bool parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> GoalToDimacsStringUtf8(IntPtr c, IntPtr g, bool includeNames)
+    {
+        var result = nativeLibrary.GoalToDimacsString(c, g, includeNames);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GoalToDimacsString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GoalToDimacsStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="g" ctype="Z3_goal">goal parameter</param>
+    /// <param name="includeNames" ctype="bool">bool parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GoalToDimacsString(IntPtr c, IntPtr g, bool includeNames, IBufferWriter<byte> destination)
+    {
+        destination.Write(GoalToDimacsStringUtf8(c, g, includeNames));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GoalToDimacsStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="g" ctype="Z3_goal">goal parameter</param>
+    /// <param name="includeNames" ctype="bool">bool parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GoalToDimacsString(IntPtr c, IntPtr g, bool includeNames, Stream destination)
+    {
+        destination.Write(GoalToDimacsStringUtf8(c, g, includeNames));
+    }
+
 }
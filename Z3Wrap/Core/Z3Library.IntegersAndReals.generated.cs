@@ -31,6 +31,24 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkAdd));
     }
 
+    /// <summary>
+    ///  Create an AST node representing <c>args[0] + ... + args[num_args-1]</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// The array <c>args</c> must have <c>num_args</c> elements. All arguments must have int or real sort.
+    /// The number of arguments must be greater than zero.
+    /// </remarks>
+    public IntPtr MkAdd(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkAdd(c, numArgs, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkAdd));
+    }
+
     /// <summary>
     ///  Create an AST node representing <c>args[0] * ... * args[num_args-1]</c> .
     /// </summary>
@@ -50,6 +68,25 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkMul));
     }
 
+    /// <summary>
+    ///  Create an AST node representing <c>args[0] * ... * args[num_args-1]</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// The array <c>args</c> must have <c>num_args</c> elements. All arguments must have int or real sort.
+    /// Z3 has limited support for non-linear arithmetic.
+    /// The number of arguments must be greater than zero.
+    /// </remarks>
+    public IntPtr MkMul(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkMul(c, numArgs, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkMul));
+    }
+
     /// <summary>
     ///  Create an AST node representing <c>args[0] - ... - args[num_args - 1]</c> .
     /// </summary>
@@ -68,6 +105,24 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkSub));
     }
 
+    /// <summary>
+    ///  Create an AST node representing <c>args[0] - ... - args[num_args - 1]</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// The array <c>args</c> must have <c>num_args</c> elements. All arguments must have int or real sort.
+    /// The number of arguments must be greater than zero.
+    /// </remarks>
+    public IntPtr MkSub(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkSub(c, numArgs, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkSub));
+    }
+
     /// <summary>
     ///  Create an AST node representing <c>- arg</c> .
     /// </summary>
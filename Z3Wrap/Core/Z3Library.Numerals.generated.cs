@@ -30,6 +30,23 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkNumeral));
     }
 
+    /// <summary>
+    ///  Create a numeral of a given sort.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> logical context. </param>
+    /// <param name="numeral" ctype="Z3_string"> A string representing the numeral value in decimal notation. The string may be of the form <c>[num]*[.[num]*][E[+|-][num]+]</c> . If the given sort is a real, then the numeral can be a rational, that is, a string of the form <c>[num]* / [num]*</c> . </param>
+    /// <param name="ty" ctype="Z3_sort"> The sort of the numeral. In the current implementation, the given sort can be an int, real, finite-domain, or bit-vectors of arbitrary size. </param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <seealso cref="MkInt"/>
+    /// <seealso cref="MkUnsignedInt"/>
+    public IntPtr MkNumeral(IntPtr c, ReadOnlySpan<byte> numeral, IntPtr ty)
+    {
+        using var numeralUtf8 = new NullTerminatedUtf8(numeral, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.MkNumeral(c, numeralUtf8.Span, ty);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkNumeral));
+    }
+
     /// <summary>
     ///  Create a real from a fraction.
     /// </summary>
@@ -40,7 +57,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// Precondition: den != 0
     /// </remarks>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     /// <seealso cref="MkInt"/>
     /// <seealso cref="MkRealInt64"/>
     /// <seealso cref="MkUnsignedInt"/>
@@ -75,9 +92,9 @@ public sealed partial class Z3Library
     /// <param name="ty" ctype="Z3_sort">sort parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function can be used to create numerals that fit in a machine integer. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string.
+    /// This function can be used to create numerals that fit in a machine integer. It is slightly faster than <see cref="MkNumeral(IntPtr, string, IntPtr)"/> since it is not necessary to parse a string.
     /// </remarks>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     public IntPtr MkInt(IntPtr c, int v, IntPtr ty)
     {
         var result = nativeLibrary.MkInt(c, v, ty);
@@ -93,9 +110,9 @@ public sealed partial class Z3Library
     /// <param name="ty" ctype="Z3_sort">sort parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function can be used to create numerals that fit in a machine unsigned integer. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string.
+    /// This function can be used to create numerals that fit in a machine unsigned integer. It is slightly faster than <see cref="MkNumeral(IntPtr, string, IntPtr)"/> since it is not necessary to parse a string.
     /// </remarks>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     public IntPtr MkUnsignedInt(IntPtr c, uint v, IntPtr ty)
     {
         var result = nativeLibrary.MkUnsignedInt(c, v, ty);
@@ -111,9 +128,9 @@ public sealed partial class Z3Library
     /// <param name="ty" ctype="Z3_sort">sort parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function can be used to create numerals that fit in a machine <c>int64_t</c> integer. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string.
+    /// This function can be used to create numerals that fit in a machine <c>int64_t</c> integer. It is slightly faster than <see cref="MkNumeral(IntPtr, string, IntPtr)"/> since it is not necessary to parse a string.
     /// </remarks>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     public IntPtr MkInt64(IntPtr c, long v, IntPtr ty)
     {
         var result = nativeLibrary.MkInt64(c, v, ty);
@@ -129,9 +146,9 @@ public sealed partial class Z3Library
     /// <param name="ty" ctype="Z3_sort">sort parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
     /// <remarks>
-    /// This function can be used to create numerals that fit in a machine <c>uint64_t</c> integer. It is slightly faster than <see cref="MkNumeral"/> since it is not necessary to parse a string.
+    /// This function can be used to create numerals that fit in a machine <c>uint64_t</c> integer. It is slightly faster than <see cref="MkNumeral(IntPtr, string, IntPtr)"/> since it is not necessary to parse a string.
     /// </remarks>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     public IntPtr MkUnsignedInt64(IntPtr c, ulong v, IntPtr ty)
     {
         var result = nativeLibrary.MkUnsignedInt64(c, v, ty);
@@ -146,7 +163,7 @@ public sealed partial class Z3Library
     /// <param name="sz" ctype="unsigned">unsigned parameter</param>
     /// <param name="bits" ctype="bool const*">bool parameter</param>
     /// <returns ctype="Z3_ast">ast value</returns>
-    /// <seealso cref="MkNumeral"/>
+    /// <seealso cref="MkNumeral(IntPtr, string, IntPtr)"/>
     /// <seealso cref="MkBvNumeral"/>
     public IntPtr MkBvNumeral(IntPtr c, uint sz, bool[] bits)
     {
@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -54,7 +55,7 @@ public sealed partial class Z3Library
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="o" ctype="Z3_optimize">optimize parameter</param>
     /// <param name="a" ctype="Z3_ast">ast parameter</param>
-    /// <seealso cref="OptimizeAssertSoft"/>
+    /// <seealso cref="OptimizeAssertSoft(IntPtr, IntPtr, IntPtr, string, string)"/>
     /// <seealso cref="OptimizeAssertAndTrack"/>
     public void OptimizeAssert(IntPtr c, IntPtr o, IntPtr a)
     {
@@ -70,7 +71,7 @@ public sealed partial class Z3Library
     /// <param name="a" ctype="Z3_ast">ast parameter</param>
     /// <param name="t" ctype="Z3_ast">ast parameter</param>
     /// <seealso cref="OptimizeAssert"/>
-    /// <seealso cref="OptimizeAssertSoft"/>
+    /// <seealso cref="OptimizeAssertSoft(IntPtr, IntPtr, IntPtr, string, string)"/>
     public void OptimizeAssertAndTrack(IntPtr c, IntPtr o, IntPtr a, IntPtr t)
     {
         nativeLibrary.OptimizeAssertAndTrack(c, o, a, t);
@@ -99,6 +100,28 @@ public sealed partial class Z3Library
         return result;
     }
 
+    /// <summary>
+    ///  Assert soft constraint to the optimization context.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context </param>
+    /// <param name="o" ctype="Z3_optimize"> - optimization context </param>
+    /// <param name="a" ctype="Z3_ast"> - formula </param>
+    /// <param name="weight" ctype="Z3_string"> - a penalty for violating soft constraint. Negative weights convert into rewards. </param>
+    /// <param name="id"> - optional identifier to group soft constraints </param>
+    /// <returns ctype="unsigned">unsigned value</returns>
+    /// <seealso cref="OptimizeAssert"/>
+    /// <seealso cref="OptimizeAssertAndTrack"/>
+    public uint OptimizeAssertSoft(IntPtr c, IntPtr o, IntPtr a, ReadOnlySpan<byte> weight, ReadOnlySpan<byte> id)
+    {
+        using var weightUtf8 = new NullTerminatedUtf8(weight, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        using var idUtf8 = new NullTerminatedUtf8(id, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var idSymbol = nativeLibrary.MkStringSymbol(c, idUtf8.Span);
+        CheckError(c);
+        var result = nativeLibrary.OptimizeAssertSoft(c, o, a, weightUtf8.Span, idSymbol);
+        CheckError(c);
+        return result;
+    }
+
     /// <summary>
     ///  Assert soft constraint to the optimization context.
     /// </summary>
@@ -118,6 +141,25 @@ public sealed partial class Z3Library
         return result;
     }
 
+    /// <summary>
+    ///  Assert soft constraint to the optimization context.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context </param>
+    /// <param name="o" ctype="Z3_optimize"> - optimization context </param>
+    /// <param name="a" ctype="Z3_ast"> - formula </param>
+    /// <param name="weight" ctype="Z3_string"> - a penalty for violating soft constraint. Negative weights convert into rewards. </param>
+    /// <param name="id" ctype="Z3_symbol"> - optional identifier to group soft constraints </param>
+    /// <returns ctype="unsigned">unsigned value</returns>
+    /// <seealso cref="OptimizeAssert"/>
+    /// <seealso cref="OptimizeAssertAndTrack"/>
+    public uint OptimizeAssertSoftOriginal(IntPtr c, IntPtr o, IntPtr a, ReadOnlySpan<byte> weight, IntPtr id)
+    {
+        using var weightUtf8 = new NullTerminatedUtf8(weight, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.OptimizeAssertSoft(c, o, a, weightUtf8.Span, id);
+        CheckError(c);
+        return result;
+    }
+
     /// <summary>
     ///  Add a maximization constraint.
     /// </summary>
@@ -199,7 +241,7 @@ public sealed partial class Z3Library
     /// <param name="numAssumptions" ctype="unsigned"> - number of additional assumptions </param>
     /// <param name="assumptions" ctype="Z3_ast const[]"> - the additional assumptions </param>
     /// <returns ctype="Z3_lbool">lbool value</returns>
-    /// <seealso cref="OptimizeGetReasonUnknown"/>
+    /// <seealso cref="OptimizeGetReasonUnknown(IntPtr, IntPtr)"/>
     /// <seealso cref="OptimizeGetModel"/>
     /// <seealso cref="OptimizeGetStatistics"/>
     /// <seealso cref="OptimizeGetUnsatCore"/>
@@ -211,13 +253,32 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Retrieve a string that describes the last status returned by <see cref="OptimizeCheck"/> .
+    ///  Check consistency and produce optimal values.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context </param>
+    /// <param name="o" ctype="Z3_optimize"> - optimization context </param>
+    /// <param name="numAssumptions" ctype="unsigned"> - number of additional assumptions </param>
+    /// <param name="assumptions" ctype="Z3_ast const[]"> - the additional assumptions </param>
+    /// <returns ctype="Z3_lbool">lbool value</returns>
+    /// <seealso cref="OptimizeGetReasonUnknown(IntPtr, IntPtr)"/>
+    /// <seealso cref="OptimizeGetModel"/>
+    /// <seealso cref="OptimizeGetStatistics"/>
+    /// <seealso cref="OptimizeGetUnsatCore"/>
+    public Lbool OptimizeCheck(IntPtr c, IntPtr o, uint numAssumptions, ReadOnlySpan<IntPtr> assumptions)
+    {
+        var result = nativeLibrary.OptimizeCheck(c, o, numAssumptions, assumptions);
+        CheckError(c);
+        return (Lbool)result;
+    }
+
+    /// <summary>
+    ///  Retrieve a string that describes the last status returned by <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> .
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="d" ctype="Z3_optimize">optimize parameter</param>
     /// <returns ctype="Z3_string">string value</returns>
     /// <remarks>
-    /// Use this method when <see cref="OptimizeCheck"/> returns <c>Z3_L_UNDEF</c> .
+    /// Use this method when <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> returns <c>Z3_L_UNDEF</c> .
     /// </remarks>
     public string OptimizeGetReasonUnknown(IntPtr c, IntPtr d)
     {
@@ -228,7 +289,46 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Retrieve the model for the last <see cref="OptimizeCheck"/> .
+    ///  Retrieve a string that describes the last status returned by <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="d" ctype="Z3_optimize">optimize parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Use this method when <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> returns <c>Z3_L_UNDEF</c> .
+    /// </remarks>
+    public ReadOnlySpan<byte> OptimizeGetReasonUnknownUtf8(IntPtr c, IntPtr d)
+    {
+        var result = nativeLibrary.OptimizeGetReasonUnknown(c, d);
+        CheckError(c);
+        result = CheckHandle(result, nameof(OptimizeGetReasonUnknown));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="OptimizeGetReasonUnknownUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="d" ctype="Z3_optimize">optimize parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void OptimizeGetReasonUnknown(IntPtr c, IntPtr d, IBufferWriter<byte> destination)
+    {
+        destination.Write(OptimizeGetReasonUnknownUtf8(c, d));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="OptimizeGetReasonUnknownUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="d" ctype="Z3_optimize">optimize parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void OptimizeGetReasonUnknown(IntPtr c, IntPtr d, Stream destination)
+    {
+        destination.Write(OptimizeGetReasonUnknownUtf8(c, d));
+    }
+
+    /// <summary>
+    ///  Retrieve the model for the last <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> .
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="o" ctype="Z3_optimize">optimize parameter</param>
@@ -244,7 +344,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Retrieve the unsat core for the last <see cref="OptimizeCheck"/> The unsat core is a subset of the assumptions <c>a</c> .
+    ///  Retrieve the unsat core for the last <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> The unsat core is a subset of the assumptions <c>a</c> .
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="o" ctype="Z3_optimize">optimize parameter</param>
@@ -263,7 +363,7 @@ public sealed partial class Z3Library
     /// <param name="c" ctype="Z3_context"> - context </param>
     /// <param name="o" ctype="Z3_optimize"> - optimization context </param>
     /// <param name="p" ctype="Z3_params"> - parameters </param>
-    /// <seealso cref="OptimizeGetHelp"/>
+    /// <seealso cref="OptimizeGetHelp(IntPtr, IntPtr)"/>
     /// <seealso cref="OptimizeGetParamDescrs"/>
     public void OptimizeSetParams(IntPtr c, IntPtr o, IntPtr p)
     {
@@ -277,7 +377,7 @@ public sealed partial class Z3Library
     /// <param name="c" ctype="Z3_context"> - context </param>
     /// <param name="o" ctype="Z3_optimize"> - optimization context </param>
     /// <returns ctype="Z3_param_descrs">param_descrs value</returns>
-    /// <seealso cref="OptimizeGetHelp"/>
+    /// <seealso cref="OptimizeGetHelp(IntPtr, IntPtr)"/>
     /// <seealso cref="OptimizeSetParams"/>
     public IntPtr OptimizeGetParamDescrs(IntPtr c, IntPtr o)
     {
@@ -362,8 +462,8 @@ public sealed partial class Z3Library
     /// <param name="c" ctype="Z3_context"> - context. </param>
     /// <param name="o" ctype="Z3_optimize"> - optimization context. </param>
     /// <returns ctype="Z3_string">string value</returns>
-    /// <seealso cref="OptimizeFromFile"/>
-    /// <seealso cref="OptimizeFromString"/>
+    /// <seealso cref="OptimizeFromFile(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="OptimizeFromString(IntPtr, IntPtr, string)"/>
     public string OptimizeToString(IntPtr c, IntPtr o)
     {
         var result = nativeLibrary.OptimizeToString(c, o);
@@ -372,14 +472,52 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Print the current context as a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context. </param>
+    /// <param name="o" ctype="Z3_optimize"> - optimization context. </param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <seealso cref="OptimizeFromFile(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="OptimizeFromString(IntPtr, IntPtr, string)"/>
+    public ReadOnlySpan<byte> OptimizeToStringUtf8(IntPtr c, IntPtr o)
+    {
+        var result = nativeLibrary.OptimizeToString(c, o);
+        CheckError(c);
+        result = CheckHandle(result, nameof(OptimizeToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="OptimizeToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context. </param>
+    /// <param name="o" ctype="Z3_optimize"> - optimization context. </param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void OptimizeToString(IntPtr c, IntPtr o, IBufferWriter<byte> destination)
+    {
+        destination.Write(OptimizeToStringUtf8(c, o));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="OptimizeToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context. </param>
+    /// <param name="o" ctype="Z3_optimize"> - optimization context. </param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void OptimizeToString(IntPtr c, IntPtr o, Stream destination)
+    {
+        destination.Write(OptimizeToStringUtf8(c, o));
+    }
+
     /// <summary>
     ///  Parse an SMT-LIB2 string with assertions, soft constraints and optimization objectives. Add the parsed constraints and objectives to the optimization context.
     /// </summary>
     /// <param name="c" ctype="Z3_context"> - context. </param>
     /// <param name="o" ctype="Z3_optimize"> - optimize context. </param>
     /// <param name="s" ctype="Z3_string"> - string containing SMT2 specification. </param>
-    /// <seealso cref="OptimizeFromFile"/>
-    /// <seealso cref="OptimizeToString"/>
+    /// <seealso cref="OptimizeFromFile(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="OptimizeToString(IntPtr, IntPtr)"/>
     public void OptimizeFromString(IntPtr c, IntPtr o, string s)
     {
         using var sAnsi = new AnsiStringPtr(s);
@@ -387,14 +525,29 @@ public sealed partial class Z3Library
         CheckError(c);
     }
 
+    /// <summary>
+    ///  Parse an SMT-LIB2 string with assertions, soft constraints and optimization objectives. Add the parsed constraints and objectives to the optimization context.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context. </param>
+    /// <param name="o" ctype="Z3_optimize"> - optimize context. </param>
+    /// <param name="s" ctype="Z3_string"> - string containing SMT2 specification. </param>
+    /// <seealso cref="OptimizeFromFile(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="OptimizeToString(IntPtr, IntPtr)"/>
+    public void OptimizeFromString(IntPtr c, IntPtr o, ReadOnlySpan<byte> s)
+    {
+        using var sUtf8 = new NullTerminatedUtf8(s, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        nativeLibrary.OptimizeFromString(c, o, sUtf8.Span);
+        CheckError(c);
+    }
+
     /// <summary>
     ///  Parse an SMT-LIB2 file with assertions, soft constraints and optimization objectives. Add the parsed constraints and objectives to the optimization context.
     /// </summary>
     /// <param name="c" ctype="Z3_context"> - context. </param>
     /// <param name="o" ctype="Z3_optimize"> - optimize context. </param>
     /// <param name="s" ctype="Z3_string"> - path to file containing SMT2 specification. </param>
-    /// <seealso cref="OptimizeFromString"/>
-    /// <seealso cref="OptimizeToString"/>
+    /// <seealso cref="OptimizeFromString(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="OptimizeToString(IntPtr, IntPtr)"/>
     public void OptimizeFromFile(IntPtr c, IntPtr o, string s)
     {
         using var sAnsi = new AnsiStringPtr(s);
@@ -402,6 +555,21 @@ public sealed partial class Z3Library
         CheckError(c);
     }
 
+    /// <summary>
+    ///  Parse an SMT-LIB2 file with assertions, soft constraints and optimization objectives. Add the parsed constraints and objectives to the optimization context.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context. </param>
+    /// <param name="o" ctype="Z3_optimize"> - optimize context. </param>
+    /// <param name="s" ctype="Z3_string"> - path to file containing SMT2 specification. </param>
+    /// <seealso cref="OptimizeFromString(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="OptimizeToString(IntPtr, IntPtr)"/>
+    public void OptimizeFromFile(IntPtr c, IntPtr o, ReadOnlySpan<byte> s)
+    {
+        using var sUtf8 = new NullTerminatedUtf8(s, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        nativeLibrary.OptimizeFromFile(c, o, sUtf8.Span);
+        CheckError(c);
+    }
+
     /// <summary>
     ///  Return a string containing a description of parameters accepted by optimize.
     /// </summary>
@@ -419,7 +587,45 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Retrieve statistics information from the last call to <see cref="OptimizeCheck"/> .
+    ///  Return a string containing a description of parameters accepted by optimize.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_optimize">optimize parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <seealso cref="OptimizeGetParamDescrs"/>
+    /// <seealso cref="OptimizeSetParams"/>
+    public ReadOnlySpan<byte> OptimizeGetHelpUtf8(IntPtr c, IntPtr t)
+    {
+        var result = nativeLibrary.OptimizeGetHelp(c, t);
+        CheckError(c);
+        result = CheckHandle(result, nameof(OptimizeGetHelp));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="OptimizeGetHelpUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_optimize">optimize parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void OptimizeGetHelp(IntPtr c, IntPtr t, IBufferWriter<byte> destination)
+    {
+        destination.Write(OptimizeGetHelpUtf8(c, t));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="OptimizeGetHelpUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_optimize">optimize parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void OptimizeGetHelp(IntPtr c, IntPtr t, Stream destination)
+    {
+        destination.Write(OptimizeGetHelpUtf8(c, t));
+    }
+
+    /// <summary>
+    ///  Retrieve statistics information from the last call to <see cref="OptimizeCheck(IntPtr, IntPtr, uint, IntPtr[])"/> .
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="d" ctype="Z3_optimize">optimize parameter</param>
@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -50,6 +51,23 @@ public sealed partial class Z3Library
         return (ParamKind)result;
     }
 
+    /// <summary>
+    ///  Return the kind associated with the given parameter name <c>n</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_param_descrs">param_descrs parameter</param>
+    /// <param name="n">symbol parameter</param>
+    /// <returns ctype="Z3_param_kind">param_kind value</returns>
+    public ParamKind ParamDescrsGetKind(IntPtr c, IntPtr p, ReadOnlySpan<byte> n)
+    {
+        using var nUtf8 = new NullTerminatedUtf8(n, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var nSymbol = nativeLibrary.MkStringSymbol(c, nUtf8.Span);
+        CheckError(c);
+        var result = nativeLibrary.ParamDescrsGetKind(c, p, nSymbol);
+        CheckError(c);
+        return (ParamKind)result;
+    }
+
     /// <summary>
     ///  Return the kind associated with the given parameter name <c>n</c> .
     /// </summary>
@@ -112,6 +130,66 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Retrieve documentation string corresponding to parameter name <c>s</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_param_descrs">param_descrs parameter</param>
+    /// <param name="s">symbol parameter</param>
+    /// <returns ctype="Z3_string">string value</returns>
+    public string ParamDescrsGetDocumentation(IntPtr c, IntPtr p, ReadOnlySpan<byte> s)
+    {
+        using var sUtf8 = new NullTerminatedUtf8(s, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var sSymbol = nativeLibrary.MkStringSymbol(c, sUtf8.Span);
+        CheckError(c);
+        var result = nativeLibrary.ParamDescrsGetDocumentation(c, p, sSymbol);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ParamDescrsGetDocumentation));
+        return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
+    }
+
+    /// <summary>
+    ///  Retrieve documentation string corresponding to parameter name <c>s</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_param_descrs">param_descrs parameter</param>
+    /// <param name="s">symbol parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> ParamDescrsGetDocumentationUtf8(IntPtr c, IntPtr p, string s)
+    {
+        using var sAnsi = new AnsiStringPtr(s);
+        var sSymbol = nativeLibrary.MkStringSymbol(c, sAnsi);
+        CheckError(c);
+        var result = nativeLibrary.ParamDescrsGetDocumentation(c, p, sSymbol);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ParamDescrsGetDocumentation));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ParamDescrsGetDocumentationUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_param_descrs">param_descrs parameter</param>
+    /// <param name="s">symbol parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void ParamDescrsGetDocumentation(IntPtr c, IntPtr p, string s, IBufferWriter<byte> destination)
+    {
+        destination.Write(ParamDescrsGetDocumentationUtf8(c, p, s));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ParamDescrsGetDocumentationUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_param_descrs">param_descrs parameter</param>
+    /// <param name="s">symbol parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void ParamDescrsGetDocumentation(IntPtr c, IntPtr p, string s, Stream destination)
+    {
+        destination.Write(ParamDescrsGetDocumentationUtf8(c, p, s));
+    }
+
     /// <summary>
     ///  Retrieve documentation string corresponding to parameter name <c>s</c> .
     /// </summary>
@@ -141,4 +219,40 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert a parameter description set into a string. This function is mainly used for printing the contents of a parameter description set.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_param_descrs">param_descrs parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> ParamDescrsToStringUtf8(IntPtr c, IntPtr p)
+    {
+        var result = nativeLibrary.ParamDescrsToString(c, p);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ParamDescrsToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ParamDescrsToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_param_descrs">param_descrs parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void ParamDescrsToString(IntPtr c, IntPtr p, IBufferWriter<byte> destination)
+    {
+        destination.Write(ParamDescrsToStringUtf8(c, p));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ParamDescrsToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_param_descrs">param_descrs parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void ParamDescrsToString(IntPtr c, IntPtr p, Stream destination)
+    {
+        destination.Write(ParamDescrsToStringUtf8(c, p));
+    }
+
 }
@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -64,6 +65,22 @@ public sealed partial class Z3Library
         CheckError(c);
     }
 
+    /// <summary>
+    ///  Add a Boolean parameter <c>k</c> with value <c>v</c> to the parameter set <c>p</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_params">params parameter</param>
+    /// <param name="k">symbol parameter</param>
+    /// <param name="v" ctype="bool">bool parameter</param>
+    public void ParamsSetBool(IntPtr c, IntPtr p, ReadOnlySpan<byte> k, bool v)
+    {
+        using var kUtf8 = new NullTerminatedUtf8(k, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var kSymbol = nativeLibrary.MkStringSymbol(c, kUtf8.Span);
+        CheckError(c);
+        nativeLibrary.ParamsSetBool(c, p, kSymbol, v);
+        CheckError(c);
+    }
+
     /// <summary>
     ///  Add a Boolean parameter <c>k</c> with value <c>v</c> to the parameter set <c>p</c> .
     /// </summary>
@@ -93,6 +110,22 @@ public sealed partial class Z3Library
         CheckError(c);
     }
 
+    /// <summary>
+    ///  Add a unsigned parameter <c>k</c> with value <c>v</c> to the parameter set <c>p</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_params">params parameter</param>
+    /// <param name="k">symbol parameter</param>
+    /// <param name="v" ctype="unsigned">unsigned parameter</param>
+    public void ParamsSetUint(IntPtr c, IntPtr p, ReadOnlySpan<byte> k, uint v)
+    {
+        using var kUtf8 = new NullTerminatedUtf8(k, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var kSymbol = nativeLibrary.MkStringSymbol(c, kUtf8.Span);
+        CheckError(c);
+        nativeLibrary.ParamsSetUint(c, p, kSymbol, v);
+        CheckError(c);
+    }
+
     /// <summary>
     ///  Add a unsigned parameter <c>k</c> with value <c>v</c> to the parameter set <c>p</c> .
     /// </summary>
@@ -122,6 +155,22 @@ public sealed partial class Z3Library
         CheckError(c);
     }
 
+    /// <summary>
+    ///  Add a double parameter <c>k</c> with value <c>v</c> to the parameter set <c>p</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_params">params parameter</param>
+    /// <param name="k">symbol parameter</param>
+    /// <param name="v" ctype="double">double parameter</param>
+    public void ParamsSetDouble(IntPtr c, IntPtr p, ReadOnlySpan<byte> k, double v)
+    {
+        using var kUtf8 = new NullTerminatedUtf8(k, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var kSymbol = nativeLibrary.MkStringSymbol(c, kUtf8.Span);
+        CheckError(c);
+        nativeLibrary.ParamsSetDouble(c, p, kSymbol, v);
+        CheckError(c);
+    }
+
     /// <summary>
     ///  Add a double parameter <c>k</c> with value <c>v</c> to the parameter set <c>p</c> .
     /// </summary>
@@ -154,6 +203,25 @@ public sealed partial class Z3Library
         CheckError(c);
     }
 
+    /// <summary>
+    ///  Add a symbol parameter <c>k</c> with value <c>v</c> to the parameter set <c>p</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_params">params parameter</param>
+    /// <param name="k">symbol parameter</param>
+    /// <param name="v">symbol parameter</param>
+    public void ParamsSetSymbol(IntPtr c, IntPtr p, ReadOnlySpan<byte> k, ReadOnlySpan<byte> v)
+    {
+        using var kUtf8 = new NullTerminatedUtf8(k, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var kSymbol = nativeLibrary.MkStringSymbol(c, kUtf8.Span);
+        CheckError(c);
+        using var vUtf8 = new NullTerminatedUtf8(v, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var vSymbol = nativeLibrary.MkStringSymbol(c, vUtf8.Span);
+        CheckError(c);
+        nativeLibrary.ParamsSetSymbol(c, p, kSymbol, vSymbol);
+        CheckError(c);
+    }
+
     /// <summary>
     ///  Add a symbol parameter <c>k</c> with value <c>v</c> to the parameter set <c>p</c> .
     /// </summary>
@@ -181,6 +249,42 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert a parameter set into a string. This function is mainly used for printing the contents of a parameter set.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_params">params parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> ParamsToStringUtf8(IntPtr c, IntPtr p)
+    {
+        var result = nativeLibrary.ParamsToString(c, p);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ParamsToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ParamsToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_params">params parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void ParamsToString(IntPtr c, IntPtr p, IBufferWriter<byte> destination)
+    {
+        destination.Write(ParamsToStringUtf8(c, p));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ParamsToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_params">params parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void ParamsToString(IntPtr c, IntPtr p, Stream destination)
+    {
+        destination.Write(ParamsToStringUtf8(c, p));
+    }
+
     /// <summary>
     ///  Validate the parameter set <c>p</c> against the parameter description set <c>d</c> .
     /// </summary>
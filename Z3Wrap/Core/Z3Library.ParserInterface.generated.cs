@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -38,7 +39,55 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Similar to <see cref="ParseSmtlib2String"/> , but reads the benchmark from a file.
+    ///  Parse the given string using the SMT-LIB2 parser.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="str" ctype="Z3_string">string parameter</param>
+    /// <param name="numSorts" ctype="unsigned">unsigned parameter</param>
+    /// <param name="sortNames" ctype="Z3_symbol const[]">symbol parameter</param>
+    /// <param name="sorts" ctype="Z3_sort const[]">sort parameter</param>
+    /// <param name="numDecls" ctype="unsigned">unsigned parameter</param>
+    /// <param name="declNames" ctype="Z3_symbol const[]">symbol parameter</param>
+    /// <param name="decls" ctype="Z3_func_decl const[]">func_decl parameter</param>
+    /// <returns ctype="Z3_ast_vector">ast_vector value</returns>
+    /// <remarks>
+    /// It returns a formula comprising of the conjunction of assertions in the scope (up to push/pop) at the end of the string.
+    /// </remarks>
+    public IntPtr[] ParseSmtlib2String(IntPtr c, string str, uint numSorts, ReadOnlySpan<IntPtr> sortNames, ReadOnlySpan<IntPtr> sorts, uint numDecls, ReadOnlySpan<IntPtr> declNames, ReadOnlySpan<IntPtr> decls)
+    {
+        using var strAnsi = new AnsiStringPtr(str);
+        var result = nativeLibrary.ParseSmtlib2String(c, strAnsi, numSorts, sortNames, sorts, numDecls, declNames, decls);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ParseSmtlib2String));
+        return AstVectorToArray(c, result);
+    }
+
+    /// <summary>
+    ///  Parse the given string using the SMT-LIB2 parser.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="str" ctype="Z3_string">string parameter</param>
+    /// <param name="numSorts" ctype="unsigned">unsigned parameter</param>
+    /// <param name="sortNames" ctype="Z3_symbol const[]">symbol parameter</param>
+    /// <param name="sorts" ctype="Z3_sort const[]">sort parameter</param>
+    /// <param name="numDecls" ctype="unsigned">unsigned parameter</param>
+    /// <param name="declNames" ctype="Z3_symbol const[]">symbol parameter</param>
+    /// <param name="decls" ctype="Z3_func_decl const[]">func_decl parameter</param>
+    /// <returns ctype="Z3_ast_vector">ast_vector value</returns>
+    /// <remarks>
+    /// It returns a formula comprising of the conjunction of assertions in the scope (up to push/pop) at the end of the string.
+    /// </remarks>
+    public IntPtr[] ParseSmtlib2String(IntPtr c, ReadOnlySpan<byte> str, uint numSorts, ReadOnlySpan<IntPtr> sortNames, ReadOnlySpan<IntPtr> sorts, uint numDecls, ReadOnlySpan<IntPtr> declNames, ReadOnlySpan<IntPtr> decls)
+    {
+        using var strUtf8 = new NullTerminatedUtf8(str, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.ParseSmtlib2String(c, strUtf8.Span, numSorts, sortNames, sorts, numDecls, declNames, decls);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ParseSmtlib2String));
+        return AstVectorToArray(c, result);
+    }
+
+    /// <summary>
+    ///  Similar to <see cref="ParseSmtlib2String(IntPtr, string, uint, IntPtr[], IntPtr[], uint, IntPtr[], IntPtr[])"/> , but reads the benchmark from a file.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="fileName" ctype="Z3_string">string parameter</param>
@@ -58,6 +107,48 @@ public sealed partial class Z3Library
         return AstVectorToArray(c, result);
     }
 
+    /// <summary>
+    ///  Similar to <see cref="ParseSmtlib2String(IntPtr, string, uint, IntPtr[], IntPtr[], uint, IntPtr[], IntPtr[])"/> , but reads the benchmark from a file.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="fileName" ctype="Z3_string">string parameter</param>
+    /// <param name="numSorts" ctype="unsigned">unsigned parameter</param>
+    /// <param name="sortNames" ctype="Z3_symbol const[]">symbol parameter</param>
+    /// <param name="sorts" ctype="Z3_sort const[]">sort parameter</param>
+    /// <param name="numDecls" ctype="unsigned">unsigned parameter</param>
+    /// <param name="declNames" ctype="Z3_symbol const[]">symbol parameter</param>
+    /// <param name="decls" ctype="Z3_func_decl const[]">func_decl parameter</param>
+    /// <returns ctype="Z3_ast_vector">ast_vector value</returns>
+    public IntPtr[] ParseSmtlib2File(IntPtr c, string fileName, uint numSorts, ReadOnlySpan<IntPtr> sortNames, ReadOnlySpan<IntPtr> sorts, uint numDecls, ReadOnlySpan<IntPtr> declNames, ReadOnlySpan<IntPtr> decls)
+    {
+        using var fileNameAnsi = new AnsiStringPtr(fileName);
+        var result = nativeLibrary.ParseSmtlib2File(c, fileNameAnsi, numSorts, sortNames, sorts, numDecls, declNames, decls);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ParseSmtlib2File));
+        return AstVectorToArray(c, result);
+    }
+
+    /// <summary>
+    ///  Similar to <see cref="ParseSmtlib2String(IntPtr, string, uint, IntPtr[], IntPtr[], uint, IntPtr[], IntPtr[])"/> , but reads the benchmark from a file.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="fileName" ctype="Z3_string">string parameter</param>
+    /// <param name="numSorts" ctype="unsigned">unsigned parameter</param>
+    /// <param name="sortNames" ctype="Z3_symbol const[]">symbol parameter</param>
+    /// <param name="sorts" ctype="Z3_sort const[]">sort parameter</param>
+    /// <param name="numDecls" ctype="unsigned">unsigned parameter</param>
+    /// <param name="declNames" ctype="Z3_symbol const[]">symbol parameter</param>
+    /// <param name="decls" ctype="Z3_func_decl const[]">func_decl parameter</param>
+    /// <returns ctype="Z3_ast_vector">ast_vector value</returns>
+    public IntPtr[] ParseSmtlib2File(IntPtr c, ReadOnlySpan<byte> fileName, uint numSorts, ReadOnlySpan<IntPtr> sortNames, ReadOnlySpan<IntPtr> sorts, uint numDecls, ReadOnlySpan<IntPtr> declNames, ReadOnlySpan<IntPtr> decls)
+    {
+        using var fileNameUtf8 = new NullTerminatedUtf8(fileName, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.ParseSmtlib2File(c, fileNameUtf8.Span, numSorts, sortNames, sorts, numDecls, declNames, decls);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ParseSmtlib2File));
+        return AstVectorToArray(c, result);
+    }
+
     /// <summary>
     ///  Parse and evaluate and SMT-LIB2 command sequence. The state from a previous call is saved so the next evaluation builds on top of the previous call.
     /// </summary>
@@ -73,6 +164,58 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Parse and evaluate and SMT-LIB2 command sequence. The state from a previous call is saved so the next evaluation builds on top of the previous call.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="str" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_string">output generated from processing commands. </returns>
+    public string EvalSmtlib2String(IntPtr c, ReadOnlySpan<byte> str)
+    {
+        using var strUtf8 = new NullTerminatedUtf8(str, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.EvalSmtlib2String(c, strUtf8.Span);
+        CheckError(c);
+        result = CheckHandle(result, nameof(EvalSmtlib2String));
+        return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
+    }
+
+    /// <summary>
+    ///  Parse and evaluate and SMT-LIB2 command sequence. The state from a previous call is saved so the next evaluation builds on top of the previous call.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="str" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> EvalSmtlib2StringUtf8(IntPtr c, string str)
+    {
+        using var strAnsi = new AnsiStringPtr(str);
+        var result = nativeLibrary.EvalSmtlib2String(c, strAnsi);
+        CheckError(c);
+        result = CheckHandle(result, nameof(EvalSmtlib2String));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="EvalSmtlib2StringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="str" ctype="Z3_string">string parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void EvalSmtlib2String(IntPtr c, string str, IBufferWriter<byte> destination)
+    {
+        destination.Write(EvalSmtlib2StringUtf8(c, str));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="EvalSmtlib2StringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="str" ctype="Z3_string">string parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void EvalSmtlib2String(IntPtr c, string str, Stream destination)
+    {
+        destination.Write(EvalSmtlib2StringUtf8(c, str));
+    }
+
     /// <summary>
     ///  Create a parser context.
     /// </summary>
@@ -148,4 +291,20 @@ public sealed partial class Z3Library
         return AstVectorToArray(c, result);
     }
 
+    /// <summary>
+    ///  Parse a string of SMTLIB2 commands. Return assertions.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="pc" ctype="Z3_parser_context">parser_context parameter</param>
+    /// <param name="s" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_ast_vector">ast_vector value</returns>
+    public IntPtr[] ParserContextFromString(IntPtr c, IntPtr pc, ReadOnlySpan<byte> s)
+    {
+        using var sUtf8 = new NullTerminatedUtf8(s, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.ParserContextFromString(c, pc, sUtf8.Span);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ParserContextFromString));
+        return AstVectorToArray(c, result);
+    }
+
 }
@@ -72,6 +72,24 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkDistinct));
     }
 
+    /// <summary>
+    ///  Create an AST node representing <c>distinct(args[0], ..., args[num_args-1])</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// The <c>distinct</c> construct is used for declaring the arguments pairwise distinct. That is, <c>Forall 0 &lt;= i &lt; j &lt; num_args. not args[i] = args[j]</c> . All arguments must have the same sort.
+    /// The number of arguments of a distinct construct must be greater than one.
+    /// </remarks>
+    public IntPtr MkDistinct(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkDistinct(c, numArgs, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkDistinct));
+    }
+
     /// <summary>
     ///  Create an AST node representing <c>not(a)</c> .
     /// </summary>
@@ -175,6 +193,24 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkAnd));
     }
 
+    /// <summary>
+    ///  Create an AST node representing <c>args[0] and ... and args[num_args-1]</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// The array <c>args</c> must have <c>num_args</c> elements. All arguments must have Boolean sort.
+    /// The number of arguments must be greater than zero.
+    /// </remarks>
+    public IntPtr MkAnd(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkAnd(c, numArgs, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkAnd));
+    }
+
     /// <summary>
     ///  Create an AST node representing <c>args[0] or ... or args[num_args-1]</c> .
     /// </summary>
@@ -193,4 +229,22 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkOr));
     }
 
+    /// <summary>
+    ///  Create an AST node representing <c>args[0] or ... or args[num_args-1]</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// The array <c>args</c> must have <c>num_args</c> elements. All arguments must have Boolean sort.
+    /// The number of arguments must be greater than zero.
+    /// </remarks>
+    public IntPtr MkOr(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkOr(c, numArgs, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkOr));
+    }
+
 }
@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -161,6 +162,20 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkString));
     }
 
+    /// <summary>
+    ///  Create a string constant out of the string that is passed in The string may contain escape encoding for non-printable characters or characters outside of the basic printable ASCII range. For example, the escape encoding \u{0} represents the character 0 and the encoding \u{100} represents the character 256.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    public IntPtr MkString(IntPtr c, ReadOnlySpan<byte> s)
+    {
+        using var sUtf8 = new NullTerminatedUtf8(s, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.MkString(c, sUtf8.Span);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkString));
+    }
+
     /// <summary>
     ///  Create a string constant out of the string that is passed in It takes the length of the string as well to take into account 0 characters. The string is treated as if it is unescaped so a sequence of characters \u{0} is treated as 5 characters and not the character 0.
     /// </summary>
@@ -176,6 +191,21 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkLstring));
     }
 
+    /// <summary>
+    ///  Create a string constant out of the string that is passed in It takes the length of the string as well to take into account 0 characters. The string is treated as if it is unescaped so a sequence of characters \u{0} is treated as 5 characters and not the character 0.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="len" ctype="unsigned">unsigned parameter</param>
+    /// <param name="s" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    public IntPtr MkLstring(IntPtr c, uint len, ReadOnlySpan<byte> s)
+    {
+        using var sUtf8 = new NullTerminatedUtf8(s, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.MkLstring(c, len, sUtf8.Span);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkLstring));
+    }
+
     /// <summary>
     ///  Create a string constant out of the string that is passed in It takes the length of the string as well to take into account 0 characters. The string is unescaped.
     /// </summary>
@@ -220,6 +250,45 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Retrieve the string constant stored in <c>s</c> . Characters outside the basic printable ASCII range are escaped.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_ast">ast parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Precondition: Z3_is_string(c, s)
+    /// </remarks>
+    public ReadOnlySpan<byte> GetStringUtf8(IntPtr c, IntPtr s)
+    {
+        var result = nativeLibrary.GetString(c, s);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GetString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_ast">ast parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GetString(IntPtr c, IntPtr s, IBufferWriter<byte> destination)
+    {
+        destination.Write(GetStringUtf8(c, s));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_ast">ast parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GetString(IntPtr c, IntPtr s, Stream destination)
+    {
+        destination.Write(GetStringUtf8(c, s));
+    }
+
     /// <summary>
     ///  Retrieve the string constant stored in <c>s</c> . The string can contain escape sequences. Characters in the range 1 to 255 are literal. Characters in the range 0, and 256 above are escaped.
     /// </summary>
@@ -316,6 +385,23 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkSeqConcat));
     }
 
+    /// <summary>
+    ///  Concatenate sequences.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="n" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// Precondition: n &gt; 0
+    /// </remarks>
+    public IntPtr MkSeqConcat(IntPtr c, uint n, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkSeqConcat(c, n, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkSeqConcat));
+    }
+
     /// <summary>
     ///  Check if <c>prefix</c> is a prefix of <c>s</c> .
     /// </summary>
@@ -722,6 +808,23 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkReUnion));
     }
 
+    /// <summary>
+    ///  Create the union of the regular languages.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="n" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// Precondition: n &gt; 0
+    /// </remarks>
+    public IntPtr MkReUnion(IntPtr c, uint n, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkReUnion(c, n, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkReUnion));
+    }
+
     /// <summary>
     ///  Create the concatenation of the regular languages.
     /// </summary>
@@ -739,6 +842,23 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkReConcat));
     }
 
+    /// <summary>
+    ///  Create the concatenation of the regular languages.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="n" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// Precondition: n &gt; 0
+    /// </remarks>
+    public IntPtr MkReConcat(IntPtr c, uint n, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkReConcat(c, n, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkReConcat));
+    }
+
     /// <summary>
     ///  Create the range regular expression over two sequences of length 1.
     /// </summary>
@@ -812,6 +932,23 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkReIntersect));
     }
 
+    /// <summary>
+    ///  Create the intersection of the regular languages.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="n" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    /// <remarks>
+    /// Precondition: n &gt; 0
+    /// </remarks>
+    public IntPtr MkReIntersect(IntPtr c, uint n, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkReIntersect(c, n, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkReIntersect));
+    }
+
     /// <summary>
     ///  Create the complement of the regular language <c>re</c> .
     /// </summary>
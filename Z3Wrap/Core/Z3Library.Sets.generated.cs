@@ -100,6 +100,20 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkSetUnion));
     }
 
+    /// <summary>
+    ///  Take the union of a list of sets.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    public IntPtr MkSetUnion(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkSetUnion(c, numArgs, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkSetUnion));
+    }
+
     /// <summary>
     ///  Take the intersection of a list of sets.
     /// </summary>
@@ -114,6 +128,20 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkSetIntersect));
     }
 
+    /// <summary>
+    ///  Take the intersection of a list of sets.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="numArgs" ctype="unsigned">unsigned parameter</param>
+    /// <param name="args" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_ast">ast value</returns>
+    public IntPtr MkSetIntersect(IntPtr c, uint numArgs, ReadOnlySpan<IntPtr> args)
+    {
+        var result = nativeLibrary.MkSetIntersect(c, numArgs, args);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkSetIntersect));
+    }
+
     /// <summary>
     ///  Take the set difference between two sets.
     /// </summary>
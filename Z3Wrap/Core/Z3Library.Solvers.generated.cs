@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -23,7 +24,7 @@ public sealed partial class Z3Library
     /// User must use <see cref="SolverIncRef"/> and <see cref="SolverDecRef"/> to manage solver objects. Even if the context was created using MkContext instead of <see cref="MkContextRc"/> .
     /// </remarks>
     /// <seealso cref="MkSimpleSolver"/>
-    /// <seealso cref="MkSolverForLogic"/>
+    /// <seealso cref="MkSolverForLogic(IntPtr, string)"/>
     /// <seealso cref="MkSolverFromTactic"/>
     public IntPtr MkSolver(IntPtr c)
     {
@@ -42,7 +43,7 @@ public sealed partial class Z3Library
     /// User must use <see cref="SolverIncRef"/> and <see cref="SolverDecRef"/> to manage solver objects. Even if the context was created using MkContext instead of <see cref="MkContextRc"/> .
     /// </remarks>
     /// <seealso cref="MkSolver"/>
-    /// <seealso cref="MkSolverForLogic"/>
+    /// <seealso cref="MkSolverForLogic(IntPtr, string)"/>
     /// <seealso cref="MkSolverFromTactic"/>
     public IntPtr MkSimpleSolver(IntPtr c)
     {
@@ -73,6 +74,28 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkSolverForLogic));
     }
 
+    /// <summary>
+    ///  Create a new solver customized for the given logic. It behaves like <see cref="MkSolver"/> if the logic is unknown or unsupported.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="logic">symbol parameter</param>
+    /// <returns ctype="Z3_solver">solver value</returns>
+    /// <remarks>
+    /// User must use <see cref="SolverIncRef"/> and <see cref="SolverDecRef"/> to manage solver objects. Even if the context was created using MkContext instead of <see cref="MkContextRc"/> .
+    /// </remarks>
+    /// <seealso cref="MkSolver"/>
+    /// <seealso cref="MkSimpleSolver"/>
+    /// <seealso cref="MkSolverFromTactic"/>
+    public IntPtr MkSolverForLogic(IntPtr c, ReadOnlySpan<byte> logic)
+    {
+        using var logicUtf8 = new NullTerminatedUtf8(logic, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var logicSymbol = nativeLibrary.MkStringSymbol(c, logicUtf8.Span);
+        CheckError(c);
+        var result = nativeLibrary.MkSolverForLogic(c, logicSymbol);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkSolverForLogic));
+    }
+
     /// <summary>
     ///  Create a new solver customized for the given logic. It behaves like <see cref="MkSolver"/> if the logic is unknown or unsupported.
     /// </summary>
@@ -103,7 +126,7 @@ public sealed partial class Z3Library
     /// </remarks>
     /// <seealso cref="MkSolver"/>
     /// <seealso cref="MkSimpleSolver"/>
-    /// <seealso cref="MkSolverForLogic"/>
+    /// <seealso cref="MkSolverForLogic(IntPtr, string)"/>
     public IntPtr MkSolverFromTactic(IntPtr c, IntPtr t)
     {
         var result = nativeLibrary.MkSolverFromTactic(c, t);
@@ -156,13 +179,51 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return a string describing all solver available parameters.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <seealso cref="SolverGetParamDescrs"/>
+    /// <seealso cref="SolverSetParams"/>
+    public ReadOnlySpan<byte> SolverGetHelpUtf8(IntPtr c, IntPtr s)
+    {
+        var result = nativeLibrary.SolverGetHelp(c, s);
+        CheckError(c);
+        result = CheckHandle(result, nameof(SolverGetHelp));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SolverGetHelpUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void SolverGetHelp(IntPtr c, IntPtr s, IBufferWriter<byte> destination)
+    {
+        destination.Write(SolverGetHelpUtf8(c, s));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SolverGetHelpUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void SolverGetHelp(IntPtr c, IntPtr s, Stream destination)
+    {
+        destination.Write(SolverGetHelpUtf8(c, s));
+    }
+
     /// <summary>
     ///  Return the parameter description set for the given solver object.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
     /// <returns ctype="Z3_param_descrs">param_descrs value</returns>
-    /// <seealso cref="SolverGetHelp"/>
+    /// <seealso cref="SolverGetHelp(IntPtr, IntPtr)"/>
     /// <seealso cref="SolverSetParams"/>
     public IntPtr SolverGetParamDescrs(IntPtr c, IntPtr s)
     {
@@ -177,7 +238,7 @@ public sealed partial class Z3Library
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
     /// <param name="p" ctype="Z3_params">params parameter</param>
-    /// <seealso cref="SolverGetHelp"/>
+    /// <seealso cref="SolverGetHelp(IntPtr, IntPtr)"/>
     /// <seealso cref="SolverGetParamDescrs"/>
     public void SolverSetParams(IntPtr c, IntPtr s, IntPtr p)
     {
@@ -284,7 +345,7 @@ public sealed partial class Z3Library
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
     /// <param name="a" ctype="Z3_ast">ast parameter</param>
     /// <remarks>
-    /// The functions <see cref="SolverCheck"/> and <see cref="SolverCheckAssumptions"/> should be used to check whether the logical context is consistent or not.
+    /// The functions <see cref="SolverCheck"/> and <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> should be used to check whether the logical context is consistent or not.
     /// </remarks>
     /// <seealso cref="SolverAssertAndTrack"/>
     /// <seealso cref="SolverReset"/>
@@ -302,7 +363,7 @@ public sealed partial class Z3Library
     /// <param name="a" ctype="Z3_ast">ast parameter</param>
     /// <param name="p" ctype="Z3_ast">ast parameter</param>
     /// <remarks>
-    /// This API is an alternative to <see cref="SolverCheckAssumptions"/> for extracting unsat cores. Both APIs can be used in the same solver. The unsat core will contain a combination of the Boolean variables provided using Z3_solver_assert_and_track and the Boolean literals provided using <see cref="SolverCheckAssumptions"/> .
+    /// This API is an alternative to <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> for extracting unsat cores. Both APIs can be used in the same solver. The unsat core will contain a combination of the Boolean variables provided using Z3_solver_assert_and_track and the Boolean literals provided using <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> .
     /// Precondition: <c>a</c> must be a Boolean expression
     /// Precondition: <c>p</c> must be a Boolean constant (aka variable).
     /// </remarks>
@@ -320,8 +381,8 @@ public sealed partial class Z3Library
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
     /// <param name="fileName" ctype="Z3_string">string parameter</param>
-    /// <seealso cref="SolverFromString"/>
-    /// <seealso cref="SolverToString"/>
+    /// <seealso cref="SolverFromString(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="SolverToString(IntPtr, IntPtr)"/>
     public void SolverFromFile(IntPtr c, IntPtr s, string fileName)
     {
         using var fileNameAnsi = new AnsiStringPtr(fileName);
@@ -329,14 +390,29 @@ public sealed partial class Z3Library
         CheckError(c);
     }
 
+    /// <summary>
+    ///  load solver assertions from a file.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="fileName" ctype="Z3_string">string parameter</param>
+    /// <seealso cref="SolverFromString(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="SolverToString(IntPtr, IntPtr)"/>
+    public void SolverFromFile(IntPtr c, IntPtr s, ReadOnlySpan<byte> fileName)
+    {
+        using var fileNameUtf8 = new NullTerminatedUtf8(fileName, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        nativeLibrary.SolverFromFile(c, s, fileNameUtf8.Span);
+        CheckError(c);
+    }
+
     /// <summary>
     ///  load solver assertions from a string.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
     /// <param name="str" ctype="Z3_string">string parameter</param>
-    /// <seealso cref="SolverFromFile"/>
-    /// <seealso cref="SolverToString"/>
+    /// <seealso cref="SolverFromFile(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="SolverToString(IntPtr, IntPtr)"/>
     public void SolverFromString(IntPtr c, IntPtr s, string str)
     {
         using var strAnsi = new AnsiStringPtr(str);
@@ -344,6 +420,21 @@ public sealed partial class Z3Library
         CheckError(c);
     }
 
+    /// <summary>
+    ///  load solver assertions from a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="str" ctype="Z3_string">string parameter</param>
+    /// <seealso cref="SolverFromFile(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="SolverToString(IntPtr, IntPtr)"/>
+    public void SolverFromString(IntPtr c, IntPtr s, ReadOnlySpan<byte> str)
+    {
+        using var strUtf8 = new NullTerminatedUtf8(str, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        nativeLibrary.SolverFromString(c, s, strUtf8.Span);
+        CheckError(c);
+    }
+
     /// <summary>
     ///  Return the set of asserted formulas on the solver.
     /// </summary>
@@ -557,7 +648,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  register a callback when a new expression with a registered function is used by the solver The registered function appears at the top level and is created using <see cref="SolverPropagateDeclare"/> .
+    ///  register a callback when a new expression with a registered function is used by the solver The registered function appears at the top level and is created using <see cref="SolverPropagateDeclare(IntPtr, string, uint, out IntPtr, IntPtr)"/> .
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
@@ -629,6 +720,26 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(SolverPropagateDeclare));
     }
 
+    /// <summary>SolverPropagateDeclare</summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name">symbol parameter</param>
+    /// <param name="n" ctype="unsigned">unsigned parameter</param>
+    /// <param name="domain" ctype="Z3_sort*">sort parameter</param>
+    /// <param name="range" ctype="Z3_sort">sort parameter</param>
+    /// <returns ctype="Z3_func_decl">func_decl value</returns>
+    /// <remarks>
+    /// Create uninterpreted function declaration for the user propagator. When expressions using the function are created by the solver invoke a callback to <see cref="SolverPropagateCreated"/> with arguments  context and callback solve  declared_expr: expression using function that was used as the top-level symbol  declared_id: a unique identifier (unique within the current scope) to track the expression.
+    /// </remarks>
+    public IntPtr SolverPropagateDeclare(IntPtr c, ReadOnlySpan<byte> name, uint n, out IntPtr domain, IntPtr range)
+    {
+        using var nameUtf8 = new NullTerminatedUtf8(name, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var nameSymbol = nativeLibrary.MkStringSymbol(c, nameUtf8.Span);
+        CheckError(c);
+        var result = nativeLibrary.SolverPropagateDeclare(c, nameSymbol, n, out domain, range);
+        CheckError(c);
+        return CheckHandle(result, nameof(SolverPropagateDeclare));
+    }
+
     /// <summary>SolverPropagateDeclare</summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="name" ctype="Z3_symbol">symbol parameter</param>
@@ -692,6 +803,28 @@ public sealed partial class Z3Library
         return result;
     }
 
+    /// <summary>
+    ///  propagate a consequence based on fixed values and equalities. A client may invoke it during the <c>propagate_fixed</c> , <c>propagate_eq</c> , <c>propagate_diseq</c> , and <c>propagate_final</c> callbacks. The callback adds a propagation consequence based on the fixed values passed <c>ids</c> and equalities <c>eqs</c> based on parameters <c>lhs</c> , <c>rhs</c> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context </param>
+    /// <param name="cb" ctype="Z3_solver_callback"> - solver callback </param>
+    /// <param name="numFixed" ctype="unsigned"> - number of fixed terms used as premise to propagation </param>
+    /// <param name="fixed" ctype="Z3_ast const*"> - array of length <c>num_ids</c> containing terms that are fixed in the current scope </param>
+    /// <param name="numEqs" ctype="unsigned"> - number of equalities used as premise to propagation </param>
+    /// <param name="eqLhs" ctype="Z3_ast const*"> - left side of equalities </param>
+    /// <param name="eqRhs" ctype="Z3_ast const*"> - right side of equalities </param>
+    /// <param name="conseq" ctype="Z3_ast"> - consequence to propagate. It is typically an atomic formula, but it can be an arbitrary formula. </param>
+    /// <returns ctype="bool">bool value</returns>
+    /// <remarks>
+    /// The solver might discard the propagation in case it is true in the current state. The function returns false in this case; otw. the function returns true. At least one propagation in the final callback has to return true in order to prevent the solver from finishing.
+    /// </remarks>
+    public bool SolverPropagateConsequence(IntPtr c, IntPtr cb, uint numFixed, IntPtr[] @fixed, uint numEqs, ReadOnlySpan<IntPtr> eqLhs, out IntPtr eqRhs, IntPtr conseq)
+    {
+        var result = nativeLibrary.SolverPropagateConsequence(c, cb, numFixed, @fixed, numEqs, eqLhs, out eqRhs, conseq);
+        CheckError(c);
+        return result;
+    }
+
     /// <summary>
     ///  provide an initialization hint to the solver. The initialization hint is used to calibrate an initial value of the expression that represents a variable. If the variable is Boolean, the initial phase is set according to <c>value</c> . If the variable is an integer or real, the initial Simplex tableau is recalibrated to attempt to follow the value assignment.
     /// </summary>
@@ -714,7 +847,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// The function <see cref="SolverGetModel"/> retrieves a model if the assertions is satisfiable (i.e., the result is <c>Z3_L_TRUE</c> ) and model construction is enabled. Note that if the call returns <c>Z3_L_UNDEF</c> , Z3 does not ensure that calls to <see cref="SolverGetModel"/> succeed and any models produced in this case are not guaranteed to satisfy the assertions. The function <see cref="SolverGetProof"/> retrieves a proof if proof generation was enabled when the context was created, and the assertions are unsatisfiable (i.e., the result is <c>Z3_L_FALSE</c> ).
     /// </remarks>
-    /// <seealso cref="SolverCheckAssumptions"/>
+    /// <seealso cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/>
     public Lbool SolverCheck(IntPtr c, IntPtr s)
     {
         var result = nativeLibrary.SolverCheck(c, s);
@@ -741,6 +874,25 @@ public sealed partial class Z3Library
         return (Lbool)result;
     }
 
+    /// <summary>
+    ///  Check whether the assertions in the given solver and optional assumptions are consistent or not.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="numAssumptions" ctype="unsigned">unsigned parameter</param>
+    /// <param name="assumptions" ctype="Z3_ast const[]">ast parameter</param>
+    /// <returns ctype="Z3_lbool">lbool value</returns>
+    /// <remarks>
+    /// The function <see cref="SolverGetUnsatCore"/> retrieves the subset of the assumptions used in the unsatisfiability proof produced by Z3.
+    /// </remarks>
+    /// <seealso cref="SolverCheck"/>
+    public Lbool SolverCheckAssumptions(IntPtr c, IntPtr s, uint numAssumptions, ReadOnlySpan<IntPtr> assumptions)
+    {
+        var result = nativeLibrary.SolverCheckAssumptions(c, s, numAssumptions, assumptions);
+        CheckError(c);
+        return (Lbool)result;
+    }
+
     /// <summary>
     ///  Retrieve congruence class representatives for terms.
     /// </summary>
@@ -760,6 +912,25 @@ public sealed partial class Z3Library
         return (Lbool)result;
     }
 
+    /// <summary>
+    ///  Retrieve congruence class representatives for terms.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="numTerms" ctype="unsigned">unsigned parameter</param>
+    /// <param name="terms" ctype="Z3_ast const[]">ast parameter</param>
+    /// <param name="classIds" ctype="unsigned[]">unsigned parameter</param>
+    /// <returns ctype="Z3_lbool">lbool value</returns>
+    /// <remarks>
+    /// The function can be used for relying on Z3 to identify equal terms under the current set of assumptions. The array of terms and array of class identifiers should have the same length. The class identifiers are numerals that are assigned to the same value for their corresponding terms if the current context forces the terms to be equal. You cannot deduce that terms corresponding to different numerals must be all different, (especially when using non-convex theories). All implied equalities are returned by this call. This means that two terms map to the same class identifier if and only if the current context implies that they are equal. A side-effect of the function is a satisfiability check on the assertions on the solver that is passed in. The function return <c>Z3_L_FALSE</c> if the current assertions are not satisfiable.
+    /// </remarks>
+    public Lbool GetImpliedEqualities(IntPtr c, IntPtr s, uint numTerms, ReadOnlySpan<IntPtr> terms, uint[] classIds)
+    {
+        var result = nativeLibrary.GetImpliedEqualities(c, s, numTerms, terms, classIds);
+        CheckError(c);
+        return (Lbool)result;
+    }
+
     /// <summary>
     ///  retrieve consequences from solver that determine values of the supplied function symbols.
     /// </summary>
@@ -796,7 +967,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Retrieve the model for the last <see cref="SolverCheck"/> or <see cref="SolverCheckAssumptions"/> .
+    ///  Retrieve the model for the last <see cref="SolverCheck"/> or <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> .
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
@@ -812,7 +983,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Retrieve the proof for the last <see cref="SolverCheck"/> or <see cref="SolverCheckAssumptions"/> .
+    ///  Retrieve the proof for the last <see cref="SolverCheck"/> or <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> .
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
@@ -828,7 +999,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Retrieve the unsat core for the last <see cref="SolverCheckAssumptions"/> The unsat core is a subset of the assumptions <c>a</c> .
+    ///  Retrieve the unsat core for the last <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> The unsat core is a subset of the assumptions <c>a</c> .
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
@@ -845,7 +1016,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Return a brief justification for an "unknown" result (i.e., <c>Z3_L_UNDEF</c> ) for the commands <see cref="SolverCheck"/> and <see cref="SolverCheckAssumptions"/> .
+    ///  Return a brief justification for an "unknown" result (i.e., <c>Z3_L_UNDEF</c> ) for the commands <see cref="SolverCheck"/> and <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> .
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
@@ -858,6 +1029,42 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return a brief justification for an "unknown" result (i.e., <c>Z3_L_UNDEF</c> ) for the commands <see cref="SolverCheck"/> and <see cref="SolverCheckAssumptions(IntPtr, IntPtr, uint, IntPtr[])"/> .
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> SolverGetReasonUnknownUtf8(IntPtr c, IntPtr s)
+    {
+        var result = nativeLibrary.SolverGetReasonUnknown(c, s);
+        CheckError(c);
+        result = CheckHandle(result, nameof(SolverGetReasonUnknown));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SolverGetReasonUnknownUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void SolverGetReasonUnknown(IntPtr c, IntPtr s, IBufferWriter<byte> destination)
+    {
+        destination.Write(SolverGetReasonUnknownUtf8(c, s));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SolverGetReasonUnknownUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void SolverGetReasonUnknown(IntPtr c, IntPtr s, Stream destination)
+    {
+        destination.Write(SolverGetReasonUnknownUtf8(c, s));
+    }
+
     /// <summary>
     ///  Return statistics for the given solver.
     /// </summary>
@@ -880,8 +1087,8 @@ public sealed partial class Z3Library
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_solver">solver parameter</param>
     /// <returns ctype="Z3_string">string value</returns>
-    /// <seealso cref="SolverFromFile"/>
-    /// <seealso cref="SolverFromString"/>
+    /// <seealso cref="SolverFromFile(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="SolverFromString(IntPtr, IntPtr, string)"/>
     public string SolverToString(IntPtr c, IntPtr s)
     {
         var result = nativeLibrary.SolverToString(c, s);
@@ -890,6 +1097,44 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert a solver into a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <seealso cref="SolverFromFile(IntPtr, IntPtr, string)"/>
+    /// <seealso cref="SolverFromString(IntPtr, IntPtr, string)"/>
+    public ReadOnlySpan<byte> SolverToStringUtf8(IntPtr c, IntPtr s)
+    {
+        var result = nativeLibrary.SolverToString(c, s);
+        CheckError(c);
+        result = CheckHandle(result, nameof(SolverToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SolverToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void SolverToString(IntPtr c, IntPtr s, IBufferWriter<byte> destination)
+    {
+        destination.Write(SolverToStringUtf8(c, s));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SolverToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void SolverToString(IntPtr c, IntPtr s, Stream destination)
+    {
+        destination.Write(SolverToStringUtf8(c, s));
+    }
+
     /// <summary>
     ///  Convert a solver into a DIMACS formatted string.
     /// </summary>
@@ -905,4 +1150,43 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert a solver into a DIMACS formatted string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="includeNames" ctype="bool">bool parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> SolverToDimacsStringUtf8(IntPtr c, IntPtr s, bool includeNames)
+    {
+        var result = nativeLibrary.SolverToDimacsString(c, s, includeNames);
+        CheckError(c);
+        result = CheckHandle(result, nameof(SolverToDimacsString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SolverToDimacsStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="includeNames" ctype="bool">bool parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void SolverToDimacsString(IntPtr c, IntPtr s, bool includeNames, IBufferWriter<byte> destination)
+    {
+        destination.Write(SolverToDimacsStringUtf8(c, s, includeNames));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SolverToDimacsStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_solver">solver parameter</param>
+    /// <param name="includeNames" ctype="bool">bool parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void SolverToDimacsString(IntPtr c, IntPtr s, bool includeNames, Stream destination)
+    {
+        destination.Write(SolverToDimacsStringUtf8(c, s, includeNames));
+    }
+
 }
@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -27,6 +28,42 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert a statistics into a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_stats">stats parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> StatsToStringUtf8(IntPtr c, IntPtr s)
+    {
+        var result = nativeLibrary.StatsToString(c, s);
+        CheckError(c);
+        result = CheckHandle(result, nameof(StatsToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="StatsToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_stats">stats parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void StatsToString(IntPtr c, IntPtr s, IBufferWriter<byte> destination)
+    {
+        destination.Write(StatsToStringUtf8(c, s));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="StatsToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_stats">stats parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void StatsToString(IntPtr c, IntPtr s, Stream destination)
+    {
+        destination.Write(StatsToStringUtf8(c, s));
+    }
+
     /// <summary>
     ///  Increment the reference counter of the given statistics object.
     /// </summary>
@@ -78,6 +115,48 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return the key (a string) for a particular statistical data.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_stats">stats parameter</param>
+    /// <param name="idx" ctype="unsigned">unsigned parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Precondition: idx &lt; Z3_stats_size(c, s)
+    /// </remarks>
+    public ReadOnlySpan<byte> StatsGetKeyUtf8(IntPtr c, IntPtr s, uint idx)
+    {
+        var result = nativeLibrary.StatsGetKey(c, s, idx);
+        CheckError(c);
+        result = CheckHandle(result, nameof(StatsGetKey));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="StatsGetKeyUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_stats">stats parameter</param>
+    /// <param name="idx" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void StatsGetKey(IntPtr c, IntPtr s, uint idx, IBufferWriter<byte> destination)
+    {
+        destination.Write(StatsGetKeyUtf8(c, s, idx));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="StatsGetKeyUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_stats">stats parameter</param>
+    /// <param name="idx" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void StatsGetKey(IntPtr c, IntPtr s, uint idx, Stream destination)
+    {
+        destination.Write(StatsGetKeyUtf8(c, s, idx));
+    }
+
     /// <summary>
     ///  Return <c>true</c> if the given statistical data is a unsigned integer.
     /// </summary>
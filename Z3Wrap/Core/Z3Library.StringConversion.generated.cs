@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -21,9 +22,9 @@ public sealed partial class Z3Library
     /// <remarks>
     /// The default mode for pretty printing AST nodes is to produce SMT-LIB style output where common subexpressions are printed at each occurrence. The mode is called <c>Z3_PRINT_SMTLIB_FULL</c> . To print shared common subexpressions only once, use the <c>Z3_PRINT_LOW_LEVEL</c> mode. To print in way that conforms to SMT-LIB standards and uses let expressions to share common sub-expressions use <c>Z3_PRINT_SMTLIB2_COMPLIANT</c> .
     /// </remarks>
-    /// <seealso cref="AstToString"/>
-    /// <seealso cref="PatternToString"/>
-    /// <seealso cref="FuncDeclToString"/>
+    /// <seealso cref="AstToString(IntPtr, IntPtr)"/>
+    /// <seealso cref="PatternToString(IntPtr, IntPtr)"/>
+    /// <seealso cref="FuncDeclToString(IntPtr, IntPtr)"/>
     public void SetAstPrintMode(IntPtr c, AstPrintMode mode)
     {
         nativeLibrary.SetAstPrintMode(c, (NativeZ3Library.AstPrintMode)mode);
@@ -39,8 +40,8 @@ public sealed partial class Z3Library
     /// <remarks>
     /// Warning: The result buffer is statically allocated by Z3. It will be automatically deallocated when <see cref="DelContext"/> is invoked. So, the buffer is invalidated in the next call to <c>Z3_ast_to_string</c> .
     /// </remarks>
-    /// <seealso cref="PatternToString"/>
-    /// <seealso cref="SortToString"/>
+    /// <seealso cref="PatternToString(IntPtr, IntPtr)"/>
+    /// <seealso cref="SortToString(IntPtr, IntPtr)"/>
     public string AstToString(IntPtr c, IntPtr a)
     {
         var result = nativeLibrary.AstToString(c, a);
@@ -49,6 +50,47 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert the given AST node into a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Warning: The result buffer is statically allocated by Z3. It will be automatically deallocated when <see cref="DelContext"/> is invoked. So, the buffer is invalidated in the next call to <c>Z3_ast_to_string</c> .
+    /// </remarks>
+    /// <seealso cref="PatternToString(IntPtr, IntPtr)"/>
+    /// <seealso cref="SortToString(IntPtr, IntPtr)"/>
+    public ReadOnlySpan<byte> AstToStringUtf8(IntPtr c, IntPtr a)
+    {
+        var result = nativeLibrary.AstToString(c, a);
+        CheckError(c);
+        result = CheckHandle(result, nameof(AstToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="AstToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void AstToString(IntPtr c, IntPtr a, IBufferWriter<byte> destination)
+    {
+        destination.Write(AstToStringUtf8(c, a));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="AstToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="a" ctype="Z3_ast">ast parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void AstToString(IntPtr c, IntPtr a, Stream destination)
+    {
+        destination.Write(AstToStringUtf8(c, a));
+    }
+
     /// <summary>PatternToString</summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="p" ctype="Z3_pattern">pattern parameter</param>
@@ -61,6 +103,40 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>PatternToString</summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_pattern">pattern parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> PatternToStringUtf8(IntPtr c, IntPtr p)
+    {
+        var result = nativeLibrary.PatternToString(c, p);
+        CheckError(c);
+        result = CheckHandle(result, nameof(PatternToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="PatternToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_pattern">pattern parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void PatternToString(IntPtr c, IntPtr p, IBufferWriter<byte> destination)
+    {
+        destination.Write(PatternToStringUtf8(c, p));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="PatternToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="p" ctype="Z3_pattern">pattern parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void PatternToString(IntPtr c, IntPtr p, Stream destination)
+    {
+        destination.Write(PatternToStringUtf8(c, p));
+    }
+
     /// <summary>SortToString</summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="s" ctype="Z3_sort">sort parameter</param>
@@ -73,6 +149,40 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>SortToString</summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_sort">sort parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> SortToStringUtf8(IntPtr c, IntPtr s)
+    {
+        var result = nativeLibrary.SortToString(c, s);
+        CheckError(c);
+        result = CheckHandle(result, nameof(SortToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SortToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_sort">sort parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void SortToString(IntPtr c, IntPtr s, IBufferWriter<byte> destination)
+    {
+        destination.Write(SortToStringUtf8(c, s));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SortToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_sort">sort parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void SortToString(IntPtr c, IntPtr s, Stream destination)
+    {
+        destination.Write(SortToStringUtf8(c, s));
+    }
+
     /// <summary>FuncDeclToString</summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="d" ctype="Z3_func_decl">func_decl parameter</param>
@@ -85,6 +195,40 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>FuncDeclToString</summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="d" ctype="Z3_func_decl">func_decl parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> FuncDeclToStringUtf8(IntPtr c, IntPtr d)
+    {
+        var result = nativeLibrary.FuncDeclToString(c, d);
+        CheckError(c);
+        result = CheckHandle(result, nameof(FuncDeclToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="FuncDeclToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="d" ctype="Z3_func_decl">func_decl parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void FuncDeclToString(IntPtr c, IntPtr d, IBufferWriter<byte> destination)
+    {
+        destination.Write(FuncDeclToStringUtf8(c, d));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="FuncDeclToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="d" ctype="Z3_func_decl">func_decl parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void FuncDeclToString(IntPtr c, IntPtr d, Stream destination)
+    {
+        destination.Write(FuncDeclToStringUtf8(c, d));
+    }
+
     /// <summary>
     ///  Convert the given model into a string.
     /// </summary>
@@ -102,6 +246,45 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert the given model into a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="m" ctype="Z3_model">model parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Warning: The result buffer is statically allocated by Z3. It will be automatically deallocated when <see cref="DelContext"/> is invoked. So, the buffer is invalidated in the next call to <c>Z3_model_to_string</c> .
+    /// </remarks>
+    public ReadOnlySpan<byte> ModelToStringUtf8(IntPtr c, IntPtr m)
+    {
+        var result = nativeLibrary.ModelToString(c, m);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ModelToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ModelToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="m" ctype="Z3_model">model parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void ModelToString(IntPtr c, IntPtr m, IBufferWriter<byte> destination)
+    {
+        destination.Write(ModelToStringUtf8(c, m));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ModelToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="m" ctype="Z3_model">model parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void ModelToString(IntPtr c, IntPtr m, Stream destination)
+    {
+        destination.Write(ModelToStringUtf8(c, m));
+    }
+
     /// <summary>
     ///  Convert the given benchmark into SMT-LIB formatted string.
     /// </summary>
@@ -129,4 +312,119 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert the given benchmark into SMT-LIB formatted string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context. </param>
+    /// <param name="name" ctype="Z3_string"> - name of benchmark. The argument is optional. </param>
+    /// <param name="logic" ctype="Z3_string"> - the benchmark logic. </param>
+    /// <param name="status" ctype="Z3_string"> - the status string (sat, unsat, or unknown) </param>
+    /// <param name="attributes" ctype="Z3_string"> - other attributes, such as source, difficulty or category. </param>
+    /// <param name="numAssumptions" ctype="unsigned"> - number of assumptions. </param>
+    /// <param name="assumptions" ctype="Z3_ast const[]"> - auxiliary assumptions. </param>
+    /// <param name="formula" ctype="Z3_ast"> - formula to be checked for consistency in conjunction with assumptions. </param>
+    /// <returns ctype="Z3_string">string value</returns>
+    /// <remarks>
+    /// Warning: The result buffer is statically allocated by Z3. It will be automatically deallocated when <see cref="DelContext"/> is invoked. So, the buffer is invalidated in the next call to <c>Z3_benchmark_to_smtlib_string</c> .
+    /// </remarks>
+    public string BenchmarkToSmtlibString(IntPtr c, string name, string logic, string status, string attributes, uint numAssumptions, ReadOnlySpan<IntPtr> assumptions, IntPtr formula)
+    {
+        using var nameAnsi = new AnsiStringPtr(name);
+        using var logicAnsi = new AnsiStringPtr(logic);
+        using var statusAnsi = new AnsiStringPtr(status);
+        using var attributesAnsi = new AnsiStringPtr(attributes);
+        var result = nativeLibrary.BenchmarkToSmtlibString(c, nameAnsi, logicAnsi, statusAnsi, attributesAnsi, numAssumptions, assumptions, formula);
+        CheckError(c);
+        result = CheckHandle(result, nameof(BenchmarkToSmtlibString));
+        return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
+    }
+
+    /// <summary>
+    ///  Convert the given benchmark into SMT-LIB formatted string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context. </param>
+    /// <param name="name" ctype="Z3_string"> - name of benchmark. The argument is optional. </param>
+    /// <param name="logic" ctype="Z3_string"> - the benchmark logic. </param>
+    /// <param name="status" ctype="Z3_string"> - the status string (sat, unsat, or unknown) </param>
+    /// <param name="attributes" ctype="Z3_string"> - other attributes, such as source, difficulty or category. </param>
+    /// <param name="numAssumptions" ctype="unsigned"> - number of assumptions. </param>
+    /// <param name="assumptions" ctype="Z3_ast const[]"> - auxiliary assumptions. </param>
+    /// <param name="formula" ctype="Z3_ast"> - formula to be checked for consistency in conjunction with assumptions. </param>
+    /// <returns ctype="Z3_string">string value</returns>
+    /// <remarks>
+    /// Warning: The result buffer is statically allocated by Z3. It will be automatically deallocated when <see cref="DelContext"/> is invoked. So, the buffer is invalidated in the next call to <c>Z3_benchmark_to_smtlib_string</c> .
+    /// </remarks>
+    public string BenchmarkToSmtlibString(IntPtr c, ReadOnlySpan<byte> name, ReadOnlySpan<byte> logic, ReadOnlySpan<byte> status, ReadOnlySpan<byte> attributes, uint numAssumptions, ReadOnlySpan<IntPtr> assumptions, IntPtr formula)
+    {
+        using var nameUtf8 = new NullTerminatedUtf8(name, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        using var logicUtf8 = new NullTerminatedUtf8(logic, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        using var statusUtf8 = new NullTerminatedUtf8(status, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        using var attributesUtf8 = new NullTerminatedUtf8(attributes, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.BenchmarkToSmtlibString(c, nameUtf8.Span, logicUtf8.Span, statusUtf8.Span, attributesUtf8.Span, numAssumptions, assumptions, formula);
+        CheckError(c);
+        result = CheckHandle(result, nameof(BenchmarkToSmtlibString));
+        return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
+    }
+
+    /// <summary>
+    ///  Convert the given benchmark into SMT-LIB formatted string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context. </param>
+    /// <param name="name" ctype="Z3_string"> - name of benchmark. The argument is optional. </param>
+    /// <param name="logic" ctype="Z3_string"> - the benchmark logic. </param>
+    /// <param name="status" ctype="Z3_string"> - the status string (sat, unsat, or unknown) </param>
+    /// <param name="attributes" ctype="Z3_string"> - other attributes, such as source, difficulty or category. </param>
+    /// <param name="numAssumptions" ctype="unsigned"> - number of assumptions. </param>
+    /// <param name="assumptions" ctype="Z3_ast const[]"> - auxiliary assumptions. </param>
+    /// <param name="formula" ctype="Z3_ast"> - formula to be checked for consistency in conjunction with assumptions. </param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Warning: The result buffer is statically allocated by Z3. It will be automatically deallocated when <see cref="DelContext"/> is invoked. So, the buffer is invalidated in the next call to <c>Z3_benchmark_to_smtlib_string</c> .
+    /// </remarks>
+    public ReadOnlySpan<byte> BenchmarkToSmtlibStringUtf8(IntPtr c, string name, string logic, string status, string attributes, uint numAssumptions, IntPtr[] assumptions, IntPtr formula)
+    {
+        using var nameAnsi = new AnsiStringPtr(name);
+        using var logicAnsi = new AnsiStringPtr(logic);
+        using var statusAnsi = new AnsiStringPtr(status);
+        using var attributesAnsi = new AnsiStringPtr(attributes);
+        var result = nativeLibrary.BenchmarkToSmtlibString(c, nameAnsi, logicAnsi, statusAnsi, attributesAnsi, numAssumptions, assumptions, formula);
+        CheckError(c);
+        result = CheckHandle(result, nameof(BenchmarkToSmtlibString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="BenchmarkToSmtlibStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context. </param>
+    /// <param name="name" ctype="Z3_string"> - name of benchmark. The argument is optional. </param>
+    /// <param name="logic" ctype="Z3_string"> - the benchmark logic. </param>
+    /// <param name="status" ctype="Z3_string"> - the status string (sat, unsat, or unknown) </param>
+    /// <param name="attributes" ctype="Z3_string"> - other attributes, such as source, difficulty or category. </param>
+    /// <param name="numAssumptions" ctype="unsigned"> - number of assumptions. </param>
+    /// <param name="assumptions" ctype="Z3_ast const[]"> - auxiliary assumptions. </param>
+    /// <param name="formula" ctype="Z3_ast"> - formula to be checked for consistency in conjunction with assumptions. </param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void BenchmarkToSmtlibString(IntPtr c, string name, string logic, string status, string attributes, uint numAssumptions, IntPtr[] assumptions, IntPtr formula, IBufferWriter<byte> destination)
+    {
+        destination.Write(BenchmarkToSmtlibStringUtf8(c, name, logic, status, attributes, numAssumptions, assumptions, formula));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="BenchmarkToSmtlibStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> - context. </param>
+    /// <param name="name" ctype="Z3_string"> - name of benchmark. The argument is optional. </param>
+    /// <param name="logic" ctype="Z3_string"> - the benchmark logic. </param>
+    /// <param name="status" ctype="Z3_string"> - the status string (sat, unsat, or unknown) </param>
+    /// <param name="attributes" ctype="Z3_string"> - other attributes, such as source, difficulty or category. </param>
+    /// <param name="numAssumptions" ctype="unsigned"> - number of assumptions. </param>
+    /// <param name="assumptions" ctype="Z3_ast const[]"> - auxiliary assumptions. </param>
+    /// <param name="formula" ctype="Z3_ast"> - formula to be checked for consistency in conjunction with assumptions. </param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void BenchmarkToSmtlibString(IntPtr c, string name, string logic, string status, string attributes, uint numAssumptions, IntPtr[] assumptions, IntPtr formula, Stream destination)
+    {
+        destination.Write(BenchmarkToSmtlibStringUtf8(c, name, logic, status, attributes, numAssumptions, assumptions, formula));
+    }
+
 }
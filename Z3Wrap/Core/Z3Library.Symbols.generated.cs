@@ -23,7 +23,7 @@ public sealed partial class Z3Library
     /// Symbols are used to name several term and type constructors. NB. Not all integers can be passed to this function. The legal range of unsigned integers is 0 to 2^30-1.
     /// </remarks>
     /// <seealso cref="GetSymbolInt"/>
-    /// <seealso cref="MkStringSymbol"/>
+    /// <seealso cref="MkStringSymbol(IntPtr, string)"/>
     public IntPtr MkIntSymbol(IntPtr c, int i)
     {
         var result = nativeLibrary.MkIntSymbol(c, i);
@@ -40,7 +40,7 @@ public sealed partial class Z3Library
     /// <remarks>
     /// Symbols are used to name several term and type constructors.
     /// </remarks>
-    /// <seealso cref="GetSymbolString"/>
+    /// <seealso cref="GetSymbolString(IntPtr, IntPtr)"/>
     /// <seealso cref="MkIntSymbol"/>
     public IntPtr MkStringSymbol(IntPtr c, string s)
     {
@@ -50,4 +50,23 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkStringSymbol));
     }
 
+    /// <summary>
+    ///  Create a Z3 symbol using a C string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="s" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_symbol">symbol value</returns>
+    /// <remarks>
+    /// Symbols are used to name several term and type constructors.
+    /// </remarks>
+    /// <seealso cref="GetSymbolString(IntPtr, IntPtr)"/>
+    /// <seealso cref="MkIntSymbol"/>
+    public IntPtr MkStringSymbol(IntPtr c, ReadOnlySpan<byte> s)
+    {
+        using var sUtf8 = new NullTerminatedUtf8(s, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.MkStringSymbol(c, sUtf8.Span);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkStringSymbol));
+    }
+
 }
@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -14,7 +15,7 @@ namespace Spaceorc.Z3Wrap.Core;
 public sealed partial class Z3Library
 {
     /// <summary>
-    ///  Return a tactic associated with the given name. The complete list of tactics may be obtained using the procedures <see cref="GetNumTactics"/> and <see cref="GetTacticName"/> . It may also be obtained using the command <c>(help-tactic)</c> in the SMT 2.0 front-end.
+    ///  Return a tactic associated with the given name. The complete list of tactics may be obtained using the procedures <see cref="GetNumTactics"/> and <see cref="GetTacticName(IntPtr, uint)"/> . It may also be obtained using the command <c>(help-tactic)</c> in the SMT 2.0 front-end.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="name" ctype="Z3_string">string parameter</param>
@@ -30,6 +31,23 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkTactic));
     }
 
+    /// <summary>
+    ///  Return a tactic associated with the given name. The complete list of tactics may be obtained using the procedures <see cref="GetNumTactics"/> and <see cref="GetTacticName(IntPtr, uint)"/> . It may also be obtained using the command <c>(help-tactic)</c> in the SMT 2.0 front-end.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_tactic">tactic value</returns>
+    /// <remarks>
+    /// Tactics are the basic building block for creating custom solvers for specific problem domains.
+    /// </remarks>
+    public IntPtr MkTactic(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        using var nameUtf8 = new NullTerminatedUtf8(name, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.MkTactic(c, nameUtf8.Span);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkTactic));
+    }
+
     /// <summary>
     ///  Increment the reference counter of the given tactic.
     /// </summary>
@@ -51,7 +69,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Return a probe associated with the given name. The complete list of probes may be obtained using the procedures <see cref="GetNumProbes"/> and <see cref="GetProbeName"/> . It may also be obtained using the command <c>(help-tactic)</c> in the SMT 2.0 front-end.
+    ///  Return a probe associated with the given name. The complete list of probes may be obtained using the procedures <see cref="GetNumProbes"/> and <see cref="GetProbeName(IntPtr, uint)"/> . It may also be obtained using the command <c>(help-tactic)</c> in the SMT 2.0 front-end.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="name" ctype="Z3_string">string parameter</param>
@@ -67,6 +85,23 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkProbe));
     }
 
+    /// <summary>
+    ///  Return a probe associated with the given name. The complete list of probes may be obtained using the procedures <see cref="GetNumProbes"/> and <see cref="GetProbeName(IntPtr, uint)"/> . It may also be obtained using the command <c>(help-tactic)</c> in the SMT 2.0 front-end.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_probe">probe value</returns>
+    /// <remarks>
+    /// Probes are used to inspect a goal (aka problem) and collect information that may be used to decide which solver and/or preprocessing step will be used.
+    /// </remarks>
+    public IntPtr MkProbe(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        using var nameUtf8 = new NullTerminatedUtf8(name, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.MkProbe(c, nameUtf8.Span);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkProbe));
+    }
+
     /// <summary>
     ///  Increment the reference counter of the given probe.
     /// </summary>
@@ -129,6 +164,20 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(TacticParOr));
     }
 
+    /// <summary>
+    ///  Return a tactic that applies the given tactics in parallel.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="num" ctype="unsigned">unsigned parameter</param>
+    /// <param name="ts" ctype="Z3_tactic const[]">tactic parameter</param>
+    /// <returns ctype="Z3_tactic">tactic value</returns>
+    public IntPtr TacticParOr(IntPtr c, uint num, ReadOnlySpan<IntPtr> ts)
+    {
+        var result = nativeLibrary.TacticParOr(c, num, ts);
+        CheckError(c);
+        return CheckHandle(result, nameof(TacticParOr));
+    }
+
     /// <summary>
     ///  Return a tactic that applies <c>t1</c> to a given goal and then <c>t2</c> to every subgoal produced by <c>t1</c> . The subgoals are processed in parallel.
     /// </summary>
@@ -264,7 +313,7 @@ public sealed partial class Z3Library
     }
 
     /// <summary>
-    ///  Return a simplifier associated with the given name. The complete list of simplifiers may be obtained using the procedures <see cref="GetNumSimplifiers"/> and <see cref="GetSimplifierName"/> . It may also be obtained using the command <c>(help-simplifier)</c> in the SMT 2.0 front-end.
+    ///  Return a simplifier associated with the given name. The complete list of simplifiers may be obtained using the procedures <see cref="GetNumSimplifiers"/> and <see cref="GetSimplifierName(IntPtr, uint)"/> . It may also be obtained using the command <c>(help-simplifier)</c> in the SMT 2.0 front-end.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <param name="name" ctype="Z3_string">string parameter</param>
@@ -280,6 +329,23 @@ public sealed partial class Z3Library
         return CheckHandle(result, nameof(MkSimplifier));
     }
 
+    /// <summary>
+    ///  Return a simplifier associated with the given name. The complete list of simplifiers may be obtained using the procedures <see cref="GetNumSimplifiers"/> and <see cref="GetSimplifierName(IntPtr, uint)"/> . It may also be obtained using the command <c>(help-simplifier)</c> in the SMT 2.0 front-end.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_simplifier">simplifier value</returns>
+    /// <remarks>
+    /// Simplifiers are the basic building block for creating custom solvers for specific problem domains.
+    /// </remarks>
+    public IntPtr MkSimplifier(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        using var nameUtf8 = new NullTerminatedUtf8(name, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.MkSimplifier(c, nameUtf8.Span);
+        CheckError(c);
+        return CheckHandle(result, nameof(MkSimplifier));
+    }
+
     /// <summary>
     ///  Increment the reference counter of the given simplifier.
     /// </summary>
@@ -347,7 +413,7 @@ public sealed partial class Z3Library
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <returns ctype="unsigned">unsigned value</returns>
-    /// <seealso cref="GetSimplifierName"/>
+    /// <seealso cref="GetSimplifierName(IntPtr, uint)"/>
     public uint GetNumSimplifiers(IntPtr c)
     {
         var result = nativeLibrary.GetNumSimplifiers(c);
@@ -373,6 +439,46 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return the name of the idx simplifier.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="i" ctype="unsigned">unsigned parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Precondition: i &lt; Z3_get_num_simplifiers(c)
+    /// </remarks>
+    /// <seealso cref="GetNumSimplifiers"/>
+    public ReadOnlySpan<byte> GetSimplifierNameUtf8(IntPtr c, uint i)
+    {
+        var result = nativeLibrary.GetSimplifierName(c, i);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GetSimplifierName));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetSimplifierNameUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="i" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GetSimplifierName(IntPtr c, uint i, IBufferWriter<byte> destination)
+    {
+        destination.Write(GetSimplifierNameUtf8(c, i));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetSimplifierNameUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="i" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GetSimplifierName(IntPtr c, uint i, Stream destination)
+    {
+        destination.Write(GetSimplifierNameUtf8(c, i));
+    }
+
     /// <summary>
     ///  Return a string containing a description of parameters accepted by the given simplifier.
     /// </summary>
@@ -387,6 +493,42 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return a string containing a description of parameters accepted by the given simplifier.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_simplifier">simplifier parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> SimplifierGetHelpUtf8(IntPtr c, IntPtr t)
+    {
+        var result = nativeLibrary.SimplifierGetHelp(c, t);
+        CheckError(c);
+        result = CheckHandle(result, nameof(SimplifierGetHelp));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SimplifierGetHelpUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_simplifier">simplifier parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void SimplifierGetHelp(IntPtr c, IntPtr t, IBufferWriter<byte> destination)
+    {
+        destination.Write(SimplifierGetHelpUtf8(c, t));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SimplifierGetHelpUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_simplifier">simplifier parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void SimplifierGetHelp(IntPtr c, IntPtr t, Stream destination)
+    {
+        destination.Write(SimplifierGetHelpUtf8(c, t));
+    }
+
     /// <summary>
     ///  Return the parameter description set for the given simplifier object.
     /// </summary>
@@ -415,6 +557,58 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return a string containing a description of the simplifier with the given name.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_string">string value</returns>
+    public string SimplifierGetDescr(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        using var nameUtf8 = new NullTerminatedUtf8(name, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.SimplifierGetDescr(c, nameUtf8.Span);
+        CheckError(c);
+        result = CheckHandle(result, nameof(SimplifierGetDescr));
+        return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
+    }
+
+    /// <summary>
+    ///  Return a string containing a description of the simplifier with the given name.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> SimplifierGetDescrUtf8(IntPtr c, string name)
+    {
+        using var nameAnsi = new AnsiStringPtr(name);
+        var result = nativeLibrary.SimplifierGetDescr(c, nameAnsi);
+        CheckError(c);
+        result = CheckHandle(result, nameof(SimplifierGetDescr));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SimplifierGetDescrUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void SimplifierGetDescr(IntPtr c, string name, IBufferWriter<byte> destination)
+    {
+        destination.Write(SimplifierGetDescrUtf8(c, name));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="SimplifierGetDescrUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void SimplifierGetDescr(IntPtr c, string name, Stream destination)
+    {
+        destination.Write(SimplifierGetDescrUtf8(c, name));
+    }
+
     /// <summary>
     ///  Return a probe that always evaluates to val.
     /// </summary>
@@ -568,7 +762,7 @@ public sealed partial class Z3Library
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <returns ctype="unsigned">unsigned value</returns>
-    /// <seealso cref="GetTacticName"/>
+    /// <seealso cref="GetTacticName(IntPtr, uint)"/>
     public uint GetNumTactics(IntPtr c)
     {
         var result = nativeLibrary.GetNumTactics(c);
@@ -594,12 +788,52 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return the name of the idx tactic.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="i" ctype="unsigned">unsigned parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Precondition: i &lt; Z3_get_num_tactics(c)
+    /// </remarks>
+    /// <seealso cref="GetNumTactics"/>
+    public ReadOnlySpan<byte> GetTacticNameUtf8(IntPtr c, uint i)
+    {
+        var result = nativeLibrary.GetTacticName(c, i);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GetTacticName));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetTacticNameUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="i" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GetTacticName(IntPtr c, uint i, IBufferWriter<byte> destination)
+    {
+        destination.Write(GetTacticNameUtf8(c, i));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetTacticNameUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="i" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GetTacticName(IntPtr c, uint i, Stream destination)
+    {
+        destination.Write(GetTacticNameUtf8(c, i));
+    }
+
     /// <summary>
     ///  Return the number of builtin probes available in Z3.
     /// </summary>
     /// <param name="c" ctype="Z3_context">context parameter</param>
     /// <returns ctype="unsigned">unsigned value</returns>
-    /// <seealso cref="GetProbeName"/>
+    /// <seealso cref="GetProbeName(IntPtr, uint)"/>
     public uint GetNumProbes(IntPtr c)
     {
         var result = nativeLibrary.GetNumProbes(c);
@@ -625,6 +859,46 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return the name of the <c>i</c> probe.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="i" ctype="unsigned">unsigned parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// Precondition: i &lt; Z3_get_num_probes(c)
+    /// </remarks>
+    /// <seealso cref="GetNumProbes"/>
+    public ReadOnlySpan<byte> GetProbeNameUtf8(IntPtr c, uint i)
+    {
+        var result = nativeLibrary.GetProbeName(c, i);
+        CheckError(c);
+        result = CheckHandle(result, nameof(GetProbeName));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetProbeNameUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="i" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void GetProbeName(IntPtr c, uint i, IBufferWriter<byte> destination)
+    {
+        destination.Write(GetProbeNameUtf8(c, i));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="GetProbeNameUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="i" ctype="unsigned">unsigned parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void GetProbeName(IntPtr c, uint i, Stream destination)
+    {
+        destination.Write(GetProbeNameUtf8(c, i));
+    }
+
     /// <summary>
     ///  Return a string containing a description of parameters accepted by the given tactic.
     /// </summary>
@@ -639,6 +913,42 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return a string containing a description of parameters accepted by the given tactic.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_tactic">tactic parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> TacticGetHelpUtf8(IntPtr c, IntPtr t)
+    {
+        var result = nativeLibrary.TacticGetHelp(c, t);
+        CheckError(c);
+        result = CheckHandle(result, nameof(TacticGetHelp));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="TacticGetHelpUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_tactic">tactic parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void TacticGetHelp(IntPtr c, IntPtr t, IBufferWriter<byte> destination)
+    {
+        destination.Write(TacticGetHelpUtf8(c, t));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="TacticGetHelpUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_tactic">tactic parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void TacticGetHelp(IntPtr c, IntPtr t, Stream destination)
+    {
+        destination.Write(TacticGetHelpUtf8(c, t));
+    }
+
     /// <summary>
     ///  Return the parameter description set for the given tactic object.
     /// </summary>
@@ -667,6 +977,58 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return a string containing a description of the tactic with the given name.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_string">string value</returns>
+    public string TacticGetDescr(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        using var nameUtf8 = new NullTerminatedUtf8(name, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.TacticGetDescr(c, nameUtf8.Span);
+        CheckError(c);
+        result = CheckHandle(result, nameof(TacticGetDescr));
+        return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
+    }
+
+    /// <summary>
+    ///  Return a string containing a description of the tactic with the given name.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> TacticGetDescrUtf8(IntPtr c, string name)
+    {
+        using var nameAnsi = new AnsiStringPtr(name);
+        var result = nativeLibrary.TacticGetDescr(c, nameAnsi);
+        CheckError(c);
+        result = CheckHandle(result, nameof(TacticGetDescr));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="TacticGetDescrUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void TacticGetDescr(IntPtr c, string name, IBufferWriter<byte> destination)
+    {
+        destination.Write(TacticGetDescrUtf8(c, name));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="TacticGetDescrUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void TacticGetDescr(IntPtr c, string name, Stream destination)
+    {
+        destination.Write(TacticGetDescrUtf8(c, name));
+    }
+
     /// <summary>
     ///  Return a string containing a description of the probe with the given name.
     /// </summary>
@@ -682,6 +1044,58 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return a string containing a description of the probe with the given name.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_string">string value</returns>
+    public string ProbeGetDescr(IntPtr c, ReadOnlySpan<byte> name)
+    {
+        using var nameUtf8 = new NullTerminatedUtf8(name, stackalloc byte[NullTerminatedUtf8.StackCapacity]);
+        var result = nativeLibrary.ProbeGetDescr(c, nameUtf8.Span);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ProbeGetDescr));
+        return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
+    }
+
+    /// <summary>
+    ///  Return a string containing a description of the probe with the given name.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> ProbeGetDescrUtf8(IntPtr c, string name)
+    {
+        using var nameAnsi = new AnsiStringPtr(name);
+        var result = nativeLibrary.ProbeGetDescr(c, nameAnsi);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ProbeGetDescr));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ProbeGetDescrUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void ProbeGetDescr(IntPtr c, string name, IBufferWriter<byte> destination)
+    {
+        destination.Write(ProbeGetDescrUtf8(c, name));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ProbeGetDescrUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="name" ctype="Z3_string">string parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void ProbeGetDescr(IntPtr c, string name, Stream destination)
+    {
+        destination.Write(ProbeGetDescrUtf8(c, name));
+    }
+
     /// <summary>
     ///  Execute the probe over the goal. The probe always produce a double value. "Boolean" probes return 0.0 for false, and a value different from 0.0 for true.
     /// </summary>
@@ -761,6 +1175,42 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Convert the <c>Z3_apply_result</c> object returned by <see cref="TacticApply"/> into a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="r" ctype="Z3_apply_result">apply_result parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> ApplyResultToStringUtf8(IntPtr c, IntPtr r)
+    {
+        var result = nativeLibrary.ApplyResultToString(c, r);
+        CheckError(c);
+        result = CheckHandle(result, nameof(ApplyResultToString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ApplyResultToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="r" ctype="Z3_apply_result">apply_result parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void ApplyResultToString(IntPtr c, IntPtr r, IBufferWriter<byte> destination)
+    {
+        destination.Write(ApplyResultToStringUtf8(c, r));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="ApplyResultToStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="r" ctype="Z3_apply_result">apply_result parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void ApplyResultToString(IntPtr c, IntPtr r, Stream destination)
+    {
+        destination.Write(ApplyResultToStringUtf8(c, r));
+    }
+
     /// <summary>
     ///  Return the number of subgoals in the <c>Z3_apply_result</c> object returned by <see cref="TacticApply"/> .
     /// </summary>
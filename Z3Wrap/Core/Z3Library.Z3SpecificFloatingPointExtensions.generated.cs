@@ -6,6 +6,7 @@
 
 #nullable enable
 
+using System.Buffers;
 using System.Runtime.InteropServices;
 using Spaceorc.Z3Wrap.Core.Interop;
 
@@ -214,6 +215,42 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>
+    ///  Return the significand value of a floating-point numeral as a string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> logical context </param>
+    /// <param name="t" ctype="Z3_ast"> a floating-point numeral </param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    public ReadOnlySpan<byte> FpaGetNumeralSignificandStringUtf8(IntPtr c, IntPtr t)
+    {
+        var result = nativeLibrary.FpaGetNumeralSignificandString(c, t);
+        CheckError(c);
+        result = CheckHandle(result, nameof(FpaGetNumeralSignificandString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="FpaGetNumeralSignificandStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> logical context </param>
+    /// <param name="t" ctype="Z3_ast"> a floating-point numeral </param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void FpaGetNumeralSignificandString(IntPtr c, IntPtr t, IBufferWriter<byte> destination)
+    {
+        destination.Write(FpaGetNumeralSignificandStringUtf8(c, t));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="FpaGetNumeralSignificandStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context"> logical context </param>
+    /// <param name="t" ctype="Z3_ast"> a floating-point numeral </param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void FpaGetNumeralSignificandString(IntPtr c, IntPtr t, Stream destination)
+    {
+        destination.Write(FpaGetNumeralSignificandStringUtf8(c, t));
+    }
+
     /// <summary>
     ///  Return the significand value of a floating-point numeral as a uint64.
     /// </summary>
@@ -258,6 +295,57 @@ public sealed partial class Z3Library
         return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException("Failed to marshal string from native code.");
     }
 
+    /// <summary>FpaGetNumeralExponentString</summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_ast">ast parameter</param>
+    /// <param name="biased" ctype="bool">bool parameter</param>
+    /// <returns ctype="Z3_string">UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 and is only valid until the next call that returns a string on the same context.</returns>
+    /// <remarks>
+    /// <code>
+    /// \brief Return the exponent value of a floating-point numeral as a string.
+    /// 
+    /// \param c logical context
+    /// \param t a floating-point numeral
+    /// \param biased flag to indicate whether the result is in biased representation
+    /// \returns true if \c t corresponds to a floating point numeral, otherwise invokes exception handler or returns false
+    /// 
+    /// Remarks: This function extracts the exponent in `t`, without normalization.
+    /// NaN is an invalid argument.
+    /// 
+    /// </code>
+    /// </remarks>
+    public ReadOnlySpan<byte> FpaGetNumeralExponentStringUtf8(IntPtr c, IntPtr t, bool biased)
+    {
+        var result = nativeLibrary.FpaGetNumeralExponentString(c, t, biased);
+        CheckError(c);
+        result = CheckHandle(result, nameof(FpaGetNumeralExponentString));
+        return NativeUtf8Span(result);
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="FpaGetNumeralExponentStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_ast">ast parameter</param>
+    /// <param name="biased" ctype="bool">bool parameter</param>
+    /// <param name="destination">Buffer writer receiving the UTF-8 bytes of the result.</param>
+    public void FpaGetNumeralExponentString(IntPtr c, IntPtr t, bool biased, IBufferWriter<byte> destination)
+    {
+        destination.Write(FpaGetNumeralExponentStringUtf8(c, t, biased));
+    }
+
+    /// <summary>
+    ///  Writes the result of <see cref="FpaGetNumeralExponentStringUtf8"/> to a destination without creating a managed string.
+    /// </summary>
+    /// <param name="c" ctype="Z3_context">context parameter</param>
+    /// <param name="t" ctype="Z3_ast">ast parameter</param>
+    /// <param name="biased" ctype="bool">bool parameter</param>
+    /// <param name="destination">Stream receiving the UTF-8 bytes of the result.</param>
+    public void FpaGetNumeralExponentString(IntPtr c, IntPtr t, bool biased, Stream destination)
+    {
+        destination.Write(FpaGetNumeralExponentStringUtf8(c, t, biased));
+    }
+
     /// <summary>
     ///  Return the exponent value of a floating-point numeral as a signed 64-bit integer.
     /// </summary>
@@ -150,7 +150,7 @@ public sealed partial class Z3Library : IDisposable
     /// <remarks>
     ///     This is the recommended method for creating Z3 contexts in Z3 4.x.
     ///     After creation, the configuration cannot be changed, though some parameters
-    ///     can be updated using <see cref="UpdateParamValue" />.
+    ///     can be updated using <see cref="UpdateParamValue(IntPtr, string, string)" />.
     /// </remarks>
     public IntPtr MkContextRc(IntPtr cfg)
     {
@@ -173,6 +173,56 @@ public sealed partial class Z3Library : IDisposable
         // No error check needed for deletion
     }
 
+    // Memory Management
+
+    /// <summary>
+    ///     Gets Z3's estimate of the native memory currently allocated by the library, across all contexts.
+    /// </summary>
+    /// <returns>Estimated allocation size in bytes.</returns>
+    /// <remarks>
+    ///     Cheap enough to sample periodically; see <see cref="Z3MemoryGovernor" />.
+    /// </remarks>
+    public ulong GetEstimatedAllocSize()
+    {
+        return nativeLibrary.GetEstimatedAllocSize();
+    }
+
+    // Call Profiling
+
+    /// <summary>
+    ///     Gets a value indicating whether native call profiling is enabled for this process.
+    /// </summary>
+    /// <remarks>
+    ///     Enable it by setting the <c>Spaceorc.Z3Wrap.EnableNativeCallProfiling</c> <see cref="AppContext" /> switch
+    ///     (for example via <c>runtimeconfig.json</c> or <see cref="AppContext.SetSwitch" />) before the first Z3 call.
+    ///     When disabled, native calls carry no profiling overhead.
+    /// </remarks>
+    public static bool IsCallProfilingEnabled => NativeCallProfiler.IsEnabled;
+
+    /// <summary>
+    ///     Gets a snapshot of the hottest native Z3 functions, ordered by total time spent in native code.
+    /// </summary>
+    /// <param name="top">Maximum number of functions to return.</param>
+    /// <returns>Per-function call counts and latencies; empty when profiling is disabled.</returns>
+    /// <remarks>
+    ///     The profile is process-wide and covers all loaded libraries. The same measurements are published as
+    ///     <c>z3.native.calls</c> and <c>z3.native.duration</c> instruments of the <c>Spaceorc.Z3Wrap</c> meter,
+    ///     tagged with <c>z3.function</c>.
+    /// </remarks>
+    public static IReadOnlyList<Z3CallProfileEntry> GetCallProfile(int top = int.MaxValue)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegative(top);
+        return NativeCallProfiler.Snapshot(top);
+    }
+
+    /// <summary>
+    ///     Clears all recorded native call statistics.
+    /// </summary>
+    public static void ResetCallProfile()
+    {
+        NativeCallProfiler.Reset();
+    }
+
     // Private Helper Methods
 
     private static IntPtr CheckHandle(IntPtr handle, string methodName)
@@ -201,6 +251,12 @@ public sealed partial class Z3Library : IDisposable
         Debug.WriteLine($"Z3 Error: {errorCode}: {message}");
     }
 
+    private static unsafe ReadOnlySpan<byte> NativeUtf8Span(IntPtr str)
+    {
+        // Z3 owns the buffer and reuses it on the next string-returning call
+        return MemoryMarshal.CreateReadOnlySpanFromNullTerminated((byte*)str);
+    }
+
     private IntPtr[] AstVectorToArray(IntPtr ctx, IntPtr vector)
     {
         var size = nativeLibrary.AstVectorSize(ctx, vector);
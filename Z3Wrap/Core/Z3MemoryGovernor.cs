@@ -0,0 +1,170 @@
+using System.Diagnostics.Metrics;
+using Spaceorc.Z3Wrap.Core.Interop;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Watches Z3's estimated native allocation and enforces a process-wide memory budget.
+/// </summary>
+/// <remarks>
+/// <para>
+/// The governor samples <see cref="Z3Library.GetEstimatedAllocSize"/> on a timer, reports the sampled size to the
+/// garbage collector via <see cref="GC.AddMemoryPressure"/>. The sample of the governor installed as
+/// <see cref="Z3.MemoryGovernor"/> is published as the <c>z3.native.memory</c> gauge of the <c>Spaceorc.Z3Wrap</c>
+/// meter.
+/// </para>
+/// <para>
+/// Install it with <see cref="Z3.MemoryGovernor"/>. While the budget is exceeded, creating a
+/// <see cref="Z3Context"/> throws a <see cref="Z3Exception"/> with <see cref="Z3Library.ErrorCode.Z3_MEMOUT_FAIL"/>,
+/// and every sample interrupts running checks in all governed contexts, which then return
+/// <see cref="Z3Status.Unknown"/>.
+/// </para>
+/// </remarks>
+public sealed class Z3MemoryGovernor : IDisposable
+{
+    private static readonly ObservableGauge<long> memoryGauge = Z3Metrics.Meter.CreateObservableGauge(
+        "z3.native.memory",
+        ObserveInstalledGovernor,
+        unit: "By",
+        description: "Estimated native memory allocated by Z3"
+    );
+
+    private readonly Z3Library library;
+    private readonly Dictionary<IntPtr, Z3Library> contexts = [];
+    private readonly Timer timer;
+    private long estimatedAllocSize;
+    private long reportedPressure;
+    private bool disposed;
+
+    /// <summary>
+    /// Initializes a new memory governor and starts sampling.
+    /// </summary>
+    /// <param name="library">The Z3 library to sample.</param>
+    /// <param name="budgetBytes">Maximum estimated native allocation in bytes.</param>
+    /// <param name="samplingInterval">Time between samples. If null, samples once per second.
+    ///     Use <see cref="Timeout.InfiniteTimeSpan"/> to sample only on context creation and <see cref="Sample"/>.</param>
+    public Z3MemoryGovernor(Z3Library library, long budgetBytes, TimeSpan? samplingInterval = null)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(budgetBytes);
+
+        this.library = library;
+        BudgetBytes = budgetBytes;
+
+        // Force the type initializer so the gauge exists once any governor does
+        _ = memoryGauge;
+
+        var interval = samplingInterval ?? TimeSpan.FromSeconds(1);
+        timer = new Timer(_ => SampleOnTimer(), null, interval, interval);
+    }
+
+    /// <summary>
+    /// Gets the memory budget in bytes.
+    /// </summary>
+    public long BudgetBytes { get; }
+
+    /// <summary>
+    /// Gets the estimated native allocation in bytes as of the last sample.
+    /// </summary>
+    public long EstimatedAllocSize => Interlocked.Read(ref estimatedAllocSize);
+
+    /// <summary>
+    /// Gets whether the last sample exceeded the budget.
+    /// </summary>
+    public bool IsOverBudget => EstimatedAllocSize > BudgetBytes;
+
+    /// <summary>
+    /// Samples the estimated native allocation now, updates memory pressure and enforces the budget.
+    /// </summary>
+    /// <returns>The estimated native allocation in bytes.</returns>
+    public long Sample()
+    {
+        lock (contexts)
+        {
+            if (disposed)
+                return EstimatedAllocSize;
+
+            var size = (long)Math.Min(library.GetEstimatedAllocSize(), long.MaxValue);
+            Interlocked.Exchange(ref estimatedAllocSize, size);
+            UpdateMemoryPressure(size);
+
+            if (size > BudgetBytes)
+            {
+                foreach (var (contextHandle, contextLibrary) in contexts)
+                    contextLibrary.Interrupt(contextHandle);
+            }
+
+            return size;
+        }
+    }
+
+    /// <summary>
+    /// Stops sampling and removes the memory pressure reported so far.
+    /// </summary>
+    public void Dispose()
+    {
+        lock (contexts)
+        {
+            if (disposed)
+                return;
+
+            disposed = true;
+            timer.Dispose();
+            UpdateMemoryPressure(0);
+            contexts.Clear();
+        }
+    }
+
+    internal void ThrowIfOverBudget()
+    {
+        var size = Sample();
+        if (size > BudgetBytes)
+            throw new Z3Exception(
+                Z3Library.ErrorCode.Z3_MEMOUT_FAIL,
+                $"Native memory budget exceeded: {size} bytes allocated, budget is {BudgetBytes} bytes"
+            );
+    }
+
+    internal void Register(IntPtr contextHandle, Z3Library contextLibrary)
+    {
+        lock (contexts)
+        {
+            if (!disposed)
+                contexts[contextHandle] = contextLibrary;
+        }
+    }
+
+    internal void Unregister(IntPtr contextHandle)
+    {
+        lock (contexts)
+        {
+            contexts.Remove(contextHandle);
+        }
+    }
+
+    private static IEnumerable<Measurement<long>> ObserveInstalledGovernor() =>
+        Z3.MemoryGovernor is { } governor ? [new Measurement<long>(governor.EstimatedAllocSize)] : [];
+
+    private void SampleOnTimer()
+    {
+        // An exception escaping a timer callback terminates the process
+        try
+        {
+            Sample();
+        }
+        catch (Exception ex)
+        {
+            Z3EventSource.Log.MemorySampleFailed(ex.ToString());
+        }
+    }
+
+    private void UpdateMemoryPressure(long size)
+    {
+        var delta = size - reportedPressure;
+        if (delta > 0)
+            GC.AddMemoryPressure(delta);
+        else if (delta < 0)
+            GC.RemoveMemoryPressure(-delta);
+
+        reportedPressure = size;
+    }
+}
@@ -0,0 +1,124 @@
+using Spaceorc.Z3Wrap.Expressions.Arrays;
+using Spaceorc.Z3Wrap.Expressions.Common;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+public sealed partial class Z3Model
+{
+    /// <summary>
+    /// Gets the explicitly assigned entries and the default value of an array expression in this model.
+    /// </summary>
+    /// <typeparam name="TIndex">Array index type.</typeparam>
+    /// <typeparam name="TValue">Array element type.</typeparam>
+    /// <param name="expr">The array expression.</param>
+    /// <returns>Named tuple with the Entries (one per distinct index, in no particular order) and the Default value.</returns>
+    /// <remarks>
+    /// The value is read in one pass, either from the model's store chain over a constant array or from the entries
+    /// and else value of the function interpretation behind an <c>as-array</c> value.
+    /// </remarks>
+    /// <exception cref="InvalidOperationException">Thrown if the array value is neither of those forms.</exception>
+    public (IReadOnlyList<(TIndex Index, TValue Value)> Entries, TValue Default) GetArrayValues<TIndex, TValue>(
+        ArrayExpr<TIndex, TValue> expr
+    )
+        where TIndex : Z3Expr, IExprType<TIndex>
+        where TValue : Z3Expr, IExprType<TValue>
+    {
+        ThrowIfInvalidated();
+
+        var library = context.Library;
+        if (!library.ModelEval(context.Handle, modelHandle, expr.Handle, true, out var value))
+            throw new InvalidOperationException("Failed to evaluate expression in model");
+
+        library.IncRef(context.Handle, value);
+        try
+        {
+            return library.IsAsArray(context.Handle, value)
+                ? ReadFuncInterpEntries<TIndex, TValue>(library.GetAsArrayFuncDecl(context.Handle, value))
+                : ReadStoreEntries<TIndex, TValue>(value, expr);
+        }
+        finally
+        {
+            library.DecRef(context.Handle, value);
+        }
+    }
+
+    private (IReadOnlyList<(TIndex Index, TValue Value)> Entries, TValue Default) ReadStoreEntries<TIndex, TValue>(
+        IntPtr value,
+        Z3Expr expr
+    )
+        where TIndex : Z3Expr, IExprType<TIndex>
+        where TValue : Z3Expr, IExprType<TValue>
+    {
+        var library = context.Library;
+        var entries = new List<(TIndex Index, TValue Value)>();
+        var seen = new HashSet<IntPtr>();
+
+        // Inner stores are referenced by the evaluated value, which the caller keeps alive
+        var current = value;
+        while (library.IsApp(context.Handle, current))
+        {
+            var kind = library.GetDeclKind(context.Handle, library.GetAppDecl(context.Handle, current));
+            if (kind == Z3Library.DeclKind.Z3_OP_CONST_ARRAY)
+                return (entries, Z3Expr.Create<TValue>(context, library.GetAppArg(context.Handle, current, 0)));
+
+            if (kind != Z3Library.DeclKind.Z3_OP_STORE)
+                break;
+
+            // The outermost store of an index is the one that holds
+            var index = library.GetAppArg(context.Handle, current, 1);
+            if (seen.Add(index))
+            {
+                entries.Add(
+                    (
+                        Z3Expr.Create<TIndex>(context, index),
+                        Z3Expr.Create<TValue>(context, library.GetAppArg(context.Handle, current, 2))
+                    )
+                );
+            }
+
+            current = library.GetAppArg(context.Handle, current, 0);
+        }
+
+        throw new InvalidOperationException($"Expression {expr} does not evaluate to a finite array in this model");
+    }
+
+    private (IReadOnlyList<(TIndex Index, TValue Value)> Entries, TValue Default) ReadFuncInterpEntries<TIndex, TValue>(
+        IntPtr funcDecl
+    )
+        where TIndex : Z3Expr, IExprType<TIndex>
+        where TValue : Z3Expr, IExprType<TValue>
+    {
+        var library = context.Library;
+        var interp = library.ModelGetFuncInterp(context.Handle, modelHandle, funcDecl);
+        library.FuncInterpIncRef(context.Handle, interp);
+        try
+        {
+            var count = library.FuncInterpGetNumEntries(context.Handle, interp);
+            var entries = new List<(TIndex Index, TValue Value)>((int)count);
+            for (var i = 0u; i < count; i++)
+            {
+                var entry = library.FuncInterpGetEntry(context.Handle, interp, i);
+                library.FuncEntryIncRef(context.Handle, entry);
+                try
+                {
+                    entries.Add(
+                        (
+                            Z3Expr.Create<TIndex>(context, library.FuncEntryGetArg(context.Handle, entry, 0)),
+                            Z3Expr.Create<TValue>(context, library.FuncEntryGetValue(context.Handle, entry))
+                        )
+                    );
+                }
+                finally
+                {
+                    library.FuncEntryDecRef(context.Handle, entry);
+                }
+            }
+
+            return (entries, Z3Expr.Create<TValue>(context, library.FuncInterpGetElse(context.Handle, interp)));
+        }
+        finally
+        {
+            library.FuncInterpDecRef(context.Handle, interp);
+        }
+    }
+}
@@ -9,128 +9,81 @@ public sealed partial class Z3Model
     /// </summary>
     /// <param name="expr">The Float16 expression.</param>
     /// <returns>The Half value.</returns>
-    public Half GetHalfValue(FpExpr<Float16> expr)
-    {
-        var str = GetFpStringValue(expr);
-
-        // Try to parse as a normal float first
-        if (Half.TryParse(str, out var result))
-            return result;
-
-        // Handle special IEEE values in Z3 format
-        if (str.Contains("NaN") || str.Contains("nan"))
-            return Half.NaN;
-        if (str.Contains("+oo") || str.Contains("+infinity") || str == "oo")
-            return Half.PositiveInfinity;
-        if (str.Contains("-oo") || str.Contains("-infinity"))
-            return Half.NegativeInfinity;
-        if (str.Contains("+zero"))
-            return (Half)0.0;
-        if (str.Contains("-zero"))
-            return BitConverter.UInt16BitsToHalf(0x8000); // -0.0
-
-        // Handle IEEE bit representation: (fp #bS #bEEEEE #bSSSSSSSSS)
-        if (str.StartsWith("(fp "))
-        {
-            var parts = str.Split(' ', StringSplitOptions.RemoveEmptyEntries);
-            if (parts.Length == 4)
-            {
-                var sign = ParseFpComponent(parts[1]);
-                var exp = ParseFpComponent(parts[2]);
-                var sig = ParseFpComponent(parts[3].TrimEnd(')'));
-
-                var bits = (ushort)((sign << 15) | (exp << 10) | sig);
-                return BitConverter.UInt16BitsToHalf(bits);
-            }
-        }
-
-        throw new InvalidOperationException($"Failed to parse Float16 value '{str}' from expression {expr}");
-    }
+    public Half GetHalfValue(FpExpr<Float16> expr) => BitConverter.UInt16BitsToHalf((ushort)GetFpBits(expr));
 
     /// <summary>
     /// Gets the float value of a Float32 expression in this model.
     /// </summary>
     /// <param name="expr">The Float32 expression.</param>
     /// <returns>The float value.</returns>
-    public float GetFloatValue(FpExpr<Float32> expr)
-    {
-        var str = GetFpStringValue(expr);
-
-        // Try to parse as a normal float first
-        if (float.TryParse(str, out var result))
-            return result;
-
-        // Handle special IEEE values in Z3 format
-        if (str.Contains("NaN") || str.Contains("nan"))
-            return float.NaN;
-        if (str.Contains("+oo") || str.Contains("+infinity") || str == "oo")
-            return float.PositiveInfinity;
-        if (str.Contains("-oo") || str.Contains("-infinity"))
-            return float.NegativeInfinity;
-        if (str.Contains("+zero"))
-            return 0.0f;
-        if (str.Contains("-zero"))
-            return BitConverter.Int32BitsToSingle(unchecked((int)0x80000000)); // -0.0f
-
-        // Handle IEEE bit representation: (fp #bS #xEE #bSSSSSSSSSSSSSSSSSSSSSSS)
-        if (str.StartsWith("(fp "))
-        {
-            var parts = str.Split(' ', StringSplitOptions.RemoveEmptyEntries);
-            if (parts.Length == 4)
-            {
-                var sign = (uint)ParseFpComponent(parts[1]);
-                var exp = (uint)ParseFpComponent(parts[2]);
-                var sig = (uint)ParseFpComponent(parts[3].TrimEnd(')'));
-
-                var bits = (uint)((sign << 31) | (exp << 23) | sig);
-                return BitConverter.UInt32BitsToSingle(bits);
-            }
-        }
-
-        throw new InvalidOperationException($"Failed to parse Float32 value '{str}' from expression {expr}");
-    }
+    public float GetFloatValue(FpExpr<Float32> expr) => BitConverter.UInt32BitsToSingle((uint)GetFpBits(expr));
 
     /// <summary>
     /// Gets the double value of a Float64 expression in this model.
     /// </summary>
     /// <param name="expr">The Float64 expression.</param>
     /// <returns>The double value.</returns>
-    public double GetDoubleValue(FpExpr<Float64> expr)
+    public double GetDoubleValue(FpExpr<Float64> expr) => BitConverter.UInt64BitsToDouble(GetFpBits(expr));
+
+    /// <summary>
+    /// Gets the Half values of Float16 expressions in this model.
+    /// </summary>
+    /// <param name="exprs">The Float16 expressions.</param>
+    /// <param name="values">Destination for the values, at least as long as <paramref name="exprs"/>.</param>
+    /// <exception cref="ArgumentException">Thrown if the destination is too short.</exception>
+    public void GetHalfValues(ReadOnlySpan<FpExpr<Float16>> exprs, Span<Half> values)
     {
-        var str = GetFpStringValue(expr);
-
-        // Try to parse as a normal double first
-        if (double.TryParse(str, out var result))
-            return result;
-
-        // Handle special IEEE values in Z3 format
-        if (str.Contains("NaN") || str.Contains("nan"))
-            return double.NaN;
-        if (str.Contains("+oo") || str.Contains("+infinity") || str == "oo")
-            return double.PositiveInfinity;
-        if (str.Contains("-oo") || str.Contains("-infinity"))
-            return double.NegativeInfinity;
-        if (str.Contains("+zero"))
-            return 0.0;
-        if (str.Contains("-zero"))
-            return BitConverter.Int64BitsToDouble(unchecked((long)0x8000000000000000)); // -0.0
-
-        // Handle IEEE bit representation: (fp #bS #bEEEEEEEEEEE #xSSSSSSSSSSSSS)
-        if (str.StartsWith("(fp "))
-        {
-            var parts = str.Split(' ', StringSplitOptions.RemoveEmptyEntries);
-            if (parts.Length == 4)
-            {
-                var sign = ParseFpComponent(parts[1]);
-                var exp = ParseFpComponent(parts[2]);
-                var sig = ParseFpComponent(parts[3].TrimEnd(')'));
-
-                var bits = (ulong)((sign << 63) | (exp << 52) | sig);
-                return BitConverter.UInt64BitsToDouble(bits);
-            }
-        }
+        ThrowIfDestinationTooShort(exprs.Length, values.Length, nameof(values));
+        for (var i = 0; i < exprs.Length; i++)
+            values[i] = BitConverter.UInt16BitsToHalf((ushort)GetFpBits(exprs[i]));
+    }
+
+    /// <summary>
+    /// Gets the float values of Float32 expressions in this model.
+    /// </summary>
+    /// <param name="exprs">The Float32 expressions.</param>
+    /// <param name="values">Destination for the values, at least as long as <paramref name="exprs"/>.</param>
+    /// <exception cref="ArgumentException">Thrown if the destination is too short.</exception>
+    public void GetFloatValues(ReadOnlySpan<FpExpr<Float32>> exprs, Span<float> values)
+    {
+        ThrowIfDestinationTooShort(exprs.Length, values.Length, nameof(values));
+        for (var i = 0; i < exprs.Length; i++)
+            values[i] = BitConverter.UInt32BitsToSingle((uint)GetFpBits(exprs[i]));
+    }
+
+    /// <summary>
+    /// Gets the double values of Float64 expressions in this model.
+    /// </summary>
+    /// <param name="exprs">The Float64 expressions.</param>
+    /// <param name="values">Destination for the values, at least as long as <paramref name="exprs"/>.</param>
+    /// <exception cref="ArgumentException">Thrown if the destination is too short.</exception>
+    public void GetDoubleValues(ReadOnlySpan<FpExpr<Float64>> exprs, Span<double> values)
+    {
+        ThrowIfDestinationTooShort(exprs.Length, values.Length, nameof(values));
+        for (var i = 0; i < exprs.Length; i++)
+            values[i] = BitConverter.UInt64BitsToDouble(GetFpBits(exprs[i]));
+    }
+
+    /// <summary>
+    /// Gets the IEEE 754 bit pattern of a floating-point expression's value in this model.
+    /// </summary>
+    /// <typeparam name="TFormat">The floating-point format, at most 64 bits wide.</typeparam>
+    /// <param name="expr">The floating-point expression.</param>
+    /// <returns>The sign, biased exponent and trailing significand packed into the low bits, as stored by IEEE 754.</returns>
+    /// <remarks>NaN values are returned as Z3 represents them: positive, with only the lowest significand bit set.</remarks>
+    /// <exception cref="NotSupportedException">Thrown if the format is wider than 64 bits.</exception>
+    public ulong GetFpBits<TFormat>(FpExpr<TFormat> expr)
+        where TFormat : IFloatFormat
+    {
+        if (TFormat.ExponentBits + TFormat.SignificandBits > 64)
+            throw new NotSupportedException(
+                $"Bit patterns are limited to 64 bits, but {typeof(TFormat).Name} is wider"
+            );
 
-        throw new InvalidOperationException($"Failed to parse Float64 value '{str}' from expression {expr}");
+        var (sign, exponent, significand) = GetFpComponents(expr);
+
+        var bits = (exponent << (int)(TFormat.SignificandBits - 1)) | significand;
+        return sign ? bits | (1UL << (int)(TFormat.ExponentBits + TFormat.SignificandBits - 1)) : bits;
     }
 
     /// <summary>
@@ -153,76 +106,60 @@ public sealed partial class Z3Model
     /// <typeparam name="TFormat">The floating-point format.</typeparam>
     /// <param name="expr">The floating-point expression.</param>
     /// <returns>Named tuple with Sign (bool), Exponent (ulong), and Significand (ulong) components.</returns>
+    /// <remarks>
+    /// Components are read with Z3's floating-point numeral accessors, so no value is formatted or parsed.
+    /// The exponent is biased and the significand excludes the hidden bit.
+    /// </remarks>
     public (bool Sign, ulong Exponent, ulong Significand) GetFpComponents<TFormat>(FpExpr<TFormat> expr)
         where TFormat : IFloatFormat
     {
-        var str = GetFpStringValue(expr);
+        ThrowIfInvalidated();
 
-        // Handle IEEE bit representation: (fp #bS #bEEEEE #bSSSSSSSSS)
-        if (str.StartsWith("(fp "))
-        {
-            var parts = str.Split(' ', StringSplitOptions.RemoveEmptyEntries);
-            if (parts.Length == 4)
-            {
-                var sign = ParseFpComponent(parts[1]) != 0;
-                var exp = ParseFpComponent(parts[2]);
-                var sig = ParseFpComponent(parts[3].TrimEnd(')'));
-
-                return (sign, exp, sig);
-            }
-        }
+        var library = context.Library;
+        if (!library.ModelEval(context.Handle, modelHandle, expr.Handle, true, out var numeral))
+            throw new InvalidOperationException("Failed to evaluate expression in model");
 
-        // Handle special values
-        var maxExp = (1UL << (int)TFormat.ExponentBits) - 1;
-
-        if (str.Contains("NaN") || str.Contains("nan"))
-            return (false, maxExp, 1);
-        if (str.Contains("+oo") || str.Contains("+infinity") || str == "oo")
-            return (false, maxExp, 0);
-        if (str.Contains("-oo") || str.Contains("-infinity"))
-            return (true, maxExp, 0);
-        if (str.Contains("+zero"))
-            return (false, 0, 0);
-        if (str.Contains("-zero"))
-            return (true, 0, 0);
-
-        // Try to parse as numeric value for standard formats and extract components
-        if (typeof(TFormat) == typeof(Float16))
+        // The accessors below create no terms, but hold a reference anyway so the value cannot be collected
+        library.IncRef(context.Handle, numeral);
+        try
         {
-            if (Half.TryParse(str, out var half))
-            {
-                var bits = BitConverter.HalfToUInt16Bits(half);
-                return ((bits & 0x8000) != 0, (ulong)((bits >> 10) & 0x1F), (ulong)(bits & 0x3FF));
-            }
-        }
-        else if (typeof(TFormat) == typeof(Float32))
-        {
-            if (float.TryParse(str, out var single))
-            {
-                var bits = BitConverter.SingleToUInt32Bits(single);
-                return ((bits & 0x80000000) != 0, (ulong)((bits >> 23) & 0xFF), (ulong)(bits & 0x7FFFFF));
-            }
+            var maxExponent = (1UL << (int)TFormat.ExponentBits) - 1;
+
+            if (library.FpaIsNumeralNan(context.Handle, numeral))
+                return (false, maxExponent, 1);
+
+            var sign = library.FpaIsNumeralNegative(context.Handle, numeral);
+
+            if (library.FpaIsNumeralInf(context.Handle, numeral))
+                return (sign, maxExponent, 0);
+
+            if (library.FpaIsNumeralZero(context.Handle, numeral))
+                return (sign, 0, 0);
+
+            if (!library.FpaGetNumeralSignificandUint64(context.Handle, numeral, out var significand))
+                throw new InvalidOperationException(
+                    $"Expression {expr} does not evaluate to a {typeof(TFormat).Name} numeral in this model"
+                );
+
+            if (library.FpaIsNumeralSubnormal(context.Handle, numeral))
+                return (sign, 0, significand);
+
+            if (!library.FpaGetNumeralExponentInt64(context.Handle, numeral, out var exponent, true))
+                throw new InvalidOperationException(
+                    $"Expression {expr} does not evaluate to a {typeof(TFormat).Name} numeral in this model"
+                );
+
+            return (sign, (ulong)exponent, significand);
         }
-        else if (typeof(TFormat) == typeof(Float64))
+        finally
         {
-            if (double.TryParse(str, out var dbl))
-            {
-                var bits = BitConverter.DoubleToUInt64Bits(dbl);
-                return ((bits & 0x8000000000000000) != 0, (bits >> 52) & 0x7FF, bits & 0xFFFFFFFFFFFFF);
-            }
+            library.DecRef(context.Handle, numeral);
         }
-
-        throw new InvalidOperationException(
-            $"Failed to parse {typeof(TFormat).Name} value '{str}' from expression {expr}"
-        );
     }
 
-    private static ulong ParseFpComponent(string component)
+    private static void ThrowIfDestinationTooShort(int required, int length, string paramName)
     {
-        if (component.StartsWith("#b"))
-            return Convert.ToUInt64(component[2..], 2);
-        if (component.StartsWith("#x"))
-            return Convert.ToUInt64(component[2..], 16);
-        return Convert.ToUInt64(component);
+        if (length < required)
+            throw new ArgumentException($"Destination has {length} elements but {required} are required", paramName);
     }
 }
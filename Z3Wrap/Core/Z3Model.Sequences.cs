@@ -0,0 +1,73 @@
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Expressions.Common;
+using Spaceorc.Z3Wrap.Expressions.Sequences;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+public sealed partial class Z3Model
+{
+    /// <summary>
+    /// Gets the elements of a sequence expression's value in this model.
+    /// </summary>
+    /// <typeparam name="T">Sequence element type.</typeparam>
+    /// <param name="expr">The sequence expression.</param>
+    /// <returns>The element values in sequence order.</returns>
+    /// <remarks>
+    /// The value is evaluated once and its units and concatenations are walked natively; only the elements are
+    /// wrapped as expressions.
+    /// </remarks>
+    /// <exception cref="InvalidOperationException">Thrown if the value is not a concrete sequence.</exception>
+    public T[] GetSeqValues<T>(SeqExpr<T> expr)
+        where T : Z3Expr, IExprType<T>
+    {
+        ThrowIfInvalidated();
+
+        var library = context.Library;
+        if (!library.ModelEval(context.Handle, modelHandle, expr.Handle, true, out var value))
+            throw new InvalidOperationException("Failed to evaluate expression in model");
+
+        library.IncRef(context.Handle, value);
+        var elements = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            // Subterms are referenced by the evaluated value, so walking them needs no references of its own
+            var pending = new Stack<IntPtr>();
+            pending.Push(value);
+            while (pending.TryPop(out var current))
+            {
+                var kind = library.IsApp(context.Handle, current)
+                    ? library.GetDeclKind(context.Handle, library.GetAppDecl(context.Handle, current))
+                    : default;
+
+                switch (kind)
+                {
+                    case Z3Library.DeclKind.Z3_OP_SEQ_EMPTY:
+                        break;
+                    case Z3Library.DeclKind.Z3_OP_SEQ_UNIT:
+                        elements.Add(library.GetAppArg(context.Handle, current, 0));
+                        break;
+                    case Z3Library.DeclKind.Z3_OP_SEQ_CONCAT:
+                        // Pushed in reverse so the leftmost operand is visited first
+                        for (var i = library.GetAppNumArgs(context.Handle, current); i > 0; i--)
+                            pending.Push(library.GetAppArg(context.Handle, current, i - 1));
+                        break;
+                    default:
+                        throw new InvalidOperationException(
+                            $"Expression {expr} does not evaluate to a concrete sequence in this model"
+                        );
+                }
+            }
+
+            var result = new T[elements.Length];
+            for (var i = 0; i < result.Length; i++)
+                result[i] = Z3Expr.Create<T>(context, elements.Span[i]);
+
+            return result;
+        }
+        finally
+        {
+            elements.Dispose();
+            library.DecRef(context.Handle, value);
+        }
+    }
+}
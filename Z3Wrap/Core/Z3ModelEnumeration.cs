@@ -0,0 +1,134 @@
+using System.Collections;
+using System.Diagnostics;
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Expressions.Common;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Enumeration of the distinct assignments to a projection set over all models of a solver's constraints.
+/// </summary>
+/// <typeparam name="T">Expression type of the projected terms.</typeparam>
+/// <remarks>
+/// Each row holds the model values of the projected terms, in projection order. After a row is produced its
+/// assignment is blocked with a clause built from native handles, so no model wrapper or blocking expression is
+/// created per iteration. Blocking clauses live in a solver scope that is popped when the enumeration ends, leaving
+/// the solver as it was. Every enumeration starts over and resets <see cref="ModelCount"/> and
+/// <see cref="Elapsed"/>.
+/// </remarks>
+public sealed class Z3ModelEnumeration<T> : IEnumerable<T[]>
+    where T : Z3Expr, IExprType<T>
+{
+    private readonly Z3Solver solver;
+    private readonly T[] projection;
+    private readonly int limit;
+
+    internal Z3ModelEnumeration(Z3Solver solver, T[] projection, int limit)
+    {
+        this.solver = solver;
+        this.projection = projection;
+        this.limit = limit;
+    }
+
+    /// <summary>
+    /// Gets the number of rows produced by the current or last enumeration.
+    /// </summary>
+    public int ModelCount { get; private set; }
+
+    /// <summary>
+    /// Gets the time spent checking, reading models and blocking them in the current or last enumeration.
+    /// </summary>
+    public TimeSpan Elapsed { get; private set; }
+
+    /// <summary>
+    /// Gets the enumeration throughput in rows per second of <see cref="Elapsed"/> time.
+    /// </summary>
+    public double ModelsPerSecond => Elapsed > TimeSpan.Zero ? ModelCount / Elapsed.TotalSeconds : 0;
+
+    /// <summary>
+    /// Enumerates the rows, checking the solver once per row.
+    /// </summary>
+    /// <returns>Enumerator over the rows.</returns>
+    /// <exception cref="InvalidOperationException">Thrown if a check returns unknown.</exception>
+    public IEnumerator<T[]> GetEnumerator()
+    {
+        ModelCount = 0;
+        Elapsed = TimeSpan.Zero;
+
+        var handles = new IntPtr[projection.Length];
+        for (var i = 0; i < handles.Length; i++)
+            handles[i] = projection[i].Handle;
+
+        solver.Push();
+        try
+        {
+            while (ModelCount < limit && NextRow(handles) is { } row)
+            {
+                ModelCount++;
+                yield return row;
+            }
+        }
+        finally
+        {
+            solver.Pop();
+        }
+    }
+
+    IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+
+    private T[]? NextRow(IntPtr[] handles)
+    {
+        var start = Stopwatch.GetTimestamp();
+        try
+        {
+            switch (solver.Check())
+            {
+                case Z3Status.Unsatisfiable:
+                    return null;
+                case Z3Status.Unknown:
+                    throw new InvalidOperationException(
+                        $"Solver returned unknown while enumerating models: {solver.GetReasonUnknown()}"
+                    );
+            }
+
+            var context = solver.Context;
+            var library = context.Library;
+            var model = library.SolverGetModel(context.Handle, solver.Handle);
+            library.ModelIncRef(context.Handle, model);
+
+            var equalities = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+            try
+            {
+                var row = new T[handles.Length];
+                for (var i = 0; i < handles.Length; i++)
+                {
+                    if (!library.ModelEval(context.Handle, model, handles[i], true, out var value))
+                        throw new InvalidOperationException("Failed to evaluate expression in model");
+
+                    // The value has the sort of the projected term, so no sort check is needed
+                    row[i] = T.Create(context, value);
+
+                    var equality = library.MkEq(context.Handle, handles[i], value);
+                    library.IncRef(context.Handle, equality);
+                    equalities.Add(equality);
+                }
+
+                var assignment = library.MkAnd(context.Handle, (uint)equalities.Length, equalities.Span);
+                library.SolverAssert(context.Handle, solver.Handle, library.MkNot(context.Handle, assignment));
+                return row;
+            }
+            finally
+            {
+                foreach (var equality in equalities.Span)
+                    library.DecRef(context.Handle, equality);
+
+                equalities.Dispose();
+                library.ModelDecRef(context.Handle, model);
+            }
+        }
+        finally
+        {
+            Elapsed += Stopwatch.GetElapsedTime(start);
+        }
+    }
+}
@@ -1,3 +1,6 @@
+using System.Globalization;
+using System.Numerics;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.BitVectors;
 using Spaceorc.Z3Wrap.Expressions.Logic;
 using Spaceorc.Z3Wrap.Expressions.Numerics;
@@ -15,6 +18,7 @@ public sealed class Z3Optimizer : IDisposable
     private bool disposed;
     private bool isBeingDisposedByContext;
     private Z3Status? lastCheckResult;
+    private string priority = "lex";
 
     internal Z3Optimizer(Z3Context context)
     {
@@ -65,23 +69,144 @@ public sealed class Z3Optimizer : IDisposable
         context.Library.OptimizeAssert(context.Handle, InternalHandle, constraint.Handle);
     }
 
+    /// <summary>
+    /// Adds an arena-built boolean constraint to the optimizer.
+    /// </summary>
+    /// <param name="constraint">The boolean constraint to add.</param>
+    /// <exception cref="ObjectDisposedException">Thrown if the arena of the constraint has been disposed.</exception>
+    public void Assert(ExprRef<BoolExpr> constraint)
+    {
+        ThrowIfDisposed();
+        constraint.Arena.ThrowIfDisposed();
+        InvalidateModel(); // Model no longer valid after assertion
+
+        context.Library.OptimizeAssert(context.Handle, InternalHandle, constraint.Handle);
+    }
+
+    /// <summary>
+    /// Loads declarations and assertions from an SMT-LIB2 file.
+    /// </summary>
+    /// <param name="path">Path to the SMT-LIB2 file.</param>
+    /// <remarks>
+    /// The file is read and parsed natively by Z3, without creating managed strings or expressions.
+    /// </remarks>
+    public void LoadSmtLib2(string path)
+    {
+        ThrowIfDisposed();
+        InvalidateModel();
+
+        context.Library.OptimizeFromFile(context.Handle, InternalHandle, path);
+    }
+
+    /// <summary>
+    /// Loads declarations and assertions from an SMT-LIB2 script in UTF-8.
+    /// </summary>
+    /// <param name="script">UTF-8 encoded SMT-LIB2 script.</param>
+    /// <remarks>
+    /// The script is parsed natively by Z3 in place when it ends with a NUL byte; otherwise it is copied once into a pooled buffer.
+    /// </remarks>
+    public void LoadSmtLib2(ReadOnlyMemory<byte> script)
+    {
+        ThrowIfDisposed();
+        InvalidateModel();
+
+        context.Library.OptimizeFromString(context.Handle, InternalHandle, script.Span);
+    }
+
+    /// <summary>
+    /// Loads assertions from an SMT-LIB2 file and returns the constants it declares.
+    /// </summary>
+    /// <param name="path">Path to the SMT-LIB2 file.</param>
+    /// <param name="declarations">Table of the uninterpreted constants used by the loaded assertions.</param>
+    public void LoadSmtLib2(string path, out Z3Declarations declarations)
+    {
+        ThrowIfDisposed();
+        InvalidateModel();
+
+        var assertions = context.Library.ParseSmtlib2File(context.Handle, path, 0, [], [], 0, [], []);
+        declarations = AssertParsed(assertions);
+    }
+
+    /// <summary>
+    /// Loads assertions from an SMT-LIB2 script in UTF-8 and returns the constants it declares.
+    /// </summary>
+    /// <param name="script">UTF-8 encoded SMT-LIB2 script.</param>
+    /// <param name="declarations">Table of the uninterpreted constants used by the loaded assertions.</param>
+    public void LoadSmtLib2(ReadOnlyMemory<byte> script, out Z3Declarations declarations)
+    {
+        ThrowIfDisposed();
+        InvalidateModel();
+
+        var assertions = context.Library.ParseSmtlib2String(context.Handle, script.Span, 0, [], [], 0, [], []);
+        declarations = AssertParsed(assertions);
+    }
+
     /// <summary>
     /// Checks the satisfiability and optimality of the current constraints.
     /// </summary>
     /// <returns>The satisfiability status.</returns>
-    public Z3Status Check()
+    public Z3Status Check() => CheckCore("Z3Optimizer.Check", []);
+
+    /// <summary>
+    /// Checks the satisfiability and optimality of the current constraints under assumptions.
+    /// </summary>
+    /// <param name="assumptions">Boolean expressions assumed to hold for this check only.</param>
+    /// <returns>The satisfiability status.</returns>
+    /// <remarks>
+    /// After an Unsatisfiable result, call <see cref="GetUnsatCore"/> to retrieve the conflicting assumptions.
+    /// </remarks>
+    public Z3Status CheckAssumptions(params BoolExpr[] assumptions)
     {
         ThrowIfDisposed();
-        InvalidateModel(); // Clear any previous model
 
-        lastCheckResult = context.Library.OptimizeCheck(context.Handle, InternalHandle, 0, []) switch
+        var assumptionHandles = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
         {
-            Z3Library.Lbool.Z3_L_FALSE => Z3Status.Unsatisfiable,
-            Z3Library.Lbool.Z3_L_TRUE => Z3Status.Satisfiable,
-            Z3Library.Lbool.Z3_L_UNDEF => Z3Status.Unknown,
-            _ => throw new InvalidOperationException($"Unexpected optimizer result: {lastCheckResult}"),
-        };
-        return lastCheckResult.Value;
+            assumptionHandles.AddRange(assumptions);
+            return CheckCore("Z3Optimizer.CheckAssumptions", assumptionHandles.Span);
+        }
+        finally
+        {
+            assumptionHandles.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Gets the conflicting assumptions after <see cref="CheckAssumptions"/> returns Unsatisfiable.
+    /// </summary>
+    /// <returns>Array of boolean expressions representing the conflicting assumptions.</returns>
+    /// <exception cref="InvalidOperationException">Thrown if the last check was not unsatisfiable.</exception>
+    public BoolExpr[] GetUnsatCore()
+    {
+        ThrowIfDisposed();
+
+        if (lastCheckResult == null)
+            throw new InvalidOperationException("Must call CheckAssumptions() before GetUnsatCore()");
+
+        if (lastCheckResult != Z3Status.Unsatisfiable)
+            throw new InvalidOperationException($"Cannot get unsat core when optimizer status is {lastCheckResult}");
+
+        var coreHandles = context.Library.OptimizeGetUnsatCore(context.Handle, InternalHandle);
+
+        var core = new BoolExpr[coreHandles.Length];
+        for (var i = 0; i < coreHandles.Length; i++)
+            core[i] = Z3Expr.Create<BoolExpr>(context, coreHandles[i]);
+
+        return core;
+    }
+
+    /// <summary>
+    /// Applies a set of parameters to this optimizer.
+    /// </summary>
+    /// <param name="parameters">The parameters to apply.</param>
+    public void SetParams(Z3Params parameters)
+    {
+        ThrowIfDisposed();
+        parameters.ApplyToOptimizer(context, InternalHandle);
+
+        // Z3 has no getter for parameter values; remembered so that Pareto enumeration can restore it
+        if (parameters.TryGetValue("priority", out var value) && value is string newPriority)
+            priority = newPriority;
     }
 
     /// <summary>
@@ -95,6 +220,18 @@ public sealed class Z3Optimizer : IDisposable
         return context.Library.OptimizeGetReasonUnknown(context.Handle, InternalHandle);
     }
 
+    /// <summary>
+    /// Gets a snapshot of the optimizer statistics (conflicts, decisions, memory, time, ...).
+    /// </summary>
+    /// <returns>Statistics snapshot; use <see cref="Z3Statistics.Diff"/> to compare two snapshots.</returns>
+    public Z3Statistics GetStatistics()
+    {
+        ThrowIfDisposed();
+
+        var statsHandle = context.Library.OptimizeGetStatistics(context.Handle, InternalHandle);
+        return Z3Statistics.Create(context, statsHandle);
+    }
+
     /// <summary>
     /// Pushes a new scope onto the optimizer stack.
     /// </summary>
@@ -115,7 +252,9 @@ public sealed class Z3Optimizer : IDisposable
         ThrowIfDisposed();
         InvalidateModel(); // Model no longer valid after pop
 
-        context.Library.OptimizePop(context.Handle, InternalHandle);
+        // Z3_optimize_pop removes a single scope per call
+        for (var i = 0u; i < numScopes; i++)
+            context.Library.OptimizePop(context.Handle, InternalHandle);
     }
 
     /// <summary>
@@ -232,6 +371,57 @@ public sealed class Z3Optimizer : IDisposable
         return new RealObjective(objectiveId);
     }
 
+    /// <summary>
+    /// Adds a soft constraint that is penalized by its weight when violated.
+    /// </summary>
+    /// <param name="constraint">The boolean constraint to prefer.</param>
+    /// <param name="weight">Penalty for violating the constraint; negative weights act as rewards.</param>
+    /// <param name="group">Identifier of the soft constraint group, or null for the default group.</param>
+    /// <returns>The objective that minimizes the total penalty of the group.</returns>
+    public IntObjective AssertSoft(BoolExpr constraint, long weight = 1, string? group = null) =>
+        AssertSoft([(constraint, weight)], group);
+
+    /// <summary>
+    /// Adds a batch of weighted soft constraints to one group.
+    /// </summary>
+    /// <param name="constraints">The constraints and their violation penalties.</param>
+    /// <param name="group">Identifier of the soft constraint group, or null for the default group.</param>
+    /// <returns>The objective that minimizes the total penalty of the group.</returns>
+    /// <remarks>
+    /// The group symbol is created once per batch and each weight is formatted into a stack buffer, so adding a
+    /// constraint costs a single native call.
+    /// </remarks>
+    /// <exception cref="ArgumentException">Thrown if <paramref name="constraints"/> is empty.</exception>
+    public IntObjective AssertSoft(ReadOnlySpan<(BoolExpr Constraint, long Weight)> constraints, string? group = null)
+    {
+        ThrowIfDisposed();
+        InvalidateModel();
+
+        if (constraints.IsEmpty)
+            throw new ArgumentException("At least one soft constraint is required", nameof(constraints));
+
+        var groupSymbol = group == null ? IntPtr.Zero : context.Library.MkStringSymbol(context.Handle, group);
+
+        // Room for the sign, 19 digits and the NUL terminator
+        Span<byte> weightBuffer = stackalloc byte[21];
+        var objectiveId = 0u;
+        foreach (var (constraint, weight) in constraints)
+        {
+            weight.TryFormat(weightBuffer, out var length, default, CultureInfo.InvariantCulture);
+            weightBuffer[length] = 0;
+
+            objectiveId = context.Library.OptimizeAssertSoftOriginal(
+                context.Handle,
+                InternalHandle,
+                constraint.Handle,
+                weightBuffer[..(length + 1)],
+                groupSymbol
+            );
+        }
+
+        return new IntObjective(objectiveId);
+    }
+
     /// <summary>
     /// Gets the upper bound for an integer optimization objective.
     /// </summary>
@@ -306,6 +496,32 @@ public sealed class Z3Optimizer : IDisposable
         return ArithmeticExpr.CreateDynamic(context, astHandle);
     }
 
+    /// <summary>
+    /// Enumerates the Pareto front of the current objectives.
+    /// </summary>
+    /// <param name="objectives">The objectives whose values form each point.</param>
+    /// <param name="limit">Maximum number of points to produce.</param>
+    /// <returns>Lazy enumeration of objective values, in <paramref name="objectives"/> order, one array per point.</returns>
+    /// <remarks>
+    /// The optimizer is switched to Pareto priority for the duration of the enumeration and back to the priority set
+    /// before it afterwards. Enumeration starts from a fresh front, and stopping it early discards the remaining
+    /// points, so later checks start over. Every point is the result of one <see cref="Check"/>, so
+    /// <see cref="GetModel"/> returns the model of the current point while it is being processed. Values that fit in
+    /// 64 bits are read without formatting them as strings.
+    /// </remarks>
+    /// <exception cref="ArgumentOutOfRangeException">Thrown if <paramref name="limit"/> is negative.</exception>
+    /// <exception cref="InvalidOperationException">Thrown if a check returns unknown or an objective is unbounded.</exception>
+    public IEnumerable<BigInteger[]> EnumerateParetoFront(
+        IReadOnlyList<IntObjective> objectives,
+        int limit = int.MaxValue
+    )
+    {
+        ThrowIfDisposed();
+        ArgumentOutOfRangeException.ThrowIfNegative(limit);
+
+        return EnumerateParetoPoints(objectives, limit);
+    }
+
     /// <summary>
     /// Returns a string representation of the optimizer state.
     /// </summary>
@@ -317,6 +533,138 @@ public sealed class Z3Optimizer : IDisposable
         return context.Library.OptimizeToString(context.Handle, InternalHandle);
     }
 
+    /// <summary>
+    /// Writes the hard constraints and objectives to a stream as an SMT-LIB2 script in UTF-8.
+    /// </summary>
+    /// <param name="destination">The stream to write the script to.</param>
+    /// <remarks>
+    /// The script declares all uninterpreted constants and functions, followed by one <c>assert</c> per constraint
+    /// and one <c>minimize</c> per objective (Z3 reports maximization objectives in negated, minimization form).
+    /// Terms are walked incrementally and written in chunks; shared subterms are bound with <c>let</c>.
+    /// </remarks>
+    public void WriteSmtLib2(Stream destination)
+    {
+        ThrowIfDisposed();
+
+        var assertions = context.Library.OptimizeGetAssertions(context.Handle, InternalHandle);
+        var objectives = context.Library.OptimizeGetObjectives(context.Handle, InternalHandle);
+
+        using var writer = new Z3SmtLib2Writer(context, destination);
+        writer.WriteDeclarations([.. assertions, .. objectives]);
+        foreach (var assertion in assertions)
+            writer.WriteCommand("assert"u8, assertion);
+        foreach (var objective in objectives)
+            writer.WriteCommand("minimize"u8, objective);
+    }
+
+    private Z3Status CheckCore(string operation, ReadOnlySpan<IntPtr> assumptions)
+    {
+        ThrowIfDisposed();
+        InvalidateModel(); // Clear any previous model
+
+        using var trace = SolverTracing.Start(operation);
+        if (trace is { IsRecording: true })
+            trace.SetAssertionCount(context.Library.OptimizeGetAssertions(context.Handle, InternalHandle).Length);
+
+        lastCheckResult = context.Library.OptimizeCheck(
+            context.Handle,
+            InternalHandle,
+            (uint)assumptions.Length,
+            assumptions
+        ) switch
+        {
+            Z3Library.Lbool.Z3_L_FALSE => Z3Status.Unsatisfiable,
+            Z3Library.Lbool.Z3_L_TRUE => Z3Status.Satisfiable,
+            Z3Library.Lbool.Z3_L_UNDEF => Z3Status.Unknown,
+            _ => throw new InvalidOperationException($"Unexpected optimizer result: {lastCheckResult}"),
+        };
+        trace?.SetResult(lastCheckResult.Value);
+        if (trace is { IsRecording: true })
+            trace.SetDetails(GetTracedReasonUnknown(), GetStatistics());
+        return lastCheckResult.Value;
+    }
+
+    private IEnumerable<BigInteger[]> EnumerateParetoPoints(IReadOnlyList<IntObjective> objectives, int limit)
+    {
+        var previousPriority = priority;
+        var exhausted = false;
+        ResetIterationState();
+        SetParams(new Z3Params { { "priority", "pareto" } });
+        try
+        {
+            for (var count = 0; count < limit; count++)
+            {
+                switch (Check())
+                {
+                    case Z3Status.Unsatisfiable:
+                        exhausted = true;
+                        yield break;
+                    case Z3Status.Unknown:
+                        throw new InvalidOperationException(
+                            $"Optimizer returned unknown while enumerating the Pareto front: {GetReasonUnknown()}"
+                        );
+                }
+
+                var point = new BigInteger[objectives.Count];
+                for (var i = 0; i < point.Length; i++)
+                    point[i] = GetObjectiveValue(objectives[i]);
+
+                yield return point;
+            }
+        }
+        finally
+        {
+            if (!disposed)
+            {
+                if (!exhausted)
+                    ResetIterationState();
+
+                SetParams(new Z3Params { { "priority", previousPriority } });
+            }
+        }
+    }
+
+    private void ResetIterationState()
+    {
+        // Pareto and box priorities iterate their results over later checks until Z3 reports unsat;
+        // popping a scope discards that state
+        Push();
+        Pop();
+    }
+
+    private BigInteger GetObjectiveValue(IntObjective objective)
+    {
+        // At a Pareto point both bounds of an objective equal its value
+        var value = context.Library.OptimizeGetUpper(context.Handle, InternalHandle, objective.ObjectiveId);
+        context.Library.IncRef(context.Handle, value);
+        try
+        {
+            if (!context.Library.IsNumeralAst(context.Handle, value))
+                throw new InvalidOperationException("Objective value is unbounded");
+
+            return context.Library.GetNumeralInt64(context.Handle, value, out var fast)
+                ? fast
+                : BigInteger.Parse(
+                    context.Library.GetNumeralString(context.Handle, value),
+                    CultureInfo.InvariantCulture
+                );
+        }
+        finally
+        {
+            context.Library.DecRef(context.Handle, value);
+        }
+    }
+
+    private Z3Declarations AssertParsed(IntPtr[] assertions)
+    {
+        foreach (var assertion in assertions)
+            context.Library.OptimizeAssert(context.Handle, InternalHandle, assertion);
+
+        return Z3Declarations.Collect(context, assertions);
+    }
+
+    private string? GetTracedReasonUnknown() => lastCheckResult == Z3Status.Unknown ? GetReasonUnknown() : null;
+
     private void InvalidateModel()
     {
         cachedModel?.Invalidate();
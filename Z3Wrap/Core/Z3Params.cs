@@ -124,7 +124,18 @@ public sealed class Z3Params : IEnumerable<KeyValuePair<string, object>>
         return string.Join(", ", parameters.Select(kvp => $"{kvp.Key}={kvp.Value}"));
     }
 
-    internal void ApplyTo(Z3Context context, IntPtr solverHandle)
+    internal bool TryGetValue(string name, out object? value) => parameters.TryGetValue(name, out value);
+
+    internal void ApplyTo(Z3Context context, IntPtr solverHandle) =>
+        Apply(context, paramsHandle => context.Library.SolverSetParams(context.Handle, solverHandle, paramsHandle));
+
+    internal void ApplyToOptimizer(Z3Context context, IntPtr optimizerHandle) =>
+        Apply(
+            context,
+            paramsHandle => context.Library.OptimizeSetParams(context.Handle, optimizerHandle, paramsHandle)
+        );
+
+    internal void Apply(Z3Context context, Action<IntPtr> setParams)
     {
         var paramsHandle = context.Library.MkParams(context.Handle);
         context.Library.ParamsIncRef(context.Handle, paramsHandle);
@@ -149,7 +160,7 @@ public sealed class Z3Params : IEnumerable<KeyValuePair<string, object>>
                 }
             }
 
-            context.Library.SolverSetParams(context.Handle, solverHandle, paramsHandle);
+            setParams(paramsHandle);
         }
         finally
         {
@@ -0,0 +1,153 @@
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Represents a Z3 probe: a measure of a goal, such as its size or whether it is in a given logic.
+/// </summary>
+/// <remarks>
+/// Probes are owned by their context and released when it is disposed. Comparison and logical operators build new
+/// probes whose value is 1.0 when they hold and 0.0 otherwise, for use with <see cref="Z3Tactic.When"/> and
+/// <see cref="Z3Tactic.Cond"/>.
+/// </remarks>
+public sealed class Z3Probe
+{
+    internal Z3Probe(Z3Context context, IntPtr handle)
+    {
+        context.TrackProbe(handle);
+        Context = context;
+        Handle = handle;
+    }
+
+    /// <summary>
+    /// Gets the Z3 context that owns this probe.
+    /// </summary>
+    public Z3Context Context { get; }
+
+    /// <summary>
+    /// Gets the native Z3 probe handle.
+    /// </summary>
+    public IntPtr Handle { get; }
+
+    /// <summary>
+    /// Evaluates the probe on a goal.
+    /// </summary>
+    /// <param name="goal">The goal to measure.</param>
+    /// <returns>The probe value.</returns>
+    public double Apply(Z3Goal goal) => Context.Library.ProbeApply(Context.Handle, Handle, goal.Handle);
+
+    /// <summary>
+    /// Creates a probe that holds when both probes have equal values.
+    /// </summary>
+    /// <param name="other">The probe to compare with.</param>
+    /// <returns>The comparison probe.</returns>
+    public Z3Probe Eq(Z3Probe other) => new(Context, Context.Library.ProbeEq(Context.Handle, Handle, other.Handle));
+
+    /// <summary>
+    /// Creates a probe that holds when this probe's value equals a constant.
+    /// </summary>
+    /// <param name="value">The constant to compare with.</param>
+    /// <returns>The comparison probe.</returns>
+    public Z3Probe Eq(double value) => Eq(Const(Context, value));
+
+    /// <summary>
+    /// Creates a probe that always evaluates to a constant.
+    /// </summary>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="value">The constant value.</param>
+    /// <returns>The constant probe.</returns>
+    public static Z3Probe Const(Z3Context context, double value) =>
+        new(context, context.Library.ProbeConst(context.Handle, value));
+
+    /// <summary>
+    /// Creates a probe that holds when the left value is less than the right value.
+    /// </summary>
+    /// <param name="left">The left probe.</param>
+    /// <param name="right">The right probe.</param>
+    /// <returns>The comparison probe.</returns>
+    public static Z3Probe operator <(Z3Probe left, Z3Probe right) =>
+        new(left.Context, left.Context.Library.ProbeLt(left.Context.Handle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Creates a probe that holds when the left value is greater than the right value.
+    /// </summary>
+    /// <param name="left">The left probe.</param>
+    /// <param name="right">The right probe.</param>
+    /// <returns>The comparison probe.</returns>
+    public static Z3Probe operator >(Z3Probe left, Z3Probe right) =>
+        new(left.Context, left.Context.Library.ProbeGt(left.Context.Handle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Creates a probe that holds when the left value is less than or equal to the right value.
+    /// </summary>
+    /// <param name="left">The left probe.</param>
+    /// <param name="right">The right probe.</param>
+    /// <returns>The comparison probe.</returns>
+    public static Z3Probe operator <=(Z3Probe left, Z3Probe right) =>
+        new(left.Context, left.Context.Library.ProbeLe(left.Context.Handle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Creates a probe that holds when the left value is greater than or equal to the right value.
+    /// </summary>
+    /// <param name="left">The left probe.</param>
+    /// <param name="right">The right probe.</param>
+    /// <returns>The comparison probe.</returns>
+    public static Z3Probe operator >=(Z3Probe left, Z3Probe right) =>
+        new(left.Context, left.Context.Library.ProbeGe(left.Context.Handle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Creates a probe that holds when the probe's value is less than a constant.
+    /// </summary>
+    /// <param name="left">The probe.</param>
+    /// <param name="right">The constant.</param>
+    /// <returns>The comparison probe.</returns>
+    public static Z3Probe operator <(Z3Probe left, double right) => left < Const(left.Context, right);
+
+    /// <summary>
+    /// Creates a probe that holds when the probe's value is greater than a constant.
+    /// </summary>
+    /// <param name="left">The probe.</param>
+    /// <param name="right">The constant.</param>
+    /// <returns>The comparison probe.</returns>
+    public static Z3Probe operator >(Z3Probe left, double right) => left > Const(left.Context, right);
+
+    /// <summary>
+    /// Creates a probe that holds when the probe's value is less than or equal to a constant.
+    /// </summary>
+    /// <param name="left">The probe.</param>
+    /// <param name="right">The constant.</param>
+    /// <returns>The comparison probe.</returns>
+    public static Z3Probe operator <=(Z3Probe left, double right) => left <= Const(left.Context, right);
+
+    /// <summary>
+    /// Creates a probe that holds when the probe's value is greater than or equal to a constant.
+    /// </summary>
+    /// <param name="left">The probe.</param>
+    /// <param name="right">The constant.</param>
+    /// <returns>The comparison probe.</returns>
+    public static Z3Probe operator >=(Z3Probe left, double right) => left >= Const(left.Context, right);
+
+    /// <summary>
+    /// Creates a probe that holds when both probes hold.
+    /// </summary>
+    /// <param name="left">The left probe.</param>
+    /// <param name="right">The right probe.</param>
+    /// <returns>The conjunction probe.</returns>
+    public static Z3Probe operator &(Z3Probe left, Z3Probe right) =>
+        new(left.Context, left.Context.Library.ProbeAnd(left.Context.Handle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Creates a probe that holds when either probe holds.
+    /// </summary>
+    /// <param name="left">The left probe.</param>
+    /// <param name="right">The right probe.</param>
+    /// <returns>The disjunction probe.</returns>
+    public static Z3Probe operator |(Z3Probe left, Z3Probe right) =>
+        new(left.Context, left.Context.Library.ProbeOr(left.Context.Handle, left.Handle, right.Handle));
+
+    /// <summary>
+    /// Creates a probe that holds when the probe does not hold.
+    /// </summary>
+    /// <param name="probe">The probe to negate.</param>
+    /// <returns>The negation probe.</returns>
+    public static Z3Probe operator !(Z3Probe probe) =>
+        new(probe.Context, probe.Context.Library.ProbeNot(probe.Context.Handle, probe.Handle));
+}
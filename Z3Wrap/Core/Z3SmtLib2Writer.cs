@@ -0,0 +1,342 @@
+using System.Buffers;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Streams Z3 terms to UTF-8 SMT-LIB2 text in fixed-size chunks.
+/// Shared subterms are bound once with <c>let</c>, so output size is linear in DAG size rather than tree size.
+/// </summary>
+/// <remarks>
+/// Applications are walked iteratively; quantifiers, numerals and applications whose declaration has sort,
+/// term or declaration parameters are written as a whole using Z3's own printer.
+/// </remarks>
+internal sealed class Z3SmtLib2Writer : IDisposable
+{
+    private const int ChunkSize = 64 * 1024;
+
+    private readonly Z3Context context;
+    private readonly Z3Library library;
+    private readonly Stream stream;
+    private byte[]? chunk;
+    private int chunkLength;
+
+    public Z3SmtLib2Writer(Z3Context context, Stream stream)
+    {
+        this.context = context;
+        this.stream = stream;
+        library = context.Library;
+        chunk = ArrayPool<byte>.Shared.Rent(ChunkSize);
+    }
+
+    /// <summary>
+    /// Writes <c>declare-fun</c> commands for all uninterpreted constants and functions used by the terms.
+    /// </summary>
+    public void WriteDeclarations(IReadOnlyList<IntPtr> terms)
+    {
+        var visitedTerms = new HashSet<uint>();
+        var declaredFuncs = new HashSet<uint>();
+        var pending = new Stack<IntPtr>(terms);
+
+        while (pending.TryPop(out var term))
+        {
+            if (!visitedTerms.Add(library.GetAstId(context.Handle, term)))
+                continue;
+
+            switch (library.GetAstKind(context.Handle, term))
+            {
+                case Z3Library.AstKind.Z3_APP_AST:
+                    var decl = library.GetAppDecl(context.Handle, term);
+                    if (
+                        library.GetDeclKind(context.Handle, decl) == Z3Library.DeclKind.Z3_OP_UNINTERPRETED
+                        && declaredFuncs.Add(library.GetFuncDeclId(context.Handle, decl))
+                    )
+                    {
+                        Write(library.FuncDeclToStringUtf8(context.Handle, decl));
+                        Write("\n"u8);
+                    }
+
+                    var numArgs = library.GetAppNumArgs(context.Handle, term);
+                    for (var i = numArgs; i > 0; i--)
+                        pending.Push(library.GetAppArg(context.Handle, term, i - 1));
+                    break;
+
+                case Z3Library.AstKind.Z3_QUANTIFIER_AST:
+                    pending.Push(library.GetQuantifierBody(context.Handle, term));
+                    break;
+            }
+        }
+    }
+
+    /// <summary>
+    /// Writes <c>(command term)</c> followed by a newline.
+    /// </summary>
+    public void WriteCommand(ReadOnlySpan<byte> command, IntPtr term)
+    {
+        Write("("u8);
+        Write(command);
+        Write(" "u8);
+        WriteTerm(term);
+        Write(")\n"u8);
+    }
+
+    /// <summary>
+    /// Writes a single term, binding subterms referenced more than once with nested <c>let</c>s.
+    /// </summary>
+    public void WriteTerm(IntPtr term)
+    {
+        var references = CountReferences(term);
+        var names = new Dictionary<uint, int>();
+
+        // Post-order walk so every shared node is bound after the shared nodes it refers to
+        var visited = new HashSet<uint>();
+        var pending = new Stack<(IntPtr Term, bool Expanded)>();
+        pending.Push((term, false));
+
+        while (pending.TryPop(out var item))
+        {
+            var id = library.GetAstId(context.Handle, item.Term);
+            if (item.Expanded)
+            {
+                if (item.Term == term || references[id] < 2)
+                    continue;
+
+                Write("(let (("u8);
+                WriteName(names.Count + 1);
+                Write(" "u8);
+                WriteInline(item.Term, names);
+                Write("))\n"u8);
+                names.Add(id, names.Count + 1);
+                continue;
+            }
+
+            if (!IsCompound(item.Term, out var numArgs) || !visited.Add(id))
+                continue;
+
+            pending.Push((item.Term, true));
+            for (var i = numArgs; i > 0; i--)
+                pending.Push((library.GetAppArg(context.Handle, item.Term, i - 1), false));
+        }
+
+        WriteInline(term, names);
+
+        for (var i = 0; i < names.Count; i++)
+            Write(")"u8);
+    }
+
+    public void Flush()
+    {
+        if (chunk == null)
+            return;
+
+        stream.Write(chunk, 0, chunkLength);
+        chunkLength = 0;
+        stream.Flush();
+    }
+
+    public void Dispose()
+    {
+        if (chunk == null)
+            return;
+
+        Flush();
+        ArrayPool<byte>.Shared.Return(chunk);
+        chunk = null;
+    }
+
+    private Dictionary<uint, int> CountReferences(IntPtr term)
+    {
+        var references = new Dictionary<uint, int>();
+        var pending = new Stack<IntPtr>();
+        pending.Push(term);
+
+        while (pending.TryPop(out var current))
+        {
+            if (!IsCompound(current, out var numArgs))
+                continue;
+
+            var id = library.GetAstId(context.Handle, current);
+            if (references.TryGetValue(id, out var count))
+            {
+                references[id] = count + 1;
+                continue;
+            }
+
+            references.Add(id, 1);
+            for (var i = 0u; i < numArgs; i++)
+                pending.Push(library.GetAppArg(context.Handle, current, i));
+        }
+
+        return references;
+    }
+
+    private void WriteInline(IntPtr term, Dictionary<uint, int> names)
+    {
+        // IntPtr.Zero marks a closing parenthesis
+        var pending = new Stack<(IntPtr Term, bool LeadingSpace)>();
+        pending.Push((term, false));
+
+        while (pending.TryPop(out var item))
+        {
+            if (item.Term == IntPtr.Zero)
+            {
+                Write(")"u8);
+                continue;
+            }
+
+            if (item.LeadingSpace)
+                Write(" "u8);
+
+            if (item.Term != term && names.TryGetValue(library.GetAstId(context.Handle, item.Term), out var index))
+            {
+                WriteName(index);
+                continue;
+            }
+
+            if (!IsCompound(item.Term, out var numArgs))
+            {
+                Write(library.AstToStringUtf8(context.Handle, item.Term));
+                continue;
+            }
+
+            Write("("u8);
+            WriteHead(library.GetAppDecl(context.Handle, item.Term));
+            pending.Push((IntPtr.Zero, false));
+            for (var i = numArgs; i > 0; i--)
+                pending.Push((library.GetAppArg(context.Handle, item.Term, i - 1), true));
+        }
+    }
+
+    private bool IsCompound(IntPtr term, out uint numArgs)
+    {
+        numArgs = 0;
+        if (library.GetAstKind(context.Handle, term) != Z3Library.AstKind.Z3_APP_AST)
+            return false;
+
+        numArgs = library.GetAppNumArgs(context.Handle, term);
+        if (numArgs == 0)
+            return false;
+
+        var decl = library.GetAppDecl(context.Handle, term);
+        var numParameters = library.GetDeclNumParameters(context.Handle, decl);
+        for (var i = 0u; i < numParameters; i++)
+        {
+            var kind = library.GetDeclParameterKind(context.Handle, decl, i);
+            if (
+                kind
+                is not (
+                    Z3Library.ParameterKind.Z3_PARAMETER_INT
+                    or Z3Library.ParameterKind.Z3_PARAMETER_RATIONAL
+                    or Z3Library.ParameterKind.Z3_PARAMETER_SYMBOL
+                )
+            )
+                return false;
+        }
+
+        return true;
+    }
+
+    private void WriteHead(IntPtr decl)
+    {
+        var numParameters = library.GetDeclNumParameters(context.Handle, decl);
+        if (numParameters > 0)
+            Write("(_ "u8);
+
+        // Z3 names if-then-else "if" internally
+        if (library.GetDeclKind(context.Handle, decl) == Z3Library.DeclKind.Z3_OP_ITE)
+            Write("ite"u8);
+        else
+            WriteSymbol(library.GetDeclName(context.Handle, decl));
+
+        if (numParameters == 0)
+            return;
+
+        for (var i = 0u; i < numParameters; i++)
+        {
+            Write(" "u8);
+            switch (library.GetDeclParameterKind(context.Handle, decl, i))
+            {
+                case Z3Library.ParameterKind.Z3_PARAMETER_INT:
+                    WriteNumber(library.GetDeclIntParameter(context.Handle, decl, i));
+                    break;
+                case Z3Library.ParameterKind.Z3_PARAMETER_RATIONAL:
+                    Write(library.GetDeclRationalParameterUtf8(context.Handle, decl, i));
+                    break;
+                default:
+                    WriteSymbol(library.GetDeclSymbolParameter(context.Handle, decl, i));
+                    break;
+            }
+        }
+
+        Write(")"u8);
+    }
+
+    private void WriteSymbol(IntPtr symbol)
+    {
+        if (library.GetSymbolKind(context.Handle, symbol) == Z3Library.SymbolKind.Z3_INT_SYMBOL)
+        {
+            Write("k!"u8);
+            WriteNumber(library.GetSymbolInt(context.Handle, symbol));
+            return;
+        }
+
+        var name = library.GetSymbolStringUtf8(context.Handle, symbol);
+        if (IsSimpleSymbol(name))
+        {
+            Write(name);
+            return;
+        }
+
+        Write("|"u8);
+        Write(name);
+        Write("|"u8);
+    }
+
+    private void WriteName(int index)
+    {
+        Write("z3w!"u8);
+        WriteNumber(index);
+    }
+
+    private void WriteNumber(int value)
+    {
+        Span<byte> digits = stackalloc byte[11];
+        value.TryFormat(digits, out var length);
+        Write(digits[..length]);
+    }
+
+    private void Write(ReadOnlySpan<byte> bytes)
+    {
+        ObjectDisposedException.ThrowIf(chunk == null, this);
+
+        if (chunkLength + bytes.Length > chunk.Length)
+        {
+            stream.Write(chunk, 0, chunkLength);
+            chunkLength = 0;
+
+            if (bytes.Length > chunk.Length)
+            {
+                stream.Write(bytes);
+                return;
+            }
+        }
+
+        bytes.CopyTo(chunk.AsSpan(chunkLength));
+        chunkLength += bytes.Length;
+    }
+
+    private static bool IsSimpleSymbol(ReadOnlySpan<byte> name)
+    {
+        if (name.IsEmpty || char.IsAsciiDigit((char)name[0]))
+            return false;
+
+        foreach (var b in name)
+        {
+            if (char.IsAsciiLetterOrDigit((char)b) || "~!@$%^&*_-+=<>.?/"u8.Contains(b))
+                continue;
+
+            return false;
+        }
+
+        return true;
+    }
+}
@@ -1,3 +1,5 @@
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Expressions.Common;
 using Spaceorc.Z3Wrap.Expressions.Logic;
 
 namespace Spaceorc.Z3Wrap.Core;
@@ -24,6 +26,14 @@ public sealed class Z3Solver : IDisposable
         context.Library.SolverIncRef(context.Handle, InternalHandle);
     }
 
+    internal Z3Solver(Z3Context context, Z3Tactic tactic)
+    {
+        this.context = context;
+
+        InternalHandle = context.Library.MkSolverFromTactic(context.Handle, tactic.Handle);
+        context.Library.SolverIncRef(context.Handle, InternalHandle);
+    }
+
     /// <summary>
     /// Gets the native Z3 solver handle.
     /// </summary>
@@ -65,6 +75,78 @@ public sealed class Z3Solver : IDisposable
         context.Library.SolverAssert(context.Handle, InternalHandle, constraint.Handle);
     }
 
+    /// <summary>
+    /// Adds an arena-built boolean constraint to the solver.
+    /// </summary>
+    /// <param name="constraint">The boolean constraint to add.</param>
+    /// <exception cref="ObjectDisposedException">Thrown if the arena of the constraint has been disposed.</exception>
+    public void Assert(ExprRef<BoolExpr> constraint)
+    {
+        ThrowIfDisposed();
+        constraint.Arena.ThrowIfDisposed();
+        InvalidateModel(); // Model no longer valid after assertion
+
+        context.Library.SolverAssert(context.Handle, InternalHandle, constraint.Handle);
+    }
+
+    /// <summary>
+    /// Loads declarations and assertions from an SMT-LIB2 file.
+    /// </summary>
+    /// <param name="path">Path to the SMT-LIB2 file.</param>
+    /// <remarks>
+    /// The file is read and parsed natively by Z3, without creating managed strings or expressions.
+    /// </remarks>
+    public void LoadSmtLib2(string path)
+    {
+        ThrowIfDisposed();
+        InvalidateModel();
+
+        context.Library.SolverFromFile(context.Handle, InternalHandle, path);
+    }
+
+    /// <summary>
+    /// Loads declarations and assertions from an SMT-LIB2 script in UTF-8.
+    /// </summary>
+    /// <param name="script">UTF-8 encoded SMT-LIB2 script.</param>
+    /// <remarks>
+    /// The script is parsed natively by Z3 in place when it ends with a NUL byte; otherwise it is copied once into a pooled buffer.
+    /// </remarks>
+    public void LoadSmtLib2(ReadOnlyMemory<byte> script)
+    {
+        ThrowIfDisposed();
+        InvalidateModel();
+
+        context.Library.SolverFromString(context.Handle, InternalHandle, script.Span);
+    }
+
+    /// <summary>
+    /// Loads assertions from an SMT-LIB2 file and returns the constants it declares.
+    /// </summary>
+    /// <param name="path">Path to the SMT-LIB2 file.</param>
+    /// <param name="declarations">Table of the uninterpreted constants used by the loaded assertions.</param>
+    public void LoadSmtLib2(string path, out Z3Declarations declarations)
+    {
+        ThrowIfDisposed();
+        InvalidateModel();
+
+        var assertions = context.Library.ParseSmtlib2File(context.Handle, path, 0, [], [], 0, [], []);
+        declarations = AssertParsed(assertions);
+    }
+
+    /// <summary>
+    /// Loads assertions from an SMT-LIB2 script in UTF-8 and returns the constants it declares.
+    /// </summary>
+    /// <param name="script">UTF-8 encoded SMT-LIB2 script.</param>
+    /// <param name="declarations">Table of the uninterpreted constants used by the loaded assertions.</param>
+    public void LoadSmtLib2(ReadOnlyMemory<byte> script, out Z3Declarations declarations)
+    {
+        ThrowIfDisposed();
+        InvalidateModel();
+
+        var assertions = context.Library.ParseSmtlib2String(context.Handle, script.Span, 0, [], [], 0, [], []);
+        declarations = AssertParsed(assertions);
+    }
+
     /// <summary>
     /// Resets the solver by removing all constraints.
     /// </summary>
@@ -96,6 +178,10 @@ public sealed class Z3Solver : IDisposable
         ThrowIfDisposed();
         InvalidateModel(); // Clear any previous model
 
+        using var trace = SolverTracing.Start("Z3Solver.Check");
+        if (trace is { IsRecording: true })
+            trace.SetAssertionCount(context.Library.SolverGetAssertions(context.Handle, InternalHandle).Length);
+
         lastCheckResult = context.Library.SolverCheck(context.Handle, InternalHandle) switch
         {
             Z3Library.Lbool.Z3_L_FALSE => Z3Status.Unsatisfiable,
@@ -103,6 +189,9 @@ public sealed class Z3Solver : IDisposable
             Z3Library.Lbool.Z3_L_UNDEF => Z3Status.Unknown,
             _ => throw new InvalidOperationException($"Unexpected solver result: {lastCheckResult}"),
         };
+        trace?.SetResult(lastCheckResult.Value);
+        if (trace is { IsRecording: true })
+            trace.SetDetails(GetTracedReasonUnknown(), GetStatistics());
         return lastCheckResult.Value;
     }
 
@@ -117,17 +206,59 @@ public sealed class Z3Solver : IDisposable
     /// Common patterns: direct constraints (x &gt; 10) or boolean trackers with implications.
     /// </remarks>
     public Z3Status CheckAssumptions(params BoolExpr[] assumptions)
+    {
+        ThrowIfDisposed();
+
+        var assumptionHandles = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            assumptionHandles.AddRange(assumptions);
+            return CheckAssumptionHandles(assumptionHandles.Span);
+        }
+        finally
+        {
+            assumptionHandles.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Gets minimal unsatisfiable subset after CheckAssumptions returns Unsatisfiable.
+    /// </summary>
+    /// <returns>Array of boolean expressions representing the minimal conflicting assumptions.</returns>
+    /// <exception cref="InvalidOperationException">Thrown if CheckAssumptions was not called or result was not Unsatisfiable.</exception>
+    /// <remarks>
+    /// The returned core is a minimal subset of assumptions that together are unsatisfiable.
+    /// Must be called after <see cref="CheckAssumptions"/> returns <see cref="Z3Status.Unsatisfiable"/>.
+    /// </remarks>
+    public BoolExpr[] GetUnsatCore()
+    {
+        var coreHandles = GetUnsatCoreHandles();
+
+        var core = new BoolExpr[coreHandles.Length];
+        for (var i = 0; i < coreHandles.Length; i++)
+        {
+            core[i] = Z3Expr.Create<BoolExpr>(context, coreHandles[i]);
+        }
+
+        return core;
+    }
+
+    internal Z3Context Context => context;
+
+    internal Z3Status CheckAssumptionHandles(ReadOnlySpan<IntPtr> assumptions)
     {
         ThrowIfDisposed();
         InvalidateModel(); // Clear any previous model
 
-        var assumptionHandles = assumptions.Select(a => a.Handle).ToArray();
+        using var trace = SolverTracing.Start("Z3Solver.CheckAssumptions");
+        if (trace is { IsRecording: true })
+            trace.SetAssertionCount(context.Library.SolverGetAssertions(context.Handle, InternalHandle).Length);
 
         lastCheckResult = context.Library.SolverCheckAssumptions(
             context.Handle,
             InternalHandle,
-            (uint)assumptionHandles.Length,
-            assumptionHandles
+            (uint)assumptions.Length,
+            assumptions
         ) switch
         {
             Z3Library.Lbool.Z3_L_FALSE => Z3Status.Unsatisfiable,
@@ -135,19 +266,16 @@ public sealed class Z3Solver : IDisposable
             Z3Library.Lbool.Z3_L_UNDEF => Z3Status.Unknown,
             _ => throw new InvalidOperationException($"Unexpected solver result: {lastCheckResult}"),
         };
+        trace?.SetResult(lastCheckResult.Value);
+        if (trace is { IsRecording: true })
+            trace.SetDetails(GetTracedReasonUnknown(), GetStatistics());
         return lastCheckResult.Value;
     }
 
     /// <summary>
-    /// Gets minimal unsatisfiable subset after CheckAssumptions returns Unsatisfiable.
+    /// Gets the unsat core as the native handles of the assumptions, without wrapping them as expressions.
     /// </summary>
-    /// <returns>Array of boolean expressions representing the minimal conflicting assumptions.</returns>
-    /// <exception cref="InvalidOperationException">Thrown if CheckAssumptions was not called or result was not Unsatisfiable.</exception>
-    /// <remarks>
-    /// The returned core is a minimal subset of assumptions that together are unsatisfiable.
-    /// Must be called after <see cref="CheckAssumptions"/> returns <see cref="Z3Status.Unsatisfiable"/>.
-    /// </remarks>
-    public BoolExpr[] GetUnsatCore()
+    internal IntPtr[] GetUnsatCoreHandles()
     {
         ThrowIfDisposed();
 
@@ -157,15 +285,31 @@ public sealed class Z3Solver : IDisposable
         if (lastCheckResult != Z3Status.Unsatisfiable)
             throw new InvalidOperationException($"Cannot get unsat core when solver status is {lastCheckResult}");
 
+        using var trace = SolverTracing.Start("Z3Solver.GetUnsatCore");
         var coreHandles = context.Library.SolverGetUnsatCore(context.Handle, InternalHandle);
+        trace?.SetCoreSize(coreHandles.Length);
+        return coreHandles;
+    }
 
-        var core = new BoolExpr[coreHandles.Length];
-        for (var i = 0; i < coreHandles.Length; i++)
-        {
-            core[i] = Z3Expr.Create<BoolExpr>(context, coreHandles[i]);
-        }
+    /// <summary>
+    /// Enumerates the distinct assignments to a projection set over all models of the current constraints.
+    /// </summary>
+    /// <typeparam name="T">Expression type of the projected terms.</typeparam>
+    /// <param name="projection">The terms whose values form each row.</param>
+    /// <param name="limit">Maximum number of rows to produce.</param>
+    /// <returns>Lazy enumeration of value rows that also reports the model count and throughput.</returns>
+    /// <exception cref="ArgumentOutOfRangeException">Thrown if <paramref name="limit"/> is negative.</exception>
+    /// <remarks>
+    /// Blocking clauses are asserted in a scope pushed for the enumeration and popped when it ends, so the
+    /// solver must not be pushed or popped by the caller while an enumeration is in progress.
+    /// </remarks>
+    public Z3ModelEnumeration<T> EnumerateModels<T>(IEnumerable<T> projection, int limit = int.MaxValue)
+        where T : Z3Expr, IExprType<T>
+    {
+        ThrowIfDisposed();
+        ArgumentOutOfRangeException.ThrowIfNegative(limit);
 
-        return core;
+        return new Z3ModelEnumeration<T>(this, [.. projection], limit);
     }
 
     /// <summary>
@@ -179,6 +323,18 @@ public sealed class Z3Solver : IDisposable
         return context.Library.SolverGetReasonUnknown(context.Handle, InternalHandle);
     }
 
+    /// <summary>
+    /// Gets a snapshot of the solver statistics (conflicts, decisions, memory, time, ...).
+    /// </summary>
+    /// <returns>Statistics snapshot; use <see cref="Z3Statistics.Diff"/> to compare two snapshots.</returns>
+    public Z3Statistics GetStatistics()
+    {
+        ThrowIfDisposed();
+
+        var statsHandle = context.Library.SolverGetStatistics(context.Handle, InternalHandle);
+        return Z3Statistics.Create(context, statsHandle);
+    }
+
     /// <summary>
     /// Pushes a new scope onto the solver stack.
     /// </summary>
@@ -221,6 +377,7 @@ public sealed class Z3Solver : IDisposable
         // Return cached model if we have one
         if (cachedModel == null)
         {
+            using var trace = SolverTracing.Start("Z3Solver.GetModel");
             var modelHandle = context.Library.SolverGetModel(context.Handle, InternalHandle);
             cachedModel = new Z3Model(context, modelHandle);
         }
@@ -253,6 +410,62 @@ public sealed class Z3Solver : IDisposable
         return context.Library.AstToString(context.Handle, proofHandle);
     }
 
+    /// <summary>
+    /// Writes the proof to a stream as UTF-8 after an unsatisfiable check result.
+    /// </summary>
+    /// <param name="destination">The stream to write the proof to.</param>
+    /// <exception cref="InvalidOperationException">Thrown if Check was not called or result was not Unsatisfiable.</exception>
+    /// <remarks>
+    /// Unlike <see cref="GetProof"/>, the proof DAG is walked incrementally and written in chunks, binding shared
+    /// inference steps with <c>let</c>, so memory stays bounded and output size is linear in the number of distinct steps.
+    /// Proof generation must be enabled at context creation by setting the 'proof' parameter to true.
+    /// </remarks>
+    public void WriteProof(Stream destination)
+    {
+        ThrowIfDisposed();
+
+        if (lastCheckResult == null)
+            throw new InvalidOperationException("Must call Check() before WriteProof()");
+
+        if (lastCheckResult != Z3Status.Unsatisfiable)
+            throw new InvalidOperationException($"Cannot get proof when solver status is {lastCheckResult}");
+
+        var proofHandle = context.Library.SolverGetProof(context.Handle, InternalHandle);
+
+        using var writer = new Z3SmtLib2Writer(context, destination);
+        writer.WriteTerm(proofHandle);
+    }
+
+    /// <summary>
+    /// Writes the current assertions to a stream as an SMT-LIB2 script in UTF-8.
+    /// </summary>
+    /// <param name="destination">The stream to write the script to.</param>
+    /// <remarks>
+    /// The script declares all uninterpreted constants and functions, followed by one <c>assert</c> per assertion.
+    /// Terms are walked incrementally and written in chunks; shared subterms are bound with <c>let</c>.
+    /// </remarks>
+    public void WriteSmtLib2(Stream destination)
+    {
+        ThrowIfDisposed();
+
+        var assertions = context.Library.SolverGetAssertions(context.Handle, InternalHandle);
+
+        using var writer = new Z3SmtLib2Writer(context, destination);
+        writer.WriteDeclarations(assertions);
+        foreach (var assertion in assertions)
+            writer.WriteCommand("assert"u8, assertion);
+    }
+
+    private Z3Declarations AssertParsed(IntPtr[] assertions)
+    {
+        foreach (var assertion in assertions)
+            context.Library.SolverAssert(context.Handle, InternalHandle, assertion);
+
+        return Z3Declarations.Collect(context, assertions);
+    }
+
+    private string? GetTracedReasonUnknown() => lastCheckResult == Z3Status.Unknown ? GetReasonUnknown() : null;
+
     private void InvalidateModel()
     {
         cachedModel?.Invalidate();
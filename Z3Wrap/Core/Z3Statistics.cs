@@ -0,0 +1,226 @@
+using System.Collections;
+using System.Collections.Concurrent;
+using System.Diagnostics.Metrics;
+using System.Text;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Immutable snapshot of Z3 solver or optimizer statistics.
+/// </summary>
+/// <remarks>
+/// Keys are interned once per process and values are stored in parallel arrays, so taking a snapshot
+/// allocates no per-key strings after warm-up and never parses <c>Z3_stats_to_string</c>.
+/// Integer statistics are stored as exact doubles.
+/// </remarks>
+public sealed class Z3Statistics : IReadOnlyDictionary<string, double>
+{
+    private const int MaxStackKeyLength = 128;
+
+    private static readonly ConcurrentDictionary<string, string> internedKeys = new();
+    private static readonly ConcurrentDictionary<string, string>.AlternateLookup<ReadOnlySpan<char>> internedKeyLookup =
+        internedKeys.GetAlternateLookup<ReadOnlySpan<char>>();
+
+    private readonly string[] keys;
+    private readonly double[] values;
+    private readonly bool[] integral;
+
+    private Z3Statistics(string[] keys, double[] values, bool[] integral)
+    {
+        this.keys = keys;
+        this.values = values;
+        this.integral = integral;
+    }
+
+    /// <summary>
+    /// Gets the number of statistics in the snapshot.
+    /// </summary>
+    public int Count => keys.Length;
+
+    /// <summary>
+    /// Gets the value of the statistic with the given key.
+    /// </summary>
+    /// <param name="key">The statistic key (for example <c>conflicts</c>).</param>
+    /// <exception cref="KeyNotFoundException">Thrown if the snapshot has no such statistic.</exception>
+    public double this[string key] =>
+        TryGetValue(key, out var value) ? value : throw new KeyNotFoundException($"Statistic '{key}' not found");
+
+    /// <summary>
+    /// Gets all statistic keys in Z3 order.
+    /// </summary>
+    public IEnumerable<string> Keys => keys;
+
+    /// <summary>
+    /// Gets all statistic values in Z3 order.
+    /// </summary>
+    public IEnumerable<double> Values => values;
+
+    /// <summary>
+    /// Gets the number of conflicts, if reported.
+    /// </summary>
+    public long? Conflicts => GetInteger("conflicts");
+
+    /// <summary>
+    /// Gets the number of decisions, if reported.
+    /// </summary>
+    public long? Decisions => GetInteger("decisions");
+
+    /// <summary>
+    /// Gets the number of propagations, if reported.
+    /// </summary>
+    public long? Propagations => GetInteger("propagations");
+
+    /// <summary>
+    /// Gets the memory in use in megabytes, if reported.
+    /// </summary>
+    public double? Memory => TryGetValue("memory", out var value) ? value : null;
+
+    /// <summary>
+    /// Gets the peak memory usage in megabytes, if reported.
+    /// </summary>
+    public double? MaxMemory => TryGetValue("max memory", out var value) ? value : null;
+
+    /// <summary>
+    /// Gets the time spent, if reported.
+    /// </summary>
+    public TimeSpan? Time => TryGetValue("time", out var value) ? TimeSpan.FromSeconds(value) : null;
+
+    /// <summary>
+    /// Gets the key of the statistic at the given index.
+    /// </summary>
+    /// <param name="index">Zero-based statistic index.</param>
+    /// <returns>The statistic key.</returns>
+    public string GetKey(int index) => keys[index];
+
+    /// <summary>
+    /// Gets the value of the statistic at the given index.
+    /// </summary>
+    /// <param name="index">Zero-based statistic index.</param>
+    /// <returns>The statistic value.</returns>
+    public double GetValue(int index) => values[index];
+
+    /// <summary>
+    /// Determines whether the statistic at the given index is an integer counter.
+    /// </summary>
+    /// <param name="index">Zero-based statistic index.</param>
+    /// <returns>True for integer statistics; false for floating-point statistics.</returns>
+    public bool IsInteger(int index) => integral[index];
+
+    /// <summary>
+    /// Determines whether the snapshot contains a statistic with the given key.
+    /// </summary>
+    /// <param name="key">The statistic key.</param>
+    /// <returns>True if the statistic is present; otherwise false.</returns>
+    public bool ContainsKey(string key) => IndexOf(key) >= 0;
+
+    /// <summary>
+    /// Gets the value of the statistic with the given key.
+    /// </summary>
+    /// <param name="key">The statistic key.</param>
+    /// <param name="value">The statistic value, if present.</param>
+    /// <returns>True if the statistic is present; otherwise false.</returns>
+    public bool TryGetValue(string key, out double value)
+    {
+        var index = IndexOf(key);
+        value = index >= 0 ? values[index] : 0;
+        return index >= 0;
+    }
+
+    /// <summary>
+    /// Computes the change of every statistic relative to an earlier snapshot.
+    /// </summary>
+    /// <param name="baseline">The earlier snapshot.</param>
+    /// <returns>A snapshot with this snapshot's keys and values minus the baseline values (missing baseline values count as zero).</returns>
+    public Z3Statistics Diff(Z3Statistics baseline)
+    {
+        var diff = new double[values.Length];
+        for (var i = 0; i < values.Length; i++)
+            diff[i] = baseline.TryGetValue(keys[i], out var previous) ? values[i] - previous : values[i];
+
+        return new Z3Statistics(keys, diff, integral);
+    }
+
+    /// <summary>
+    /// Records every statistic into a histogram, tagged with <c>z3.statistic</c> set to the key.
+    /// </summary>
+    /// <param name="histogram">The histogram to record into, typically created from an application <see cref="Meter"/>.</param>
+    public void RecordTo(Histogram<double> histogram)
+    {
+        if (!histogram.Enabled)
+            return;
+
+        for (var i = 0; i < keys.Length; i++)
+            histogram.Record(values[i], new KeyValuePair<string, object?>("z3.statistic", keys[i]));
+    }
+
+    /// <summary>
+    /// Returns an enumerator over all statistics in Z3 order.
+    /// </summary>
+    /// <returns>An enumerator of key/value pairs.</returns>
+    public IEnumerator<KeyValuePair<string, double>> GetEnumerator()
+    {
+        for (var i = 0; i < keys.Length; i++)
+            yield return new KeyValuePair<string, double>(keys[i], values[i]);
+    }
+
+    IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+
+    /// <summary>
+    /// Returns the statistics as space-separated <c>key=value</c> pairs.
+    /// </summary>
+    /// <returns>String representation of the snapshot.</returns>
+    public override string ToString() => string.Join(" ", this.Select(pair => $"{pair.Key}={pair.Value}"));
+
+    internal static Z3Statistics Create(Z3Context context, IntPtr statsHandle)
+    {
+        var library = context.Library;
+        library.StatsIncRef(context.Handle, statsHandle);
+        try
+        {
+            var size = (int)library.StatsSize(context.Handle, statsHandle);
+            var keys = new string[size];
+            var values = new double[size];
+            var integral = new bool[size];
+
+            for (var i = 0u; i < size; i++)
+            {
+                keys[i] = Intern(library.StatsGetKeyUtf8(context.Handle, statsHandle, i));
+                integral[i] = library.StatsIsUint(context.Handle, statsHandle, i);
+                values[i] = integral[i]
+                    ? library.StatsGetUintValue(context.Handle, statsHandle, i)
+                    : library.StatsGetDoubleValue(context.Handle, statsHandle, i);
+            }
+
+            return new Z3Statistics(keys, values, integral);
+        }
+        finally
+        {
+            library.StatsDecRef(context.Handle, statsHandle);
+        }
+    }
+
+    private static string Intern(ReadOnlySpan<byte> utf8Key)
+    {
+        if (utf8Key.Length > MaxStackKeyLength)
+            return internedKeys.GetOrAdd(Encoding.UTF8.GetString(utf8Key), key => key);
+
+        Span<char> chars = stackalloc char[MaxStackKeyLength];
+        var length = Encoding.UTF8.GetChars(utf8Key, chars);
+        if (internedKeyLookup.TryGetValue(chars[..length], out var interned))
+            return interned;
+
+        var key = new string(chars[..length]);
+        return internedKeys.GetOrAdd(key, key);
+    }
+
+    private int IndexOf(string key)
+    {
+        for (var i = 0; i < keys.Length; i++)
+            if (string.Equals(keys[i], key, StringComparison.Ordinal))
+                return i;
+
+        return -1;
+    }
+
+    private long? GetInteger(string key) => TryGetValue(key, out var value) ? (long)value : null;
+}
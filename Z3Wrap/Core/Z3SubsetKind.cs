@@ -0,0 +1,17 @@
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Kind of assumption subset reported by <see cref="Z3UnsatCoreEngine.Enumerate"/>.
+/// </summary>
+public enum Z3SubsetKind
+{
+    /// <summary>
+    /// Minimal unsatisfiable subset: unsatisfiable, but satisfiable once any assumption is removed.
+    /// </summary>
+    MinimalUnsatisfiableSubset,
+
+    /// <summary>
+    /// Minimal correction set: removing it leaves a maximal satisfiable subset of the assumptions.
+    /// </summary>
+    MinimalCorrectionSet,
+}
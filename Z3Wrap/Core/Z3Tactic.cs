@@ -0,0 +1,179 @@
+using Spaceorc.Z3Wrap.Core.Interop;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Represents a Z3 tactic: a goal transformation that can be combined into preprocessing and solving pipelines.
+/// </summary>
+/// <remarks>
+/// Tactics are owned by their context and released when it is disposed. Combinators return new tactics and leave
+/// their operands unchanged, so a pipeline can be built once and reused for many goals or solvers
+/// (<see cref="Z3Context.CreateSolver(Z3Tactic)"/>).
+/// </remarks>
+public sealed class Z3Tactic
+{
+    internal Z3Tactic(Z3Context context, IntPtr handle)
+    {
+        context.TrackTactic(handle);
+        Context = context;
+        Handle = handle;
+    }
+
+    /// <summary>
+    /// Gets the Z3 context that owns this tactic.
+    /// </summary>
+    public Z3Context Context { get; }
+
+    /// <summary>
+    /// Gets the native Z3 tactic handle.
+    /// </summary>
+    public IntPtr Handle { get; }
+
+    /// <summary>
+    /// Applies the tactic to a goal.
+    /// </summary>
+    /// <param name="goal">The goal to transform.</param>
+    /// <returns>The subgoals produced by the tactic.</returns>
+    public Z3Goal[] Apply(Z3Goal goal)
+    {
+        var library = Context.Library;
+        var result = library.TacticApply(Context.Handle, Handle, goal.Handle);
+        library.ApplyResultIncRef(Context.Handle, result);
+        try
+        {
+            var subgoals = new Z3Goal[library.ApplyResultGetNumSubgoals(Context.Handle, result)];
+            for (var i = 0u; i < subgoals.Length; i++)
+                subgoals[i] = new Z3Goal(Context, library.ApplyResultGetSubgoal(Context.Handle, result, i));
+
+            return subgoals;
+        }
+        finally
+        {
+            library.ApplyResultDecRef(Context.Handle, result);
+        }
+    }
+
+    /// <summary>
+    /// Creates a tactic that applies this tactic and then <paramref name="next"/> to every subgoal.
+    /// </summary>
+    /// <param name="next">The tactic to apply to the subgoals.</param>
+    /// <returns>The sequential tactic.</returns>
+    public Z3Tactic Then(Z3Tactic next) =>
+        new(Context, Context.Library.TacticAndThen(Context.Handle, Handle, next.Handle));
+
+    /// <summary>
+    /// Creates a tactic that applies this tactic and then <paramref name="next"/> to the subgoals in parallel.
+    /// </summary>
+    /// <param name="next">The tactic to apply to the subgoals.</param>
+    /// <returns>The parallel sequential tactic.</returns>
+    public Z3Tactic ParThen(Z3Tactic next) =>
+        new(Context, Context.Library.TacticParAndThen(Context.Handle, Handle, next.Handle));
+
+    /// <summary>
+    /// Creates a tactic that applies this tactic and, if it fails, <paramref name="fallback"/> instead.
+    /// </summary>
+    /// <param name="fallback">The tactic to apply on failure.</param>
+    /// <returns>The fallback tactic.</returns>
+    public Z3Tactic OrElse(Z3Tactic fallback) =>
+        new(Context, Context.Library.TacticOrElse(Context.Handle, Handle, fallback.Handle));
+
+    /// <summary>
+    /// Creates a tactic that fails if this tactic does not finish within a time limit.
+    /// </summary>
+    /// <param name="timeout">The time limit, at most <see cref="uint.MaxValue"/> milliseconds.</param>
+    /// <returns>The time-limited tactic.</returns>
+    /// <exception cref="ArgumentOutOfRangeException">Thrown if <paramref name="timeout"/> is negative or too large.</exception>
+    public Z3Tactic TryFor(TimeSpan timeout)
+    {
+        ArgumentOutOfRangeException.ThrowIfLessThan(timeout, TimeSpan.Zero);
+        ArgumentOutOfRangeException.ThrowIfGreaterThan(timeout, TimeSpan.FromMilliseconds(uint.MaxValue));
+
+        return new(Context, Context.Library.TacticTryFor(Context.Handle, Handle, (uint)timeout.TotalMilliseconds));
+    }
+
+    /// <summary>
+    /// Creates a tactic that applies this tactic only to goals on which <paramref name="probe"/> holds.
+    /// </summary>
+    /// <param name="probe">The condition.</param>
+    /// <returns>The conditional tactic; goals failing the condition are left unchanged.</returns>
+    public Z3Tactic When(Z3Probe probe) =>
+        new(Context, Context.Library.TacticWhen(Context.Handle, probe.Handle, Handle));
+
+    /// <summary>
+    /// Creates a tactic that applies this tactic repeatedly to the subgoals until no subgoal changes.
+    /// </summary>
+    /// <param name="max">Maximum number of repetitions.</param>
+    /// <returns>The repeating tactic.</returns>
+    public Z3Tactic Repeat(uint max = uint.MaxValue) =>
+        new(Context, Context.Library.TacticRepeat(Context.Handle, Handle, max));
+
+    /// <summary>
+    /// Creates a tactic that applies this tactic with the given parameters.
+    /// </summary>
+    /// <param name="parameters">The parameters to use.</param>
+    /// <returns>The configured tactic.</returns>
+    public Z3Tactic UsingParams(Z3Params parameters)
+    {
+        var handle = IntPtr.Zero;
+        parameters.Apply(
+            Context,
+            paramsHandle => handle = Context.Library.TacticUsingParams(Context.Handle, Handle, paramsHandle)
+        );
+
+        return new(Context, handle);
+    }
+
+    /// <summary>
+    /// Gets the help text of the tactic, including its parameters.
+    /// </summary>
+    /// <returns>The help text.</returns>
+    public string GetHelp() => Context.Library.TacticGetHelp(Context.Handle, Handle);
+
+    /// <summary>
+    /// Creates a tactic that applies the given tactics to the goal in parallel and returns the first result.
+    /// </summary>
+    /// <param name="tactics">The competing tactics.</param>
+    /// <returns>The parallel tactic.</returns>
+    /// <exception cref="ArgumentException">Thrown if <paramref name="tactics"/> is empty.</exception>
+    public static Z3Tactic ParOr(params Z3Tactic[] tactics)
+    {
+        if (tactics.Length == 0)
+            throw new ArgumentException("At least one tactic is required", nameof(tactics));
+
+        var context = tactics[0].Context;
+        var handles = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            foreach (var tactic in tactics)
+                handles.Add(tactic.Handle);
+
+            return new(context, context.Library.TacticParOr(context.Handle, (uint)handles.Length, handles.Span));
+        }
+        finally
+        {
+            handles.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Creates a tactic that dispatches goals on a probe: <paramref name="ifTrue"/> where it holds and
+    /// <paramref name="ifFalse"/> elsewhere.
+    /// </summary>
+    /// <param name="probe">The condition.</param>
+    /// <param name="ifTrue">The tactic for goals on which the probe holds.</param>
+    /// <param name="ifFalse">The tactic for the other goals.</param>
+    /// <returns>The dispatching tactic.</returns>
+    public static Z3Tactic Cond(Z3Probe probe, Z3Tactic ifTrue, Z3Tactic ifFalse) =>
+        new(
+            probe.Context,
+            probe.Context.Library.TacticCond(probe.Context.Handle, probe.Handle, ifTrue.Handle, ifFalse.Handle)
+        );
+
+    /// <summary>
+    /// Creates a tactic that fails on goals on which a probe holds and leaves other goals unchanged.
+    /// </summary>
+    /// <param name="probe">The failure condition.</param>
+    /// <returns>The guard tactic.</returns>
+    public static Z3Tactic FailIf(Z3Probe probe) =>
+        new(probe.Context, probe.Context.Library.TacticFailIf(probe.Context.Handle, probe.Handle));
+}
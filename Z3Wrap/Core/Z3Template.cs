@@ -0,0 +1,121 @@
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Expressions.Common;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Expression built once over positional placeholders and instantiated by substituting values for them.
+/// </summary>
+/// <typeparam name="TResult">Expression type of the template body.</typeparam>
+/// <remarks>
+/// Instantiation is a single <c>Z3_substitute</c> call, so the number of managed wrappers and native calls does not
+/// grow with the number of operators in the body; Z3 still walks the body to rebuild it. Create templates with
+/// <see cref="CommonContextExtensions.Template{TResult}"/>.
+/// </remarks>
+public sealed class Z3Template<TResult>
+    where TResult : Z3Expr, IExprType<TResult>
+{
+    private readonly Z3Context context;
+    private readonly IntPtr[] placeholders;
+    private readonly IntPtr[] sorts;
+
+    internal Z3Template(Z3Context context, TResult body, IntPtr[] placeholders, IntPtr[] sorts)
+    {
+        this.context = context;
+        this.placeholders = placeholders;
+        this.sorts = sorts;
+        Body = body;
+    }
+
+    /// <summary>
+    /// Gets the template body over its placeholders.
+    /// </summary>
+    public TResult Body { get; }
+
+    /// <summary>
+    /// Gets the number of placeholders.
+    /// </summary>
+    public int ParameterCount => sorts.Length;
+
+    /// <summary>
+    /// Instantiates the template with one value per placeholder.
+    /// </summary>
+    /// <param name="values">Values in placeholder declaration order.</param>
+    /// <returns>The body with every placeholder replaced by its value.</returns>
+    /// <exception cref="ArgumentException">Thrown if the number or sorts of the values do not match the placeholders.</exception>
+    public TResult Instantiate(params ReadOnlySpan<Z3Expr> values)
+    {
+        if (values.Length != sorts.Length)
+            throw new ArgumentException(
+                $"Template expects {sorts.Length} values but got {values.Length}",
+                nameof(values)
+            );
+
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            for (var i = 0; i < values.Length; i++)
+                args.Add(GetValueHandle(values[i], i, nameof(values)));
+
+            return Substitute(args.Span);
+        }
+        finally
+        {
+            args.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Instantiates the template once per row of values.
+    /// </summary>
+    /// <param name="values">Rows of <see cref="ParameterCount"/> values each, laid out one row after another.</param>
+    /// <returns>One instance per row, in row order.</returns>
+    /// <exception cref="ArgumentException">Thrown if the values do not form whole rows or their sorts do not match the placeholders.</exception>
+    /// <exception cref="InvalidOperationException">Thrown if the template has no placeholders, so rows cannot be told apart.</exception>
+    public TResult[] InstantiateMany(ReadOnlySpan<Z3Expr> values)
+    {
+        if (sorts.Length == 0)
+            throw new InvalidOperationException("Template has no placeholders; use Body or Instantiate instead");
+
+        if (values.Length % sorts.Length != 0)
+            throw new ArgumentException(
+                $"Template expects a multiple of {sorts.Length} values but got {values.Length}",
+                nameof(values)
+            );
+
+        var results = new TResult[values.Length / sorts.Length];
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            for (var i = 0; i < results.Length; i++)
+            {
+                args.Clear();
+                for (var j = 0; j < sorts.Length; j++)
+                    args.Add(GetValueHandle(values[i * sorts.Length + j], j, nameof(values)));
+
+                results[i] = Substitute(args.Span);
+            }
+
+            return results;
+        }
+        finally
+        {
+            args.Dispose();
+        }
+    }
+
+    private IntPtr GetValueHandle(Z3Expr value, int index, string paramName)
+    {
+        var handle = value.Handle;
+        if (context.Library.GetSort(context.Handle, handle) != sorts[index])
+            throw new ArgumentException($"Value for placeholder {index} does not match its sort", paramName);
+
+        return handle;
+    }
+
+    private TResult Substitute(ReadOnlySpan<IntPtr> to)
+    {
+        var resultHandle = context.Library.Substitute(context.Handle, Body.Handle, (uint)to.Length, placeholders, to);
+        return Z3Expr.Create<TResult>(context, resultHandle);
+    }
+}
@@ -0,0 +1,46 @@
+using Spaceorc.Z3Wrap.Expressions.Common;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Declares the placeholders of a <see cref="Z3Template{TResult}"/> while its body is being built.
+/// </summary>
+public sealed class Z3TemplateParameters
+{
+    private readonly Z3Context context;
+    private readonly List<IntPtr> placeholders = [];
+    private readonly List<IntPtr> sorts = [];
+
+    internal Z3TemplateParameters(Z3Context context)
+    {
+        this.context = context;
+    }
+
+    /// <summary>
+    /// Gets the number of declared placeholders.
+    /// </summary>
+    public int Count => sorts.Count;
+
+    internal IntPtr[] Placeholders => [.. placeholders];
+
+    internal IntPtr[] Sorts => [.. sorts];
+
+    /// <summary>
+    /// Declares the next positional placeholder.
+    /// </summary>
+    /// <typeparam name="T">Expression type of the placeholder.</typeparam>
+    /// <returns>Placeholder expression to use in the template body.</returns>
+    /// <remarks>
+    /// Placeholders are fresh constants, so quantifiers in the body do not capture them; use them only inside the
+    /// template body.
+    /// </remarks>
+    public T Param<T>()
+        where T : Z3Expr, IExprType<T>
+    {
+        var sort = T.Sort(context);
+        var placeholder = Z3Expr.Create<T>(context, context.Library.MkFreshConst(context.Handle, "param", sort));
+        placeholders.Add(placeholder.Handle);
+        sorts.Add(sort);
+        return placeholder;
+    }
+}
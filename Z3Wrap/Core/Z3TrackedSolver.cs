@@ -0,0 +1,185 @@
+using Spaceorc.Z3Wrap.Expressions.Logic;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Tracks labeled groups of constraints on a solver through indicator literals, so groups can be switched on and
+/// off between checks and unsat cores are reported as labels.
+/// </summary>
+/// <typeparam name="TLabel">Label type identifying a constraint group.</typeparam>
+/// <remarks>
+/// Each group gets an indicator from a pool of fresh boolean constants declared in batches, and every constraint of
+/// the group is asserted as <c>indicator =&gt; constraint</c>. <see cref="Check"/> assumes the indicators of the
+/// enabled groups, so a disabled group costs nothing and needs no <see cref="Z3Solver.Push"/>/<see cref="Z3Solver.Pop"/>.
+/// The assumption array is rebuilt only after groups are added or toggled, and cores map back to labels by index.
+/// </remarks>
+public sealed class Z3TrackedSolver<TLabel>
+    where TLabel : notnull
+{
+    private const int DefaultPoolSize = 64;
+
+    private readonly List<BoolExpr> indicators = [];
+    private readonly Dictionary<IntPtr, int> indicatorIndices = [];
+    private readonly List<TLabel> labels = [];
+    private readonly List<bool> enabled = [];
+    private readonly Dictionary<TLabel, int> groups = [];
+    private IntPtr[] assumptions = [];
+    private int assumptionCount;
+    private bool assumptionsChanged;
+
+    /// <summary>
+    /// Initializes a new tracked solver over an existing solver.
+    /// </summary>
+    /// <param name="solver">The solver to assert tracked constraints on.</param>
+    /// <param name="poolSize">Number of indicator literals to declare up front.</param>
+    /// <exception cref="ArgumentOutOfRangeException">Thrown if <paramref name="poolSize"/> is negative.</exception>
+    public Z3TrackedSolver(Z3Solver solver, int poolSize = DefaultPoolSize)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegative(poolSize);
+
+        Solver = solver;
+        if (poolSize > 0)
+            DeclareIndicators(poolSize);
+    }
+
+    /// <summary>
+    /// Gets the underlying solver.
+    /// </summary>
+    public Z3Solver Solver { get; }
+
+    /// <summary>
+    /// Gets the number of constraint groups.
+    /// </summary>
+    public int GroupCount => labels.Count;
+
+    /// <summary>
+    /// Gets the labels of all constraint groups in the order they were created.
+    /// </summary>
+    public IReadOnlyList<TLabel> Labels => labels;
+
+    /// <summary>
+    /// Asserts a constraint as part of a labeled group, creating the group (enabled) on first use.
+    /// </summary>
+    /// <param name="constraint">The constraint to track.</param>
+    /// <param name="label">The label of the group.</param>
+    /// <returns>The indicator literal of the group.</returns>
+    public BoolExpr AssertAndTrack(BoolExpr constraint, TLabel label)
+    {
+        var indicator = indicators[GetOrAddGroup(label)];
+        Solver.Assert(Solver.Context.Implies(indicator, constraint));
+        return indicator;
+    }
+
+    /// <summary>
+    /// Enables a constraint group for subsequent checks.
+    /// </summary>
+    /// <param name="label">The label of the group.</param>
+    /// <exception cref="ArgumentException">Thrown if no group has the label.</exception>
+    public void Enable(TLabel label) => SetEnabled(label, true);
+
+    /// <summary>
+    /// Disables a constraint group for subsequent checks.
+    /// </summary>
+    /// <param name="label">The label of the group.</param>
+    /// <exception cref="ArgumentException">Thrown if no group has the label.</exception>
+    public void Disable(TLabel label) => SetEnabled(label, false);
+
+    /// <summary>
+    /// Gets whether a constraint group exists and is enabled.
+    /// </summary>
+    /// <param name="label">The label of the group.</param>
+    /// <returns>True if the group is enabled.</returns>
+    public bool IsEnabled(TLabel label) => groups.TryGetValue(label, out var index) && enabled[index];
+
+    /// <summary>
+    /// Checks the untracked constraints together with the enabled constraint groups.
+    /// </summary>
+    /// <returns>The satisfiability status.</returns>
+    public Z3Status Check()
+    {
+        if (assumptionsChanged)
+            CollectAssumptions();
+
+        return Solver.CheckAssumptionHandles(assumptions.AsSpan(0, assumptionCount));
+    }
+
+    /// <summary>
+    /// Gets the labels of the groups in the unsat core after <see cref="Check"/> returns
+    /// <see cref="Z3Status.Unsatisfiable"/>.
+    /// </summary>
+    /// <returns>Labels of the conflicting groups.</returns>
+    /// <exception cref="InvalidOperationException">
+    /// Thrown if the last check was not unsatisfiable, or if the last check of <see cref="Solver"/> was made with
+    /// other assumptions than this tracked solver's (for example through <see cref="Z3Solver.CheckAssumptions"/>).
+    /// </exception>
+    public TLabel[] GetUnsatCore()
+    {
+        var core = Solver.GetUnsatCoreHandles();
+
+        var result = new TLabel[core.Length];
+        for (var i = 0; i < core.Length; i++)
+        {
+            if (!indicatorIndices.TryGetValue(core[i], out var index) || index >= labels.Count)
+                throw new InvalidOperationException(
+                    "The unsat core contains an assumption that is not a group indicator; the last check of the "
+                        + "solver was not made by this tracked solver"
+                );
+
+            result[i] = labels[index];
+        }
+
+        return result;
+    }
+
+    private int GetOrAddGroup(TLabel label)
+    {
+        if (groups.TryGetValue(label, out var index))
+            return index;
+
+        index = labels.Count;
+        if (index == indicators.Count)
+            DeclareIndicators(Math.Max(indicators.Count, DefaultPoolSize));
+
+        groups.Add(label, index);
+        labels.Add(label);
+        enabled.Add(true);
+        assumptionsChanged = true;
+        return index;
+    }
+
+    private void SetEnabled(TLabel label, bool value)
+    {
+        if (!groups.TryGetValue(label, out var index))
+            throw new ArgumentException($"No constraint group is labeled '{label}'", nameof(label));
+
+        if (enabled[index] == value)
+            return;
+
+        enabled[index] = value;
+        assumptionsChanged = true;
+    }
+
+    private void DeclareIndicators(int count)
+    {
+        foreach (var indicator in Solver.Context.BoolConsts("track", count))
+        {
+            indicatorIndices.Add(indicator.Handle, indicators.Count);
+            indicators.Add(indicator);
+        }
+    }
+
+    private void CollectAssumptions()
+    {
+        if (assumptions.Length < labels.Count)
+            assumptions = new IntPtr[indicators.Count];
+
+        assumptionCount = 0;
+        for (var i = 0; i < labels.Count; i++)
+        {
+            if (enabled[i])
+                assumptions[assumptionCount++] = indicators[i].Handle;
+        }
+
+        assumptionsChanged = false;
+    }
+}
@@ -0,0 +1,251 @@
+using System.Diagnostics;
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Expressions.Logic;
+
+namespace Spaceorc.Z3Wrap.Core;
+
+/// <summary>
+/// Minimizes unsat cores and enumerates minimal unsatisfiable subsets and minimal correction sets over a fixed
+/// list of assumptions, using <see cref="Z3Solver.CheckAssumptions"/> on one solver incrementally.
+/// </summary>
+/// <remarks>
+/// The solver's assertions are treated as hard constraints. Subsets are tracked as assumption indices and checked
+/// by native handle, so no expression is wrapped until a result is returned. Every check is traced like any other
+/// <c>CheckAssumptions</c> call; <see cref="CheckCount"/> and <see cref="CheckTime"/> summarize the checks made.
+/// Assumptions that are the same native term are treated as one, and results contain each such term once.
+/// </remarks>
+public sealed class Z3UnsatCoreEngine
+{
+    private readonly Z3Solver solver;
+    private readonly BoolExpr[] assumptions;
+    private readonly BoolExpr[] distinct;
+    private readonly IntPtr[] handles;
+    private readonly Dictionary<IntPtr, int> indices = [];
+
+    /// <summary>
+    /// Initializes a new engine over the given assumptions.
+    /// </summary>
+    /// <param name="solver">The solver holding the hard constraints.</param>
+    /// <param name="assumptions">The soft assumptions to reason about.</param>
+    public Z3UnsatCoreEngine(Z3Solver solver, IEnumerable<BoolExpr> assumptions)
+    {
+        this.solver = solver;
+        this.assumptions = [.. assumptions];
+
+        // Subsets are indices into the distinct terms, so a core handle maps back to exactly one index
+        var distinctAssumptions = new List<BoolExpr>();
+        foreach (var assumption in this.assumptions)
+        {
+            if (indices.TryAdd(assumption.Handle, distinctAssumptions.Count))
+                distinctAssumptions.Add(assumption);
+        }
+
+        distinct = [.. distinctAssumptions];
+        handles = [.. distinct.Select(assumption => assumption.Handle)];
+    }
+
+    /// <summary>
+    /// Gets the assumptions the engine reasons about.
+    /// </summary>
+    public IReadOnlyList<BoolExpr> Assumptions => assumptions;
+
+    /// <summary>
+    /// Gets the number of satisfiability checks made so far.
+    /// </summary>
+    public int CheckCount { get; private set; }
+
+    /// <summary>
+    /// Gets the total time spent in satisfiability checks so far.
+    /// </summary>
+    public TimeSpan CheckTime { get; private set; }
+
+    /// <summary>
+    /// Finds a minimal unsatisfiable subset of the assumptions.
+    /// </summary>
+    /// <param name="strategy">The minimization strategy.</param>
+    /// <returns>Assumptions that are unsatisfiable together but satisfiable once any one is removed.</returns>
+    /// <exception cref="InvalidOperationException">Thrown if the assumptions are satisfiable or a check returns unknown.</exception>
+    public BoolExpr[] Minimize(Z3CoreMinimization strategy = Z3CoreMinimization.Deletion)
+    {
+        if (IsSatisfiable([.. Enumerable.Range(0, distinct.Length)]))
+            throw new InvalidOperationException("Cannot minimize an unsat core when the assumptions are satisfiable");
+
+        return ToExprs(Reduce(GetCoreIndices(), strategy));
+    }
+
+    /// <summary>
+    /// Enumerates all minimal unsatisfiable subsets and minimal correction sets of the assumptions (MARCO).
+    /// </summary>
+    /// <param name="strategy">The strategy used to minimize each unsatisfiable seed.</param>
+    /// <returns>Subsets in discovery order, each tagged with its kind.</returns>
+    /// <remarks>
+    /// Explored subsets are recorded in a separate map solver over fresh boolean selectors, which lives for the
+    /// duration of the enumeration. Stopping the enumeration early returns the subsets found so far.
+    /// </remarks>
+    /// <exception cref="InvalidOperationException">Thrown if a check returns unknown.</exception>
+    public IEnumerable<(Z3SubsetKind Kind, BoolExpr[] Assumptions)> Enumerate(
+        Z3CoreMinimization strategy = Z3CoreMinimization.Deletion
+    )
+    {
+        var context = solver.Context;
+        var selectors = context.BoolConsts("marco", distinct.Length);
+        using var map = context.CreateSolver();
+
+        while (map.Check() == Z3Status.Satisfiable)
+        {
+            var model = map.GetModel();
+            var seed = new List<int>();
+            for (var i = 0; i < selectors.Count; i++)
+            {
+                if (model.GetBoolValue(selectors[i]))
+                    seed.Add(i);
+            }
+
+            if (IsSatisfiable(seed))
+            {
+                var correction = Grow(seed);
+                if (correction.Count == 0)
+                    yield break;
+
+                // Every later seed must include an assumption of this correction set
+                map.Assert(context.Or(correction.Select(i => selectors[i])));
+                yield return (Z3SubsetKind.MinimalCorrectionSet, ToExprs(correction));
+            }
+            else
+            {
+                var unsatisfiable = Reduce(GetCoreIndices(), strategy);
+
+                // The hard constraints are unsatisfiable on their own, so this is the only such subset
+                if (unsatisfiable.Count == 0)
+                {
+                    yield return (Z3SubsetKind.MinimalUnsatisfiableSubset, []);
+                    yield break;
+                }
+
+                // Every later seed must leave out an assumption of this unsatisfiable subset
+                map.Assert(context.Or(unsatisfiable.Select(i => !selectors[i])));
+                yield return (Z3SubsetKind.MinimalUnsatisfiableSubset, ToExprs(unsatisfiable));
+            }
+        }
+    }
+
+    private List<int> Reduce(List<int> core, Z3CoreMinimization strategy) =>
+        strategy switch
+        {
+            Z3CoreMinimization.Deletion => Shrink(core),
+            Z3CoreMinimization.QuickXplain => core.Count == 0 ? core : QuickXplain([], false, core),
+            _ => throw new ArgumentOutOfRangeException(nameof(strategy), strategy, "Unknown core minimization"),
+        };
+
+    private List<int> Shrink(List<int> core)
+    {
+        // An assumption is required once the core without it is satisfiable. Refined cores keep every required
+        // assumption, because they are unsatisfiable subsets of the core that proved it required.
+        var required = new HashSet<int>();
+        while (true)
+        {
+            var candidate = core.FindIndex(i => !required.Contains(i));
+            if (candidate < 0)
+                return core;
+
+            var rest = new List<int>(core);
+            rest.RemoveAt(candidate);
+
+            if (IsSatisfiable(rest))
+                required.Add(core[candidate]);
+            else
+                core = GetCoreIndices();
+        }
+    }
+
+    private List<int> QuickXplain(List<int> background, bool backgroundChanged, List<int> constraints)
+    {
+        if (backgroundChanged && !IsSatisfiable(background))
+            return [];
+
+        if (constraints.Count == 1)
+            return constraints;
+
+        var half = constraints.Count / 2;
+        var first = constraints.GetRange(0, half);
+        var second = constraints.GetRange(half, constraints.Count - half);
+
+        var secondConflict = QuickXplain([.. background, .. first], first.Count > 0, second);
+        var firstConflict = QuickXplain([.. background, .. secondConflict], secondConflict.Count > 0, first);
+        return [.. firstConflict, .. secondConflict];
+    }
+
+    private List<int> Grow(List<int> seed)
+    {
+        var included = new bool[distinct.Length];
+        foreach (var i in seed)
+            included[i] = true;
+
+        var current = new List<int>(seed);
+        var correction = new List<int>();
+        for (var i = 0; i < distinct.Length; i++)
+        {
+            if (included[i])
+                continue;
+
+            current.Add(i);
+            if (!IsSatisfiable(current))
+            {
+                current.RemoveAt(current.Count - 1);
+                correction.Add(i);
+            }
+        }
+
+        return correction;
+    }
+
+    private bool IsSatisfiable(List<int> subset)
+    {
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            foreach (var i in subset)
+                args.Add(handles[i]);
+
+            var start = Stopwatch.GetTimestamp();
+            var status = solver.CheckAssumptionHandles(args.Span);
+            CheckTime += Stopwatch.GetElapsedTime(start);
+            CheckCount++;
+
+            return status switch
+            {
+                Z3Status.Satisfiable => true,
+                Z3Status.Unsatisfiable => false,
+                _ => throw new InvalidOperationException(
+                    $"Solver returned unknown while checking assumptions: {solver.GetReasonUnknown()}"
+                ),
+            };
+        }
+        finally
+        {
+            args.Dispose();
+        }
+    }
+
+    private List<int> GetCoreIndices()
+    {
+        var core = new List<int>();
+        foreach (var handle in solver.GetUnsatCoreHandles())
+        {
+            if (indices.TryGetValue(handle, out var index))
+                core.Add(index);
+        }
+
+        core.Sort();
+        return core;
+    }
+
+    private BoolExpr[] ToExprs(List<int> subset)
+    {
+        var result = new BoolExpr[subset.Count];
+        for (var i = 0; i < result.Length; i++)
+            result[i] = distinct[subset[i]];
+
+        return result;
+    }
+}
@@ -1,4 +1,5 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Common;
 using Spaceorc.Z3Wrap.Expressions.Numerics;
 
@@ -23,7 +24,7 @@ public static class ArrayContextExtensions
     {
         var arraySort = context.GetSortForType<ArrayExpr<TIndex, TValue>>();
 
-        var handle = context.Library.MkConst(context.Handle, name, arraySort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), arraySort);
 
         return Z3Expr.Create<ArrayExpr<TIndex, TValue>>(context, handle);
     }
@@ -59,7 +60,7 @@ public static class ArrayContextExtensions
         where TValue : Z3Expr, IExprType<TValue>
     {
         var arraySort = context.GetSortForType<ArrayExpr<TIndex1, TIndex2, TValue>>();
-        var handle = context.Library.MkConst(context.Handle, name, arraySort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), arraySort);
         return Z3Expr.Create<ArrayExpr<TIndex1, TIndex2, TValue>>(context, handle);
     }
 
@@ -83,7 +84,7 @@ public static class ArrayContextExtensions
         where TValue : Z3Expr, IExprType<TValue>
     {
         var arraySort = context.GetSortForType<ArrayExpr<TIndex1, TIndex2, TIndex3, TValue>>();
-        var handle = context.Library.MkConst(context.Handle, name, arraySort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), arraySort);
         return Z3Expr.Create<ArrayExpr<TIndex1, TIndex2, TIndex3, TValue>>(context, handle);
     }
 
@@ -119,6 +120,100 @@ public static class ArrayContextExtensions
         return context.Array<IntExpr, TValue>(defaultValue);
     }
 
+    /// <summary>
+    /// Creates array holding the given entries and a default value for all other indices.
+    /// </summary>
+    /// <typeparam name="TIndex">Array index type.</typeparam>
+    /// <typeparam name="TValue">Array element type.</typeparam>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="entries">The index and value pairs. A later entry for the same index overrides an earlier one.</param>
+    /// <param name="defaultValue">The value of every index without an entry.</param>
+    /// <returns>Array expression equal to the stored entries over a constant default array.</returns>
+    /// <remarks>
+    /// The store chain is built from native handles directly, so only the resulting array is wrapped and tracked
+    /// rather than every intermediate store.
+    /// </remarks>
+    public static ArrayExpr<TIndex, TValue> ArrayFrom<TIndex, TValue>(
+        this Z3Context context,
+        ReadOnlySpan<(TIndex Index, TValue Value)> entries,
+        TValue defaultValue
+    )
+        where TIndex : Z3Expr, IExprType<TIndex>
+        where TValue : Z3Expr, IExprType<TValue>
+    {
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            // Resolve every operand first so no other native call runs while the chain is unreferenced
+            foreach (var (index, value) in entries)
+            {
+                args.Add(index.Handle);
+                args.Add(value.Handle);
+            }
+
+            var defaultHandle = defaultValue.Handle;
+            var indexSort = context.GetSortForType<TIndex>();
+
+            var library = context.Library;
+            var handle = library.MkConstArray(context.Handle, indexSort, defaultHandle);
+            var operands = args.Span;
+            for (var i = 0; i < operands.Length; i += 2)
+                handle = library.MkStore(context.Handle, handle, operands[i], operands[i + 1]);
+
+            return Z3Expr.Create<ArrayExpr<TIndex, TValue>>(context, handle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Creates array with integer index holding the given values at indices 0, 1, 2, ... and a default value for
+    /// all other indices.
+    /// </summary>
+    /// <typeparam name="TValue">Array element type.</typeparam>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="values">The values, stored at their position in the span.</param>
+    /// <param name="defaultValue">The value of every index outside the span.</param>
+    /// <returns>Array expression equal to the stored values over a constant default array.</returns>
+    public static ArrayExpr<IntExpr, TValue> ArrayFrom<TValue>(
+        this Z3Context context,
+        ReadOnlySpan<TValue> values,
+        TValue defaultValue
+    )
+        where TValue : Z3Expr, IExprType<TValue>
+    {
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            foreach (var value in values)
+                args.Add(value.Handle);
+
+            var defaultHandle = defaultValue.Handle;
+            var indexSort = context.GetSortForType<IntExpr>();
+
+            var library = context.Library;
+            var handle = library.MkConstArray(context.Handle, indexSort, defaultHandle);
+            var operands = args.Span;
+            for (var i = 0; i < operands.Length; i++)
+            {
+                // Creating the index numeral is a native call, so the chain needs a reference while it runs
+                library.IncRef(context.Handle, handle);
+                var index = library.MkInt64(context.Handle, i, indexSort);
+                var stored = library.MkStore(context.Handle, handle, index, operands[i]);
+                library.DecRef(context.Handle, handle);
+                handle = stored;
+            }
+
+            return Z3Expr.Create<ArrayExpr<IntExpr, TValue>>(context, handle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
+    }
+
     /// <summary>
     /// Creates array with value stored at specified index.
     /// </summary>
@@ -1,4 +1,5 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Common;
 using Spaceorc.Z3Wrap.Expressions.Numerics;
 using Spaceorc.Z3Wrap.Values.BitVectors;
 
@@ -20,11 +21,22 @@ public static class BvCoreContextExtensions
         where TSize : ISize
     {
         var sort = context.Library.MkBvSort(context.Handle, TSize.Size);
-        var handle = context.Library.MkConst(context.Handle, name, sort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), sort);
 
         return Z3Expr.Create<BvExpr<TSize>>(context, handle);
     }
 
+    /// <summary>
+    /// Creates an array of fresh bit-vector constants named after a common prefix.
+    /// </summary>
+    /// <typeparam name="TSize">Bit-vector size type.</typeparam>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="prefix">The name prefix; Z3 appends a unique suffix to each constant.</param>
+    /// <param name="count">The number of constants.</param>
+    /// <returns>Array of bit-vector constants.</returns>
+    public static Z3ConstArray<BvExpr<TSize>> BvConsts<TSize>(this Z3Context context, string prefix, int count)
+        where TSize : ISize => context.Consts<BvExpr<TSize>>(prefix, count);
+
     /// <summary>
     /// Creates bit-vector expression from value.
     /// </summary>
@@ -1,4 +1,6 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Values.Numerics;
 
 namespace Spaceorc.Z3Wrap.Expressions.Common;
 
@@ -17,14 +19,35 @@ public static class ArithmeticOperationsContextExtensions
     public static T Add<T>(this Z3Context context, params IEnumerable<T> operands)
         where T : Z3Expr, IArithmeticExpr<T>, IExprType<T>
     {
-        var args = operands.Select(o => o.Handle).ToArray();
-        if (args.Length == 0)
-            return T.Zero(context);
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(operands);
+            if (args.Length == 0)
+                return T.Zero(context);
 
-        var resultHandle = context.Library.MkAdd(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<T>(context, resultHandle);
+            var resultHandle = context.Library.MkAdd(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<T>(context, resultHandle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 
+    /// <summary>
+    /// Creates a linear combination of arithmetic expressions as a single flat sum.
+    /// </summary>
+    /// <typeparam name="T">Arithmetic expression type.</typeparam>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="coefficients">The coefficients.</param>
+    /// <param name="variables">The variables, merged when they appear more than once.</param>
+    /// <returns>Expression representing the sum of coefficients[i] * variables[i].</returns>
+    /// <exception cref="ArgumentException">Thrown if the spans differ in length.</exception>
+    public static T Sum<T>(this Z3Context context, ReadOnlySpan<Real> coefficients, ReadOnlySpan<T> variables)
+        where T : Z3Expr, IArithmeticExpr<T>, IExprType<T> =>
+        new LinearExprBuilder<T>(context).AddRange(coefficients, variables).Build();
+
     /// <summary>
     /// Creates subtraction expression for multiple arithmetic expressions.
     /// </summary>
@@ -35,14 +58,22 @@ public static class ArithmeticOperationsContextExtensions
     public static T Sub<T>(this Z3Context context, params IEnumerable<T> operands)
         where T : Z3Expr, IArithmeticExpr<T>, IExprType<T>
     {
-        var args = operands.Select(o => o.Handle).ToArray();
-        if (args.Length == 0)
-            throw new InvalidOperationException(
-                "Sub requires at least one operand. Z3 does not support empty subtraction."
-            );
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(operands);
+            if (args.Length == 0)
+                throw new InvalidOperationException(
+                    "Sub requires at least one operand. Z3 does not support empty subtraction."
+                );
 
-        var resultHandle = context.Library.MkSub(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<T>(context, resultHandle);
+            var resultHandle = context.Library.MkSub(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<T>(context, resultHandle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 
     /// <summary>
@@ -55,12 +86,20 @@ public static class ArithmeticOperationsContextExtensions
     public static T Mul<T>(this Z3Context context, params IEnumerable<T> operands)
         where T : Z3Expr, IArithmeticExpr<T>, IExprType<T>
     {
-        var args = operands.Select(o => o.Handle).ToArray();
-        if (args.Length == 0)
-            return T.One(context);
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(operands);
+            if (args.Length == 0)
+                return T.One(context);
 
-        var resultHandle = context.Library.MkMul(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<T>(context, resultHandle);
+            var resultHandle = context.Library.MkMul(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<T>(context, resultHandle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 
     /// <summary>
@@ -52,4 +52,34 @@ public static class CommonContextExtensions
         var resultHandle = context.Library.Simplify(context.Handle, expr.Handle);
         return Z3Expr.Create<T>(context, resultHandle);
     }
+
+    /// <summary>
+    /// Creates an array of fresh constants of any sort named after a common prefix.
+    /// </summary>
+    /// <typeparam name="T">Expression type of the constants.</typeparam>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="prefix">The name prefix; Z3 appends a unique suffix to each constant.</param>
+    /// <param name="count">The number of constants.</param>
+    /// <returns>Array of constants.</returns>
+    /// <exception cref="ArgumentOutOfRangeException">Thrown if count is negative.</exception>
+    public static Z3ConstArray<T> Consts<T>(this Z3Context context, string prefix, int count)
+        where T : Z3Expr, IExprType<T> => Z3ConstArray<T>.Create(context, prefix, count);
+
+    /// <summary>
+    /// Builds a template expression over positional placeholders for repeated instantiation by substitution.
+    /// </summary>
+    /// <typeparam name="TResult">Expression type of the template body.</typeparam>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="build">Builds the body, declaring placeholders with <see cref="Z3TemplateParameters.Param{T}"/>.</param>
+    /// <returns>The compiled template.</returns>
+    public static Z3Template<TResult> Template<TResult>(
+        this Z3Context context,
+        Func<Z3TemplateParameters, TResult> build
+    )
+        where TResult : Z3Expr, IExprType<TResult>
+    {
+        var parameters = new Z3TemplateParameters(context);
+        var body = build(parameters);
+        return new Z3Template<TResult>(context, body, parameters.Placeholders, parameters.Sorts);
+    }
 }
@@ -0,0 +1,201 @@
+using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Values.Numerics;
+
+namespace Spaceorc.Z3Wrap.Expressions.Common;
+
+/// <summary>
+/// Accumulates a linear combination of arithmetic terms and emits it as a single flat sum.
+/// </summary>
+/// <typeparam name="T">Arithmetic expression type.</typeparam>
+/// <remarks>
+/// Terms over the same variable are merged as they are added and nothing is created in Z3 until <see cref="Build"/>,
+/// which emits one multiplication per non-unit coefficient and a single n-ary addition instead of the left-deep
+/// chain of binary additions built by repeated <c>+</c>.
+/// </remarks>
+public sealed class LinearExprBuilder<T>
+    where T : Z3Expr, IArithmeticExpr<T>, IExprType<T>
+{
+    private const int InitialCapacity = 8;
+
+    private readonly Z3Context context;
+    private readonly bool integerSort;
+    private readonly Dictionary<IntPtr, int> indices = [];
+    private T[] variables = [];
+    private Real[] coefficients = [];
+    private int count;
+    private Real constant = Real.Zero;
+
+    /// <summary>
+    /// Initializes a new empty linear expression builder.
+    /// </summary>
+    /// <param name="context">The Z3 context the expression is built in.</param>
+    public LinearExprBuilder(Z3Context context)
+    {
+        this.context = context;
+        integerSort = context.Library.GetSortKind(context.Handle, T.Sort(context)) == Z3Library.SortKind.Z3_INT_SORT;
+    }
+
+    /// <summary>
+    /// Gets the number of distinct variables added so far, including those whose coefficients cancelled out.
+    /// </summary>
+    public int Count => count;
+
+    /// <summary>
+    /// Gets the accumulated constant term.
+    /// </summary>
+    public Real Constant => constant;
+
+    /// <summary>
+    /// Adds a variable with coefficient one.
+    /// </summary>
+    /// <param name="variable">The variable to add.</param>
+    /// <returns>This builder.</returns>
+    public LinearExprBuilder<T> Add(T variable) => Add(Real.One, variable);
+
+    /// <summary>
+    /// Adds a variable scaled by a coefficient, merging it with any earlier term over the same variable.
+    /// </summary>
+    /// <param name="coefficient">The coefficient.</param>
+    /// <param name="variable">The variable to add.</param>
+    /// <returns>This builder.</returns>
+    /// <exception cref="ArgumentException">Thrown if the coefficient is fractional and the expression sort is integer.</exception>
+    public LinearExprBuilder<T> Add(Real coefficient, T variable)
+    {
+        ThrowIfFractional(coefficient, nameof(coefficient));
+
+        if (indices.TryGetValue(variable.Handle, out var index))
+        {
+            coefficients[index] += coefficient;
+            return this;
+        }
+
+        if (count == variables.Length)
+            Grow();
+
+        indices.Add(variable.Handle, count);
+        variables[count] = variable;
+        coefficients[count] = coefficient;
+        count++;
+        return this;
+    }
+
+    /// <summary>
+    /// Adds variables scaled by the coefficients at the same positions.
+    /// </summary>
+    /// <param name="coefficients">The coefficients.</param>
+    /// <param name="variables">The variables to add.</param>
+    /// <returns>This builder.</returns>
+    /// <exception cref="ArgumentException">Thrown if the spans differ in length, or a coefficient is fractional and the expression sort is integer.</exception>
+    public LinearExprBuilder<T> AddRange(ReadOnlySpan<Real> coefficients, ReadOnlySpan<T> variables)
+    {
+        if (coefficients.Length != variables.Length)
+            throw new ArgumentException("Coefficients and variables must have the same length", nameof(variables));
+
+        for (var i = 0; i < variables.Length; i++)
+            Add(coefficients[i], variables[i]);
+
+        return this;
+    }
+
+    /// <summary>
+    /// Adds a value to the constant term.
+    /// </summary>
+    /// <param name="value">The value to add.</param>
+    /// <returns>This builder.</returns>
+    /// <exception cref="ArgumentException">Thrown if the value is fractional and the expression sort is integer.</exception>
+    public LinearExprBuilder<T> AddConstant(Real value)
+    {
+        ThrowIfFractional(value, nameof(value));
+        constant += value;
+        return this;
+    }
+
+    /// <summary>
+    /// Removes all terms and resets the constant term to zero.
+    /// </summary>
+    public void Clear()
+    {
+        indices.Clear();
+        Array.Clear(variables, 0, count);
+        count = 0;
+        constant = Real.Zero;
+    }
+
+    /// <summary>
+    /// Creates the sum of all terms with non-zero coefficients and the constant term.
+    /// </summary>
+    /// <returns>Expression representing the linear combination.</returns>
+    public T Build()
+    {
+        var library = context.Library;
+        var sort = T.Sort(context);
+        Span<IntPtr> product = stackalloc IntPtr[2];
+
+        // Every handle in args holds a reference until the sum has been created and tracked
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            for (var i = 0; i < count; i++)
+            {
+                var coefficient = coefficients[i];
+                if (coefficient.IsZero)
+                    continue;
+
+                if (coefficient == Real.One)
+                {
+                    library.IncRef(context.Handle, variables[i].Handle);
+                    args.Add(variables[i].Handle);
+                    continue;
+                }
+
+                product[0] = CreateNumeral(coefficient, sort);
+                product[1] = variables[i].Handle;
+                IntPtr term;
+                try
+                {
+                    term = library.MkMul(context.Handle, 2, product);
+                    library.IncRef(context.Handle, term);
+                }
+                finally
+                {
+                    library.DecRef(context.Handle, product[0]);
+                }
+                args.Add(term);
+            }
+
+            if (!constant.IsZero || args.Length == 0)
+                args.Add(CreateNumeral(constant, sort));
+
+            var resultHandle =
+                args.Length == 1 ? args.Span[0] : library.MkAdd(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<T>(context, resultHandle);
+        }
+        finally
+        {
+            foreach (var handle in args.Span)
+                library.DecRef(context.Handle, handle);
+            args.Dispose();
+        }
+    }
+
+    private IntPtr CreateNumeral(Real value, IntPtr sort)
+    {
+        var handle = context.Library.MkNumeral(context.Handle, value.ToString(), sort);
+        context.Library.IncRef(context.Handle, handle);
+        return handle;
+    }
+
+    private void Grow()
+    {
+        var capacity = Math.Max(InitialCapacity, variables.Length * 2);
+        Array.Resize(ref variables, capacity);
+        Array.Resize(ref coefficients, capacity);
+    }
+
+    private void ThrowIfFractional(Real value, string paramName)
+    {
+        if (integerSort && !value.IsInteger)
+            throw new ArgumentException($"Integer linear expression cannot have fractional value {value}", paramName);
+    }
+}
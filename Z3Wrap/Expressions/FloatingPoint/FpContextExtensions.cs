@@ -18,7 +18,7 @@ public static class FpContextExtensions
         where TFormat : IFloatFormat
     {
         var sort = context.Library.MkFpaSort(context.Handle, TFormat.ExponentBits, TFormat.SignificandBits);
-        var handle = context.Library.MkConst(context.Handle, name, sort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), sort);
         return new FpExpr<TFormat>(context, handle);
     }
 
@@ -1,4 +1,5 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Common;
 
 namespace Spaceorc.Z3Wrap.Expressions.Functions;
@@ -33,9 +34,9 @@ public static class FuncContextExtensions
     {
         var rangeSort = context.GetSortForType<TResult>();
 
-        var funcDeclHandle = context.Library.MkFuncDecl(
+        var funcDeclHandle = context.Library.MkFuncDeclOriginal(
             context.Handle,
-            name,
+            context.GetSymbol(name),
             0, // domain size (0 for constants)
             [], // empty domain array
             rangeSort
@@ -59,9 +60,9 @@ public static class FuncContextExtensions
         var domainSorts = new[] { context.GetSortForType<T1>() };
         var rangeSort = context.GetSortForType<TResult>();
 
-        var funcDeclHandle = context.Library.MkFuncDecl(
+        var funcDeclHandle = context.Library.MkFuncDeclOriginal(
             context.Handle,
-            name,
+            context.GetSymbol(name),
             1, // domain size
             domainSorts,
             rangeSort
@@ -87,9 +88,9 @@ public static class FuncContextExtensions
         var domainSorts = new[] { context.GetSortForType<T1>(), context.GetSortForType<T2>() };
         var rangeSort = context.GetSortForType<TResult>();
 
-        var funcDeclHandle = context.Library.MkFuncDecl(
+        var funcDeclHandle = context.Library.MkFuncDeclOriginal(
             context.Handle,
-            name,
+            context.GetSymbol(name),
             2, // domain size
             domainSorts,
             rangeSort
@@ -122,9 +123,9 @@ public static class FuncContextExtensions
         };
         var rangeSort = context.GetSortForType<TResult>();
 
-        var funcDeclHandle = context.Library.MkFuncDecl(
+        var funcDeclHandle = context.Library.MkFuncDeclOriginal(
             context.Handle,
-            name,
+            context.GetSymbol(name),
             3, // domain size
             domainSorts,
             rangeSort
@@ -148,15 +149,28 @@ public static class FuncContextExtensions
     )
         where TResult : Z3Expr, IExprType<TResult>
     {
-        var argHandles = args.Select(a => a.Handle).ToArray();
-        if (argHandles.Length != funcDecl.Arity)
-            throw new ArgumentException(
-                $"Function has arity {funcDecl.Arity}, but {argHandles.Length} arguments provided",
-                nameof(args)
+        var argHandles = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            argHandles.AddRange(args);
+            if (argHandles.Length != funcDecl.Arity)
+                throw new ArgumentException(
+                    $"Function has arity {funcDecl.Arity}, but {argHandles.Length} arguments provided",
+                    nameof(args)
+                );
+
+            var appHandle = context.Library.MkApp(
+                context.Handle,
+                funcDecl.Handle,
+                (uint)argHandles.Length,
+                argHandles.Span
             );
 
-        var appHandle = context.Library.MkApp(context.Handle, funcDecl.Handle, (uint)argHandles.Length, argHandles);
-
-        return Z3Expr.Create<TResult>(context, appHandle);
+            return Z3Expr.Create<TResult>(context, appHandle);
+        }
+        finally
+        {
+            argHandles.Dispose();
+        }
     }
 }
@@ -33,9 +33,9 @@ public sealed class FuncDeclBuilder<TResult>(Z3Context context, string name)
         var domainSorts = ranges.Select(r => r()).ToArray();
         var rangeSort = context.GetSortForType<TResult>();
 
-        var funcDeclHandle = context.Library.MkFuncDecl(
+        var funcDeclHandle = context.Library.MkFuncDeclOriginal(
             context.Handle,
-            name,
+            context.GetSymbol(name),
             (uint)domainSorts.Length,
             domainSorts,
             rangeSort
@@ -1,4 +1,5 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Common;
 
 namespace Spaceorc.Z3Wrap.Expressions.Logic;
@@ -51,10 +52,20 @@ public static class BoolContextExtensions
     public static BoolExpr BoolConst(this Z3Context context, string name)
     {
         var boolSort = context.Library.MkBoolSort(context.Handle);
-        var handle = context.Library.MkConst(context.Handle, name, boolSort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), boolSort);
         return Z3Expr.Create<BoolExpr>(context, handle);
     }
 
+    /// <summary>
+    /// Creates an array of fresh boolean constants named after a common prefix.
+    /// </summary>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="prefix">The name prefix; Z3 appends a unique suffix to each constant.</param>
+    /// <param name="count">The number of constants.</param>
+    /// <returns>Array of boolean constants.</returns>
+    public static Z3ConstArray<BoolExpr> BoolConsts(this Z3Context context, string prefix, int count) =>
+        context.Consts<BoolExpr>(prefix, count);
+
     /// <summary>
     /// Creates logical AND expression for multiple boolean operands.
     /// </summary>
@@ -63,11 +74,19 @@ public static class BoolContextExtensions
     /// <returns>Boolean expression representing conjunction of operands.</returns>
     public static BoolExpr And(this Z3Context context, params IEnumerable<BoolExpr> operands)
     {
-        var args = operands.Select(o => o.Handle).ToArray();
-        if (args.Length == 0)
-            return context.True();
-        var resultHandle = context.Library.MkAnd(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<BoolExpr>(context, resultHandle);
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(operands);
+            if (args.Length == 0)
+                return context.True();
+            var resultHandle = context.Library.MkAnd(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<BoolExpr>(context, resultHandle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 
     /// <summary>
@@ -78,11 +97,19 @@ public static class BoolContextExtensions
     /// <returns>Boolean expression representing disjunction of operands.</returns>
     public static BoolExpr Or(this Z3Context context, params IEnumerable<BoolExpr> operands)
     {
-        var args = operands.Select(o => o.Handle).ToArray();
-        if (args.Length == 0)
-            return context.False();
-        var resultHandle = context.Library.MkOr(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<BoolExpr>(context, resultHandle);
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(operands);
+            if (args.Length == 0)
+                return context.False();
+            var resultHandle = context.Library.MkOr(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<BoolExpr>(context, resultHandle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 
     /// <summary>
@@ -162,10 +189,18 @@ public static class BoolContextExtensions
     public static BoolExpr Distinct<T>(this Z3Context context, params IEnumerable<T> exprs)
         where T : Z3Expr
     {
-        var args = exprs.Select(e => e.Handle).ToArray();
-        if (args.Length < 2)
-            throw new ArgumentException("Distinct requires at least 2 arguments", nameof(exprs));
-        var resultHandle = context.Library.MkDistinct(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<BoolExpr>(context, resultHandle);
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(exprs);
+            if (args.Length < 2)
+                throw new ArgumentException("Distinct requires at least 2 arguments", nameof(exprs));
+            var resultHandle = context.Library.MkDistinct(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<BoolExpr>(context, resultHandle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 }
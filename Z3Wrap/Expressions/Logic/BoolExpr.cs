@@ -1,4 +1,5 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Common;
 
 namespace Spaceorc.Z3Wrap.Expressions.Logic;
@@ -12,6 +13,9 @@ public sealed class BoolExpr : Z3Expr, IExprType<BoolExpr>
     private BoolExpr(Z3Context context, IntPtr handle)
         : base(context, handle) { }
 
+    private BoolExpr(Z3Context context, OperatorChain chain)
+        : base(context, chain) { }
+
     static BoolExpr IExprType<BoolExpr>.Create(Z3Context context, IntPtr handle) => new(context, handle);
 
     static IntPtr IExprType<BoolExpr>.Sort(Z3Context context) => context.Library.MkBoolSort(context.Handle);
@@ -29,7 +33,8 @@ public sealed class BoolExpr : Z3Expr, IExprType<BoolExpr>
     /// <param name="left">Left operand.</param>
     /// <param name="right">Right operand.</param>
     /// <returns>AND expression.</returns>
-    public static BoolExpr operator &(BoolExpr left, BoolExpr right) => left.Context.And(left, right);
+    public static BoolExpr operator &(BoolExpr left, BoolExpr right) =>
+        Chain(Z3Library.DeclKind.Z3_OP_AND, left, right);
 
     /// <summary>
     /// Logical OR of two boolean expressions.
@@ -37,7 +42,7 @@ public sealed class BoolExpr : Z3Expr, IExprType<BoolExpr>
     /// <param name="left">Left operand.</param>
     /// <param name="right">Right operand.</param>
     /// <returns>OR expression.</returns>
-    public static BoolExpr operator |(BoolExpr left, BoolExpr right) => left.Context.Or(left, right);
+    public static BoolExpr operator |(BoolExpr left, BoolExpr right) => Chain(Z3Library.DeclKind.Z3_OP_OR, left, right);
 
     /// <summary>
     /// Logical XOR of two boolean expressions.
@@ -69,5 +74,8 @@ public sealed class BoolExpr : Z3Expr, IExprType<BoolExpr>
     /// <param name="right">Right operand.</param>
     /// <returns>Inequality expression.</returns>
     public static BoolExpr operator !=(BoolExpr left, BoolExpr right) => left.Neq(right);
+
+    private static BoolExpr Chain(Z3Library.DeclKind kind, BoolExpr left, BoolExpr right) =>
+        new(left.Context, OperatorChain.Combine(kind, left, right));
 }
 #pragma warning restore CS0660, CS0661
@@ -1,4 +1,5 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Common;
 
 namespace Spaceorc.Z3Wrap.Expressions.Numerics;
@@ -14,6 +15,9 @@ public abstract class ArithmeticExpr : Z3Expr, INumericExpr
     protected ArithmeticExpr(Z3Context context, IntPtr handle)
         : base(context, handle) { }
 
+    private protected ArithmeticExpr(Z3Context context, OperatorChain chain)
+        : base(context, chain) { }
+
     /// <summary>
     /// Creates the appropriate ArithmeticExpr subtype (IntExpr or RealExpr) based on Z3 sort.
     /// Used for dynamic creation from optimizer results.
@@ -1,6 +1,7 @@
 using System.Numerics;
 using Spaceorc.Z3Wrap.Core;
 using Spaceorc.Z3Wrap.Expressions.BitVectors;
+using Spaceorc.Z3Wrap.Expressions.Common;
 using Spaceorc.Z3Wrap.Expressions.Strings;
 using Spaceorc.Z3Wrap.Values.BitVectors;
 
@@ -49,10 +50,20 @@ public static class IntContextExtensions
     public static IntExpr IntConst(this Z3Context context, string name)
     {
         var intSort = context.Library.MkIntSort(context.Handle);
-        var handle = context.Library.MkConst(context.Handle, name, intSort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), intSort);
         return Z3Expr.Create<IntExpr>(context, handle);
     }
 
+    /// <summary>
+    /// Creates an array of fresh integer constants named after a common prefix.
+    /// </summary>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="prefix">The name prefix; Z3 appends a unique suffix to each constant.</param>
+    /// <param name="count">The number of constants.</param>
+    /// <returns>Array of integer constants.</returns>
+    public static Z3ConstArray<IntExpr> IntConsts(this Z3Context context, string prefix, int count) =>
+        context.Consts<IntExpr>(prefix, count);
+
     /// <summary>
     /// Creates real expression from integer expression.
     /// </summary>
@@ -1,5 +1,6 @@
 using System.Numerics;
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.BitVectors;
 using Spaceorc.Z3Wrap.Expressions.Common;
 using Spaceorc.Z3Wrap.Expressions.Logic;
@@ -17,6 +18,9 @@ public sealed class IntExpr : ArithmeticExpr, IArithmeticExpr<IntExpr>, IExprTyp
     private IntExpr(Z3Context context, IntPtr handle)
         : base(context, handle) { }
 
+    private IntExpr(Z3Context context, OperatorChain chain)
+        : base(context, chain) { }
+
     static IntExpr IExprType<IntExpr>.Create(Z3Context context, IntPtr handle) => new(context, handle);
 
     static IntPtr IExprType<IntExpr>.Sort(Z3Context context) => context.Library.MkIntSort(context.Handle);
@@ -72,7 +76,7 @@ public sealed class IntExpr : ArithmeticExpr, IArithmeticExpr<IntExpr>, IExprTyp
     /// <param name="left">Left operand.</param>
     /// <param name="right">Right operand.</param>
     /// <returns>Addition expression.</returns>
-    public static IntExpr operator +(IntExpr left, IntExpr right) => left.Add(right);
+    public static IntExpr operator +(IntExpr left, IntExpr right) => Chain(Z3Library.DeclKind.Z3_OP_ADD, left, right);
 
     /// <summary>
     /// Subtraction of two integer expressions.
@@ -88,7 +92,7 @@ public sealed class IntExpr : ArithmeticExpr, IArithmeticExpr<IntExpr>, IExprTyp
     /// <param name="left">Left operand.</param>
     /// <param name="right">Right operand.</param>
     /// <returns>Multiplication expression.</returns>
-    public static IntExpr operator *(IntExpr left, IntExpr right) => left.Mul(right);
+    public static IntExpr operator *(IntExpr left, IntExpr right) => Chain(Z3Library.DeclKind.Z3_OP_MUL, left, right);
 
     /// <summary>
     /// Division of two integer expressions.
@@ -160,5 +164,8 @@ public sealed class IntExpr : ArithmeticExpr, IArithmeticExpr<IntExpr>, IExprTyp
     /// <param name="right">Right operand.</param>
     /// <returns>Inequality comparison expression.</returns>
     public static BoolExpr operator !=(IntExpr left, IntExpr right) => left.Neq(right);
+
+    private static IntExpr Chain(Z3Library.DeclKind kind, IntExpr left, IntExpr right) =>
+        new(left.Context, OperatorChain.Combine(kind, left, right));
 }
 #pragma warning restore CS0660, CS0661
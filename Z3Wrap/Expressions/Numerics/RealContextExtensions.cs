@@ -1,4 +1,5 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Expressions.Common;
 using Spaceorc.Z3Wrap.Values.Numerics;
 
 namespace Spaceorc.Z3Wrap.Expressions.Numerics;
@@ -30,10 +31,20 @@ public static class RealContextExtensions
     public static RealExpr RealConst(this Z3Context context, string name)
     {
         var realSort = context.Library.MkRealSort(context.Handle);
-        var handle = context.Library.MkConst(context.Handle, name, realSort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), realSort);
         return Z3Expr.Create<RealExpr>(context, handle);
     }
 
+    /// <summary>
+    /// Creates an array of fresh real constants named after a common prefix.
+    /// </summary>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="prefix">The name prefix; Z3 appends a unique suffix to each constant.</param>
+    /// <param name="count">The number of constants.</param>
+    /// <returns>Array of real constants.</returns>
+    public static Z3ConstArray<RealExpr> RealConsts(this Z3Context context, string prefix, int count) =>
+        context.Consts<RealExpr>(prefix, count);
+
     /// <summary>
     /// Creates integer expression from real expression.
     /// </summary>
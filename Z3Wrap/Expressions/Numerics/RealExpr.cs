@@ -1,5 +1,6 @@
 using System.Numerics;
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Common;
 using Spaceorc.Z3Wrap.Expressions.Logic;
 using Spaceorc.Z3Wrap.Values.Numerics;
@@ -15,6 +16,9 @@ public sealed class RealExpr : ArithmeticExpr, IArithmeticExpr<RealExpr>, IExprT
     private RealExpr(Z3Context context, IntPtr handle)
         : base(context, handle) { }
 
+    private RealExpr(Z3Context context, OperatorChain chain)
+        : base(context, chain) { }
+
     static RealExpr IExprType<RealExpr>.Create(Z3Context context, IntPtr handle) => new(context, handle);
 
     static IntPtr IExprType<RealExpr>.Sort(Z3Context context) => context.Library.MkRealSort(context.Handle);
@@ -70,7 +74,8 @@ public sealed class RealExpr : ArithmeticExpr, IArithmeticExpr<RealExpr>, IExprT
     /// <param name="left">Left operand.</param>
     /// <param name="right">Right operand.</param>
     /// <returns>Addition expression.</returns>
-    public static RealExpr operator +(RealExpr left, RealExpr right) => left.Add(right);
+    public static RealExpr operator +(RealExpr left, RealExpr right) =>
+        Chain(Z3Library.DeclKind.Z3_OP_ADD, left, right);
 
     /// <summary>
     /// Subtraction of two real expressions.
@@ -86,7 +91,8 @@ public sealed class RealExpr : ArithmeticExpr, IArithmeticExpr<RealExpr>, IExprT
     /// <param name="left">Left operand.</param>
     /// <param name="right">Right operand.</param>
     /// <returns>Multiplication expression.</returns>
-    public static RealExpr operator *(RealExpr left, RealExpr right) => left.Mul(right);
+    public static RealExpr operator *(RealExpr left, RealExpr right) =>
+        Chain(Z3Library.DeclKind.Z3_OP_MUL, left, right);
 
     /// <summary>
     /// Division of two real expressions.
@@ -150,5 +156,8 @@ public sealed class RealExpr : ArithmeticExpr, IArithmeticExpr<RealExpr>, IExprT
     /// <param name="right">Right operand.</param>
     /// <returns>Inequality comparison expression.</returns>
     public static BoolExpr operator !=(RealExpr left, RealExpr right) => left.Neq(right);
+
+    private static RealExpr Chain(Z3Library.DeclKind kind, RealExpr left, RealExpr right) =>
+        new(left.Context, OperatorChain.Combine(kind, left, right));
 }
 #pragma warning restore CS0660, CS0661
@@ -1,4 +1,5 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Logic;
 
 namespace Spaceorc.Z3Wrap.Expressions.Quantifiers;
@@ -25,28 +26,7 @@ public static class QuantifiersContextExtensions
         BoolExpr body
     )
     {
-        var bound = boundVars.Select(v => v.Handle).ToArray();
-
-        var patternHandles = triggerGroups
-            .Where(g => g.Count > 0)
-            .Select(g =>
-            {
-                var handles = g.Select(p => p.Handle).ToArray();
-                var pattern = context.Library.MkPattern(context.Handle, (uint)handles.Length, handles);
-                return pattern;
-            })
-            .ToArray();
-
-        var handle = context.Library.MkForallConst(
-            context.Handle,
-            weight,
-            (uint)bound.Length,
-            bound,
-            (uint)patternHandles.Length,
-            patternHandles,
-            body.Handle
-        );
-        return Z3Expr.Create<BoolExpr>(context, handle);
+        return context.Quantifier(true, weight, boundVars, triggerGroups, body);
     }
 
     /// <summary>
@@ -153,28 +133,7 @@ public static class QuantifiersContextExtensions
         BoolExpr body
     )
     {
-        var bound = boundVars.Select(v => v.Handle).ToArray();
-
-        var patternHandles = triggerGroups
-            .Where(g => g.Count > 0)
-            .Select(g =>
-            {
-                var handles = g.Select(p => p.Handle).ToArray();
-                var pattern = context.Library.MkPattern(context.Handle, (uint)handles.Length, handles);
-                return pattern;
-            })
-            .ToArray();
-
-        var handle = context.Library.MkExistsConst(
-            context.Handle,
-            weight,
-            (uint)bound.Length,
-            bound,
-            (uint)patternHandles.Length,
-            patternHandles,
-            body.Handle
-        );
-        return Z3Expr.Create<BoolExpr>(context, handle);
+        return context.Quantifier(false, weight, boundVars, triggerGroups, body);
     }
 
     /// <summary>
@@ -263,4 +222,59 @@ public static class QuantifiersContextExtensions
     {
         return context.Exists(0, [boundVar1, boundVar2, boundVar3, boundVar4], Array.Empty<Z3Expr>(), body);
     }
+
+    private static BoolExpr Quantifier(
+        this Z3Context context,
+        bool isForall,
+        uint weight,
+        IReadOnlyList<Z3Expr> boundVars,
+        IReadOnlyList<IReadOnlyList<Z3Expr>> triggerGroups,
+        BoolExpr body
+    )
+    {
+        var bound = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        var patterns = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        var terms = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            bound.AddRange(boundVars);
+
+            foreach (var group in triggerGroups)
+            {
+                if (group.Count == 0)
+                    continue;
+
+                terms.Clear();
+                terms.AddRange(group);
+                patterns.Add(context.Library.MkPattern(context.Handle, (uint)terms.Length, terms.Span));
+            }
+
+            var handle = isForall
+                ? context.Library.MkForallConst(
+                    context.Handle,
+                    weight,
+                    (uint)bound.Length,
+                    bound.Span,
+                    (uint)patterns.Length,
+                    patterns.Span,
+                    body.Handle
+                )
+                : context.Library.MkExistsConst(
+                    context.Handle,
+                    weight,
+                    (uint)bound.Length,
+                    bound.Span,
+                    (uint)patterns.Length,
+                    patterns.Span,
+                    body.Handle
+                );
+            return Z3Expr.Create<BoolExpr>(context, handle);
+        }
+        finally
+        {
+            terms.Dispose();
+            patterns.Dispose();
+            bound.Dispose();
+        }
+    }
 }
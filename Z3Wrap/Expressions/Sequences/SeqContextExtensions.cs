@@ -1,7 +1,12 @@
+using System.Globalization;
+using System.Numerics;
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
+using Spaceorc.Z3Wrap.Expressions.BitVectors;
 using Spaceorc.Z3Wrap.Expressions.Common;
 using Spaceorc.Z3Wrap.Expressions.Functions;
 using Spaceorc.Z3Wrap.Expressions.Numerics;
+using Spaceorc.Z3Wrap.Values.BitVectors;
 
 namespace Spaceorc.Z3Wrap.Expressions.Sequences;
 
@@ -21,7 +26,7 @@ public static class SeqContextExtensions
         where T : Z3Expr, IExprType<T>
     {
         var seqSort = context.GetSortForType<SeqExpr<T>>();
-        var handle = context.Library.MkConst(context.Handle, name, seqSort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), seqSort);
         return Z3Expr.Create<SeqExpr<T>>(context, handle);
     }
 
@@ -63,11 +68,128 @@ public static class SeqContextExtensions
     public static SeqExpr<T> Seq<T>(this Z3Context context, params IEnumerable<T> elements)
         where T : Z3Expr, IExprType<T>
     {
-        var units = elements.Select(context.SeqUnit).ToArray();
-        if (units.Length == 0)
-            return context.SeqEmpty<T>();
+        var units = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            foreach (var element in elements)
+                units.Add(RetainUnit(context, element.Handle));
 
-        return context.SeqConcat<T>(units);
+            return ConcatUnits<T>(context, units.Span);
+        }
+        finally
+        {
+            ReleaseUnits(context, units.Span);
+            units.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Creates sequence from span of elements.
+    /// </summary>
+    /// <typeparam name="T">Sequence element type.</typeparam>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="elements">The elements to create sequence from.</param>
+    /// <returns>Sequence expression containing the elements.</returns>
+    /// <remarks>Unit sequences are kept as native handles and joined by a single concatenation.</remarks>
+    public static SeqExpr<T> Seq<T>(this Z3Context context, params ReadOnlySpan<T> elements)
+        where T : Z3Expr, IExprType<T>
+    {
+        var units = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            foreach (var element in elements)
+                units.Add(RetainUnit(context, element.Handle));
+
+            return ConcatUnits<T>(context, units.Span);
+        }
+        finally
+        {
+            ReleaseUnits(context, units.Span);
+            units.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Creates sequence from array of elements.
+    /// </summary>
+    /// <typeparam name="T">Sequence element type.</typeparam>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="elements">The elements to create sequence from.</param>
+    /// <returns>Sequence expression containing the elements.</returns>
+    /// <remarks>Resolves calls with an array, which would otherwise match both the span and enumerable overloads.</remarks>
+    public static SeqExpr<T> Seq<T>(this Z3Context context, params T[] elements)
+        where T : Z3Expr, IExprType<T> => context.Seq<T>(new ReadOnlySpan<T>(elements));
+
+    /// <summary>
+    /// Creates integer sequence from integer values.
+    /// </summary>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="values">The element values.</param>
+    /// <returns>Sequence expression containing the values.</returns>
+    /// <remarks>Element numerals are created as native handles only, without expression wrappers.</remarks>
+    public static SeqExpr<IntExpr> Seq(this Z3Context context, ReadOnlySpan<BigInteger> values)
+    {
+        var library = context.Library;
+        var intSort = library.MkIntSort(context.Handle);
+
+        var units = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            foreach (var value in values)
+            {
+                var numeral =
+                    value >= long.MinValue && value <= long.MaxValue
+                        ? library.MkInt64(context.Handle, (long)value, intSort)
+                        : library.MkNumeral(context.Handle, value.ToString(CultureInfo.InvariantCulture), intSort);
+                units.Add(RetainUnit(context, numeral));
+            }
+
+            return ConcatUnits<IntExpr>(context, units.Span);
+        }
+        finally
+        {
+            ReleaseUnits(context, units.Span);
+            units.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Creates bit-vector sequence from bit-vector values.
+    /// </summary>
+    /// <typeparam name="TSize">Bit-vector size type.</typeparam>
+    /// <param name="context">The Z3 context.</param>
+    /// <param name="values">The element values.</param>
+    /// <returns>Sequence expression containing the values.</returns>
+    /// <remarks>Element numerals are created as native handles only, without expression wrappers.</remarks>
+    public static SeqExpr<BvExpr<TSize>> Seq<TSize>(this Z3Context context, ReadOnlySpan<Bv<TSize>> values)
+        where TSize : ISize
+    {
+        var library = context.Library;
+
+        // Bit-vector sorts are not persistent, so the sort needs a reference across the element calls
+        var sort = library.MkBvSort(context.Handle, TSize.Size);
+        library.IncRef(context.Handle, sort);
+
+        var units = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            foreach (var value in values)
+            {
+                var numeral =
+                    TSize.Size <= 64
+                        ? library.MkUnsignedInt64(context.Handle, value.ToULong(), sort)
+                        : library.MkNumeral(context.Handle, value.Value.ToString(CultureInfo.InvariantCulture), sort);
+                units.Add(RetainUnit(context, numeral));
+            }
+
+            return ConcatUnits<BvExpr<TSize>>(context, units.Span);
+        }
+        finally
+        {
+            ReleaseUnits(context, units.Span);
+            units.Dispose();
+            library.DecRef(context.Handle, sort);
+        }
     }
 
     /// <summary>
@@ -80,12 +202,20 @@ public static class SeqContextExtensions
     public static SeqExpr<T> SeqConcat<T>(this Z3Context context, params IEnumerable<SeqExpr<T>> sequences)
         where T : Z3Expr, IExprType<T>
     {
-        var args = sequences.Select(s => s.Handle).ToArray();
-        if (args.Length == 0)
-            throw new ArgumentException("SeqConcat requires at least one operand.", nameof(sequences));
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(sequences);
+            if (args.Length == 0)
+                throw new ArgumentException("SeqConcat requires at least one operand.", nameof(sequences));
 
-        var handle = context.Library.MkSeqConcat(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<SeqExpr<T>>(context, handle);
+            var handle = context.Library.MkSeqConcat(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<SeqExpr<T>>(context, handle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 
     /// <summary>
@@ -185,4 +315,29 @@ public static class SeqContextExtensions
         );
         return Z3Expr.Create<TAcc>(context, handle);
     }
+
+    // Units are created one by one before the concatenation consumes them, so each holds a reference until then
+    private static IntPtr RetainUnit(Z3Context context, IntPtr element)
+    {
+        var unit = context.Library.MkSeqUnit(context.Handle, element);
+        context.Library.IncRef(context.Handle, unit);
+        return unit;
+    }
+
+    private static void ReleaseUnits(Z3Context context, ReadOnlySpan<IntPtr> units)
+    {
+        foreach (var unit in units)
+            context.Library.DecRef(context.Handle, unit);
+    }
+
+    private static SeqExpr<T> ConcatUnits<T>(Z3Context context, ReadOnlySpan<IntPtr> units)
+        where T : Z3Expr, IExprType<T>
+    {
+        if (units.IsEmpty)
+            return context.SeqEmpty<T>();
+
+        var handle =
+            units.Length == 1 ? units[0] : context.Library.MkSeqConcat(context.Handle, (uint)units.Length, units);
+        return Z3Expr.Create<SeqExpr<T>>(context, handle);
+    }
 }
@@ -15,10 +15,16 @@ public static class CharContextExtensions
     /// <param name="context">The Z3 context.</param>
     /// <param name="codepoint">The Unicode codepoint.</param>
     /// <returns>Character expression representing the codepoint.</returns>
+    /// <remarks>Literals are cached per context, see <see cref="Z3Context.LiteralCacheCapacity"/>.</remarks>
     public static CharExpr Char(this Z3Context context, uint codepoint)
     {
+        if (context.CharLiterals.TryGetValue(codepoint, out var cached))
+            return cached;
+
         var handle = context.Library.MkChar(context.Handle, codepoint);
-        return Z3Expr.Create<CharExpr>(context, handle);
+        var result = Z3Expr.Create<CharExpr>(context, handle);
+        context.CharLiterals.Add(codepoint, result);
+        return result;
     }
 
     /// <summary>
@@ -41,7 +47,7 @@ public static class CharContextExtensions
     public static CharExpr CharConst(this Z3Context context, string name)
     {
         var charSort = context.Library.MkCharSort(context.Handle);
-        var handle = context.Library.MkConst(context.Handle, name, charSort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), charSort);
         return Z3Expr.Create<CharExpr>(context, handle);
     }
 
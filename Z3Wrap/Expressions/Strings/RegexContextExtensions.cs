@@ -1,4 +1,5 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Logic;
 
 namespace Spaceorc.Z3Wrap.Expressions.Strings;
@@ -14,11 +15,17 @@ public static class RegexContextExtensions
     /// <param name="context">The Z3 context.</param>
     /// <param name="pattern">The string pattern to match.</param>
     /// <returns>Regular expression matching the literal string.</returns>
+    /// <remarks>Literals are cached per context, see <see cref="Z3Context.LiteralCacheCapacity"/>.</remarks>
     public static RegexExpr Regex(this Z3Context context, string pattern)
     {
+        if (context.RegexLiterals.TryGetValue(pattern, out var cached))
+            return cached;
+
         var stringExpr = context.String(pattern);
         var handle = context.Library.MkSeqToRe(context.Handle, stringExpr.Handle);
-        return Z3Expr.Create<RegexExpr>(context, handle);
+        var result = Z3Expr.Create<RegexExpr>(context, handle);
+        context.RegexLiterals.Add(pattern, result);
+        return result;
     }
 
     /// <summary>
@@ -43,7 +50,7 @@ public static class RegexContextExtensions
     {
         var stringSort = context.Library.MkStringSort(context.Handle);
         var reSort = context.Library.MkReSort(context.Handle, stringSort);
-        var handle = context.Library.MkConst(context.Handle, name, reSort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), reSort);
         return Z3Expr.Create<RegexExpr>(context, handle);
     }
 
@@ -122,12 +129,20 @@ public static class RegexContextExtensions
     /// <returns>Regular expression matching any of the patterns.</returns>
     public static RegexExpr RegexUnion(this Z3Context context, params IEnumerable<RegexExpr> regexes)
     {
-        var args = regexes.Select(r => r.Handle).ToArray();
-        if (args.Length == 0)
-            throw new ArgumentException("RegexUnion requires at least one operand.", nameof(regexes));
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(regexes);
+            if (args.Length == 0)
+                throw new ArgumentException("RegexUnion requires at least one operand.", nameof(regexes));
 
-        var handle = context.Library.MkReUnion(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<RegexExpr>(context, handle);
+            var handle = context.Library.MkReUnion(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<RegexExpr>(context, handle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 
     /// <summary>
@@ -138,12 +153,20 @@ public static class RegexContextExtensions
     /// <returns>Regular expression matching concatenated patterns.</returns>
     public static RegexExpr RegexConcat(this Z3Context context, params IEnumerable<RegexExpr> regexes)
     {
-        var args = regexes.Select(r => r.Handle).ToArray();
-        if (args.Length == 0)
-            throw new ArgumentException("RegexConcat requires at least one operand.", nameof(regexes));
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(regexes);
+            if (args.Length == 0)
+                throw new ArgumentException("RegexConcat requires at least one operand.", nameof(regexes));
 
-        var handle = context.Library.MkReConcat(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<RegexExpr>(context, handle);
+            var handle = context.Library.MkReConcat(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<RegexExpr>(context, handle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 
     /// <summary>
@@ -154,12 +177,20 @@ public static class RegexContextExtensions
     /// <returns>Regular expression matching all patterns.</returns>
     public static RegexExpr RegexIntersect(this Z3Context context, params IEnumerable<RegexExpr> regexes)
     {
-        var args = regexes.Select(r => r.Handle).ToArray();
-        if (args.Length == 0)
-            throw new ArgumentException("RegexIntersect requires at least one operand.", nameof(regexes));
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(regexes);
+            if (args.Length == 0)
+                throw new ArgumentException("RegexIntersect requires at least one operand.", nameof(regexes));
 
-        var handle = context.Library.MkReIntersect(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<RegexExpr>(context, handle);
+            var handle = context.Library.MkReIntersect(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<RegexExpr>(context, handle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 
     /// <summary>
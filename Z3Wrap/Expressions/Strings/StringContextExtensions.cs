@@ -1,4 +1,5 @@
 using Spaceorc.Z3Wrap.Core;
+using Spaceorc.Z3Wrap.Core.Interop;
 using Spaceorc.Z3Wrap.Expressions.Logic;
 using Spaceorc.Z3Wrap.Expressions.Numerics;
 
@@ -15,10 +16,16 @@ public static class StringContextExtensions
     /// <param name="context">The Z3 context.</param>
     /// <param name="value">The string value.</param>
     /// <returns>String expression representing the value.</returns>
+    /// <remarks>Literals are cached per context, see <see cref="Z3Context.LiteralCacheCapacity"/>.</remarks>
     public static StringExpr String(this Z3Context context, string value)
     {
+        if (context.StringLiterals.TryGetValue(value, out var cached))
+            return cached;
+
         var handle = context.Library.MkString(context.Handle, value);
-        return Z3Expr.Create<StringExpr>(context, handle);
+        var result = Z3Expr.Create<StringExpr>(context, handle);
+        context.StringLiterals.Add(value, result);
+        return result;
     }
 
     /// <summary>
@@ -30,7 +37,7 @@ public static class StringContextExtensions
     public static StringExpr StringConst(this Z3Context context, string name)
     {
         var stringSort = context.Library.MkStringSort(context.Handle);
-        var handle = context.Library.MkConst(context.Handle, name, stringSort);
+        var handle = context.Library.MkConstOriginal(context.Handle, context.GetSymbol(name), stringSort);
         return Z3Expr.Create<StringExpr>(context, handle);
     }
 
@@ -42,12 +49,20 @@ public static class StringContextExtensions
     /// <returns>Concatenated string expression.</returns>
     public static StringExpr Concat(this Z3Context context, params IEnumerable<StringExpr> strings)
     {
-        var args = strings.Select(s => s.Handle).ToArray();
-        if (args.Length == 0)
-            throw new ArgumentException("Concat requires at least one operand.", nameof(strings));
+        var args = new HandleBuffer(stackalloc IntPtr[HandleBuffer.StackCapacity]);
+        try
+        {
+            args.AddRange(strings);
+            if (args.Length == 0)
+                throw new ArgumentException("Concat requires at least one operand.", nameof(strings));
 
-        var resultHandle = context.Library.MkSeqConcat(context.Handle, (uint)args.Length, args);
-        return Z3Expr.Create<StringExpr>(context, resultHandle);
+            var resultHandle = context.Library.MkSeqConcat(context.Handle, (uint)args.Length, args.Span);
+            return Z3Expr.Create<StringExpr>(context, resultHandle);
+        }
+        finally
+        {
+            args.Dispose();
+        }
     }
 
     /// <summary>
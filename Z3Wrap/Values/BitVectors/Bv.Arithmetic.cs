@@ -47,28 +47,29 @@ public readonly partial struct Bv<TSize>
     /// </summary>
     /// <param name="operand">Operand to negate.</param>
     /// <returns>Negated bitvector value.</returns>
-    public static Bv<TSize> operator -(Bv<TSize> operand) => new(-operand.value);
+    public static Bv<TSize> operator -(Bv<TSize> operand) =>
+        IsWord ? FromBits(0 - operand.bits) : new(-operand.wide);
 
     /// <summary>
     /// Adds another bitvector to this bitvector.
     /// </summary>
     /// <param name="other">Bitvector to add.</param>
     /// <returns>Sum masked to the bit width.</returns>
-    public Bv<TSize> Add(Bv<TSize> other) => new(value + other.value);
+    public Bv<TSize> Add(Bv<TSize> other) => IsWord ? FromBits(bits + other.bits) : new(wide + other.wide);
 
     /// <summary>
     /// Subtracts another bitvector from this bitvector.
     /// </summary>
     /// <param name="other">Bitvector to subtract.</param>
     /// <returns>Difference masked to the bit width.</returns>
-    public Bv<TSize> Sub(Bv<TSize> other) => new(value - other.value);
+    public Bv<TSize> Sub(Bv<TSize> other) => IsWord ? FromBits(bits - other.bits) : new(wide - other.wide);
 
     /// <summary>
     /// Multiplies this bitvector by another bitvector.
     /// </summary>
     /// <param name="other">Bitvector to multiply by.</param>
     /// <returns>Product masked to the bit width.</returns>
-    public Bv<TSize> Mul(Bv<TSize> other) => new(value * other.value);
+    public Bv<TSize> Mul(Bv<TSize> other) => IsWord ? FromBits(bits * other.bits) : new(wide * other.wide);
 
     /// <summary>
     /// Divides this bitvector by another bitvector.
@@ -81,8 +82,16 @@ public readonly partial struct Bv<TSize>
     {
         if (other.IsZero)
             throw new DivideByZeroException("Division by zero is not allowed");
+        if (IsWord)
+        {
+            if (!signed)
+                return FromBits(bits / other.bits);
+
+            // Dividing by -1 is negation; long.MinValue / -1 would overflow
+            return other.SignedBits == -1 ? -this : FromBits((ulong)(SignedBits / other.SignedBits));
+        }
         if (!signed)
-            return new Bv<TSize>(value / other.value);
+            return new Bv<TSize>(wide / other.wide);
         var leftSigned = ToBigInteger(signed: true);
         var rightSigned = other.ToBigInteger(signed: true);
         return new Bv<TSize>(leftSigned / rightSigned);
@@ -99,13 +108,21 @@ public readonly partial struct Bv<TSize>
     {
         if (other.IsZero)
             throw new DivideByZeroException("Division by zero is not allowed");
+        if (IsWord)
+        {
+            if (!signed)
+                return FromBits(bits % other.bits);
+
+            // Any remainder modulo -1 is zero; long.MinValue % -1 would overflow
+            return other.SignedBits == -1 ? Zero : FromBits((ulong)(SignedBits % other.SignedBits));
+        }
         if (signed)
         {
             var leftSigned = ToBigInteger(signed: true);
             var rightSigned = other.ToBigInteger(signed: true);
             return new Bv<TSize>(leftSigned % rightSigned);
         }
-        return new Bv<TSize>(value % other.value);
+        return new Bv<TSize>(wide % other.wide);
     }
 
     /// <summary>
@@ -119,6 +136,19 @@ public readonly partial struct Bv<TSize>
         if (other.IsZero)
             throw new DivideByZeroException("Division by zero is not allowed");
 
+        if (IsWord)
+        {
+            var divisor = other.SignedBits;
+            if (divisor == -1)
+                return Zero;
+
+            var remainder = SignedBits % divisor;
+            if (remainder != 0 && (remainder < 0) != (divisor < 0))
+                remainder += divisor;
+
+            return FromBits((ulong)remainder);
+        }
+
         var leftSigned = ToBigInteger(signed: true);
         var rightSigned = other.ToBigInteger(signed: true);
         var result = leftSigned % rightSigned;
@@ -32,26 +32,27 @@ public readonly partial struct Bv<TSize>
     /// </summary>
     /// <param name="operand">The operand to invert.</param>
     /// <returns>A new bitvector containing the result of the bitwise NOT operation.</returns>
-    public static Bv<TSize> operator ~(Bv<TSize> operand) => new(~operand.value);
+    public static Bv<TSize> operator ~(Bv<TSize> operand) =>
+        IsWord ? FromBits(~operand.bits) : new(~operand.wide);
 
     /// <summary>
     /// Performs bitwise AND operation with another bitvector.
     /// </summary>
     /// <param name="other">The bitvector to AND with.</param>
     /// <returns>A new bitvector containing the bitwise AND result.</returns>
-    public Bv<TSize> And(Bv<TSize> other) => new(value & other.value);
+    public Bv<TSize> And(Bv<TSize> other) => IsWord ? FromBits(bits & other.bits) : new(wide & other.wide);
 
     /// <summary>
     /// Performs bitwise OR operation with another bitvector.
     /// </summary>
     /// <param name="other">The bitvector to OR with.</param>
     /// <returns>A new bitvector containing the bitwise OR result.</returns>
-    public Bv<TSize> Or(Bv<TSize> other) => new(value | other.value);
+    public Bv<TSize> Or(Bv<TSize> other) => IsWord ? FromBits(bits | other.bits) : new(wide | other.wide);
 
     /// <summary>
     /// Performs bitwise XOR operation with another bitvector.
     /// </summary>
     /// <param name="other">The bitvector to XOR with.</param>
     /// <returns>A new bitvector containing the bitwise XOR result.</returns>
-    public Bv<TSize> Xor(Bv<TSize> other) => new(value ^ other.value);
+    public Bv<TSize> Xor(Bv<TSize> other) => IsWord ? FromBits(bits ^ other.bits) : new(wide ^ other.wide);
 }
@@ -42,8 +42,10 @@ public readonly partial struct Bv<TSize>
     /// <returns>true if this bitvector is less than the other; otherwise, false.</returns>
     public bool Lt(Bv<TSize> other, bool signed = false)
     {
+        if (IsWord)
+            return signed ? SignedBits < other.SignedBits : bits < other.bits;
         if (!signed)
-            return value < other.value;
+            return wide < other.wide;
 
         var leftSigned = ToBigInteger(signed: true);
         var rightSigned = other.ToBigInteger(signed: true);
@@ -58,8 +60,10 @@ public readonly partial struct Bv<TSize>
     /// <returns>true if this bitvector is greater than the other; otherwise, false.</returns>
     public bool Gt(Bv<TSize> other, bool signed = false)
     {
+        if (IsWord)
+            return signed ? SignedBits > other.SignedBits : bits > other.bits;
         if (!signed)
-            return value > other.value;
+            return wide > other.wide;
 
         var leftSigned = ToBigInteger(signed: true);
         var rightSigned = other.ToBigInteger(signed: true);
@@ -87,5 +91,5 @@ public readonly partial struct Bv<TSize>
     /// </summary>
     /// <param name="other">Bitvector to compare with.</param>
     /// <returns>Negative if less than, 0 if equal, positive if greater than.</returns>
-    public int CompareTo(Bv<TSize> other) => value.CompareTo(other.value);
+    public int CompareTo(Bv<TSize> other) => IsWord ? bits.CompareTo(other.bits) : wide.CompareTo(other.wide);
 }
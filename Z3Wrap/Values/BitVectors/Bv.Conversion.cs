@@ -11,16 +11,19 @@ public readonly partial struct Bv<TSize>
     /// <returns>The BigInteger representation of the bitvector value.</returns>
     public BigInteger ToBigInteger(bool signed = false)
     {
+        if (IsWord)
+            return signed ? SignedBits : bits;
+
         if (!signed)
-            return value;
+            return wide;
 
         // For signed interpretation: check if MSB (sign bit) is set
         var signBit = BigInteger.One << ((int)Size - 1);
-        if ((value & signBit) == 0)
-            return value; // Positive number, same as unsigned
+        if ((wide & signBit) == 0)
+            return wide; // Positive number, same as unsigned
 
         // MSB is set: convert from unsigned to signed using two's complement
-        return value - (BigInteger.One << (int)Size);
+        return wide - (BigInteger.One << (int)Size);
     }
 
     /// <summary>
@@ -31,6 +34,15 @@ public readonly partial struct Bv<TSize>
     /// <exception cref="OverflowException">Thrown when the value is outside the range of int.</exception>
     public int ToInt(bool signed = false)
     {
+        if (IsWord)
+        {
+            if (signed ? SignedBits is < int.MinValue or > int.MaxValue : bits > int.MaxValue)
+                throw new OverflowException(
+                    $"{(signed ? "Signed" : "Unsigned")} value {ToBigInteger(signed)} is outside the range of int"
+                );
+            return signed ? (int)SignedBits : (int)bits;
+        }
+
         var bigIntValue = ToBigInteger(signed);
         if (bigIntValue > int.MaxValue || bigIntValue < int.MinValue)
             throw new OverflowException(
@@ -46,9 +58,9 @@ public readonly partial struct Bv<TSize>
     /// <exception cref="OverflowException">Thrown when the value is outside the range of uint.</exception>
     public uint ToUInt()
     {
-        if (value > uint.MaxValue)
-            throw new OverflowException($"Unsigned value {value} is outside the range of uint");
-        return (uint)value;
+        if (IsWord ? bits > uint.MaxValue : wide > uint.MaxValue)
+            throw new OverflowException($"Unsigned value {Value} is outside the range of uint");
+        return IsWord ? (uint)bits : (uint)wide;
     }
 
     /// <summary>
@@ -59,6 +71,13 @@ public readonly partial struct Bv<TSize>
     /// <exception cref="OverflowException">Thrown when the value is outside the range of long.</exception>
     public long ToLong(bool signed = false)
     {
+        if (IsWord)
+        {
+            if (!signed && bits > long.MaxValue)
+                throw new OverflowException($"Unsigned value {bits} is outside the range of long");
+            return signed ? SignedBits : (long)bits;
+        }
+
         var bigIntValue = ToBigInteger(signed);
         if (bigIntValue > long.MaxValue || bigIntValue < long.MinValue)
             throw new OverflowException(
@@ -74,9 +93,12 @@ public readonly partial struct Bv<TSize>
     /// <exception cref="OverflowException">Thrown when the value is outside the range of ulong.</exception>
     public ulong ToULong()
     {
-        if (value > ulong.MaxValue)
-            throw new OverflowException($"Unsigned value {value} is outside the range of ulong");
-        return (ulong)value;
+        if (IsWord)
+            return bits;
+
+        if (wide > ulong.MaxValue)
+            throw new OverflowException($"Unsigned value {wide} is outside the range of ulong");
+        return (ulong)wide;
     }
 
     /// <summary>
@@ -114,7 +136,18 @@ public readonly partial struct Bv<TSize>
                 nameof(destination)
             );
 
-        var val = value;
+        if (IsWord)
+        {
+            var word = bits;
+            for (var i = 0; i < byteCount; i++)
+            {
+                destination[endianness == Endianness.LittleEndian ? i : byteCount - 1 - i] = (byte)word;
+                word >>= 8;
+            }
+            return;
+        }
+
+        var val = wide;
 
         if (endianness == Endianness.LittleEndian)
         {
@@ -23,7 +23,7 @@ public readonly partial struct Bv<TSize>
     /// </summary>
     /// <param name="other">The bitvector to compare with.</param>
     /// <returns>true if the bitvectors have the same value; otherwise, false.</returns>
-    public bool Equals(Bv<TSize> other) => value == other.value;
+    public bool Equals(Bv<TSize> other) => IsWord ? bits == other.bits : wide == other.wide;
 
     /// <summary>
     /// Determines whether this bitvector is equal to the specified object.
@@ -36,5 +36,5 @@ public readonly partial struct Bv<TSize>
     /// Returns the hash code for this bitvector.
     /// </summary>
     /// <returns>A 32-bit signed integer hash code.</returns>
-    public override int GetHashCode() => HashCode.Combine(value, Size);
+    public override int GetHashCode() => IsWord ? HashCode.Combine(bits, Size) : HashCode.Combine(wide, Size);
 }
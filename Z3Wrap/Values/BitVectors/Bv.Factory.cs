@@ -44,6 +44,15 @@ public readonly partial struct Bv<TSize>
                 $"Byte array length {bytes.Length} exceeds maximum {maxBytes} bytes for {Size}-bit bitvector"
             );
 
+        if (IsWord)
+        {
+            var word = 0UL;
+            for (var i = bytes.Length - 1; i >= 0; i--)
+                word = (word << 8) | bytes[i];
+
+            return FromBits(word);
+        }
+
         var value = BigInteger.Zero;
         for (int i = bytes.Length - 1; i >= 0; i--)
         {
@@ -32,10 +32,10 @@ public readonly partial struct Bv<TSize>
 
         return format.ToUpperInvariant() switch
         {
-            "D" or "DECIMAL" => $"{value} ({Size}-bit)",
+            "D" or "DECIMAL" => $"{Value} ({Size}-bit)",
             "B" or "BINARY" => $"0b{ToBinaryString()} ({Size}-bit)",
-            "X" or "HEX" => $"0x{value.ToString("X").TrimStart('0').PadLeft(1, '0')} ({Size}-bit)",
-            "V" or "VALUE" => value.ToString(formatProvider),
+            "X" or "HEX" => $"0x{Value.ToString("X").TrimStart('0').PadLeft(1, '0')} ({Size}-bit)",
+            "V" or "VALUE" => Value.ToString(formatProvider),
             _ => throw new FormatException($"Invalid format string: {format}"),
         };
     }
@@ -46,11 +46,11 @@ public readonly partial struct Bv<TSize>
     /// <returns>A string of '0' and '1' characters representing the bitvector value, padded to the full bit width.</returns>
     public string ToBinaryString()
     {
-        if (value == 0)
+        if (IsZero)
             return new string('0', (int)Size);
 
         Span<char> buffer = stackalloc char[(int)Size];
-        var val = value;
+        var val = Value;
         int pos = (int)Size - 1;
 
         // Fill from right to left (LSB to MSB)
@@ -74,7 +74,7 @@ public readonly partial struct Bv<TSize>
     public string ToHexString()
     {
         var hexDigits = (Size + 3) / 4; // Round up to nearest hex digit
-        return value.ToString("X").PadLeft((int)hexDigits, '0');
+        return Value.ToString("X").PadLeft((int)hexDigits, '0');
     }
 
     /// <summary>
@@ -18,7 +18,7 @@ public readonly partial struct Bv<TSize>
     /// </summary>
     /// <param name="value">The int value to convert.</param>
     /// <returns>A new bitvector containing the masked value.</returns>
-    public static implicit operator Bv<TSize>(int value) => new(value);
+    public static implicit operator Bv<TSize>(int value) => IsWord ? FromBits((ulong)value) : new(value);
 
     /// <summary>
     /// Implicitly converts a uint to a bitvector.
@@ -26,7 +26,7 @@ public readonly partial struct Bv<TSize>
     /// </summary>
     /// <param name="value">The uint value to convert.</param>
     /// <returns>A new bitvector containing the masked value.</returns>
-    public static implicit operator Bv<TSize>(uint value) => new(value);
+    public static implicit operator Bv<TSize>(uint value) => FromBits(value);
 
     /// <summary>
     /// Implicitly converts a long to a bitvector.
@@ -34,7 +34,7 @@ public readonly partial struct Bv<TSize>
     /// </summary>
     /// <param name="value">The long value to convert.</param>
     /// <returns>A new bitvector containing the masked value.</returns>
-    public static implicit operator Bv<TSize>(long value) => new(value);
+    public static implicit operator Bv<TSize>(long value) => IsWord ? FromBits((ulong)value) : new(value);
 
     /// <summary>
     /// Implicitly converts a ulong to a bitvector.
@@ -42,5 +42,5 @@ public readonly partial struct Bv<TSize>
     /// </summary>
     /// <param name="value">The ulong value to convert.</param>
     /// <returns>A new bitvector containing the masked value.</returns>
-    public static implicit operator Bv<TSize>(ulong value) => new(value);
+    public static implicit operator Bv<TSize>(ulong value) => FromBits(value);
 }
@@ -16,6 +16,11 @@ public readonly partial struct Bv<TSize>
         var newSize = TNewSize.Size;
         var currentSize = Size;
 
+        if (IsWord && Bv<TNewSize>.IsWord)
+            return Bv<TNewSize>.FromBits(signed && newSize > currentSize ? (ulong)SignedBits : bits);
+
+        var value = Value;
+
         if (newSize == currentSize)
         {
             // Same size - just change type
@@ -79,8 +84,11 @@ public readonly partial struct Bv<TSize>
             );
         }
 
+        if (IsWord)
+            return Bv<TResultSize>.FromBits(bits >> (int)startBit);
+
         // Extract: shift right to align the desired bits to LSB, then mask to result size
-        var shifted = value >> (int)startBit;
+        var shifted = wide >> (int)startBit;
 
         // The constructor will handle masking to TResultSize, so we don't need to mask here
         return new Bv<TResultSize>(shifted);
@@ -103,9 +111,12 @@ public readonly partial struct Bv<TSize>
         if (positions == 0)
             return this;
 
+        if (IsWord)
+            return FromBits((bits << positions) | (bits >> (size - positions)));
+
         // Rotate: (value << positions) | (value >> (size - positions))
-        var leftShifted = value << positions;
-        var rightShifted = value >> (size - positions);
+        var leftShifted = wide << positions;
+        var rightShifted = wide >> (size - positions);
 
         return new Bv<TSize>(leftShifted | rightShifted);
     }
@@ -127,9 +138,12 @@ public readonly partial struct Bv<TSize>
         if (positions == 0)
             return this;
 
+        if (IsWord)
+            return FromBits((bits >> positions) | (bits << (size - positions)));
+
         // Rotate: (value >> positions) | (value << (size - positions))
-        var rightShifted = value >> positions;
-        var leftShifted = value << (size - positions);
+        var rightShifted = wide >> positions;
+        var leftShifted = wide << (size - positions);
 
         return new Bv<TSize>(rightShifted | leftShifted);
     }
@@ -140,7 +154,7 @@ public readonly partial struct Bv<TSize>
     /// <returns>The number of set bits.</returns>
     public uint PopCount()
     {
-        return (uint)BigInteger.PopCount(value);
+        return IsWord ? (uint)BitOperations.PopCount(bits) : (uint)BigInteger.PopCount(wide);
     }
 
     /// <summary>
@@ -149,10 +163,13 @@ public readonly partial struct Bv<TSize>
     /// <returns>The number of leading zero bits (0 to Size).</returns>
     public uint CountLeadingZeros()
     {
-        if (value == 0)
+        if (IsZero)
             return Size;
 
-        var bitLength = (uint)value.GetBitLength();
+        if (IsWord)
+            return Size - 64 + (uint)BitOperations.LeadingZeroCount(bits);
+
+        var bitLength = (uint)wide.GetBitLength();
         return Size - bitLength;
     }
 
@@ -162,11 +179,14 @@ public readonly partial struct Bv<TSize>
     /// <returns>The number of trailing zero bits (0 to Size).</returns>
     public uint CountTrailingZeros()
     {
-        if (value == 0)
+        if (IsZero)
             return Size;
 
+        if (IsWord)
+            return (uint)BitOperations.TrailingZeroCount(bits);
+
         uint count = 0;
-        var val = value;
+        var val = wide;
 
         while ((val & 1) == 0)
         {
@@ -203,8 +223,11 @@ public readonly partial struct Bv<TSize>
             );
         }
 
+        if (Bv<TResultSize>.IsWord)
+            return Bv<TResultSize>.FromBits((bits << (int)lowSize) | low.bits);
+
         // Shift this bitvector to the high bits and OR with low bitvector
-        var highValue = value << (int)lowSize;
+        var highValue = Value << (int)lowSize;
         var result = highValue | low.Value;
 
         return new Bv<TResultSize>(result);
@@ -231,6 +254,16 @@ public readonly partial struct Bv<TSize>
             throw new ArgumentException($"Target size {resultSize} must be a multiple of source size {inputSize}");
 
         var repeatCount = resultSize / inputSize;
+        if (Bv<TResultSize>.IsWord)
+        {
+            var word = 0UL;
+            for (uint i = 0; i < repeatCount; i++)
+                word |= bits << (int)(i * inputSize);
+
+            return Bv<TResultSize>.FromBits(word);
+        }
+
+        var value = Value;
         if (repeatCount == 1)
             return new Bv<TResultSize>(value);
 
@@ -29,7 +29,9 @@ public readonly partial struct Bv<TSize>
     {
         if (shift < 0)
             throw new ArgumentException("Shift amount must be non-negative", nameof(shift));
-        return new Bv<TSize>(value << shift);
+        if (IsWord)
+            return shift >= Size ? Zero : FromBits(bits << shift);
+        return new Bv<TSize>(wide << shift);
     }
 
     /// <summary>
@@ -44,10 +46,17 @@ public readonly partial struct Bv<TSize>
         if (shift < 0)
             throw new ArgumentException("Shift amount must be non-negative", nameof(shift));
 
+        if (IsWord)
+        {
+            if (signed)
+                return FromBits((ulong)(SignedBits >> Math.Min(shift, 63)));
+            return shift >= Size ? Zero : FromBits(bits >> shift);
+        }
+
         if (!signed)
         {
             // Logical right shift - fill with zeros
-            return new Bv<TSize>(value >> shift);
+            return new Bv<TSize>(wide >> shift);
         }
 
         // Arithmetic right shift - preserve sign bit
@@ -6,10 +6,17 @@ namespace Spaceorc.Z3Wrap.Values.BitVectors;
 /// Represents a strongly-typed fixed-width bitvector with compile-time size validation.
 /// </summary>
 /// <typeparam name="TSize">The size specification implementing ISize.</typeparam>
+/// <remarks>
+/// Bitvectors of up to 64 bits are stored inline as a <see cref="ulong"/>; wider bitvectors use a
+/// <see cref="BigInteger"/>. The representation is chosen from the static size, so the JIT removes the
+/// unused branch for each size.
+/// </remarks>
 public readonly partial struct Bv<TSize> : IEquatable<Bv<TSize>>, IComparable<Bv<TSize>>, ISpanFormattable
     where TSize : ISize
 {
-    private readonly BigInteger value;
+    // Only one of these is used, depending on IsWord
+    private readonly ulong bits;
+    private readonly BigInteger wide;
 
     /// <summary>
     /// Gets the bit width of this bitvector type.
@@ -19,12 +26,12 @@ public readonly partial struct Bv<TSize> : IEquatable<Bv<TSize>>, IComparable<Bv
     /// <summary>
     /// Gets the underlying value as a BigInteger.
     /// </summary>
-    public BigInteger Value => value;
+    public BigInteger Value => IsWord ? bits : wide;
 
     /// <summary>
     /// Gets whether this bitvector represents zero.
     /// </summary>
-    public bool IsZero => value == 0;
+    public bool IsZero => IsWord ? bits == 0 : wide.IsZero;
 
     /// <summary>
     /// Initializes a new bitvector with the specified value.
@@ -33,7 +40,24 @@ public readonly partial struct Bv<TSize> : IEquatable<Bv<TSize>>, IComparable<Bv
     public Bv(BigInteger value)
     {
         // Mask to ensure value fits in the specified bit width
-        var maxValue = (BigInteger.One << (int)Size) - 1;
-        this.value = value & maxValue;
+        if (IsWord)
+            bits = (ulong)(value & ulong.MaxValue) & WordMask;
+        else
+            wide = value & ((BigInteger.One << (int)Size) - 1);
     }
+
+    private Bv(ulong bits, BigInteger wide)
+    {
+        this.bits = bits;
+        this.wide = wide;
+    }
+
+    private static bool IsWord => TSize.Size <= 64;
+
+    private static ulong WordMask => ulong.MaxValue >> (64 - (int)Math.Min(TSize.Size, 64));
+
+    // Bits sign-extended from the bitvector width to 64 bits; only meaningful when IsWord
+    private long SignedBits => (long)(bits << (64 - (int)Size)) >> (64 - (int)Size);
+
+    private static Bv<TSize> FromBits(ulong bits) => IsWord ? new(bits & WordMask, default) : new(0, bits);
 }
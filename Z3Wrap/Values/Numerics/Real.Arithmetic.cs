@@ -10,8 +10,20 @@ public readonly partial struct Real
     /// <returns>A rational number representing the sum.</returns>
     public static Real operator +(Real left, Real right)
     {
-        var newNum = left.numerator * right.denominator + right.numerator * left.denominator;
-        var newDen = left.denominator * right.denominator;
+        if (left.IsInline && right.IsInline)
+        {
+            if (left.smallDenominator == right.smallDenominator)
+                return Create((Int128)left.smallNumerator + right.smallNumerator, left.smallDenominator);
+
+            return Create(
+                (Int128)left.smallNumerator * right.smallDenominator
+                    + (Int128)right.smallNumerator * left.smallDenominator,
+                (Int128)left.smallDenominator * right.smallDenominator
+            );
+        }
+
+        var newNum = left.Numerator * right.Denominator + right.Numerator * left.Denominator;
+        var newDen = left.Denominator * right.Denominator;
         return new Real(newNum, newDen);
     }
 
@@ -23,8 +35,20 @@ public readonly partial struct Real
     /// <returns>A rational number representing the difference.</returns>
     public static Real operator -(Real left, Real right)
     {
-        var newNum = left.numerator * right.denominator - right.numerator * left.denominator;
-        var newDen = left.denominator * right.denominator;
+        if (left.IsInline && right.IsInline)
+        {
+            if (left.smallDenominator == right.smallDenominator)
+                return Create((Int128)left.smallNumerator - right.smallNumerator, left.smallDenominator);
+
+            return Create(
+                (Int128)left.smallNumerator * right.smallDenominator
+                    - (Int128)right.smallNumerator * left.smallDenominator,
+                (Int128)left.smallDenominator * right.smallDenominator
+            );
+        }
+
+        var newNum = left.Numerator * right.Denominator - right.Numerator * left.Denominator;
+        var newDen = left.Denominator * right.Denominator;
         return new Real(newNum, newDen);
     }
 
@@ -36,8 +60,16 @@ public readonly partial struct Real
     /// <returns>A rational number representing the product.</returns>
     public static Real operator *(Real left, Real right)
     {
-        var newNum = left.numerator * right.numerator;
-        var newDen = left.denominator * right.denominator;
+        if (left.IsInline && right.IsInline)
+        {
+            return Create(
+                (Int128)left.smallNumerator * right.smallNumerator,
+                (Int128)left.smallDenominator * right.smallDenominator
+            );
+        }
+
+        var newNum = left.Numerator * right.Numerator;
+        var newDen = left.Denominator * right.Denominator;
         return new Real(newNum, newDen);
     }
 
@@ -53,8 +85,16 @@ public readonly partial struct Real
         if (right.IsZero)
             throw new DivideByZeroException("Division by zero is not allowed");
 
-        var newNum = left.numerator * right.denominator;
-        var newDen = left.denominator * right.numerator;
+        if (left.IsInline && right.IsInline)
+        {
+            return Create(
+                (Int128)left.smallNumerator * right.smallDenominator,
+                (Int128)left.smallDenominator * right.smallNumerator
+            );
+        }
+
+        var newNum = left.Numerator * right.Denominator;
+        var newDen = left.Denominator * right.Numerator;
         return new Real(newNum, newDen);
     }
 
@@ -63,5 +103,8 @@ public readonly partial struct Real
     /// </summary>
     /// <param name="value">The rational number to negate.</param>
     /// <returns>A rational number representing the negated value.</returns>
-    public static Real operator -(Real value) => new(-value.numerator, value.denominator);
+    public static Real operator -(Real value) =>
+        value.IsInline
+            ? new Real(-value.smallNumerator, value.smallDenominator, reduced: true)
+            : new Real(-value.numerator, value.denominator);
 }
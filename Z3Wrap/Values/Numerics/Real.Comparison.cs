@@ -8,8 +8,7 @@ public readonly partial struct Real
     /// <param name="left">The left operand.</param>
     /// <param name="right">The right operand.</param>
     /// <returns>true if left is less than right; otherwise, false.</returns>
-    public static bool operator <(Real left, Real right) =>
-        left.numerator * right.denominator < right.numerator * left.denominator;
+    public static bool operator <(Real left, Real right) => Compare(left, right) < 0;
 
     /// <summary>
     /// Determines whether the left rational number is less than or equal to the right using the &lt;= operator.
@@ -17,8 +16,7 @@ public readonly partial struct Real
     /// <param name="left">The left operand.</param>
     /// <param name="right">The right operand.</param>
     /// <returns>true if left is less than or equal to right; otherwise, false.</returns>
-    public static bool operator <=(Real left, Real right) =>
-        left.numerator * right.denominator <= right.numerator * left.denominator;
+    public static bool operator <=(Real left, Real right) => Compare(left, right) <= 0;
 
     /// <summary>
     /// Determines whether the left rational number is greater than the right using the &gt; operator.
@@ -26,8 +24,7 @@ public readonly partial struct Real
     /// <param name="left">The left operand.</param>
     /// <param name="right">The right operand.</param>
     /// <returns>true if left is greater than right; otherwise, false.</returns>
-    public static bool operator >(Real left, Real right) =>
-        left.numerator * right.denominator > right.numerator * left.denominator;
+    public static bool operator >(Real left, Real right) => Compare(left, right) > 0;
 
     /// <summary>
     /// Determines whether the left rational number is greater than or equal to the right using the &gt;= operator.
@@ -35,20 +32,24 @@ public readonly partial struct Real
     /// <param name="left">The left operand.</param>
     /// <param name="right">The right operand.</param>
     /// <returns>true if left is greater than or equal to right; otherwise, false.</returns>
-    public static bool operator >=(Real left, Real right) =>
-        left.numerator * right.denominator >= right.numerator * left.denominator;
+    public static bool operator >=(Real left, Real right) => Compare(left, right) >= 0;
 
     /// <summary>
     /// Compares this rational number to another rational number.
     /// </summary>
     /// <param name="other">The rational number to compare with this rational number.</param>
     /// <returns>A value less than 0 if this rational number is less than other; 0 if they are equal; greater than 0 if this rational number is greater than other.</returns>
-    public int CompareTo(Real other)
+    public int CompareTo(Real other) => Compare(this, other);
+
+    private static int Compare(Real left, Real right)
     {
-        if (this < other)
-            return -1;
-        if (this > other)
-            return 1;
-        return 0;
+        if (left.IsInline && right.IsInline)
+        {
+            return ((Int128)left.smallNumerator * right.smallDenominator).CompareTo(
+                (Int128)right.smallNumerator * left.smallDenominator
+            );
+        }
+
+        return (left.Numerator * right.Denominator).CompareTo(right.Numerator * left.Denominator);
     }
 }
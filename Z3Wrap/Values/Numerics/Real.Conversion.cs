@@ -15,10 +15,13 @@ public readonly partial struct Real
         if (!IsInteger)
             throw new InvalidOperationException("Cannot convert non-integer value to int");
 
-        if (numerator > int.MaxValue || numerator < int.MinValue)
+        var outOfRange = IsInline
+            ? smallNumerator is > int.MaxValue or < int.MinValue
+            : numerator > int.MaxValue || numerator < int.MinValue;
+        if (outOfRange)
             throw new OverflowException($"Value {this} is outside the range of int");
 
-        return (int)numerator;
+        return IsInline ? (int)smallNumerator : (int)numerator;
     }
 
     /// <summary>
@@ -32,6 +35,9 @@ public readonly partial struct Real
         if (!IsInteger)
             throw new InvalidOperationException("Cannot convert non-integer value to long");
 
+        if (IsInline)
+            return smallNumerator;
+
         if (numerator > long.MaxValue || numerator < long.MinValue)
             throw new OverflowException($"Value {this} is outside the range of long");
 
@@ -48,7 +54,7 @@ public readonly partial struct Real
         if (!IsInteger)
             throw new InvalidOperationException("Cannot convert non-integer value to BigInteger");
 
-        return numerator;
+        return Numerator;
     }
 
     /// <summary>
@@ -57,6 +63,9 @@ public readonly partial struct Real
     /// <returns>The decimal approximation of the rational number.</returns>
     public decimal ToDecimal()
     {
+        if (IsInline)
+            return smallDenominator == 1 ? smallNumerator : (decimal)smallNumerator / smallDenominator;
+
         if (denominator == 1)
             return (decimal)numerator;
 
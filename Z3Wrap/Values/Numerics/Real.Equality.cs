@@ -9,7 +9,11 @@ public readonly partial struct Real
     /// <param name="right">The right operand.</param>
     /// <returns>true if the rational numbers are equal; otherwise, false.</returns>
     public static bool operator ==(Real left, Real right) =>
-        left.numerator == right.numerator && left.denominator == right.denominator;
+        left.IsInline
+            ? right.IsInline
+                && left.smallNumerator == right.smallNumerator
+                && left.smallDenominator == right.smallDenominator
+            : !right.IsInline && left.numerator == right.numerator && left.denominator == right.denominator;
 
     /// <summary>
     /// Determines whether two rational numbers are not equal using the != operator.
@@ -37,5 +41,7 @@ public readonly partial struct Real
     /// Returns the hash code for this rational number.
     /// </summary>
     /// <returns>A 32-bit signed integer hash code.</returns>
-    public override int GetHashCode() => HashCode.Combine(numerator, denominator);
+    /// <remarks>Each value has a single canonical representation, so equal values always hash alike.</remarks>
+    public override int GetHashCode() =>
+        IsInline ? HashCode.Combine(smallNumerator, smallDenominator) : HashCode.Combine(numerator, denominator);
 }
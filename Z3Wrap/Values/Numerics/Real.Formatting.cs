@@ -31,9 +31,9 @@ public readonly partial struct Real
 
         return format.ToUpperInvariant() switch
         {
-            "F" or "FRACTION" => $"{numerator}/{denominator}",
+            "F" or "FRACTION" => $"{Numerator}/{Denominator}",
             "D" or "DECIMAL" => ToDecimal().ToString(formatProvider),
-            "G" or "GENERAL" => denominator == 1 ? numerator.ToString(formatProvider) : $"{numerator}/{denominator}",
+            "G" or "GENERAL" => IsInteger ? Numerator.ToString(formatProvider) : $"{Numerator}/{Denominator}",
             _ => throw new FormatException($"Invalid format string: {format}"),
         };
     }
@@ -8,15 +8,20 @@ public readonly partial struct Real
     /// Returns the absolute value of this rational number.
     /// </summary>
     /// <returns>A rational number representing the absolute value.</returns>
-    public Real Abs() => numerator < 0 ? -this : this;
+    public Real Abs() => IsNegative ? -this : this;
 
     /// <summary>
     /// Returns the reciprocal (multiplicative inverse) of this rational number.
     /// </summary>
     /// <returns>A rational number representing 1/this.</returns>
     /// <exception cref="DivideByZeroException">Thrown when attempting to get the reciprocal of zero.</exception>
-    public Real Reciprocal() =>
-        IsZero ? throw new DivideByZeroException("Division by zero is not allowed") : new Real(denominator, numerator);
+    public Real Reciprocal()
+    {
+        if (IsZero)
+            throw new DivideByZeroException("Division by zero is not allowed");
+
+        return IsInline ? Create(smallDenominator, smallNumerator) : new Real(denominator, numerator);
+    }
 
     /// <summary>
     /// Raises this rational number to the specified integer power.
@@ -54,6 +59,8 @@ public readonly partial struct Real
     /// <exception cref="ArgumentException">Thrown when an invalid rounding mode is specified.</exception>
     public BigInteger Round(MidpointRounding mode = MidpointRounding.ToEven)
     {
+        var numerator = Numerator;
+        var denominator = Denominator;
         if (IsInteger)
             return numerator;
 
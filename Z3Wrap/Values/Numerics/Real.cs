@@ -6,8 +6,18 @@ namespace Spaceorc.Z3Wrap.Values.Numerics;
 /// Represents an exact rational number with unlimited precision arithmetic.
 /// Supports natural mathematical operations with automatic reduction to lowest terms.
 /// </summary>
+/// <remarks>
+/// Values whose reduced numerator and denominator fit in a <see cref="long"/> are stored inline and combined with
+/// 128-bit intermediate arithmetic; larger values are promoted to <see cref="BigInteger"/>. Every value has exactly
+/// one canonical form, so equality and hashing do not depend on how a value was computed.
+/// </remarks>
 public readonly partial struct Real : IEquatable<Real>, IComparable<Real>, IFormattable
 {
+    // Inline form, used when smallDenominator != 0 (always positive and reduced)
+    private readonly long smallNumerator;
+    private readonly long smallDenominator;
+
+    // BigInteger form, used for values that do not fit the inline form
     private readonly BigInteger numerator;
     private readonly BigInteger denominator;
 
@@ -17,7 +27,7 @@ public readonly partial struct Real : IEquatable<Real>, IComparable<Real>, IForm
     /// <param name="numerator">The numerator.</param>
     /// <param name="denominator">The denominator (defaults to 1).</param>
     public Real(int numerator, int denominator = 1)
-        : this(new BigInteger(numerator), new BigInteger(denominator)) { }
+        : this((long)numerator, denominator) { }
 
     /// <summary>
     /// Initializes a new rational number from long integer numerator and denominator.
@@ -25,7 +35,12 @@ public readonly partial struct Real : IEquatable<Real>, IComparable<Real>, IForm
     /// <param name="numerator">The numerator.</param>
     /// <param name="denominator">The denominator (defaults to 1).</param>
     public Real(long numerator, long denominator = 1)
-        : this(new BigInteger(numerator), new BigInteger(denominator)) { }
+    {
+        if (denominator == 0)
+            throw new ArgumentException("Denominator must be non-zero", nameof(denominator));
+
+        this = Create(numerator, denominator);
+    }
 
     /// <summary>
     /// Initializes a new rational number from a BigInteger numerator (denominator = 1).
@@ -54,9 +69,7 @@ public readonly partial struct Real : IEquatable<Real>, IComparable<Real>, IForm
 
         var den = BigInteger.Pow(10, scale);
 
-        var gcd = BigInteger.GreatestCommonDivisor(BigInteger.Abs(num), den);
-        numerator = num / gcd;
-        denominator = den / gcd;
+        this = new Real(num, den);
     }
 
     /// <summary>
@@ -78,37 +91,105 @@ public readonly partial struct Real : IEquatable<Real>, IComparable<Real>, IForm
         }
 
         var gcd = BigInteger.GreatestCommonDivisor(BigInteger.Abs(numerator), denominator);
-        this.numerator = numerator / gcd;
-        this.denominator = denominator / gcd;
+        numerator /= gcd;
+        denominator /= gcd;
+
+        if (FitsInline(numerator) && denominator <= long.MaxValue)
+        {
+            smallNumerator = (long)numerator;
+            smallDenominator = (long)denominator;
+        }
+        else
+        {
+            this.numerator = numerator;
+            this.denominator = denominator;
+        }
+    }
+
+    // Caller guarantees the inline invariants; the flag only distinguishes this overload from Real(long, long)
+    private Real(long numerator, long denominator, bool reduced)
+    {
+        smallNumerator = numerator;
+        smallDenominator = denominator;
     }
 
     /// <summary>
     /// Gets the numerator of the rational number.
     /// </summary>
-    public BigInteger Numerator => numerator;
+    public BigInteger Numerator => IsInline ? smallNumerator : numerator;
 
     /// <summary>
     /// Gets the denominator of the rational number.
     /// </summary>
-    public BigInteger Denominator => denominator;
+    public BigInteger Denominator => IsInline ? smallDenominator : denominator;
 
     /// <summary>
     /// Gets a value indicating whether this rational number represents an integer.
     /// </summary>
-    public bool IsInteger => denominator == 1;
+    public bool IsInteger => IsInline ? smallDenominator == 1 : denominator == 1;
 
     /// <summary>
     /// Gets a value indicating whether this rational number is zero.
     /// </summary>
-    public bool IsZero => numerator == 0;
+    public bool IsZero => IsInline ? smallNumerator == 0 : numerator.IsZero;
 
     /// <summary>
     /// Gets a value indicating whether this rational number is positive.
     /// </summary>
-    public bool IsPositive => numerator > 0;
+    public bool IsPositive => IsInline ? smallNumerator > 0 : numerator.Sign > 0;
 
     /// <summary>
     /// Gets a value indicating whether this rational number is negative.
     /// </summary>
-    public bool IsNegative => numerator < 0;
+    public bool IsNegative => IsInline ? smallNumerator < 0 : numerator.Sign < 0;
+
+    private bool IsInline => smallDenominator != 0;
+
+    // long.MinValue is excluded so that negation and Abs never overflow
+    private static bool FitsInline(BigInteger value) => value > long.MinValue && value <= long.MaxValue;
+
+    /// <summary>
+    /// Reduces numerator/denominator computed with 128-bit intermediates, promoting to BigInteger if needed.
+    /// </summary>
+    private static Real Create(Int128 numerator, Int128 denominator)
+    {
+        if (denominator < 0)
+        {
+            numerator = -numerator;
+            denominator = -denominator;
+        }
+
+        var gcd = (Int128)Gcd((UInt128)Int128.Abs(numerator), (UInt128)denominator);
+        if (gcd > 1)
+        {
+            numerator /= gcd;
+            denominator /= gcd;
+        }
+
+        if (numerator > long.MinValue && numerator <= long.MaxValue && denominator <= long.MaxValue)
+            return new Real((long)numerator, (long)denominator, reduced: true);
+
+        return new Real((BigInteger)numerator, (BigInteger)denominator);
+    }
+
+    private static UInt128 Gcd(UInt128 a, UInt128 b)
+    {
+        // Binary GCD: shifts and subtractions only, no 128-bit division
+        if (a == 0)
+            return b;
+        if (b == 0)
+            return a;
+
+        var shift = (int)UInt128.TrailingZeroCount(a | b);
+        a >>= (int)UInt128.TrailingZeroCount(a);
+        do
+        {
+            b >>= (int)UInt128.TrailingZeroCount(b);
+            if (a > b)
+                (a, b) = (b, a);
+            b -= a;
+        } while (b != 0);
+
+        return a << shift;
+    }
 }
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Cref Overload Disambiguation
+
+Rewrites <see cref="Name"/> references in generated partial classes so that they stay valid
+when Name has several overloads (string, UTF-8 span and original pointer variants).
+A bare cref to an overloaded method is ambiguous (CS0419) and fails the build with warnings as errors.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List
+
+# Method declarations emitted by the generators: one line, public or internal, non-delegate
+METHOD_DECLARATION = re.compile(
+    r'^\s+(?:public|internal)\s+(?:static\s+)?(?!delegate\b)[\w<>\[\],.?]+\s+(\w+)\(([^)]*)\)'
+)
+
+CREF = re.compile(r'cref="(\w+)(\([^"]*\))?"')
+
+PARAMETER_MODIFIERS = {'out', 'ref', 'in'}
+
+
+def _split_parameters(parameters: str) -> List[str]:
+    """Split a parameter list at top-level commas (ignoring commas inside generic arguments)."""
+    parts = []
+    depth = 0
+    current = ''
+    for char in parameters:
+        if char in '<(':
+            depth += 1
+        elif char in '>)':
+            depth -= 1
+        if char == ',' and depth == 0:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    if current.strip():
+        parts.append(current)
+    return parts
+
+
+def _cref_parameter(parameter: str) -> str:
+    """Convert a C# parameter declaration to its cref form (e.g. 'out uint value' -> 'out uint')."""
+    tokens = parameter.split('=')[0].split()
+    modifiers = [t for t in tokens[:-1] if t in PARAMETER_MODIFIERS]
+    type_name = [t for t in tokens[:-1] if t not in PARAMETER_MODIFIERS and t != 'params'][-1]
+    type_name = type_name.replace('<', '{').replace('>', '}')
+    return ' '.join(modifiers + [type_name])
+
+
+def collect_overloads(files: List[Path]) -> Dict[str, List[str]]:
+    """Collect cref signatures of all methods declared in the given files, in declaration order."""
+    overloads: Dict[str, List[str]] = {}
+    for file in files:
+        for line in file.read_text(encoding='utf-8').splitlines():
+            match = METHOD_DECLARATION.match(line)
+            if match:
+                name, parameters = match.groups()
+                cref_parameters = ', '.join(_cref_parameter(p) for p in _split_parameters(parameters))
+                overloads.setdefault(name, []).append(f"{name}({cref_parameters})")
+    return overloads
+
+
+def disambiguate_overload_crefs(files: List[Path]) -> int:
+    """
+    Rewrite crefs to methods of the partial class spread over the given files.
+    Overloaded methods are referenced by the signature of their first declared overload;
+    methods with a single declaration are referenced by bare name.
+    Returns the number of files changed.
+    """
+    overloads = collect_overloads(files)
+
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        signatures = overloads.get(name)
+        if signatures is None:
+            return match.group(0)
+        return f'cref="{signatures[0] if len(signatures) > 1 else name}"'
+
+    changed = 0
+    for file in files:
+        content = file.read_text(encoding='utf-8')
+        updated = CREF.sub(replace, content)
+        if updated != content:
+            file.write_text(updated, encoding='utf-8')
+            changed += 1
+    return changed
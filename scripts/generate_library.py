@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Tuple, Set, Optional
 
+from cref_overloads import disambiguate_overload_crefs
+
 
 # Configuration: Functions that should NOT have string overloads for Z3_symbol parameters
 # These are typically getter/query functions that inspect existing symbols rather than create new ones
@@ -431,7 +433,8 @@ def parse_native_callbacks_file(file_path: Path) -> List[CallbackDefinition]:
                 if params_str.strip():
                     param_parts = [p.strip() for p in params_str.split(',')]
                     for param_part in param_parts:
-                        parts = param_part.split()
+                        # Marshaling attributes are re-derived from the type when the public delegate is written
+                        parts = re.sub(r'^\[MarshalAs\([^)]*\)\]\s*', '', param_part).split()
                         if len(parts) >= 2:
                             param_type = parts[0]
                             param_name = parts[1]
@@ -663,6 +666,229 @@ def filter_invalid_cref_references(doc_tree: XmlNode) -> XmlNode:
     return filtered
 
 
+def is_span_param(param: ParameterInfo) -> bool:
+    """
+    Check if a parameter is a read-only input handle array that can be passed as ReadOnlySpan<IntPtr>.
+    Non-const arrays are excluded because Z3 may write back into them.
+    """
+    return param.csharp_type == 'IntPtr[]' and 'const' in param.c_type
+
+
+def has_utf8_params(func: FunctionDefinition, symbols_as_strings: bool) -> bool:
+    """
+    Check if a function takes string input that can be exposed as UTF-8 ReadOnlySpan<byte>.
+    """
+    return any(p.c_type == 'Z3_string' or (symbols_as_strings and p.c_type == 'Z3_symbol') for p in func.parameters)
+
+
+def write_method_wrapper(f, func: FunctionDefinition, method_name: str, doc_clone: XmlNode,
+                         symbols_as_strings: bool, use_spans: bool, enum_types: Set[str],
+                         callback_types: Set[str], use_utf8: bool = False, utf8_return: bool = False):
+    """
+    Write a single public wrapper method around a NativeZ3Library function.
+
+    Args:
+        symbols_as_strings: Expose Z3_symbol parameters as strings (converted via MkStringSymbol)
+        use_spans: Expose input handle arrays as ReadOnlySpan<IntPtr> (pinned by the native overload)
+        use_utf8: Expose string parameters as UTF-8 ReadOnlySpan<byte> (NUL-terminated in a stack or pooled buffer)
+        utf8_return: Return a Z3_string result as a ReadOnlySpan<byte> over the native buffer ("Utf8" suffix)
+    """
+    string_type = 'ReadOnlySpan<byte>' if use_utf8 else 'string'
+    symbol_params = [p for p in func.parameters if p.c_type == 'Z3_symbol'] if symbols_as_strings else []
+
+    # Render documentation
+    doc_output = render_xml_node(doc_clone, "    ")
+    f.write(doc_output + "\n")
+
+    # Parameters - convert Z3_string to string, optionally Z3_symbol to string and arrays to spans
+    public_params = []
+    for param in func.parameters:
+        if param.c_type == 'Z3_string':
+            public_type = string_type
+        elif param.c_type == 'Z3_symbol' and symbols_as_strings:
+            public_type = string_type  # String overload for symbols
+        elif use_spans and is_span_param(param):
+            public_type = 'ReadOnlySpan<IntPtr>'
+        else:
+            public_type = param.csharp_type
+
+        public_params.append(f"{public_type} {param.name}")
+
+    # Determine public return type (convert Z3_string to string, Z3_ast_vector to IntPtr[])
+    if func.return_c_type == 'Z3_string':
+        public_return_type = 'ReadOnlySpan<byte>' if utf8_return else 'string'
+    elif func.return_c_type == 'Z3_ast_vector':
+        public_return_type = 'IntPtr[]'
+    else:
+        public_return_type = func.return_type
+
+    # Method signature
+    params_str = ", ".join(public_params)
+    public_name = f"{method_name}Utf8" if utf8_return else method_name
+    f.write(f"    public {public_return_type} {public_name}({params_str})\n")
+    f.write("    {\n")
+
+    context_param = func.parameters[0].name
+
+    # Convert string parameters to AnsiStringPtr (or NUL-terminated UTF-8 spans)
+    string_arg_suffix = 'Utf8.Span' if use_utf8 else 'Ansi'
+
+    def write_string_conversion(param_name: str):
+        if use_utf8:
+            f.write(f"        using var {param_name}Utf8 = new NullTerminatedUtf8({param_name}, stackalloc byte[NullTerminatedUtf8.StackCapacity]);\n")
+        else:
+            f.write(f"        using var {param_name}Ansi = new AnsiStringPtr({param_name});\n")
+
+    string_params = [p for p in func.parameters if p.c_type == 'Z3_string']
+    for param in string_params:
+        write_string_conversion(param.name)
+
+    # Convert symbol string parameters to Z3_symbol
+    for param in symbol_params:
+        write_string_conversion(param.name)
+        f.write(f"        var {param.name}Symbol = nativeLibrary.MkStringSymbol({context_param}, {param.name}{string_arg_suffix});\n")
+        f.write(f"        CheckError({context_param});\n")
+
+    # Call native method
+    native_args = []
+    for param in func.parameters:
+        # Check if parameter has 'out' modifier
+        has_out_modifier = param.csharp_type.startswith('out ')
+        param_name_only = param.name
+
+        if param.c_type == 'Z3_string':
+            arg = f"{param.name}{string_arg_suffix}"
+        elif param.c_type == 'Z3_symbol' and symbols_as_strings:
+            arg = f"{param.name}Symbol"
+        elif param.csharp_type in enum_types:
+            # Enum parameter - cast to internal enum
+            arg = f"(NativeZ3Library.{param.csharp_type}){param.name}"
+        elif param.csharp_type.rstrip('?') in callback_types:
+            # Callback parameter - cast to internal delegate type
+            arg = f"(NativeZ3Library.{param.csharp_type})(object?){param.name}"
+        else:
+            arg = param_name_only
+
+        # Add 'out' keyword if needed
+        if has_out_modifier:
+            native_args.append(f"out {arg}")
+        else:
+            native_args.append(arg)
+
+    native_args_str = ", ".join(native_args)
+
+    # Check if this function should skip error checking
+    # Skip for: IncRef/DecRef (reference counting)
+    skip_error_check = func.name.endswith('IncRef') or func.name.endswith('DecRef')
+
+    # Generate call based on return type
+    if func.return_c_type == 'Z3_string':
+        # Z3_string return type - marshal to C# string
+        f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
+        if not skip_error_check:
+            f.write(f"        CheckError({context_param});\n")
+        f.write(f"        result = CheckHandle(result, nameof({func.name}));\n")
+        if utf8_return:
+            f.write(f"        return NativeUtf8Span(result);\n")
+        else:
+            f.write(f"        return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException(\"Failed to marshal string from native code.\");\n")
+    elif func.return_c_type == 'Z3_ast_vector':
+        # Z3_ast_vector return type - convert to IntPtr array
+        f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
+        if not skip_error_check:
+            f.write(f"        CheckError({context_param});\n")
+        f.write(f"        result = CheckHandle(result, nameof({func.name}));\n")
+        f.write(f"        return AstVectorToArray({context_param}, result);\n")
+    elif func.return_type == 'IntPtr':
+        f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
+        if not skip_error_check:
+            f.write(f"        CheckError({context_param});\n")
+        f.write(f"        return CheckHandle(result, nameof({func.name}));\n")
+    elif func.return_type == 'void':
+        f.write(f"        nativeLibrary.{func.name}({native_args_str});\n")
+        if not skip_error_check:
+            f.write(f"        CheckError({context_param});\n")
+    elif func.return_type in enum_types:
+        # Enum return type - cast from internal enum to public enum
+        f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
+        if not skip_error_check:
+            f.write(f"        CheckError({context_param});\n")
+        f.write(f"        return ({func.return_type})result;\n")
+    else:
+        f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
+        if not skip_error_check:
+            f.write(f"        CheckError({context_param});\n")
+        f.write(f"        return result;\n")
+
+    f.write("    }\n\n")
+
+
+def clone_doc_for_utf8_return(doc_clone: XmlNode) -> XmlNode:
+    """
+    Clone documentation for a ReadOnlySpan<byte> variant of a Z3_string-returning function.
+    """
+    import copy
+    cloned = copy.deepcopy(doc_clone)
+    returns_node = cloned.find_child_by_tag('returns')
+    text = ("UTF-8 bytes of the result (without NUL terminator). The span points into a buffer owned by Z3 "
+            "and is only valid until the next call that returns a string on the same context.")
+    if returns_node:
+        returns_node.text = text
+        returns_node.children = []
+    else:
+        cloned.children.append(XmlNode(tag='returns', text=text))
+    return cloned
+
+
+def write_string_return_copy_variants(f, func: FunctionDefinition, method_name: str, doc_clone: XmlNode,
+                                      symbols_as_strings: bool):
+    """
+    Write IBufferWriter<byte> and Stream variants of a Z3_string-returning function.
+    They copy the native UTF-8 result straight to the destination without creating a managed string.
+    """
+    public_params = []
+    call_args = []
+    for param in func.parameters:
+        if param.c_type == 'Z3_string' or (symbols_as_strings and param.c_type == 'Z3_symbol'):
+            public_type = 'string'
+        else:
+            public_type = param.csharp_type
+        public_params.append(f"{public_type} {param.name}")
+        call_args.append(f"out {param.name}" if public_type.startswith('out ') else param.name)
+
+    params_doc = [n for n in doc_clone.children if n.tag == 'param']
+    call_args_str = ", ".join(call_args)
+
+    for destination_type, destination_doc in (
+        ("IBufferWriter<byte>", "Buffer writer receiving the UTF-8 bytes of the result."),
+        ("Stream", "Stream receiving the UTF-8 bytes of the result."),
+    ):
+        doc = XmlNode(tag=None, children=[
+            XmlNode(tag='summary', children=[
+                XmlNode(tag=None, text="\n Writes the result of "),
+                XmlNode(tag='see', attributes={'cref': f"{method_name}Utf8"}),
+                XmlNode(tag=None, text=" to a destination without creating a managed string.\n"),
+            ]),
+            *params_doc,
+            XmlNode(tag='param', attributes={'name': 'destination'}, text=destination_doc),
+        ])
+        f.write(render_xml_node(doc, "    ") + "\n")
+        f.write(f"    public void {method_name}({', '.join(public_params + [f'{destination_type} destination'])})\n")
+        f.write("    {\n")
+        f.write(f"        destination.Write({method_name}Utf8({call_args_str}));\n")
+        f.write("    }\n\n")
+
+
+def write_utf8_return_variants(f, func: FunctionDefinition, method_name: str, doc_clone: XmlNode,
+                               symbols_as_strings: bool, enum_types: Set[str], callback_types: Set[str]):
+    """
+    Write the ReadOnlySpan<byte>, IBufferWriter<byte> and Stream variants of a Z3_string-returning function.
+    """
+    write_method_wrapper(f, func, method_name, clone_doc_for_utf8_return(doc_clone), symbols_as_strings, False,
+                         enum_types, callback_types, utf8_return=True)
+    write_string_return_copy_variants(f, func, method_name, doc_clone, symbols_as_strings)
+
+
 def generate_functions_file(output_dir: Path, functions: List[FunctionDefinition], group_name: str, enum_types: Set[str], callback_types: Set[str] = None):
     """
     Generate Z3Library.{GroupName}.generated.cs with public method wrappers.
@@ -679,6 +905,8 @@ def generate_functions_file(output_dir: Path, functions: List[FunctionDefinition
         f.write("// </auto-generated>\n\n")
 
         f.write("#nullable enable\n\n")
+        if any(func.return_c_type == 'Z3_string' for func in functions):
+            f.write("using System.Buffers;\n")
         f.write("using System.Runtime.InteropServices;\n")
         f.write("using Spaceorc.Z3Wrap.Core.Interop;\n\n")
         f.write("namespace Spaceorc.Z3Wrap.Core;\n\n")
@@ -695,6 +923,9 @@ def generate_functions_file(output_dir: Path, functions: List[FunctionDefinition
             # Check if this function should skip string overload (configured list)
             skip_string_overload = func.name in SKIP_SYMBOL_STRING_OVERLOAD
 
+            # Input handle arrays get an additional ReadOnlySpan<IntPtr> overload
+            span_variants = [False, True] if any(is_span_param(p) for p in func.parameters) else [False]
+
             # Generate string overload first (if symbols present and not in skip list)
             if has_symbols and not skip_string_overload:
                 # Clone and prepare documentation for string overload
@@ -705,224 +936,30 @@ def generate_functions_file(output_dir: Path, functions: List[FunctionDefinition
                 doc_clone = clone_and_modify_doc(func.doc_comment, func.name, func.parameters, param_overrides)
                 doc_clone = filter_invalid_cref_references(doc_clone)
 
-                # Render documentation
-                doc_output = render_xml_node(doc_clone, "    ")
-                f.write(doc_output + "\n")
-
-                # Parameters - convert Z3_symbol to string, Z3_string to string
-                public_params = []
-                for param in func.parameters:
-                    if param.c_type == 'Z3_string':
-                        public_type = 'string'
-                    elif param.c_type == 'Z3_symbol':
-                        public_type = 'string'  # String overload for symbols
-                    else:
-                        public_type = param.csharp_type
-
-                    public_params.append(f"{public_type} {param.name}")
+                for use_spans in span_variants:
+                    write_method_wrapper(f, func, func.name, doc_clone, True, use_spans, enum_types, callback_types)
+                write_method_wrapper(f, func, func.name, doc_clone, True, span_variants[-1], enum_types,
+                                     callback_types, use_utf8=True)
 
-                # Determine public return type (convert Z3_string to string, Z3_ast_vector to IntPtr[])
                 if func.return_c_type == 'Z3_string':
-                    public_return_type = 'string'
-                elif func.return_c_type == 'Z3_ast_vector':
-                    public_return_type = 'IntPtr[]'
-                else:
-                    public_return_type = func.return_type
-
-                # Method signature
-                params_str = ", ".join(public_params)
-                f.write(f"    public {public_return_type} {func.name}({params_str})\n")
-                f.write("    {\n")
-
-                context_param = func.parameters[0].name
-
-                # Convert string parameters to AnsiStringPtr
-                string_params = [p for p in func.parameters if p.c_type == 'Z3_string']
-                for param in string_params:
-                    f.write(f"        using var {param.name}Ansi = new AnsiStringPtr({param.name});\n")
-
-                # Convert symbol string parameters to Z3_symbol
-                for param in symbol_params:
-                    f.write(f"        using var {param.name}Ansi = new AnsiStringPtr({param.name});\n")
-                    f.write(f"        var {param.name}Symbol = nativeLibrary.MkStringSymbol({context_param}, {param.name}Ansi);\n")
-                    f.write(f"        CheckError({context_param});\n")
-
-                # Call native method
-                native_args = []
-                for param in func.parameters:
-                    # Check if parameter has 'out' modifier
-                    has_out_modifier = param.csharp_type.startswith('out ')
-                    param_name_only = param.name
-
-                    if param.c_type == 'Z3_string':
-                        arg = f"{param.name}Ansi"
-                    elif param.c_type == 'Z3_symbol':
-                        arg = f"{param.name}Symbol"
-                    elif param.csharp_type in enum_types:
-                        # Enum parameter - cast to internal enum
-                        arg = f"(NativeZ3Library.{param.csharp_type}){param.name}"
-                    elif param.csharp_type.rstrip('?') in callback_types:
-                        # Callback parameter - cast to internal delegate type
-                        arg = f"(NativeZ3Library.{param.csharp_type})(object?){param.name}"
-                    else:
-                        arg = param_name_only
-
-                    # Add 'out' keyword if needed
-                    if has_out_modifier:
-                        native_args.append(f"out {arg}")
-                    else:
-                        native_args.append(arg)
-
-                native_args_str = ", ".join(native_args)
-
-                # Check if this function should skip error checking
-                # Skip for: IncRef/DecRef (reference counting)
-                skip_error_check = func.name.endswith('IncRef') or func.name.endswith('DecRef')
-
-                # Generate call based on return type
-                if func.return_c_type == 'Z3_string':
-                    # Z3_string return type - marshal to C# string
-                    f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
-                    if not skip_error_check:
-                        f.write(f"        CheckError({context_param});\n")
-                    f.write(f"        result = CheckHandle(result, nameof({func.name}));\n")
-                    f.write(f"        return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException(\"Failed to marshal string from native code.\");\n")
-                elif func.return_c_type == 'Z3_ast_vector':
-                    # Z3_ast_vector return type - convert to IntPtr array
-                    f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
-                    if not skip_error_check:
-                        f.write(f"        CheckError({context_param});\n")
-                    f.write(f"        result = CheckHandle(result, nameof({func.name}));\n")
-                    f.write(f"        return AstVectorToArray({context_param}, result);\n")
-                elif func.return_type == 'IntPtr':
-                    f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
-                    if not skip_error_check:
-                        f.write(f"        CheckError({context_param});\n")
-                    f.write(f"        return CheckHandle(result, nameof({func.name}));\n")
-                elif func.return_type == 'void':
-                    f.write(f"        nativeLibrary.{func.name}({native_args_str});\n")
-                    if not skip_error_check:
-                        f.write(f"        CheckError({context_param});\n")
-                elif func.return_type in enum_types:
-                    # Enum return type - cast from internal enum to public enum
-                    f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
-                    if not skip_error_check:
-                        f.write(f"        CheckError({context_param});\n")
-                    f.write(f"        return ({func.return_type})result;\n")
-                else:
-                    f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
-                    if not skip_error_check:
-                        f.write(f"        CheckError({context_param});\n")
-                    f.write(f"        return result;\n")
-
-                f.write("    }\n\n")
+                    write_utf8_return_variants(f, func, func.name, doc_clone, True, enum_types, callback_types)
 
             # Generate original overload with "Original" suffix (always, or only if no symbols)
             # Clone documentation (no overrides for IntPtr version)
             doc_clone = clone_and_modify_doc(func.doc_comment, func.name, func.parameters)
             doc_clone = filter_invalid_cref_references(doc_clone)
 
-            # Render documentation
-            doc_output = render_xml_node(doc_clone, "    ")
-            f.write(doc_output + "\n")
-
-            # Parameters - convert only Z3_string to string, keep Z3_symbol as IntPtr
-            public_params = []
-            for param in func.parameters:
-                if param.c_type == 'Z3_string':
-                    public_type = 'string'
-                else:
-                    public_type = param.csharp_type
-
-                public_params.append(f"{public_type} {param.name}")
-
-            # Determine public return type (convert Z3_string to string, Z3_ast_vector to IntPtr[])
-            if func.return_c_type == 'Z3_string':
-                public_return_type = 'string'
-            elif func.return_c_type == 'Z3_ast_vector':
-                public_return_type = 'IntPtr[]'
-            else:
-                public_return_type = func.return_type
-
             # Method signature - add "Original" suffix if this function has symbols
             method_name = f"{func.name}Original" if has_symbols and not skip_string_overload else func.name
-            params_str = ", ".join(public_params)
-            f.write(f"    public {public_return_type} {method_name}({params_str})\n")
-            f.write("    {\n")
+            for use_spans in span_variants:
+                write_method_wrapper(f, func, method_name, doc_clone, False, use_spans, enum_types, callback_types)
+            if has_utf8_params(func, False):
+                write_method_wrapper(f, func, method_name, doc_clone, False, span_variants[-1], enum_types,
+                                     callback_types, use_utf8=True)
 
-            # Convert string parameters to AnsiStringPtr
-            string_params = [p for p in func.parameters if p.c_type == 'Z3_string']
-            for param in string_params:
-                f.write(f"        using var {param.name}Ansi = new AnsiStringPtr({param.name});\n")
-
-            # Call native method
-            native_args = []
-            for param in func.parameters:
-                # Check if parameter has 'out' modifier
-                has_out_modifier = param.csharp_type.startswith('out ')
-                param_name_only = param.name
-
-                if param.c_type == 'Z3_string':
-                    arg = f"{param.name}Ansi"
-                elif param.csharp_type in enum_types:
-                    # Enum parameter - cast to internal enum
-                    arg = f"(NativeZ3Library.{param.csharp_type}){param.name}"
-                elif param.csharp_type.rstrip('?') in callback_types:
-                    # Callback parameter - cast to internal delegate type
-                    arg = f"(NativeZ3Library.{param.csharp_type})(object?){param.name}"
-                else:
-                    arg = param_name_only
-
-                # Add 'out' keyword if needed
-                if has_out_modifier:
-                    native_args.append(f"out {arg}")
-                else:
-                    native_args.append(arg)
-
-            native_args_str = ", ".join(native_args)
-
-            # Check if this function should skip error checking
-            # Skip for: IncRef/DecRef (reference counting)
-            skip_error_check = func.name.endswith('IncRef') or func.name.endswith('DecRef')
-
-            # Generate call based on return type
-            context_param = func.parameters[0].name
-            if func.return_c_type == 'Z3_string':
-                # Z3_string return type - marshal to C# string
-                f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
-                if not skip_error_check:
-                    f.write(f"        CheckError({context_param});\n")
-                f.write(f"        result = CheckHandle(result, nameof({func.name}));\n")
-                f.write(f"        return Marshal.PtrToStringAnsi(result) ?? throw new InvalidOperationException(\"Failed to marshal string from native code.\");\n")
-            elif func.return_c_type == 'Z3_ast_vector':
-                # Z3_ast_vector return type - convert to IntPtr array
-                f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
-                if not skip_error_check:
-                    f.write(f"        CheckError({context_param});\n")
-                f.write(f"        result = CheckHandle(result, nameof({func.name}));\n")
-                f.write(f"        return AstVectorToArray({context_param}, result);\n")
-            elif func.return_type == 'IntPtr':
-                f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
-                if not skip_error_check:
-                    f.write(f"        CheckError({context_param});\n")
-                f.write(f"        return CheckHandle(result, nameof({func.name}));\n")
-            elif func.return_type == 'void':
-                f.write(f"        nativeLibrary.{func.name}({native_args_str});\n")
-                if not skip_error_check:
-                    f.write(f"        CheckError({context_param});\n")
-            elif func.return_type in enum_types:
-                # Enum return type - cast from internal enum to public enum
-                f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
-                if not skip_error_check:
-                    f.write(f"        CheckError({context_param});\n")
-                f.write(f"        return ({func.return_type})result;\n")
-            else:
-                f.write(f"        var result = nativeLibrary.{func.name}({native_args_str});\n")
-                if not skip_error_check:
-                    f.write(f"        CheckError({context_param});\n")
-                f.write(f"        return result;\n")
-
-            f.write("    }\n\n")
+            # Zero-copy variants of string results for the primary overload only
+            if func.return_c_type == 'Z3_string' and method_name == func.name:
+                write_utf8_return_variants(f, func, method_name, doc_clone, False, enum_types, callback_types)
 
         f.write("}\n")
 
@@ -1041,7 +1078,8 @@ def generate_callbacks_file(output_dir: Path, callbacks: List[CallbackDefinition
         f.write("// </auto-generated>\n\n")
 
         f.write("#nullable enable\n\n")
-        f.write("using System;\n\n")
+        f.write("using System;\n")
+        f.write("using System.Runtime.InteropServices;\n\n")
         f.write("namespace Spaceorc.Z3Wrap.Core;\n\n")
 
         f.write("public sealed partial class Z3Library\n")
@@ -1070,6 +1108,10 @@ def generate_callbacks_file(output_dir: Path, callbacks: List[CallbackDefinition
                 else:
                     public_type = param.csharp_type
 
+                # C bool is one byte; match the native delegate's marshaling
+                if public_type == 'bool':
+                    public_type = f"[MarshalAs(UnmanagedType.U1)] {public_type}"
+
                 public_params.append(f"{public_type} {param.name}")
 
             # Determine public return type
@@ -1189,6 +1231,9 @@ def main():
             print(f"  ⊘ No functions with Z3_context parameter (skipped)")
         print()
 
+    # Overloads make bare crefs ambiguous (CS0419) - reference them by signature
+    disambiguate_overload_crefs(sorted(output_dir.glob("Z3Library.*.generated.cs")))
+
     print("=" * 80)
     print(f"✅ Done! Generated {len(generated_function_files) + 2} files:")
     print(f"   - 1 enums file with {len(enums)} enums")
@@ -27,6 +27,7 @@ from doxygen_integration import (
     ParamDoc,
     CallbackDoc
 )
+from cref_overloads import disambiguate_overload_crefs
 
 
 @dataclass
@@ -1206,6 +1207,20 @@ def generate_delegate_name(func_name: str) -> str:
     return f"{csharp_name}Delegate"
 
 
+def generate_delegate_declaration(visibility: str, return_type_cs: str, delegate_name: str, params: List[str]) -> str:
+    """
+    Generate a Cdecl delegate declaration.
+    C bool is one byte, while the default bool marshaling is a four-byte Win32 BOOL, so bool return values
+    and parameters are marshaled as U1; otherwise the upper bytes of the register leak into the value.
+    """
+    params_cs = [f"[MarshalAs(UnmanagedType.U1)] {p}" if p.startswith("bool ") else p for p in params]
+    lines = "    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]\n"
+    if return_type_cs == "bool":
+        lines += "    [return: MarshalAs(UnmanagedType.U1)]\n"
+    lines += f"    {visibility} delegate {return_type_cs} {delegate_name}({', '.join(params_cs)});\n\n"
+    return lines
+
+
 def generate_default_param_description(c_type: str) -> str:
     """
     Generate a default parameter description from C type.
@@ -1360,14 +1375,11 @@ def generate_callbacks_file(callbacks: List[CallbackDefinition], output_dir: Pat
                 camel_case_name = convert_param_name_to_camel_case(param_name)
                 params_cs.append(f"{param_type_cs} {camel_case_name}")
 
-            params_str = ", ".join(params_cs) if params_cs else ""
-
             # Map return type
             return_type_cs = map_c_type_to_csharp(callback_def.return_type)
 
             # Delegate declaration with C# name
-            f.write("    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]\n")
-            f.write(f"    internal delegate {return_type_cs} {csharp_callback_name}({params_str});\n\n")
+            f.write(generate_delegate_declaration("internal", return_type_cs, csharp_callback_name, params_cs))
 
         f.write("}\n")
 
@@ -1487,7 +1499,84 @@ def convert_z3_refs_to_csharp(text: str) -> str:
     return re.sub(r'<see cref="(Z3_\w+(?:\(\))?)"\/>', replace_ref, text)
 
 
-def generate_partial_class(group: HeaderGroup, output_dir: Path):
+def is_span_param(c_type: str, all_params: List[Tuple[str, str]], param_index: int) -> bool:
+    """
+    Determine if a parameter is a read-only input handle array eligible for a ReadOnlySpan<IntPtr> overload.
+    Non-const arrays are excluded because Z3 may write back into them.
+    """
+    is_input_array = is_input_array_param(c_type, all_params, param_index)
+    is_output = is_output_pointer_param(c_type, all_params, param_index)
+    param_type_cs = map_c_type_to_csharp(c_type, is_output=is_output, is_input_array=is_input_array)
+    return param_type_cs == 'IntPtr[]' and 'const' in c_type
+
+
+def is_utf8_param(c_type: str) -> bool:
+    """
+    Determine if a parameter is an input C string eligible for a ReadOnlySpan<byte> UTF-8 overload.
+    """
+    return c_type.strip() == 'Z3_string'
+
+
+def write_call_profiling(f, sig: FunctionSignature, instrument: bool):
+    """
+    Write the NativeCallProfiler scope that records call count and latency of the native call.
+    The scope is an empty struct unless profiling is enabled via the runtime switch.
+    """
+    if instrument:
+        f.write(f"        using var call = NativeCallProfiler.Measure(\"{sig.name}\");\n")
+
+
+def write_span_overload(f, sig: FunctionSignature, return_type_cs: str, params_cs_with_out: List[str],
+                        param_names_with_out: List[str], span_indices: List[int], utf8_indices: List[int],
+                        instrument: bool):
+    """
+    Write a span overload for a function with read-only input handle arrays and/or input strings.
+    Handle arrays become ReadOnlySpan<IntPtr> and strings become NUL-terminated UTF-8 ReadOnlySpan<byte>.
+    Spans are passed to native code as pinned references to their first element, so callers
+    can build arguments in stack or pooled buffers instead of exact-size arrays or HGlobal strings.
+    """
+    suffix = "Utf8" if utf8_indices else "Span"
+    delegate_name = generate_delegate_name(sig.name).replace("Delegate", f"{suffix}Delegate")
+    csharp_method_name = generate_csharp_method_name(sig.name)
+
+    delegate_params = []
+    method_params = []
+    call_args = []
+    for idx, (param_cs, arg) in enumerate(zip(params_cs_with_out, param_names_with_out)):
+        name = param_cs.split()[-1]
+        if idx in span_indices:
+            delegate_params.append(f"ref IntPtr {name}")
+            method_params.append(f"ReadOnlySpan<IntPtr> {name}")
+            call_args.append(f"ref MemoryMarshal.GetReference({name})")
+        elif idx in utf8_indices:
+            delegate_params.append(f"ref byte {name}")
+            method_params.append(f"ReadOnlySpan<byte> {name}")
+            call_args.append(f"ref MemoryMarshal.GetReference({name})")
+        else:
+            delegate_params.append(param_cs)
+            method_params.append(param_cs)
+            call_args.append(arg)
+
+    f.write(generate_delegate_declaration("private", return_type_cs, delegate_name, delegate_params))
+    f.write("    /// <summary>\n")
+    if utf8_indices:
+        f.write(f"    /// UTF-8 overload of <c>{sig.name}</c>; string spans must be NUL-terminated and are pinned in place.\n")
+    else:
+        f.write(f"    /// Span overload of <c>{sig.name}</c>; input handle arrays are pinned in place.\n")
+    f.write("    /// </summary>\n")
+    f.write(f"    internal {return_type_cs} {csharp_method_name}({', '.join(method_params)})\n")
+    f.write("    {\n")
+    f.write(f"        var funcPtr = GetFunctionPointer(\"{sig.name}\");\n")
+    f.write(f"        var func = Marshal.GetDelegateForFunctionPointer<{delegate_name}>(funcPtr);\n")
+    write_call_profiling(f, sig, instrument)
+    if return_type_cs == "void":
+        f.write(f"        func({', '.join(call_args)});\n")
+    else:
+        f.write(f"        return func({', '.join(call_args)});\n")
+    f.write("    }\n\n")
+
+
+def generate_partial_class(group: HeaderGroup, output_dir: Path, instrument: bool = True):
     """
     Generate a partial class file with delegates and P/Invoke implementations.
     """
@@ -1556,7 +1645,6 @@ def generate_partial_class(group: HeaderGroup, output_dir: Path):
 
                 param_names.append(safe_param_name)
 
-            params_str = ", ".join(params_cs) if params_cs else ""
             params_str_with_out = ", ".join(params_cs_with_out) if params_cs_with_out else ""
             param_names_str = ", ".join(param_names_with_out) if param_names_with_out else ""
 
@@ -1564,8 +1652,7 @@ def generate_partial_class(group: HeaderGroup, output_dir: Path):
             csharp_method_name = generate_csharp_method_name(sig.name)
 
             # Delegate declaration
-            f.write(f"    [UnmanagedFunctionPointer(CallingConvention.Cdecl)]\n")
-            f.write(f"    private delegate {return_type_cs} {delegate_name}({params_str});\n\n")
+            f.write(generate_delegate_declaration("private", return_type_cs, delegate_name, params_cs))
 
             # XML documentation for method
             # Always generate documentation if there are parameters (to include ctype attributes)
@@ -1670,12 +1757,29 @@ def generate_partial_class(group: HeaderGroup, output_dir: Path):
             f.write("    {\n")
             f.write(f"        var funcPtr = GetFunctionPointer(\"{sig.name}\");\n")
             f.write(f"        var func = Marshal.GetDelegateForFunctionPointer<{delegate_name}>(funcPtr);\n")
+            write_call_profiling(f, sig, instrument)
             if return_type_cs == "void":
                 f.write(f"        func({param_names_str});\n")
             else:
                 f.write(f"        return func({param_names_str});\n")
             f.write("    }\n\n")
 
+            # Span overload for read-only input handle arrays and UTF-8 strings
+            span_indices = [
+                idx for idx, (param_type_c, _) in enumerate(sig.parameters)
+                if is_span_param(param_type_c, sig.parameters, idx)
+            ]
+            utf8_indices = [
+                idx for idx, (param_type_c, _) in enumerate(sig.parameters)
+                if is_utf8_param(param_type_c)
+            ]
+            if span_indices:
+                write_span_overload(f, sig, return_type_cs, params_cs_with_out, param_names_with_out,
+                                    span_indices, [], instrument)
+            if utf8_indices:
+                write_span_overload(f, sig, return_type_cs, params_cs_with_out, param_names_with_out,
+                                    span_indices, utf8_indices, instrument)
+
         f.write("}\n")
 
     return file_path
@@ -1713,6 +1817,8 @@ def main():
         parser.add_argument('--force-download', '-f', action='store_true', help='Force re-download headers even if cached')
         parser.add_argument('--enums-only', action='store_true', help='Generate only the enums file (faster)')
         parser.add_argument('--callbacks-only', action='store_true', help='Generate only the callbacks file (faster)')
+        parser.add_argument('--no-instrumentation', action='store_true',
+                            help='Omit NativeCallProfiler scopes from generated methods (no profiling support)')
         args = parser.parse_args()
 
         # Paths
@@ -1820,7 +1926,7 @@ def main():
         if args.verbose:
             for i, group in enumerate(groups, 1):
                 print(f"  [{i}/{len(groups)}] {group.group_name_clean} ({len(group.functions)} functions)...")
-                file_path = generate_partial_class(group, output_dir)
+                file_path = generate_partial_class(group, output_dir, not args.no_instrumentation)
                 generated_files.append(file_path.name)
         else:
             # Compact progress for generation
@@ -1831,11 +1937,14 @@ def main():
                 bar = '█' * filled + '░' * (bar_width - filled)
                 sys.stdout.write(f"\r  Progress [{bar}] {i}/{len(groups)} groups")
                 sys.stdout.flush()
-                file_path = generate_partial_class(group, output_dir)
+                file_path = generate_partial_class(group, output_dir, not args.no_instrumentation)
                 generated_files.append(file_path.name)
             sys.stdout.write("\r" + " " * 80 + "\r")
             sys.stdout.flush()
 
+        # Overloads make bare crefs ambiguous (CS0419) - reference them by signature
+        disambiguate_overload_crefs(sorted(output_dir.glob("NativeZ3Library.*.generated.cs")))
+
         print(f"✅ Generated {len(generated_files)} partial class files")
         print(f"   Total functions: {sum(len(g.functions) for g in groups)}")
         print(f"   Location: {output_dir}")